@@ -57,6 +57,11 @@ interface RawEROSPPlayer {
   cap_factor: number;
   pa_per_game?: number;
   fp_per_pa?: number;
+  // Monte Carlo rest-of-season distribution (startable scale)
+  erosp_p10?: number;
+  erosp_p50?: number;
+  erosp_p90?: number;
+  downside_risk?: number;
 }
 
 interface RawEROSPFile {
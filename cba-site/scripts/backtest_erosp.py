@@ -6,23 +6,40 @@ Runs the EROSP pipeline as a pre-season projection for the target year
 (using the 3 prior years of data), then compares erosp_raw/startable against
 actual fantasy points from data/historical/{year}.json.
 
+Rates go through the same projection-source ensemble as compute_erosp.py:
+the talent estimates, plus Steamer when benchmark_steamer.py has cached that
+season's counting stats (erosp_cache/steamer/) and generate_projections /
+ESPN tables when that season's files exist, weighted by the config's
+source_weights and the head-to-head benchmarks of earlier seasons.
+
 Usage:
     python backtest_erosp.py [--target-year 2025]
+    python backtest_erosp.py --years 2022-2025 [--workers 4]
+
+--years runs every season in a process pool. All inputs for the whole range
+(stats, player info, schedules, Steamer playing time, actual points) are
+loaded once in the parent and handed to the workers read-only; each worker's
+log goes to erosp_cache/backtest_logs/backtest_{year}.log.
 
 Output:
     data/erosp/backtest_{year}.json   — projection output
     data/erosp/backtest_{year}.csv    — matched comparison table
+    data/erosp/backtest_summary.csv   — --years only: Pearson / Spearman /
+                                        RMSE / MAE / bias per season, overall,
+                                        per position and per role
     Summary stats printed to stdout
 """
 
 import os
-import re
 import sys
 import json
 import argparse
+import contextlib
 import datetime
 import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import Dict, List, Optional
 
 import pandas as pd
 import numpy as np
@@ -33,248 +50,95 @@ SCRIPT_DIR  = Path(__file__).parent
 PROJECT_DIR = SCRIPT_DIR.parent
 sys.path.insert(0, str(SCRIPT_DIR))
 
-try:
-    import pybaseball
-    pybaseball.cache.enable()
-except ImportError:
-    print("ERROR: pybaseball not installed. Run: pip install pybaseball pandas numpy requests")
-    sys.exit(1)
-
 from erosp.config import (
-    PARK_FACTORS, TEAM_NORMALIZE, MLB_TEAM_ID_TO_ABBREV, FULL_SEASON_GAMES,
+    PARK_FACTORS, TEAM_NORMALIZE, MLB_TEAM_ID_TO_ABBREV, FULL_SEASON_GAMES, DEFAULT_CONFIG, EROSPConfig,
 )
 from erosp.ingest import (
-    fetch_id_map, fetch_player_info,
+    load_id_index, fetch_player_info,
     fetch_batting_stats, fetch_pitching_stats,
     fetch_statcast_xwoba, fetch_sprint_speed,
     fetch_schedule_summary,
-    build_name_to_mlbam_from_chadwick,
-    build_fangraphs_to_mlbam,
 )
+from erosp.names import normalize
 from erosp.talent import estimate_hitter_talent, estimate_pitcher_talent, LG_AVG_PITCH, PITCH_RATE_COLS
 from erosp.playing_time import build_playing_time
 from erosp.projection import compute_all_erosp_raw
+from erosp.sources import (
+    ProjectionSource, load_sources, blend_rates, backtest_weights, ensemble_weights,
+    preseason_weights, season_remaining_share, talent_rates, steamer_rates, projections_rates, espn_rates,
+)
 from erosp.startability import compute_replacement_levels, compute_erosp_startable
 
+OUTPUT_DIR   = PROJECT_DIR / "data" / "erosp"
+HIST_DIR     = PROJECT_DIR / "data" / "historical"
+LOG_DIR      = SCRIPT_DIR / "erosp_cache" / "backtest_logs"
+SUMMARY_PATH = OUTPUT_DIR / "backtest_summary.csv"
+# Steamer counting-stat projections, cached by benchmark_steamer.py
+STEAMER_CACHE_DIR = SCRIPT_DIR / "erosp_cache" / "steamer"
+# Season fantasy-point tables, read by the ensemble when present
+PROJECTIONS_PATH = SCRIPT_DIR / "fantasy_projections_{season}.csv"           # generate_projections.py
+ESPN_PROJ_PATH   = PROJECT_DIR / "data" / "espn-projections" / "{season}.json"
 
-# ---------------------------------------------------------------------------
-# Args
-# ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Backtest EROSP against actual season results")
-parser.add_argument("--target-year", type=int, default=2025,
-                    help="Season year to backtest (default: 2025)")
-args = parser.parse_args()
-
-TARGET_SEASON       = args.target_year
-HISTORICAL_YEARS    = [TARGET_SEASON - 1, TARGET_SEASON - 2, TARGET_SEASON - 3]
-Y1, Y2, Y3          = HISTORICAL_YEARS
-PITCHER_EXTRA_YEARS = [TARGET_SEASON - 4, TARGET_SEASON - 5]   # Fix 2: 5yr lookback
-Y4, Y5              = PITCHER_EXTRA_YEARS
-SEASON_STARTED      = False  # pre-season projection
-
-print(f"\n{'='*65}")
-print(f"  EROSP BACKTEST")
-print(f"{'='*65}")
-print(f"  Target season:  {TARGET_SEASON}")
-print(f"  History years:  {Y1}, {Y2}, {Y3}")
-print(f"  Mode:           Pre-season (no current-year stats, no injuries)")
-print(f"  Run date:       {datetime.date.today().strftime('%B %d, %Y')}")
-print(f"{'='*65}\n")
-
-
-# ---------------------------------------------------------------------------
-# STEP 1: ID mapping
-# ---------------------------------------------------------------------------
-print("─── Step 1: ID mapping ───────────────────────────────────────────")
-id_map_df     = fetch_id_map()
-fg_to_mlbam   = build_fangraphs_to_mlbam(id_map_df)
 # Manual FG ID overrides — keep in sync with compute_erosp.py
 _FG_MANUAL_OVERRIDES = {
     37120: 808959,   # Munetaka Murakami (CWS 1B, 2026 debutant)
 }
-fg_to_mlbam.update(_FG_MANUAL_OVERRIDES)
-name_to_mlbam = build_name_to_mlbam_from_chadwick()
-print()
 
+POS_NORMALIZE = {"LF": "OF", "CF": "OF", "RF": "OF"}
 
-# ---------------------------------------------------------------------------
-# STEP 2: Batting statistics
-# ---------------------------------------------------------------------------
-print("─── Step 2: Batting statistics ──────────────────────────────────")
-batting_by_year = fetch_batting_stats(HISTORICAL_YEARS, min_pa=100)
-if not batting_by_year:
-    print("ERROR: No batting data fetched. Exiting.")
-    sys.exit(1)
-print()
+# Groups in the accuracy table. SP/RP are split by role rather than position.
+HITTER_POSITIONS = ["C", "1B", "2B", "3B", "SS", "OF", "DH"]
+ROLES            = ["H", "SP", "RP"]
+MIN_GROUP_SIZE   = 5
+ACCURACY_COLUMNS = ["season", "projection", "scope", "group", "n",
+                    "pearson", "spearman", "rmse", "mae", "bias"]
 
 
-# ---------------------------------------------------------------------------
-# STEP 3: Pitching statistics
-# ---------------------------------------------------------------------------
-print("─── Step 3: Pitching statistics ─────────────────────────────────")
-pitching_by_year = fetch_pitching_stats(HISTORICAL_YEARS, min_ip=20)
-# Fix 2: fetch extra years (y4, y5) for extended pitcher lookback
-pitcher_extra = fetch_pitching_stats(PITCHER_EXTRA_YEARS, min_ip=20)
-pitching_by_year.update(pitcher_extra)
-extra_rows = sum(len(v) for v in pitcher_extra.values())
-print(f"  Extra pitcher years ({Y4}, {Y5}): {extra_rows:,} entries fetched.")
-print()
+def history_years(target_season: int) -> List[int]:
+    """[Y1, Y2, Y3] — the three seasons before `target_season`, most recent first."""
+    return [target_season - 1, target_season - 2, target_season - 3]
 
 
-# ---------------------------------------------------------------------------
-# STEP 4: Statcast xwOBA
-# ---------------------------------------------------------------------------
-print("─── Step 4: Statcast xwOBA ───────────────────────────────────────")
-xwoba_by_year = fetch_statcast_xwoba([Y1, Y2] if Y1 else [Y2])
-print()
+def pitcher_extra_years(target_season: int) -> List[int]:
+    """[Y4, Y5] — Fix 2: 5yr lookback for TJ returnees."""
+    return [target_season - 4, target_season - 5]
 
 
-# ---------------------------------------------------------------------------
-# STEP 5: Sprint speed
-# ---------------------------------------------------------------------------
-print(f"─── Step 5: Sprint speed ({Y1}) ──────────────────────────────────")
-sprint_speed_df = fetch_sprint_speed(Y1)
-print()
+def _enable_pybaseball() -> None:
+    try:
+        import pybaseball
+    except ImportError:
+        raise RuntimeError("pybaseball not installed. Run: pip install pybaseball pandas numpy requests")
+    pybaseball.cache.enable()
 
 
 # ---------------------------------------------------------------------------
-# STEP 6: Player info
+# Inputs — everything a backtest reads, loaded once for a set of seasons
 # ---------------------------------------------------------------------------
-print("─── Step 6: Player info (ages + positions) ───────────────────────")
-all_fgids = set()
-for df in batting_by_year.values():
-    all_fgids |= set(df["IDfg"].dropna().astype(int).tolist())
-for df in pitching_by_year.values():
-    all_fgids |= set(df["IDfg"].dropna().astype(int).tolist())
-
-all_mlbam_ids = [fg_to_mlbam[fgid] for fgid in all_fgids if fgid in fg_to_mlbam]
-name_fallback_ids = list(name_to_mlbam.values())
-all_mlbam_ids = list(set(all_mlbam_ids) | set(name_fallback_ids))
-player_info_df = fetch_player_info(all_mlbam_ids)
-print()
 
+def _backtest_schedule(target_season: int) -> dict:
+    """Schedule summary for `target_season` with games_remaining reset to a full season."""
+    schedule_summary = fetch_schedule_summary(target_season)
 
-# ---------------------------------------------------------------------------
-# STEP 7: MLB schedule — override games_remaining to full season
-# ---------------------------------------------------------------------------
-print("─── Step 7: MLB schedule (overriding to 162 games for backtest) ──")
-schedule_summary = fetch_schedule_summary(TARGET_SEASON)
-
-if not schedule_summary:
-    # Fallback: build dummy schedule with all MLB teams at 162 games
-    print("  WARNING: No schedule returned for target year. Building fallback.")
-    schedule_summary = {
-        team_id: {
-            "abbrev": abbrev,
-            "games_remaining": FULL_SEASON_GAMES,
-            "avg_park_factor_remaining": PARK_FACTORS.get(abbrev, 1.0),
+    if not schedule_summary:
+        # Fallback: build dummy schedule with all MLB teams at 162 games
+        print("  WARNING: No schedule returned for target year. Building fallback.")
+        return {
+            team_id: {
+                "abbrev": abbrev,
+                "games_remaining": FULL_SEASON_GAMES,
+                "avg_park_factor_remaining": PARK_FACTORS.get(abbrev, 1.0),
+            }
+            for team_id, abbrev in MLB_TEAM_ID_TO_ABBREV.items()
         }
-        for team_id, abbrev in MLB_TEAM_ID_TO_ABBREV.items()
-    }
-else:
+
     # Season is over — API returns 0 games remaining. Override to full season.
     n_teams = len(schedule_summary)
     for tid in schedule_summary:
         schedule_summary[tid]["games_remaining"] = FULL_SEASON_GAMES
     print(f"  Overrode games_remaining → {FULL_SEASON_GAMES} for {n_teams} teams.")
+    return schedule_summary
 
-abbrev_to_team_id = {v["abbrev"]: k for k, v in schedule_summary.items()}
-print()
-
-
-# ---------------------------------------------------------------------------
-# STEP 8: Talent estimation
-# ---------------------------------------------------------------------------
-print("─── Step 8: Talent estimation ────────────────────────────────────")
-print("  Hitters:")
-hitter_talent_df = estimate_hitter_talent(
-    batting_by_year  = batting_by_year,
-    historical_years = HISTORICAL_YEARS,
-    player_info_df   = player_info_df,
-    xwoba_by_year    = xwoba_by_year,
-    sprint_speed_df  = sprint_speed_df,
-    target_season    = TARGET_SEASON,
-    fg_to_mlbam      = fg_to_mlbam,
-    name_to_mlbam    = name_to_mlbam,
-)
-
-print("  Pitchers:")
-pitcher_talent_df = estimate_pitcher_talent(
-    pitching_by_year = pitching_by_year,
-    historical_years = HISTORICAL_YEARS,
-    player_info_df   = player_info_df,
-    target_season    = TARGET_SEASON,
-    fg_to_mlbam      = fg_to_mlbam,
-    name_to_mlbam    = name_to_mlbam,
-    extra_years      = PITCHER_EXTRA_YEARS,   # Fix 2: 5yr lookback for TJ returnees
-)
-print()
-
-
-# ---------------------------------------------------------------------------
-# STEP 8b: 40-man floor for returning/prospect pitchers (Fix 1)
-# ---------------------------------------------------------------------------
-print("─── Step 8b: Pitcher floor (TJ returnees / prospects) ───────────")
-if not pitcher_talent_df.empty:
-    _mlbam_to_total_ip: dict = {}
-    for _yr, _pit_df in pitching_by_year.items():
-        if _yr >= TARGET_SEASON:
-            continue
-        for _, _row in _pit_df.iterrows():
-            _fgid  = int(_row.get("IDfg", 0) or 0)
-            _mlbam = fg_to_mlbam.get(_fgid)
-            if _mlbam:
-                _mlbam_to_total_ip[_mlbam] = (
-                    _mlbam_to_total_ip.get(_mlbam, 0.0) + float(_row.get("IP", 0) or 0)
-                )
-
-    _pitcher_pos_set: set = set()
-    if not player_info_df.empty and "mlb_position" in player_info_df.columns:
-        for _, _prow in player_info_df.iterrows():
-            _mid = int(_prow.get("mlbam_id", 0) or 0)
-            if _mid and str(_prow.get("mlb_position", "")).upper() in {"P", "SP", "RP"}:
-                _pitcher_pos_set.add(_mid)
-
-    # Build set of MLBAM IDs with recent activity (y1 or y2) — skip these for the floor
-    _recent_activity_set: set = set()
-    for _yr in [Y1, Y2]:
-        if _yr and _yr in pitching_by_year:
-            for _, _row in pitching_by_year[_yr].iterrows():
-                _fgid = int(_row.get("IDfg", 0) or 0)
-                _m = fg_to_mlbam.get(_fgid)
-                if _m:
-                    _recent_activity_set.add(_m)
-
-    _floor_count = 0
-    for _mid in list(pitcher_talent_df.index):
-        if int(_mid) not in _pitcher_pos_set:
-            continue
-        if _mlbam_to_total_ip.get(int(_mid), 0.0) >= 30.0:
-            continue
-        if pitcher_talent_df.at[_mid, "role"] != "SP":
-            continue                                # relievers stay as-is
-        if int(_mid) in _recent_activity_set:
-            continue                                # had recent activity — not TJ returnee
-        for _col in PITCH_RATE_COLS:
-            if _col in pitcher_talent_df.columns:
-                pitcher_talent_df.at[_mid, _col] = round(LG_AVG_PITCH[_col], 6)
-        _floor_count += 1
-
-    print(f"  Floor applied to {_floor_count} pitcher(s) with < 30 total IP (SP, absent y1/y2).")
-print()
-
-
-# ---------------------------------------------------------------------------
-# STEP 9: Playing time (with Steamer pre-season projections for target year)
-# ---------------------------------------------------------------------------
-print("─── Step 9: Playing time (Steamer pre-season projections) ───────")
-
-import requests as _requests
-
-# Steamer PA projections (batting) — uses season= param for historical archives.
-# Falls back to data/erosp/steamer_raw_bat_{year}.csv if API is rate-limited.
-steamer_pa_map: dict = {}
-_bat_cache = PROJECT_DIR / "data" / "erosp" / f"steamer_raw_bat_{TARGET_SEASON}.csv"
 
 def _load_steamer_bat_from_cache(path: Path) -> dict:
     df = pd.read_csv(path)
@@ -282,39 +146,6 @@ def _load_steamer_bat_from_cache(path: Path) -> dict:
     df["PA"]       = pd.to_numeric(df["PA"],       errors="coerce")
     return dict(zip(df["playerid"].dropna().astype(int), df["PA"].fillna(0)))
 
-try:
-    steamer_bat_url = (
-        f"https://www.fangraphs.com/api/projections"
-        f"?type=steamer&stats=bat&pos=all&team=0&players=0&lg=all&season={TARGET_SEASON}"
-    )
-    resp_bat = _requests.get(steamer_bat_url, timeout=20,
-                             headers={"User-Agent": "Mozilla/5.0"})
-    if resp_bat.status_code == 200:
-        bat_data = resp_bat.json()
-        if bat_data and isinstance(bat_data, list) and len(bat_data) > 50:
-            bat_df = pd.DataFrame(bat_data)
-            if "PA" in bat_df.columns and "playerid" in bat_df.columns:
-                bat_df["playerid"] = pd.to_numeric(bat_df["playerid"], errors="coerce")
-                bat_df["PA"]       = pd.to_numeric(bat_df["PA"],       errors="coerce")
-                steamer_pa_map = dict(
-                    zip(bat_df["playerid"].dropna().astype(int),
-                        bat_df["PA"].fillna(0))
-                )
-                print(f"  Steamer {TARGET_SEASON} PA projections: {len(steamer_pa_map):,} players (live).")
-    else:
-        raise ValueError(f"HTTP {resp_bat.status_code}")
-except Exception as exc:
-    if _bat_cache.exists():
-        steamer_pa_map = _load_steamer_bat_from_cache(_bat_cache)
-        print(f"  Steamer {TARGET_SEASON} PA projections: {len(steamer_pa_map):,} players (cache).")
-    else:
-        print(f"  Steamer batting unavailable ({exc}); using playing-time defaults.")
-
-# Steamer GS/IP projections (pitching) — overrides rotation-tiering heuristic.
-# Falls back to data/erosp/steamer_raw_pit_{year}.csv if API is rate-limited.
-steamer_gs_map: dict = {}
-steamer_ip_map: dict = {}
-_pit_cache = PROJECT_DIR / "data" / "erosp" / f"steamer_raw_pit_{TARGET_SEASON}.csv"
 
 def _load_steamer_pit_from_cache(path: Path) -> tuple:
     df = pd.read_csv(path)
@@ -326,238 +157,461 @@ def _load_steamer_pit_from_cache(path: Path) -> tuple:
     ip_map = dict(zip(valid["playerid"].astype(int), valid["IP"].fillna(0)))
     return gs_map, ip_map
 
-try:
-    steamer_pit_url = (
-        f"https://www.fangraphs.com/api/projections"
-        f"?type=steamer&stats=pit&pos=all&team=0&players=0&lg=all&season={TARGET_SEASON}"
-    )
-    resp_pit = _requests.get(steamer_pit_url, timeout=20,
-                             headers={"User-Agent": "Mozilla/5.0"})
-    if resp_pit.status_code == 200:
-        pit_data = resp_pit.json()
-        if pit_data and isinstance(pit_data, list) and len(pit_data) > 50:
-            pit_df = pd.DataFrame(pit_data)
-            if "GS" in pit_df.columns and "IP" in pit_df.columns and "playerid" in pit_df.columns:
-                pit_df["playerid"] = pd.to_numeric(pit_df["playerid"], errors="coerce")
-                pit_df["GS"]       = pd.to_numeric(pit_df["GS"],       errors="coerce")
-                pit_df["IP"]       = pd.to_numeric(pit_df["IP"],       errors="coerce")
-                valid_pit = pit_df.dropna(subset=["playerid", "GS"])
-                steamer_gs_map = dict(zip(valid_pit["playerid"].astype(int), valid_pit["GS"].fillna(0)))
-                steamer_ip_map = dict(zip(valid_pit["playerid"].astype(int), valid_pit["IP"].fillna(0)))
-                print(f"  Steamer {TARGET_SEASON} GS/IP projections: {len(steamer_gs_map):,} pitchers (live).")
-    else:
-        raise ValueError(f"HTTP {resp_pit.status_code}")
-except Exception as exc:
-    if _pit_cache.exists():
-        steamer_gs_map, steamer_ip_map = _load_steamer_pit_from_cache(_pit_cache)
-        print(f"  Steamer {TARGET_SEASON} GS/IP projections: {len(steamer_gs_map):,} pitchers (cache).")
-    else:
-        print(f"  Steamer pitching unavailable ({exc}); using rotation heuristic.")
-
-playing_time_df = build_playing_time(
-    hitter_talent_df  = hitter_talent_df,
-    pitcher_talent_df = pitcher_talent_df,
-    batting_by_year   = batting_by_year,
-    pitching_by_year  = pitching_by_year,
-    target_season     = TARGET_SEASON,
-    steamer_pa_map    = steamer_pa_map if steamer_pa_map else None,
-    steamer_gs_map    = steamer_gs_map if steamer_gs_map else None,
-    steamer_ip_map    = steamer_ip_map if steamer_ip_map else None,
-)
-print()
 
+def load_steamer(target_season: int) -> dict:
+    """
+    Steamer pre-season projections for `target_season`:
+    {"pa": {fgid: PA}, "gs": {fgid: GS}, "ip": {fgid: IP}}. Uses the season=
+    param for historical archives and falls back to
+    data/erosp/steamer_raw_{bat,pit}_{year}.csv if the API is rate-limited.
+    """
+    import requests
+
+    # Steamer PA projections (batting)
+    steamer_pa_map: dict = {}
+    bat_cache = OUTPUT_DIR / f"steamer_raw_bat_{target_season}.csv"
+    try:
+        steamer_bat_url = (
+            f"https://www.fangraphs.com/api/projections"
+            f"?type=steamer&stats=bat&pos=all&team=0&players=0&lg=all&season={target_season}"
+        )
+        resp_bat = requests.get(steamer_bat_url, timeout=20,
+                                headers={"User-Agent": "Mozilla/5.0"})
+        if resp_bat.status_code == 200:
+            bat_data = resp_bat.json()
+            if bat_data and isinstance(bat_data, list) and len(bat_data) > 50:
+                bat_df = pd.DataFrame(bat_data)
+                if "PA" in bat_df.columns and "playerid" in bat_df.columns:
+                    bat_df["playerid"] = pd.to_numeric(bat_df["playerid"], errors="coerce")
+                    bat_df["PA"]       = pd.to_numeric(bat_df["PA"],       errors="coerce")
+                    steamer_pa_map = dict(
+                        zip(bat_df["playerid"].dropna().astype(int),
+                            bat_df["PA"].fillna(0))
+                    )
+                    print(f"  Steamer {target_season} PA projections: {len(steamer_pa_map):,} players (live).")
+        else:
+            raise ValueError(f"HTTP {resp_bat.status_code}")
+    except Exception as exc:
+        if bat_cache.exists():
+            steamer_pa_map = _load_steamer_bat_from_cache(bat_cache)
+            print(f"  Steamer {target_season} PA projections: {len(steamer_pa_map):,} players (cache).")
+        else:
+            print(f"  Steamer batting unavailable ({exc}); using playing-time defaults.")
+
+    # Steamer GS/IP projections (pitching) — overrides rotation-tiering heuristic.
+    steamer_gs_map: dict = {}
+    steamer_ip_map: dict = {}
+    pit_cache = OUTPUT_DIR / f"steamer_raw_pit_{target_season}.csv"
+    try:
+        steamer_pit_url = (
+            f"https://www.fangraphs.com/api/projections"
+            f"?type=steamer&stats=pit&pos=all&team=0&players=0&lg=all&season={target_season}"
+        )
+        resp_pit = requests.get(steamer_pit_url, timeout=20,
+                                headers={"User-Agent": "Mozilla/5.0"})
+        if resp_pit.status_code == 200:
+            pit_data = resp_pit.json()
+            if pit_data and isinstance(pit_data, list) and len(pit_data) > 50:
+                pit_df = pd.DataFrame(pit_data)
+                if "GS" in pit_df.columns and "IP" in pit_df.columns and "playerid" in pit_df.columns:
+                    pit_df["playerid"] = pd.to_numeric(pit_df["playerid"], errors="coerce")
+                    pit_df["GS"]       = pd.to_numeric(pit_df["GS"],       errors="coerce")
+                    pit_df["IP"]       = pd.to_numeric(pit_df["IP"],       errors="coerce")
+                    valid_pit = pit_df.dropna(subset=["playerid", "GS"])
+                    steamer_gs_map = dict(zip(valid_pit["playerid"].astype(int), valid_pit["GS"].fillna(0)))
+                    steamer_ip_map = dict(zip(valid_pit["playerid"].astype(int), valid_pit["IP"].fillna(0)))
+                    print(f"  Steamer {target_season} GS/IP projections: {len(steamer_gs_map):,} pitchers (live).")
+        else:
+            raise ValueError(f"HTTP {resp_pit.status_code}")
+    except Exception as exc:
+        if pit_cache.exists():
+            steamer_gs_map, steamer_ip_map = _load_steamer_pit_from_cache(pit_cache)
+            print(f"  Steamer {target_season} GS/IP projections: {len(steamer_gs_map):,} pitchers (cache).")
+        else:
+            print(f"  Steamer pitching unavailable ({exc}); using rotation heuristic.")
+
+    return {"pa": steamer_pa_map, "gs": steamer_gs_map, "ip": steamer_ip_map}
+
+
+def load_steamer_stats(target_season: int) -> tuple:
+    """
+    (bat, pit) Steamer counting-stat projections for `target_season` from
+    erosp_cache/steamer/ — empty frames for a season benchmark_steamer.py
+    hasn't fetched. Never hits the network.
+    """
+    frames = []
+    for stats in ("bat", "pit"):
+        path = STEAMER_CACHE_DIR / f"steamer_{stats}_{target_season}.csv"
+        frames.append(pd.read_csv(path) if path.exists() else pd.DataFrame())
+    print(f"  Steamer {target_season} counting stats: "
+          + (f"{len(frames[0]):,} batters, {len(frames[1]):,} pitchers (cache)."
+             if not (frames[0].empty and frames[1].empty) else "not cached; ensemble skips Steamer."))
+    return tuple(frames)
+
+
+def load_actuals(target_season: int) -> Optional[dict]:
+    """
+    Actual fantasy points for `target_season` from data/historical/{year}.json,
+    keyed by normalized name (max taken if a player was traded between teams).
+    None when the file is missing.
+    """
+    hist_path = HIST_DIR / f"{target_season}.json"
+    if not hist_path.exists():
+        return None
+    with open(hist_path) as f:
+        hist_data = json.load(f)
+
+    actual_by_norm: dict = {}
+    for roster in hist_data.get("rosters", []):
+        for p in roster.get("players", []):
+            nm  = p.get("playerName", "")
+            pts = float(p.get("totalPoints", 0))
+            key = normalize(nm)
+            if key not in actual_by_norm or pts > actual_by_norm[key]["pts"]:
+                actual_by_norm[key] = {
+                    "name":     nm,
+                    "pts":      pts,
+                    "espn_id":  str(p.get("playerId", "")),
+                    "position": p.get("position", ""),
+                }
+    return actual_by_norm
+
+
+def load_inputs(target_seasons: List[int]) -> dict:
+    """
+    Fetch every input the backtests of `target_seasons` read, once: the union
+    of their batting / pitching / xwOBA / sprint speed years, one player info
+    lookup, and per-season schedule, Steamer and actual-points maps. The
+    result is treated as read-only by run_backtest.
+    Raises RuntimeError when the ID register or batting data can't be loaded.
+    """
+    _enable_pybaseball()
+    target_seasons = sorted(set(target_seasons))
+    hist = sorted({y for t in target_seasons for y in history_years(t)}, reverse=True)
+    extra = sorted({y for t in target_seasons for y in pitcher_extra_years(t)} - set(hist),
+                   reverse=True)
+    xwoba_years = sorted({y for t in target_seasons for y in history_years(t)[:2]}, reverse=True)
+    speed_years = sorted({history_years(t)[0] for t in target_seasons}, reverse=True)
+
+    # ── Step 1: ID mapping ──
+    print("─── Step 1: ID mapping ───────────────────────────────────────────")
+    id_index = load_id_index()
+    if id_index is None:
+        raise RuntimeError("Could not load Chadwick register.")
+    fg_to_mlbam = id_index.fangraphs_to_mlbam()
+    fg_to_mlbam.update(_FG_MANUAL_OVERRIDES)
+    name_to_mlbam = id_index.name_to_mlbam()
+    print()
+
+    # ── Step 2: Batting statistics ──
+    print("─── Step 2: Batting statistics ──────────────────────────────────")
+    batting_by_year = fetch_batting_stats(hist, min_pa=100)
+    if not batting_by_year:
+        raise RuntimeError("No batting data fetched.")
+    print()
+
+    # ── Step 3: Pitching statistics ──
+    print("─── Step 3: Pitching statistics ─────────────────────────────────")
+    pitching_by_year = fetch_pitching_stats(hist, min_ip=20)
+    # Fix 2: fetch extra years (y4, y5) for extended pitcher lookback
+    pitcher_extra = fetch_pitching_stats(extra, min_ip=20)
+    pitching_by_year.update(pitcher_extra)
+    extra_rows = sum(len(v) for v in pitcher_extra.values())
+    print(f"  Extra pitcher years ({', '.join(map(str, extra))}): {extra_rows:,} entries fetched.")
+    print()
+
+    # ── Step 4: Statcast xwOBA ──
+    print("─── Step 4: Statcast xwOBA ───────────────────────────────────────")
+    xwoba_by_year = fetch_statcast_xwoba(xwoba_years)
+    print()
+
+    # ── Step 5: Sprint speed ──
+    print("─── Step 5: Sprint speed ─────────────────────────────────────────")
+    sprint_speed_by_year = {y: fetch_sprint_speed(y) for y in speed_years}
+    print()
+
+    # ── Step 6: Player info ──
+    print("─── Step 6: Player info (ages + positions) ───────────────────────")
+    all_fgids = set()
+    for df in batting_by_year.values():
+        all_fgids |= set(df["IDfg"].dropna().astype(int).tolist())
+    for df in pitching_by_year.values():
+        all_fgids |= set(df["IDfg"].dropna().astype(int).tolist())
+
+    all_mlbam_ids = [fg_to_mlbam[fgid] for fgid in all_fgids if fgid in fg_to_mlbam]
+    name_fallback_ids = list(name_to_mlbam.values())
+    all_mlbam_ids = list(set(all_mlbam_ids) | set(name_fallback_ids))
+    player_info_df = fetch_player_info(all_mlbam_ids)
+    print()
+
+    # ── Step 7: MLB schedule — override games_remaining to full season ──
+    print("─── Step 7: MLB schedule (overriding to 162 games for backtest) ──")
+    schedules = {t: _backtest_schedule(t) for t in target_seasons}
+    print()
+
+    # ── Step 9a: Steamer pre-season projections + actual points ──
+    print("─── Step 9a: Steamer pre-season projections ──────────────────────")
+    steamer = {t: load_steamer(t) for t in target_seasons}
+    steamer_stats = {t: load_steamer_stats(t) for t in target_seasons}
+    print()
+    actuals = {t: load_actuals(t) for t in target_seasons}
+
+    return {
+        "fg_to_mlbam":          fg_to_mlbam,
+        "name_to_mlbam":        name_to_mlbam,
+        "batting_by_year":      batting_by_year,
+        "pitching_by_year":     pitching_by_year,
+        "xwoba_by_year":        xwoba_by_year,
+        "sprint_speed_by_year": sprint_speed_by_year,
+        "player_info_df":       player_info_df,
+        "schedules":            schedules,
+        "steamer":              steamer,
+        "steamer_stats":        steamer_stats,
+        "actuals":              actuals,
+    }
 
-# ---------------------------------------------------------------------------
-# STEP 10: EROSP raw (no injury map — pre-season)
-# ---------------------------------------------------------------------------
-print("─── Step 10: EROSP raw (no injury deductions) ───────────────────")
-projection_df = compute_all_erosp_raw(
-    hitter_talent_df      = hitter_talent_df,
-    pitcher_talent_df     = pitcher_talent_df,
-    playing_time_df       = playing_time_df,
-    schedule_summary      = schedule_summary,
-    mlb_team_abbrev_to_id = abbrev_to_team_id,
-    injury_map            = None,
-)
-print()
+
+def _years_of(by_year: dict, years: List[int]) -> dict:
+    return {y: by_year[y] for y in years if y in by_year}
 
 
 # ---------------------------------------------------------------------------
-# STEP 11: Replacement levels + startability (no ESPN roster)
+# Projection
 # ---------------------------------------------------------------------------
-print("─── Step 11: Replacement levels + startability ──────────────────")
-h_proj = projection_df[projection_df["player_type"] == "hitter"] if not projection_df.empty else pd.DataFrame()
-p_proj = projection_df[projection_df["player_type"].isin(["sp", "rp"])] if not projection_df.empty else pd.DataFrame()
-
-replacement_levels = compute_replacement_levels(
-    hitter_projection_df  = h_proj,
-    pitcher_projection_df = p_proj,
-    hitter_talent_df      = hitter_talent_df,
-    pitcher_talent_df     = pitcher_talent_df,
-)
-
-# No ESPN roster → pass empty map; all players get fantasy_team_id=0
-projection_df = compute_erosp_startable(
-    projection_df      = projection_df,
-    hitter_talent_df   = hitter_talent_df,
-    pitcher_talent_df  = pitcher_talent_df,
-    espn_roster_map    = {},
-    replacement_levels = replacement_levels,
-)
-print()
 
+def _apply_pitcher_floor(pitcher_talent_df: pd.DataFrame, pitching_by_year: dict,
+                         player_info_df: pd.DataFrame, fg_to_mlbam: dict,
+                         target_season: int) -> int:
+    """
+    40-man floor for returning/prospect pitchers (Fix 1): SPs with < 30 total
+    IP and no y1/y2 activity get league-average rates. Returns the count.
+    """
+    y1, y2 = history_years(target_season)[:2]
+    ip_frames = [df[["IDfg", "IP"]] for yr, df in pitching_by_year.items() if yr < target_season]
+    if ip_frames:
+        ip = pd.concat(ip_frames, ignore_index=True)
+        mlbam = ip["IDfg"].map(fg_to_mlbam)
+        known = mlbam.notna()
+        total_ip = ip.loc[known, "IP"].astype(float).groupby(mlbam[known].astype(int)).sum()
+    else:
+        total_ip = pd.Series(dtype=float)
 
-# ---------------------------------------------------------------------------
-# STEP 12: Attach position metadata
-# ---------------------------------------------------------------------------
-print("─── Step 12: Attach metadata ────────────────────────────────────")
-position_map: dict = {}
-if not hitter_talent_df.empty:
-    position_map.update(hitter_talent_df["mlb_position"].to_dict())
-if not pitcher_talent_df.empty:
-    for mid, row in pitcher_talent_df.iterrows():
-        pos = str(row.get("mlb_position", row.get("role", "SP"))).upper()
-        if pos == "P":
-            pos = str(row.get("role", "SP")).upper()
-        position_map[mid] = pos
+    pitcher_pos_set: set = set()
+    if not player_info_df.empty and "mlb_position" in player_info_df.columns:
+        mids = pd.to_numeric(player_info_df["mlbam_id"], errors="coerce").fillna(0).astype(int)
+        is_pitcher = player_info_df["mlb_position"].astype(str).str.upper().isin(["P", "SP", "RP"])
+        pitcher_pos_set = set(mids[is_pitcher & (mids != 0)])
+
+    # MLBAM IDs with recent activity (y1 or y2) — skip these for the floor
+    recent_activity_set: set = set()
+    for yr in [y1, y2]:
+        if yr in pitching_by_year:
+            recent_activity_set |= set(pitching_by_year[yr]["IDfg"].map(fg_to_mlbam).dropna().astype(int))
+
+    ids = pitcher_talent_df.index.astype(int)
+    floor = (
+        ids.isin(list(pitcher_pos_set))
+        & (total_ip.reindex(ids).fillna(0.0).to_numpy() < 30.0)
+        & (pitcher_talent_df["role"] == "SP").to_numpy()      # relievers stay as-is
+        & ~ids.isin(list(recent_activity_set))                 # recent activity — not TJ returnee
+    )
+    for col in PITCH_RATE_COLS:
+        if col in pitcher_talent_df.columns:
+            pitcher_talent_df.loc[floor, col] = round(LG_AVG_PITCH[col], 6)
+    floor_count = int(floor.sum())
+    return floor_count
+
+
+def project_season(target_season: int, inputs: dict,
+                   config: Optional[EROSPConfig] = None) -> pd.DataFrame:
+    """
+    Pre-season EROSP projection for `target_season` from load_inputs() data,
+    under `config` (default: erosp.config.DEFAULT_CONFIG).
+    """
+    historical_years = history_years(target_season)
+    extra_years      = pitcher_extra_years(target_season)
+    y1 = historical_years[0]
+    batting_by_year  = _years_of(inputs["batting_by_year"], historical_years)
+    pitching_by_year = _years_of(inputs["pitching_by_year"], historical_years + extra_years)
+    player_info_df   = inputs["player_info_df"]
+    fg_to_mlbam      = inputs["fg_to_mlbam"]
+    name_to_mlbam    = inputs["name_to_mlbam"]
+    schedule_summary = inputs["schedules"][target_season]
+    steamer          = inputs["steamer"][target_season]
+    steamer_bat_df, steamer_pit_df = inputs["steamer_stats"][target_season]
+    cfg              = config or DEFAULT_CONFIG
+    if not batting_by_year:
+        raise RuntimeError(f"No batting data for {target_season} history years.")
+
+    abbrev_to_team_id = {v["abbrev"]: k for k, v in schedule_summary.items()}
+
+    # ── Step 8: Talent estimation ──
+    print("─── Step 8: Talent estimation ────────────────────────────────────")
+    print("  Hitters:")
+    hitter_talent_df = estimate_hitter_talent(
+        batting_by_year  = batting_by_year,
+        historical_years = historical_years,
+        player_info_df   = player_info_df,
+        xwoba_by_year    = _years_of(inputs["xwoba_by_year"], historical_years[:2]),
+        sprint_speed_df  = inputs["sprint_speed_by_year"].get(y1),
+        target_season    = target_season,
+        fg_to_mlbam      = fg_to_mlbam,
+        name_to_mlbam    = name_to_mlbam,
+        config           = config,
+    )
 
-POS_NORMALIZE = {"LF": "OF", "CF": "OF", "RF": "OF"}
-projection_df["position"] = projection_df.index.map(
-    lambda mid: POS_NORMALIZE.get(str(position_map.get(mid, "—")), str(position_map.get(mid, "—")))
-)
-projection_df["games_remaining"] = projection_df["games_remaining"].fillna(FULL_SEASON_GAMES).astype(int)
-projection_df["erosp_per_game"]  = (
-    projection_df["erosp_startable"] / projection_df["games_remaining"].clip(lower=1)
-).round(3)
-print()
+    print("  Pitchers:")
+    pitcher_talent_df = estimate_pitcher_talent(
+        pitching_by_year = pitching_by_year,
+        historical_years = historical_years,
+        player_info_df   = player_info_df,
+        target_season    = target_season,
+        fg_to_mlbam      = fg_to_mlbam,
+        name_to_mlbam    = name_to_mlbam,
+        extra_years      = extra_years,   # Fix 2: 5yr lookback for TJ returnees
+        config           = config,
+    )
+    print()
+
+    # ── Step 8b: 40-man floor for returning/prospect pitchers (Fix 1) ──
+    print("─── Step 8b: Pitcher floor (TJ returnees / prospects) ───────────")
+    if not pitcher_talent_df.empty:
+        floor_count = _apply_pitcher_floor(pitcher_talent_df, pitching_by_year,
+                                           player_info_df, fg_to_mlbam, target_season)
+        print(f"  Floor applied to {floor_count} pitcher(s) with < 30 total IP (SP, absent y1/y2).")
+    print()
+
+    # ── Step 9: Playing time (with Steamer pre-season projections) ──
+    print("─── Step 9: Playing time (Steamer pre-season projections) ───────")
+    playing_time_df = build_playing_time(
+        hitter_talent_df  = hitter_talent_df,
+        pitcher_talent_df = pitcher_talent_df,
+        batting_by_year   = batting_by_year,
+        pitching_by_year  = pitching_by_year,
+        target_season     = target_season,
+        steamer_pa_map    = steamer["pa"] or None,
+        steamer_gs_map    = steamer["gs"] or None,
+        steamer_ip_map    = steamer["ip"] or None,
+        config            = config,
+    )
+    print()
+
+    # ── Step 9e: Projection-source ensemble ──
+    print("─── Step 9e: Projection-source ensemble ─────────────────────────")
+    projections_path = Path(str(PROJECTIONS_PATH).format(season=target_season))
+    espn_path = Path(str(ESPN_PROJ_PATH).format(season=target_season))
+    sources = [ProjectionSource("erosp", lambda: talent_rates(hitter_talent_df, pitcher_talent_df))]
+    if not (steamer_bat_df.empty and steamer_pit_df.empty):
+        sources.append(ProjectionSource(
+            "steamer", lambda: steamer_rates(steamer_bat_df, steamer_pit_df, fg_to_mlbam)))
+    if projections_path.exists():
+        sources.append(ProjectionSource("projections", lambda: projections_rates(projections_path)))
+    if espn_path.exists():
+        sources.append(ProjectionSource("espn", lambda: espn_rates(espn_path, {}, name_to_mlbam)))
+    measured = backtest_weights(OUTPUT_DIR, before=target_season)
+    weights = preseason_weights(ensemble_weights(cfg.source_weights, measured),
+                                season_remaining_share(schedule_summary, cfg))
+    if measured:
+        print("  Backtest weights: " + ", ".join(f"{n} {w:.0%}" for n, w in measured.items()))
+    rates = load_sources(sources, weights)
+    hitter_blend_df, pitcher_blend_df = blend_rates(
+        hitter_talent_df, pitcher_talent_df, playing_time_df, rates, weights, config=cfg,
+    )
+    print()
+
+    # ── Step 10: EROSP raw (no injury map — pre-season) ──
+    print("─── Step 10: EROSP raw (no injury deductions) ───────────────────")
+    projection_df = compute_all_erosp_raw(
+        hitter_talent_df      = hitter_blend_df,
+        pitcher_talent_df     = pitcher_blend_df,
+        playing_time_df       = playing_time_df,
+        schedule_summary      = schedule_summary,
+        mlb_team_abbrev_to_id = abbrev_to_team_id,
+        injury_map            = None,
+        config                = config,
+    )
+    print()
+
+    # ── Step 11: Replacement levels + startability (no ESPN roster) ──
+    print("─── Step 11: Replacement levels + startability ──────────────────")
+    h_proj = projection_df[projection_df["player_type"] == "hitter"] if not projection_df.empty else pd.DataFrame()
+    p_proj = projection_df[projection_df["player_type"].isin(["sp", "rp"])] if not projection_df.empty else pd.DataFrame()
+
+    replacement_levels = compute_replacement_levels(
+        hitter_projection_df  = h_proj,
+        pitcher_projection_df = p_proj,
+        hitter_talent_df      = hitter_talent_df,
+        pitcher_talent_df     = pitcher_talent_df,
+        config                = config,
+    )
 
+    # No ESPN roster → pass empty map; all players get fantasy_team_id=0
+    projection_df = compute_erosp_startable(
+        projection_df      = projection_df,
+        hitter_talent_df   = hitter_talent_df,
+        pitcher_talent_df  = pitcher_talent_df,
+        espn_roster_map    = {},
+        replacement_levels = replacement_levels,
+        config             = config,
+    )
+    print()
+
+    # ── Step 12: Attach position metadata ──
+    print("─── Step 12: Attach metadata ────────────────────────────────────")
+    position_map: dict = {}
+    if not hitter_talent_df.empty:
+        position_map.update(hitter_talent_df["mlb_position"].to_dict())
+    if not pitcher_talent_df.empty:
+        for mid, row in pitcher_talent_df.iterrows():
+            pos = str(row.get("mlb_position", row.get("role", "SP"))).upper()
+            if pos == "P":
+                pos = str(row.get("role", "SP")).upper()
+            position_map[mid] = pos
+
+    projection_df["position"] = projection_df.index.map(
+        lambda mid: POS_NORMALIZE.get(str(position_map.get(mid, "—")), str(position_map.get(mid, "—")))
+    )
+    projection_df["games_remaining"] = projection_df["games_remaining"].fillna(FULL_SEASON_GAMES).astype(int)
+    projection_df["erosp_per_game"]  = (
+        projection_df["erosp_startable"] / projection_df["games_remaining"].clip(lower=1)
+    ).round(3)
+    print()
+    return projection_df
+
+
+def output_records(projection_df: pd.DataFrame) -> List[dict]:
+    """Backtest JSON player records, best erosp_startable first (< 5 pts dropped)."""
+    output_players = []
+    seen_mlbam: set = set()
+    for mlbam_id, row in projection_df.sort_values("erosp_startable", ascending=False).iterrows():
+        if mlbam_id in seen_mlbam:
+            continue
+        seen_mlbam.add(mlbam_id)
+        erosp_startable = float(row.get("erosp_startable", 0))
+        erosp_raw       = float(row.get("erosp_raw", 0))
+        if erosp_startable < 5.0 and erosp_raw < 5.0:
+            continue
 
-# ---------------------------------------------------------------------------
-# STEP 13: Write backtest projection JSON
-# ---------------------------------------------------------------------------
-print("─── Step 13: Writing backtest projection ────────────────────────")
-output_dir = PROJECT_DIR / "data" / "erosp"
-output_dir.mkdir(exist_ok=True)
-
-output_players = []
-seen_mlbam: set = set()
-for mlbam_id, row in projection_df.sort_values("erosp_startable", ascending=False).iterrows():
-    if mlbam_id in seen_mlbam:
-        continue
-    seen_mlbam.add(mlbam_id)
-    erosp_startable = float(row.get("erosp_startable", 0))
-    erosp_raw       = float(row.get("erosp_raw", 0))
-    if erosp_startable < 5.0 and erosp_raw < 5.0:
-        continue
-
-    player: dict = {
-        "mlbam_id":        int(mlbam_id),
-        "name":            str(row.get("name", "")),
-        "position":        str(row.get("position", "—")),
-        "mlb_team":        str(row.get("mlb_team", "")),
-        "role":            str(row.get("role", "H")),
-        "erosp_raw":       round(erosp_raw, 1),
-        "erosp_startable": round(erosp_startable, 1),
-        "erosp_per_game":  round(float(row.get("erosp_per_game", 0)), 3),
-        "games_remaining": int(row.get("games_remaining", FULL_SEASON_GAMES)),
-        "start_probability": round(float(row.get("start_probability", 1.0)), 3),
-        "cap_factor":      round(float(row.get("cap_factor", 1.0)), 3),
-    }
-    output_players.append(player)
-
-backtest_json_path = output_dir / f"backtest_{TARGET_SEASON}.json"
-with open(backtest_json_path, "w") as f:
-    json.dump({
-        "generated_at":  datetime.datetime.utcnow().isoformat() + "Z",
-        "season":        TARGET_SEASON,
-        "target_type":   "backtest_preseason",
-        "history_years": HISTORICAL_YEARS,
-        "total_players": len(output_players),
-        "players":       output_players,
-    }, f, indent=2)
-print(f"  ✓ Wrote {len(output_players):,} players → {backtest_json_path.relative_to(PROJECT_DIR)}")
-print()
+        player: dict = {
+            "mlbam_id":        int(mlbam_id),
+            "name":            str(row.get("name", "")),
+            "position":        str(row.get("position", "—")),
+            "mlb_team":        str(row.get("mlb_team", "")),
+            "role":            str(row.get("role", "H")),
+            "erosp_raw":       round(erosp_raw, 1),
+            "erosp_startable": round(erosp_startable, 1),
+            "erosp_per_game":  round(float(row.get("erosp_per_game", 0)), 3),
+            "games_remaining": int(row.get("games_remaining", FULL_SEASON_GAMES)),
+            "start_probability": round(float(row.get("start_probability", 1.0)), 3),
+            "cap_factor":      round(float(row.get("cap_factor", 1.0)), 3),
+        }
+        output_players.append(player)
+    return output_players
 
 
 # ---------------------------------------------------------------------------
-# STEP 14: Compare vs. actual season results
+# Comparison vs. actual season results
 # ---------------------------------------------------------------------------
-print(f"\n{'='*65}")
-print(f"  COMPARISON: EROSP Pre-Season vs. Actual {TARGET_SEASON} Fantasy Points")
-print(f"{'='*65}\n")
-
-hist_path = PROJECT_DIR / "data" / "historical" / f"{TARGET_SEASON}.json"
-if not hist_path.exists():
-    print(f"ERROR: No historical data at {hist_path}")
-    sys.exit(1)
-
-with open(hist_path) as f:
-    hist_data = json.load(f)
-
-
-def norm_name(n: str) -> str:
-    """Normalize player name for fuzzy matching."""
-    return re.sub(r'[^a-z0-9]', '', n.lower().replace("jr.", "").replace("sr.", ""))
-
-
-# Build actual points map by normalized name (take max if player traded between teams)
-actual_by_norm: dict = {}
-for roster in hist_data.get("rosters", []):
-    for p in roster.get("players", []):
-        nm  = p.get("playerName", "")
-        pts = float(p.get("totalPoints", 0))
-        key = norm_name(nm)
-        if key not in actual_by_norm or pts > actual_by_norm[key]["pts"]:
-            actual_by_norm[key] = {
-                "name":     nm,
-                "pts":      pts,
-                "espn_id":  str(p.get("playerId", "")),
-                "position": p.get("position", ""),
-            }
-
-print(f"  Historical data:    {len(actual_by_norm):,} unique rostered players in {TARGET_SEASON}")
-print(f"  EROSP projections:  {len(output_players):,} players")
-
-# Match on normalized name
-matched = []
-unmatched_erosp = []
-for p in output_players:
-    key = norm_name(p["name"])
-    if key in actual_by_norm:
-        act = actual_by_norm[key]
-        matched.append({
-            "name":            p["name"],
-            "position":        p["position"],
-            "role":            p["role"],
-            "erosp_raw":       p["erosp_raw"],
-            "erosp_startable": p["erosp_startable"],
-            "actual_pts":      act["pts"],
-        })
-    else:
-        unmatched_erosp.append(p["name"])
-
-print(f"  Matched:            {len(matched):,} players")
-print(f"  EROSP-only (FA/minors/unrostered): {len(unmatched_erosp):,}")
-unmatched_actual = [v["name"] for k, v in actual_by_norm.items()
-                    if k not in {norm_name(p["name"]) for p in output_players}]
-print(f"  Actual-only (no EROSP projection): {len(unmatched_actual):,}")
-print()
-
-df_m = pd.DataFrame(matched)
-df_m = df_m[df_m["actual_pts"] > 0].copy()
-print(f"  Matched with >0 actual pts: {len(df_m):,} players\n")
-
-if len(df_m) < 20:
-    print("Not enough matched players for meaningful analysis.")
-    sys.exit(1)
-
-# Add rank columns
-df_m["proj_rank"]   = df_m["erosp_raw"].rank(ascending=False).astype(int)
-df_m["actual_rank"] = df_m["actual_pts"].rank(ascending=False).astype(int)
-df_m["error"]       = df_m["erosp_raw"] - df_m["actual_pts"]
-df_m["abs_error"]   = df_m["error"].abs()
-df_m["rank_diff"]   = df_m["proj_rank"] - df_m["actual_rank"]  # positive = projected too low
-
 
 def pearson_r(x, y):
     xm = x - x.mean()
@@ -571,85 +625,331 @@ def spearman_r(x, y):
     return pearson_r(rx, ry)
 
 
-# ── Overall stats ──
-print("  ── Overall Accuracy ──────────────────────────────────────────")
-for col, label in [("erosp_raw", "EROSP Raw"), ("erosp_startable", "EROSP Startable")]:
-    x   = df_m[col]
-    y   = df_m["actual_pts"]
-    r   = pearson_r(x, y)
-    rho = spearman_r(x, y)
-    rmse = np.sqrt(((x - y) ** 2).mean())
-    mae  = (x - y).abs().mean()
-    bias = (x - y).mean()
-    n    = len(df_m)
-    print(f"\n  {label}  (n={n})")
-    print(f"    Pearson  r  = {r:.3f}")
-    print(f"    Spearman ρ  = {rho:.3f}")
-    print(f"    RMSE        = {rmse:.1f} pts")
-    print(f"    MAE         = {mae:.1f} pts")
-    print(f"    Bias        = {bias:+.1f} pts  ({'over' if bias > 0 else 'under'}-projected on average)")
-print()
-
-# ── Top 25 players by EROSP Raw ──
-print("  ── Top 25 by EROSP Raw — did we rank them correctly? ──────────")
-print(f"  {'#':>3}  {'Name':<26} {'Pos':<4} {'Proj':>6}  {'Actual':>6}  {'Err':>7}  {'ActRank':>7}")
-print(f"  {'-'*70}")
-top25 = df_m.nlargest(25, "erosp_raw")
-for i, (idx, r) in enumerate(top25.iterrows(), 1):
-    err_str = f"{r['error']:+.0f}"
-    print(f"  #{i:>2}  {r['name']:<26} {r['position']:<4} {r['erosp_raw']:>6.0f}  {r['actual_pts']:>6.0f}  {err_str:>7}  #{r['actual_rank']:>3}")
-print()
-
-# ── Biggest over-projections ──
-print("  ── Biggest OVER-projections (too optimistic) ───────────────────")
-print(f"  {'Name':<26} {'Pos':<4} {'Proj':>6}  {'Actual':>6}  {'Error':>7}  {'Note'}")
-print(f"  {'-'*72}")
-over = df_m.nlargest(15, "error")
-for _, r in over.iterrows():
-    note = "injury" if r["actual_pts"] < r["erosp_raw"] * 0.4 else ""
-    print(f"  {r['name']:<26} {r['position']:<4} {r['erosp_raw']:>6.0f}  {r['actual_pts']:>6.0f}  {r['error']:>+7.0f}  {note}")
-print()
-
-# ── Biggest under-projections ──
-print("  ── Biggest UNDER-projections (too conservative) ────────────────")
-print(f"  {'Name':<26} {'Pos':<4} {'Proj':>6}  {'Actual':>6}  {'Error':>7}")
-print(f"  {'-'*65}")
-under = df_m.nsmallest(15, "error")
-for _, r in under.iterrows():
-    print(f"  {r['name']:<26} {r['position']:<4} {r['erosp_raw']:>6.0f}  {r['actual_pts']:>6.0f}  {r['error']:>+7.0f}")
-print()
-
-# ── Accuracy by position ──
-print("  ── Rank Accuracy by Position ───────────────────────────────────")
-print(f"  {'Pos':<4} {'n':>4}  {'Pearson r':>9}  {'Spearman ρ':>10}  {'RMSE':>6}  {'MAE':>6}  {'Bias':>7}")
-print(f"  {'-'*60}")
-for pos in ["C", "1B", "2B", "3B", "SS", "OF", "SP", "RP", "DH"]:
-    if pos in ("SP", "RP"):
-        sub = df_m[df_m["role"] == pos]
-    else:
-        sub = df_m[df_m["position"] == pos]
-    if len(sub) < 5:
-        continue
-    x   = sub["erosp_raw"]
-    y   = sub["actual_pts"]
-    r   = pearson_r(x, y)
-    rho = spearman_r(x, y)
-    rmse = np.sqrt(((x - y) ** 2).mean())
-    mae  = (x - y).abs().mean()
-    bias = (x - y).mean()
-    print(f"  {pos:<4} {len(sub):>4}  {r:>9.3f}  {rho:>10.3f}  {rmse:>6.1f}  {mae:>6.1f}  {bias:>+7.1f}")
-print()
-
-# ── Save comparison CSV ──
-csv_path = output_dir / f"backtest_{TARGET_SEASON}.csv"
-df_m.sort_values("erosp_raw", ascending=False).to_csv(csv_path, index=False)
-print(f"  ✓ Saved comparison CSV → {csv_path.relative_to(PROJECT_DIR)}")
-
-print(f"\n{'='*65}")
-print(f"  ✓ Backtest complete for {TARGET_SEASON}")
-print(f"    n={len(df_m):,} matched players")
-top5 = output_players[:5]
-print(f"    Top 5 projected:")
-for p in top5:
-    print(f"      {p['name']:<24} {p['position']:<4} EROSP_R={p['erosp_raw']:.0f}")
-print(f"{'='*65}\n")
+def match_actuals(output_players: List[dict], actual_by_norm: dict) -> tuple:
+    """
+    Match projections to actual points on normalized name.
+    Returns (df_m, unmatched_erosp, unmatched_actual); df_m keeps players
+    with > 0 actual points and carries rank / error columns.
+    """
+    matched = []
+    unmatched_erosp = []
+    erosp_keys = set()
+    for p in output_players:
+        key = normalize(p["name"])
+        erosp_keys.add(key)
+        if key in actual_by_norm:
+            act = actual_by_norm[key]
+            matched.append({
+                "name":            p["name"],
+                "position":        p["position"],
+                "role":            p["role"],
+                "erosp_raw":       p["erosp_raw"],
+                "erosp_startable": p["erosp_startable"],
+                "actual_pts":      act["pts"],
+            })
+        else:
+            unmatched_erosp.append(p["name"])
+    unmatched_actual = [v["name"] for k, v in actual_by_norm.items() if k not in erosp_keys]
+
+    df_m = pd.DataFrame(matched, columns=["name", "position", "role", "erosp_raw",
+                                          "erosp_startable", "actual_pts"])
+    df_m = df_m[df_m["actual_pts"] > 0].copy()
+
+    df_m["proj_rank"]   = df_m["erosp_raw"].rank(ascending=False).astype(int)
+    df_m["actual_rank"] = df_m["actual_pts"].rank(ascending=False).astype(int)
+    df_m["error"]       = df_m["erosp_raw"] - df_m["actual_pts"]
+    df_m["abs_error"]   = df_m["error"].abs()
+    df_m["rank_diff"]   = df_m["proj_rank"] - df_m["actual_rank"]  # positive = projected too low
+    return df_m, unmatched_erosp, unmatched_actual
+
+
+def accuracy_metrics(x: pd.Series, y: pd.Series) -> dict:
+    """n, Pearson r, Spearman ρ, RMSE, MAE and bias of projection x against actual y."""
+    return {
+        "n":        len(x),
+        "pearson":  pearson_r(x, y),
+        "spearman": spearman_r(x, y),
+        "rmse":     np.sqrt(((x - y) ** 2).mean()),
+        "mae":      (x - y).abs().mean(),
+        "bias":     (x - y).mean(),
+    }
+
+
+def accuracy_table(target_season: int, df_m: pd.DataFrame) -> pd.DataFrame:
+    """
+    One row per (projection, scope, group): overall for erosp_raw and
+    erosp_startable, then erosp_raw per hitter position and per role
+    (groups under MIN_GROUP_SIZE players are left out).
+    """
+    y = df_m["actual_pts"]
+    rows = [{"season": target_season, "projection": col, "scope": "overall", "group": "all",
+             **accuracy_metrics(df_m[col], y)}
+            for col in ("erosp_raw", "erosp_startable")]
+    for scope, key, groups in (("position", "position", HITTER_POSITIONS), ("role", "role", ROLES)):
+        for group in groups:
+            sub = df_m[df_m[key] == group]
+            if len(sub) < MIN_GROUP_SIZE:
+                continue
+            rows.append({"season": target_season, "projection": "erosp_raw", "scope": scope,
+                         "group": group, **accuracy_metrics(sub["erosp_raw"], sub["actual_pts"])})
+    return pd.DataFrame(rows, columns=ACCURACY_COLUMNS)
+
+
+def print_report(target_season: int, df_m: pd.DataFrame, accuracy: pd.DataFrame) -> None:
+    # ── Overall stats ──
+    print("  ── Overall Accuracy ──────────────────────────────────────────")
+    overall = accuracy[accuracy["scope"] == "overall"].set_index("projection")
+    for col, label in [("erosp_raw", "EROSP Raw"), ("erosp_startable", "EROSP Startable")]:
+        a = overall.loc[col]
+        print(f"\n  {label}  (n={a['n']})")
+        print(f"    Pearson  r  = {a['pearson']:.3f}")
+        print(f"    Spearman ρ  = {a['spearman']:.3f}")
+        print(f"    RMSE        = {a['rmse']:.1f} pts")
+        print(f"    MAE         = {a['mae']:.1f} pts")
+        print(f"    Bias        = {a['bias']:+.1f} pts  ({'over' if a['bias'] > 0 else 'under'}-projected on average)")
+    print()
+
+    # ── Top 25 players by EROSP Raw ──
+    print("  ── Top 25 by EROSP Raw — did we rank them correctly? ──────────")
+    print(f"  {'#':>3}  {'Name':<26} {'Pos':<4} {'Proj':>6}  {'Actual':>6}  {'Err':>7}  {'ActRank':>7}")
+    print(f"  {'-'*70}")
+    top25 = df_m.nlargest(25, "erosp_raw")
+    for i, (idx, r) in enumerate(top25.iterrows(), 1):
+        err_str = f"{r['error']:+.0f}"
+        print(f"  #{i:>2}  {r['name']:<26} {r['position']:<4} {r['erosp_raw']:>6.0f}  {r['actual_pts']:>6.0f}  {err_str:>7}  #{r['actual_rank']:>3}")
+    print()
+
+    # ── Biggest over-projections ──
+    print("  ── Biggest OVER-projections (too optimistic) ───────────────────")
+    print(f"  {'Name':<26} {'Pos':<4} {'Proj':>6}  {'Actual':>6}  {'Error':>7}  {'Note'}")
+    print(f"  {'-'*72}")
+    over = df_m.nlargest(15, "error")
+    for _, r in over.iterrows():
+        note = "injury" if r["actual_pts"] < r["erosp_raw"] * 0.4 else ""
+        print(f"  {r['name']:<26} {r['position']:<4} {r['erosp_raw']:>6.0f}  {r['actual_pts']:>6.0f}  {r['error']:>+7.0f}  {note}")
+    print()
+
+    # ── Biggest under-projections ──
+    print("  ── Biggest UNDER-projections (too conservative) ────────────────")
+    print(f"  {'Name':<26} {'Pos':<4} {'Proj':>6}  {'Actual':>6}  {'Error':>7}")
+    print(f"  {'-'*65}")
+    under = df_m.nsmallest(15, "error")
+    for _, r in under.iterrows():
+        print(f"  {r['name']:<26} {r['position']:<4} {r['erosp_raw']:>6.0f}  {r['actual_pts']:>6.0f}  {r['error']:>+7.0f}")
+    print()
+
+    # ── Accuracy by position ──
+    print("  ── Rank Accuracy by Position ───────────────────────────────────")
+    print(f"  {'Pos':<4} {'n':>4}  {'Pearson r':>9}  {'Spearman ρ':>10}  {'RMSE':>6}  {'MAE':>6}  {'Bias':>7}")
+    print(f"  {'-'*60}")
+    by_group = {(r.scope, r.group): r for r in accuracy.itertuples()}
+    for pos in ["C", "1B", "2B", "3B", "SS", "OF", "SP", "RP", "DH"]:
+        a = by_group.get(("role" if pos in ("SP", "RP") else "position", pos))
+        if a is None:
+            continue
+        print(f"  {pos:<4} {a.n:>4}  {a.pearson:>9.3f}  {a.spearman:>10.3f}  {a.rmse:>6.1f}  {a.mae:>6.1f}  {a.bias:>+7.1f}")
+    print()
+
+
+def run_backtest(target_season: int, inputs: Optional[dict] = None,
+                 report: bool = True) -> pd.DataFrame:
+    """
+    Backtest one season: project it pre-season, write backtest_{year}.json /
+    .csv and return its accuracy_table(). `inputs` comes from load_inputs()
+    (loaded for just this season when omitted) and is not modified.
+    Raises RuntimeError when there is nothing to compare against.
+    """
+    historical_years = history_years(target_season)
+    y1, y2, y3 = historical_years
+
+    print(f"\n{'='*65}")
+    print(f"  EROSP BACKTEST")
+    print(f"{'='*65}")
+    print(f"  Target season:  {target_season}")
+    print(f"  History years:  {y1}, {y2}, {y3}")
+    print(f"  Mode:           Pre-season (no current-year stats, no injuries)")
+    print(f"  Run date:       {datetime.date.today().strftime('%B %d, %Y')}")
+    print(f"{'='*65}\n")
+
+    if inputs is None:
+        inputs = load_inputs([target_season])
+    projection_df = project_season(target_season, inputs)
+
+    # ── Step 13: Write backtest projection JSON ──
+    print("─── Step 13: Writing backtest projection ────────────────────────")
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    output_players = output_records(projection_df)
+    backtest_json_path = OUTPUT_DIR / f"backtest_{target_season}.json"
+    with open(backtest_json_path, "w") as f:
+        json.dump({
+            "generated_at":  datetime.datetime.utcnow().isoformat() + "Z",
+            "season":        target_season,
+            "target_type":   "backtest_preseason",
+            "history_years": historical_years,
+            "total_players": len(output_players),
+            "players":       output_players,
+        }, f, indent=2)
+    print(f"  ✓ Wrote {len(output_players):,} players → {backtest_json_path.relative_to(PROJECT_DIR)}")
+    print()
+
+    # ── Step 14: Compare vs. actual season results ──
+    print(f"\n{'='*65}")
+    print(f"  COMPARISON: EROSP Pre-Season vs. Actual {target_season} Fantasy Points")
+    print(f"{'='*65}\n")
+
+    actual_by_norm = inputs["actuals"].get(target_season)
+    if actual_by_norm is None:
+        raise RuntimeError(f"No historical data at {HIST_DIR / f'{target_season}.json'}")
+
+    print(f"  Historical data:    {len(actual_by_norm):,} unique rostered players in {target_season}")
+    print(f"  EROSP projections:  {len(output_players):,} players")
+    df_m, unmatched_erosp, unmatched_actual = match_actuals(output_players, actual_by_norm)
+    n_matched = len(output_players) - len(unmatched_erosp)
+    print(f"  Matched:            {n_matched:,} players")
+    print(f"  EROSP-only (FA/minors/unrostered): {len(unmatched_erosp):,}")
+    print(f"  Actual-only (no EROSP projection): {len(unmatched_actual):,}")
+    print()
+    print(f"  Matched with >0 actual pts: {len(df_m):,} players\n")
+
+    if len(df_m) < 20:
+        raise RuntimeError("Not enough matched players for meaningful analysis.")
+
+    accuracy = accuracy_table(target_season, df_m)
+    if report:
+        print_report(target_season, df_m, accuracy)
+
+    # ── Save comparison CSV ──
+    csv_path = OUTPUT_DIR / f"backtest_{target_season}.csv"
+    df_m.sort_values("erosp_raw", ascending=False).to_csv(csv_path, index=False)
+    print(f"  ✓ Saved comparison CSV → {csv_path.relative_to(PROJECT_DIR)}")
+
+    print(f"\n{'='*65}")
+    print(f"  ✓ Backtest complete for {target_season}")
+    print(f"    n={len(df_m):,} matched players")
+    top5 = output_players[:5]
+    print(f"    Top 5 projected:")
+    for p in top5:
+        print(f"      {p['name']:<24} {p['position']:<4} EROSP_R={p['erosp_raw']:.0f}")
+    print(f"{'='*65}\n")
+    return accuracy
+
+
+# ---------------------------------------------------------------------------
+# Multi-season harness
+# ---------------------------------------------------------------------------
+
+_WORKER_INPUTS: Optional[dict] = None
+
+
+def _init_worker(inputs: dict) -> None:
+    # Under fork the inputs are inherited copy-on-write; spawn/forkserver
+    # unpickle them once per worker rather than once per season.
+    global _WORKER_INPUTS
+    _WORKER_INPUTS = inputs
+
+
+def _backtest_worker(target_season: int) -> pd.DataFrame:
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    with open(LOG_DIR / f"backtest_{target_season}.log", "w") as log, \
+            contextlib.redirect_stdout(log):
+        return run_backtest(target_season, _WORKER_INPUTS, report=False)
+
+
+def print_summary(summary: pd.DataFrame) -> None:
+    print(f"  {'Season':<6} {'Scope':<8} {'Group':<15} {'n':>4}  {'Pearson r':>9}  "
+          f"{'Spearman ρ':>10}  {'RMSE':>6}  {'MAE':>6}  {'Bias':>7}")
+    print(f"  {'-'*84}")
+    for r in summary.itertuples():
+        group = r.group if r.scope != "overall" else (
+            "all (raw)" if r.projection == "erosp_raw" else "all (startable)")
+        print(f"  {r.season:<6} {r.scope:<8} {group:<15} {r.n:>4}  {r.pearson:>9.3f}  "
+              f"{r.spearman:>10.3f}  {r.rmse:>6.1f}  {r.mae:>6.1f}  {r.bias:>+7.1f}")
+    print()
+
+
+def backtest_seasons(target_seasons: List[int], workers: Optional[int] = None,
+                     summary_path: Optional[Path] = SUMMARY_PATH) -> pd.DataFrame:
+    """
+    Backtest each of `target_seasons` in a process pool of `workers`
+    (default: one per season, capped at the CPU count) and return the
+    consolidated accuracy table, also written to `summary_path` unless None.
+    Inputs for every season are loaded once up front and shared read-only.
+    Seasons that fail are reported and left out of the table.
+    """
+    target_seasons = sorted(set(target_seasons))
+    workers = workers or min(len(target_seasons), os.cpu_count() or 1)
+
+    print(f"\n{'='*65}")
+    print(f"  EROSP MULTI-SEASON BACKTEST")
+    print(f"{'='*65}")
+    print(f"  Target seasons: {', '.join(map(str, target_seasons))}")
+    print(f"  Workers:        {workers}")
+    print(f"  Season logs:    {LOG_DIR.relative_to(SCRIPT_DIR)}/")
+    print(f"{'='*65}\n")
+
+    inputs = load_inputs(target_seasons)
+
+    print(f"─── Backtesting {len(target_seasons)} season(s) ─────────────────────────────────")
+    tables: Dict[int, pd.DataFrame] = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(inputs,)) as pool:
+        futures = {pool.submit(_backtest_worker, t): t for t in target_seasons}
+        for future in as_completed(futures):
+            season = futures[future]
+            try:
+                tables[season] = future.result()
+                print(f"  ✓ {season}: n={tables[season]['n'].iloc[0]:,} matched players")
+            except Exception as exc:
+                print(f"  WARNING: {season} backtest failed: {exc}")
+    print()
+
+    if not tables:
+        raise RuntimeError("Every season's backtest failed — see the season logs.")
+    summary = pd.concat([tables[t] for t in sorted(tables)], ignore_index=True)
+
+    print("  ── Accuracy by Season ────────────────────────────────────────")
+    print_summary(summary)
+    if summary_path is not None:
+        summary.round(4).to_csv(summary_path, index=False)
+        print(f"  ✓ Saved summary CSV → {summary_path.relative_to(PROJECT_DIR)}\n")
+    return summary
+
+
+def parse_years(value: str) -> List[int]:
+    """'2022-2025' or '2022,2024,2025' → [2022, ...]"""
+    years: List[int] = []
+    try:
+        for part in value.split(","):
+            lo, _, hi = part.strip().partition("-")
+            years += range(int(lo), int(hi or lo) + 1)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"bad season range {value!r}; use e.g. 2022-2025")
+    if not years:
+        raise argparse.ArgumentTypeError(f"bad season range {value!r}; use e.g. 2022-2025")
+    return years
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Backtest EROSP against actual season results")
+    parser.add_argument("--target-year", type=int, default=2025,
+                        help="Season year to backtest (default: 2025)")
+    parser.add_argument("--years", type=parse_years, default=None,
+                        help="Backtest a range of seasons in parallel, e.g. 2022-2025 "
+                             "(writes data/erosp/backtest_summary.csv)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes for --years (default: one per season, up to CPU count)")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.years:
+            backtest_seasons(args.years, workers=args.workers)
+        else:
+            run_backtest(args.target_year)
+    except RuntimeError as exc:
+        print(f"\nERROR: {exc}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,165 +1,110 @@
 #!/usr/bin/env python3
 """
-Benchmark Steamer pre-season projections vs. actual CBA fantasy points.
+Benchmark Steamer pre-season projections vs. EROSP and actual CBA fantasy points.
 
-Fetches Steamer projections for the target year from FanGraphs API,
-converts counting stats → CBA scoring, then compares accuracy head-to-head
-with the EROSP backtest numbers.
+Reads Steamer projections for the target year from erosp_cache/steamer/
+(fetched from the FanGraphs API only when missing, or with --refresh),
+converts counting stats → CBA scoring column-wise, and scores them against
+data/historical/{year}.json. EROSP's side of the head-to-head is computed from
+the backtest's matched table (data/erosp/backtest_{year}.csv — run
+backtest_erosp.py for that year first), so the comparison is always current.
+
+The head-to-head uses the players both systems matched. Confidence intervals
+are percentile bootstraps over those players (resampled with replacement,
+paired across the two systems); replicates are computed in chunks across a
+process pool and are reproducible for a given --seed whatever --workers is.
 
 Usage:
     cd /path/to/cba-site/scripts
     python3 benchmark_steamer.py [--target-year 2025]
+    python3 benchmark_steamer.py --bootstrap 5000 --workers 4
+    python3 benchmark_steamer.py --refresh             re-fetch Steamer from FanGraphs
 
 Output:
-    data/erosp/steamer_benchmark_{year}.csv  — matched comparison table
+    data/erosp/steamer_benchmark_{year}.csv     — matched comparison table
+    data/erosp/steamer_head_to_head_{year}.csv  — EROSP vs. Steamer metrics with CIs
+    erosp_cache/steamer/steamer_{bat,pit}_{year}.csv — Steamer cache (untracked;
+                                                       data/erosp/steamer_raw_* is not written)
     Summary stats + EROSP head-to-head printed to stdout
 """
 
-import re
+import os
 import sys
-import json
 import argparse
 import datetime
 import warnings
-import unicodedata
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Dict, List, Optional
 
 import pandas as pd
 import numpy as np
-import requests
-
-warnings.filterwarnings("ignore")
 
 SCRIPT_DIR  = Path(__file__).parent
 PROJECT_DIR = SCRIPT_DIR.parent
+sys.path.insert(0, str(SCRIPT_DIR))
 
-# ---------------------------------------------------------------------------
-# Args
-# ---------------------------------------------------------------------------
-parser = argparse.ArgumentParser(description="Benchmark Steamer vs. actual CBA results")
-parser.add_argument("--target-year", type=int, default=2025,
-                    help="Season year to benchmark (default: 2025)")
-args = parser.parse_args()
-
-TARGET_SEASON = args.target_year
-
-# EROSP backtest results to compare against (update if you re-run the backtest)
-EROSP_STATS = {
-    "n":          388,
-    "pearson_r":  0.420,
-    "spearman":   0.410,
-    "rmse":       160.1,
-    "bias":       +0.9,
-}
-
-print(f"\n{'='*65}")
-print(f"  STEAMER BENCHMARK  vs.  {TARGET_SEASON} CBA ACTUAL RESULTS")
-print(f"{'='*65}")
-print(f"  Target season:  {TARGET_SEASON}")
-print(f"  Run date:       {datetime.date.today().strftime('%B %d, %Y')}")
-print(f"{'='*65}\n")
-
-# ---------------------------------------------------------------------------
-# CBA scoring (mirrors config.py)
-# ---------------------------------------------------------------------------
-SCORING = {
-    "single": 2.0, "double": 3.0, "triple": 4.0, "hr": 5.0,
-    "r":  1.0, "rbi": 1.0, "bb": 1.0, "hbp": 1.0,
-    "k": -1.0, "sb": 2.0,  "cs": -1.0, "gidp": -0.25,
-    # pitching
-    "ip": 3.0, "ha": -1.0, "er": -2.0, "bba": -1.0, "kp": 1.0,
-    "w":  3.0, "l":  -3.0, "sv":  5.0, "bs":  -2.0,
-    "hd": 3.0, "qs":  3.0,
-}
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-def norm_name(n: str) -> str:
-    """Normalize player name: strip diacritics, lowercase, alphanumeric only."""
-    # Strip diacritics (é→e, á→a, í→i, etc.) before regex so accented FanGraphs
-    # names match unaccented ESPN names (e.g. "José Ramírez" → "joseramirez")
-    n = unicodedata.normalize("NFD", str(n))
-    n = "".join(c for c in n if unicodedata.category(c) != "Mn")
-    n = n.lower().replace("jr.", "").replace("sr.", "")
-    return re.sub(r"[^a-z0-9]", "", n)
-
-
-def safe_float(val, default: float = 0.0) -> float:
-    try:
-        f = float(val)
-        return default if (f != f) else f   # NaN guard
-    except (TypeError, ValueError):
-        return default
+from backtest_erosp import (
+    OUTPUT_DIR, STEAMER_CACHE_DIR, ROLES, MIN_GROUP_SIZE, load_actuals, accuracy_metrics,
+)
+from erosp.config import DEFAULT_CONFIG, EROSPConfig
+from erosp.names import normalize_many
 
+warnings.filterwarnings("ignore")
 
-def row_get(row, col: str, default: float = 0.0) -> float:
-    return safe_float(row.get(col, default), default)
+FG_BASE    = "https://www.fangraphs.com/api/projections"
+FG_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; CBA-benchmarker/1.0)"}
 
+# Steamer column → CBA scoring event, summed in this order
+_BATTER_SCORING = (
+    ("1B",  "single"),   # FanGraphs provides 1B directly — no need to derive singles
+    ("2B",  "double"),
+    ("3B",  "triple"),
+    ("HR",  "hr"),
+    ("R",   "r"),
+    ("RBI", "rbi"),
+    ("BB",  "bb"),       # total walks (includes IBB) — CBA scores IBB = +1 same as BB
+    ("HBP", "hbp"),
+    ("SO",  "k"),
+    ("SB",  "sb"),
+    ("CS",  "cs"),
+    ("GDP", "gidp"),
+)
+
+_PITCHER_SCORING = (
+    ("IP",  "ip"),
+    ("H",   "ha"),
+    ("ER",  "er"),
+    ("BB",  "bba"),
+    ("SO",  "kp"),
+    ("W",   "w"),
+    ("L",   "l"),
+    ("SV",  "sv"),
+    ("BS",  "bs"),
+    ("HLD", "hd"),
+    ("QS",  "qs"),
+)
+
+# Columns kept in the Steamer cache: identity + playing time + everything scored
+STEAMER_COLUMNS = {
+    "bat": ["playerid", "PlayerName", "PA"] + [c for c, _ in _BATTER_SCORING],
+    "pit": ["playerid", "PlayerName", "G", "GS"] + [c for c, _ in _PITCHER_SCORING],
+}
 
-def steamer_batter_fp(row) -> float:
-    """Convert Steamer batting projection row → CBA fantasy points.
+MIN_PITCHER_IP = 15.0
 
-    FanGraphs Steamer provides 1B directly, so no need to derive singles.
-    BB is total walks (includes IBB) — matches CBA scoring where IBB = +1 same as BB.
-    """
-    return (
-        row_get(row, "1B")    * SCORING["single"] +
-        row_get(row, "2B")    * SCORING["double"] +
-        row_get(row, "3B")    * SCORING["triple"] +
-        row_get(row, "HR")    * SCORING["hr"]     +
-        row_get(row, "R")     * SCORING["r"]      +
-        row_get(row, "RBI")   * SCORING["rbi"]    +
-        row_get(row, "BB")    * SCORING["bb"]     +
-        row_get(row, "HBP")   * SCORING["hbp"]    +
-        row_get(row, "SO")    * SCORING["k"]      +
-        row_get(row, "SB")    * SCORING["sb"]     +
-        row_get(row, "CS")    * SCORING["cs"]     +
-        row_get(row, "GDP")   * SCORING["gidp"]
-    )
-
-
-def steamer_pitcher_fp(row) -> float:
-    """Convert Steamer pitching projection row → CBA fantasy points."""
-    sv  = row_get(row, "SV")
-    hld = row_get(row, "HLD")
-    qs  = row_get(row, "QS")
-    # BS: use explicit col if Steamer provides it, else estimate 12% of save opps
-    bs  = row_get(row, "BS") if ("BS" in row and row_get(row, "BS") > 0) else sv * 0.12
-    return (
-        row_get(row, "IP")  * SCORING["ip"]  +
-        row_get(row, "H")   * SCORING["ha"]  +
-        row_get(row, "ER")  * SCORING["er"]  +
-        row_get(row, "BB")  * SCORING["bba"] +
-        row_get(row, "SO")  * SCORING["kp"]  +
-        row_get(row, "W")   * SCORING["w"]   +
-        row_get(row, "L")   * SCORING["l"]   +
-        sv                  * SCORING["sv"]  +
-        bs                  * SCORING["bs"]  +
-        hld                 * SCORING["hd"]  +
-        qs                  * SCORING["qs"]
-    )
-
-
-def pearson_r(x: pd.Series, y: pd.Series) -> float:
-    xm, ym = x - x.mean(), y - y.mean()
-    denom = (np.sqrt((xm**2).sum()) * np.sqrt((ym**2).sum()))
-    return float((xm * ym).sum() / denom) if denom > 0 else 0.0
-
-
-def spearman_r(x: pd.Series, y: pd.Series) -> float:
-    return pearson_r(x.rank(), y.rank())
+METRICS = ("pearson", "spearman", "rmse", "mae", "bias")
+LOWER_IS_BETTER = {"pearson": False, "spearman": False, "rmse": True, "mae": True, "bias": True}
+BOOTSTRAP_CHUNK = 250   # replicates per pool task; fixed so results don't depend on --workers
 
 
 # ---------------------------------------------------------------------------
-# Fetch Steamer from FanGraphs
+# Steamer projections
 # ---------------------------------------------------------------------------
-FG_BASE   = "https://www.fangraphs.com/api/projections"
-FG_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; CBA-benchmarker/1.0)"}
-
 
 def fetch_steamer(stats: str, season: int) -> pd.DataFrame:
+    import requests
+
     url = (f"{FG_BASE}?type=steamer&stats={stats}&pos=all"
            f"&team=0&players=0&lg=all&season={season}")
     print(f"  GET {url}")
@@ -173,267 +118,473 @@ def fetch_steamer(stats: str, season: int) -> pd.DataFrame:
     return df
 
 
-print("─── Step 1: Steamer batting projections ──────────────────────────")
-try:
-    bat_df = fetch_steamer("bat", TARGET_SEASON)
-except Exception as exc:
-    print(f"  ERROR fetching batting: {exc}")
-    sys.exit(1)
-print()
+def load_steamer_raw(stats: str, season: int, refresh: bool = False) -> pd.DataFrame:
+    """
+    Steamer "bat" or "pit" projections for `season` from
+    erosp_cache/steamer/steamer_{stats}_{season}.csv, fetching (and caching)
+    them when the file is missing or `refresh`. The committed
+    data/erosp/steamer_raw_* files hold playing time only (backtest_erosp.py's
+    input) and are left alone.
+    """
+    path = STEAMER_CACHE_DIR / f"steamer_{stats}_{season}.csv"
+    if path.exists() and not refresh:
+        df = pd.read_csv(path)
+        print(f"  Cache hit  → {path.name} ({len(df):,} rows)")
+        return df
+
+    try:
+        df = fetch_steamer(stats, season)
+    except Exception as exc:
+        raise RuntimeError(f"Steamer {stats} projections unavailable: {exc}") from exc
+    cols = [c for c in STEAMER_COLUMNS[stats] if c in df.columns]
+    if "playerid" in cols:
+        df = df.dropna(subset=["playerid"])
+    STEAMER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    df[cols].to_csv(path, index=False)
+    print(f"  Cached Steamer {stats} raw → {path.name}")
+    return df[cols]
+
+
+def _stat(df: pd.DataFrame, col: str) -> np.ndarray:
+    """Numeric column as floats; missing, NaN or unparseable values count as 0."""
+    if col not in df.columns:
+        return np.zeros(len(df))
+    return pd.to_numeric(df[col], errors="coerce").fillna(0.0).to_numpy(dtype=float)
+
+
+def steamer_batter_fp(df: pd.DataFrame, config: Optional[EROSPConfig] = None) -> np.ndarray:
+    """CBA fantasy points for every row of a Steamer batting projection frame."""
+    scoring = (config or DEFAULT_CONFIG).scoring
+    fp = np.zeros(len(df))
+    for col, event in _BATTER_SCORING:
+        fp = fp + _stat(df, col) * scoring[event]
+    return fp
+
+
+def steamer_pitcher_fp(df: pd.DataFrame, config: Optional[EROSPConfig] = None) -> np.ndarray:
+    """
+    CBA fantasy points for every row of a Steamer pitching projection frame.
+    BS uses Steamer's column where positive, else 12% of projected saves.
+    """
+    scoring = (config or DEFAULT_CONFIG).scoring
+    bs = _stat(df, "BS")
+    derived = {"BS": np.where(bs > 0, bs, _stat(df, "SV") * 0.12)}
+    fp = np.zeros(len(df))
+    for col, event in _PITCHER_SCORING:
+        fp = fp + (derived[col] if col in derived else _stat(df, col)) * scoring[event]
+    return fp
+
+
+def steamer_pool(bat_df: pd.DataFrame, pit_df: pd.DataFrame,
+                 config: Optional[EROSPConfig] = None) -> tuple:
+    """
+    One Steamer projection per normalized name → (pool, twp_count); pool is
+    indexed by norm_name with name / role / steamer_fp, batters first.
+
+    Multi-team splits keep their highest-FP row. Pitchers with fewer than
+    MIN_PITCHER_IP projected IP are left out, and a pitcher sharing a name
+    with a batter is resolved as:
+      batter ≥ 200 FP           two-way player (Ohtani) — FP summed, pitcher role
+      batter < 50 FP, ≥ 100 IP  a real ace (e.g. Luis Castillo) — pitcher wins
+      otherwise                 batter kept (stops a minor-league "Juan Soto"
+                                pitcher from erasing the star hitter)
+    """
+    bat = bat_df.assign(norm_name=normalize_many(bat_df["PlayerName"]),
+                        steamer_fp=steamer_batter_fp(bat_df, config))
+    gs = _stat(pit_df, "GS")
+    g  = np.maximum(pd.to_numeric(pit_df.get("G", pd.Series(1, index=pit_df.index)),
+                                  errors="coerce").fillna(1).to_numpy(dtype=float), 1)
+    pit = pit_df.assign(norm_name=normalize_many(pit_df["PlayerName"]),
+                        steamer_fp=steamer_pitcher_fp(pit_df, config),
+                        role=np.where(gs / g >= 0.5, "SP", "RP"),
+                        _ip=_stat(pit_df, "IP"))
+    bat = bat.sort_values("steamer_fp", ascending=False).drop_duplicates("norm_name", keep="first")
+    pit = pit.sort_values("steamer_fp", ascending=False).drop_duplicates("norm_name", keep="first")
+    print(f"  Batters:  {len(bat):,} unique | FP [{bat['steamer_fp'].min():.0f}, {bat['steamer_fp'].max():.0f}]")
+    print(f"  Pitchers: {len(pit):,} unique | FP [{pit['steamer_fp'].min():.0f}, {pit['steamer_fp'].max():.0f}]")
+
+    pool = pd.DataFrame({
+        "name":       bat["PlayerName"].astype(str).to_numpy(),
+        "role":       "H",
+        "steamer_fp": bat["steamer_fp"].to_numpy(),
+    }, index=pd.Index(bat["norm_name"].to_numpy(), name="norm_name"))
+
+    pit = pit[pit["_ip"] >= MIN_PITCHER_IP].set_index("norm_name")
+    shared = pit.index.isin(pool.index)
+    both = pit[shared]
+    bat_fp = pool["steamer_fp"].reindex(both.index)
+    twp = both.index[(bat_fp >= 200.0).to_numpy()]
+    ace = both.index[((bat_fp < 50.0) & (both["_ip"] >= 100.0)).to_numpy()]
+    pool.loc[twp, "steamer_fp"] = bat_fp[twp] + both.loc[twp, "steamer_fp"]
+    pool.loc[twp, "role"]       = both.loc[twp, "role"]
+    pool.loc[ace, "name"]       = both.loc[ace, "PlayerName"].astype(str)
+    pool.loc[ace, "steamer_fp"] = both.loc[ace, "steamer_fp"]
+    pool.loc[ace, "role"]       = both.loc[ace, "role"]
+
+    new = pit[~shared]
+    pool = pd.concat([pool, pd.DataFrame({
+        "name":       new["PlayerName"].astype(str).to_numpy(),
+        "role":       new["role"].to_numpy(),
+        "steamer_fp": new["steamer_fp"].to_numpy(),
+    }, index=new.index)])
+    return pool, len(twp)
+
+
+def match_steamer(pool: pd.DataFrame, actual_by_norm: dict) -> tuple:
+    """
+    Steamer pool vs. actual points (load_actuals) → (df_m, unmatched_steamer,
+    unmatched_actual); df_m keeps players with > 0 actual points.
+    """
+    actual = pd.Series({k: v["pts"] for k, v in actual_by_norm.items()}, dtype=float)
+    in_actual = pool.index.isin(actual.index)
+    df_m = pool[in_actual].copy()
+    df_m["actual_pts"] = actual.reindex(df_m.index).to_numpy()
+    df_m = df_m[df_m["actual_pts"] > 0].reset_index(drop=True)
+    df_m["error"]     = df_m["steamer_fp"] - df_m["actual_pts"]
+    df_m["abs_error"] = df_m["error"].abs()
+    df_m["proj_rank"] = df_m["steamer_fp"].rank(ascending=False).astype(int)
+    df_m["act_rank"]  = df_m["actual_pts"].rank(ascending=False).astype(int)
+
+    unmatched_steamer = pool.loc[~in_actual, "name"].tolist()
+    unmatched_actual  = [v["name"] for k, v in actual_by_norm.items() if k not in pool.index]
+    return df_m, unmatched_steamer, unmatched_actual
 
-print("─── Step 2: Steamer pitching projections ─────────────────────────")
-try:
-    pit_df = fetch_steamer("pit", TARGET_SEASON)
-except Exception as exc:
-    print(f"  ERROR fetching pitching: {exc}")
-    sys.exit(1)
-print()
 
 # ---------------------------------------------------------------------------
-# Convert to CBA fantasy points
+# EROSP head-to-head
 # ---------------------------------------------------------------------------
-print("─── Step 3: Convert counting stats → CBA fantasy points ──────────")
-
-bat_df["steamer_fp"] = bat_df.apply(steamer_batter_fp, axis=1)
-pit_df["steamer_fp"] = pit_df.apply(steamer_pitcher_fp, axis=1)
-
-# Pitcher role: GS/(total games) >= 0.5 → SP, else RP
-pit_df["_gs"]   = pit_df.get("GS", pd.Series(0, index=pit_df.index)).fillna(0).astype(float)
-pit_df["_g"]    = pit_df.get("G",  pd.Series(1, index=pit_df.index)).fillna(1).astype(float).clip(lower=1)
-pit_df["role"]  = (pit_df["_gs"] / pit_df["_g"] >= 0.5).map({True: "SP", False: "RP"})
-
-# Normalize names; keep highest FP row when player appears multiple times (multi-team split)
-bat_df["norm_name"] = bat_df["PlayerName"].apply(norm_name)
-pit_df["norm_name"] = pit_df["PlayerName"].apply(norm_name)
-bat_df = bat_df.sort_values("steamer_fp", ascending=False).drop_duplicates("norm_name", keep="first")
-pit_df = pit_df.sort_values("steamer_fp", ascending=False).drop_duplicates("norm_name", keep="first")
-
-print(f"  Batters:  {len(bat_df):,} unique | FP [{bat_df['steamer_fp'].min():.0f}, {bat_df['steamer_fp'].max():.0f}]")
-print(f"  Pitchers: {len(pit_df):,} unique | FP [{pit_df['steamer_fp'].min():.0f}, {pit_df['steamer_fp'].max():.0f}]")
-
-# Cache raw playing-time columns so backtest_erosp.py can use them without re-fetching
-output_dir = PROJECT_DIR / "data" / "erosp"
-output_dir.mkdir(exist_ok=True)
-_bat_cache_path = output_dir / f"steamer_raw_bat_{TARGET_SEASON}.csv"
-_pit_cache_path = output_dir / f"steamer_raw_pit_{TARGET_SEASON}.csv"
-if "playerid" in bat_df.columns and "PA" in bat_df.columns:
-    bat_df[["playerid", "PA"]].dropna(subset=["playerid"]).to_csv(_bat_cache_path, index=False)
-    print(f"  Cached Steamer bat raw → {_bat_cache_path.name}")
-if "playerid" in pit_df.columns and "GS" in pit_df.columns and "IP" in pit_df.columns:
-    pit_df[["playerid", "GS", "IP"]].dropna(subset=["playerid"]).to_csv(_pit_cache_path, index=False)
-    print(f"  Cached Steamer pit raw → {_pit_cache_path.name}")
-print()
-
-# Build unified pool with two fixes:
-#   1. TWP (e.g. Ohtani): in both batting + pitching with meaningful PA + IP → sum FP
-#   2. Name collision guard: pitcher entry only added/overwrites if it has >= 15 proj IP
-#      (prevents minor-league "Juan Soto" pitcher from erasing star hitter)
-MIN_PITCHER_IP = 15.0
 
-steamer_pool: dict = {}
+def load_backtest(season: int) -> pd.DataFrame:
+    """EROSP's matched backtest table for `season` (backtest_erosp.py output)."""
+    path = OUTPUT_DIR / f"backtest_{season}.csv"
+    if not path.exists():
+        raise RuntimeError(f"{path.relative_to(PROJECT_DIR)} not found — "
+                           f"run: python backtest_erosp.py --target-year {season}")
+    return pd.read_csv(path)
 
-# Load batters first
-for _, r in bat_df.iterrows():
-    steamer_pool[r["norm_name"]] = {
-        "name":       r["PlayerName"],
-        "steamer_fp": float(r["steamer_fp"]),
-        "role":       "H",
-        "_bat_fp":    float(r["steamer_fp"]),
+
+def head_to_head_frame(df_steamer: pd.DataFrame, df_erosp: pd.DataFrame,
+                       projection: str) -> pd.DataFrame:
+    """
+    Players matched by both systems: name, role, erosp, steamer, actual_pts.
+    A name EROSP projects twice (hitter + pitcher rows) keeps its larger projection.
+    """
+    erosp = (df_erosp.assign(norm_name=normalize_many(df_erosp["name"]))
+             .sort_values(projection, ascending=False, kind="stable")
+             .drop_duplicates("norm_name")
+             .set_index("norm_name"))
+    steamer = df_steamer.assign(norm_name=normalize_many(df_steamer["name"])).set_index("norm_name")
+    joined = steamer[["name", "role", "steamer_fp"]].join(
+        erosp[[projection, "actual_pts"]], how="inner")
+    return pd.DataFrame({
+        "name":       joined["name"].to_numpy(),
+        "role":       joined["role"].to_numpy(),
+        "erosp":      joined[projection].to_numpy(dtype=float),
+        "steamer":    joined["steamer_fp"].to_numpy(dtype=float),
+        "actual_pts": joined["actual_pts"].to_numpy(dtype=float),
+    })
+
+
+def _resample_ranks(codes: np.ndarray, n_unique: int, idx: np.ndarray) -> np.ndarray:
+    """
+    Average ranks (as pandas .rank()) within every row of values[idx], where
+    `codes` are the values' positions among their sorted unique values. Ranks
+    come from per-row counts of each unique value, so no per-replicate sort.
+    """
+    n_rows = idx.shape[0]
+    sampled = codes[idx]
+    flat = (sampled + n_unique * np.arange(n_rows)[:, None]).ravel()
+    counts = np.bincount(flat, minlength=n_rows * n_unique).reshape(n_rows, n_unique)
+    below = np.cumsum(counts, axis=1) - counts
+    return np.take_along_axis(below + (counts + 1) / 2.0, sampled, axis=1)
+
+
+def _pearson_rows(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    xm = x - x.mean(axis=1, keepdims=True)
+    ym = y - y.mean(axis=1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (xm * ym).sum(axis=1) / (np.sqrt((xm**2).sum(axis=1)) * np.sqrt((ym**2).sum(axis=1)))
+
+
+def _replicate_metrics(pred: np.ndarray, actual: np.ndarray, idx: np.ndarray,
+                       pred_codes: tuple, actual_ranks: np.ndarray) -> Dict[str, np.ndarray]:
+    x, y = pred[idx], actual[idx]
+    err = x - y
+    return {
+        "pearson":  _pearson_rows(x, y),
+        "spearman": _pearson_rows(_resample_ranks(*pred_codes, idx), actual_ranks),
+        "rmse":     np.sqrt((err**2).mean(axis=1)),
+        "mae":      np.abs(err).mean(axis=1),
+        "bias":     err.mean(axis=1),
     }
 
-# Merge pitchers
-twp_count = 0
-for _, r in pit_df.iterrows():
-    nm = r["norm_name"]
-    ip = float(r.get("IP", 0) or 0)
-    if ip < MIN_PITCHER_IP:
-        continue   # fringe arm — skip to avoid name collisions
-    pit_fp = float(r["steamer_fp"])
-    role   = str(r["role"])
-
-    if nm in steamer_pool:
-        bat_fp = steamer_pool[nm]["_bat_fp"]
-        if bat_fp >= 200.0:
-            # Almost certainly TWP (star-level batting + real pitching) — sum both
-            steamer_pool[nm]["steamer_fp"] = bat_fp + pit_fp
-            steamer_pool[nm]["role"]       = role
-            twp_count += 1
-        elif bat_fp < 50.0 and ip >= 100.0:
-            # Low-PA batter with same name as a real ace — pitcher wins (e.g. Luis Castillo)
-            steamer_pool[nm] = {
-                "name":       r["PlayerName"],
-                "steamer_fp": pit_fp,
-                "role":       role,
-                "_bat_fp":    0.0,
-            }
-        # else: real batter with moderate projection — keep batter; skip ambiguous pitcher
+
+def _codes(values: np.ndarray) -> tuple:
+    uniq, inverse = np.unique(values, return_inverse=True)
+    return inverse.reshape(-1), len(uniq)
+
+
+_WORKER_ARRAYS: Optional[dict] = None
+
+
+def _init_worker(arrays: dict) -> None:
+    global _WORKER_ARRAYS
+    _WORKER_ARRAYS = arrays
+
+
+def _bootstrap_chunk(task: tuple) -> Dict[str, np.ndarray]:
+    """`size` paired replicates → {"<system>_<metric>": values}."""
+    seed, size = task
+    a = _WORKER_ARRAYS
+    n = len(a["actual"])
+    idx = np.random.default_rng(seed).integers(0, n, size=(size, n))
+    actual_ranks = _resample_ranks(*a["actual_codes"], idx)
+    out: Dict[str, np.ndarray] = {}
+    for system in ("erosp", "steamer"):
+        for metric, values in _replicate_metrics(a[system], a["actual"], idx,
+                                                 a[system + "_codes"], actual_ranks).items():
+            out[f"{system}_{metric}"] = values
+    return out
+
+
+def bootstrap_replicates(h2h: pd.DataFrame, n_boot: int, workers: int,
+                         seed: int = 0) -> Dict[str, np.ndarray]:
+    """`n_boot` paired bootstrap replicates of every metric for both systems."""
+    arrays = {"actual": h2h["actual_pts"].to_numpy(dtype=float),
+              "actual_codes": _codes(h2h["actual_pts"].to_numpy(dtype=float))}
+    for system in ("erosp", "steamer"):
+        arrays[system] = h2h[system].to_numpy(dtype=float)
+        arrays[system + "_codes"] = _codes(arrays[system])
+
+    sizes = [BOOTSTRAP_CHUNK] * (n_boot // BOOTSTRAP_CHUNK)
+    if n_boot % BOOTSTRAP_CHUNK:
+        sizes.append(n_boot % BOOTSTRAP_CHUNK)
+    tasks = list(zip(np.random.SeedSequence(seed).spawn(len(sizes)), sizes))
+
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks)), initializer=_init_worker,
+                                 initargs=(arrays,)) as pool:
+            chunks = list(pool.map(_bootstrap_chunk, tasks))
     else:
-        steamer_pool[nm] = {
-            "name":       r["PlayerName"],
-            "steamer_fp": pit_fp,
-            "role":       role,
-            "_bat_fp":    0.0,
-        }
+        _init_worker(arrays)
+        chunks = [_bootstrap_chunk(t) for t in tasks]
+    return {key: np.concatenate([c[key] for c in chunks]) for key in chunks[0]}
 
-print(f"  Combined pool: {len(steamer_pool):,} unique players ({twp_count} TWP summed)")
-print()
 
-# ---------------------------------------------------------------------------
-# Load actual 2025 fantasy results
-# ---------------------------------------------------------------------------
-print("─── Step 4: Load actual fantasy results ──────────────────────────")
-hist_path = PROJECT_DIR / "data" / "historical" / f"{TARGET_SEASON}.json"
-if not hist_path.exists():
-    print(f"  ERROR: {hist_path} not found")
-    sys.exit(1)
-
-with open(hist_path) as f:
-    hist_data = json.load(f)
-
-actual_by_norm: dict = {}
-for roster in hist_data.get("rosters", []):
-    for p in roster.get("players", []):
-        nm  = p.get("playerName", "")
-        pts = float(p.get("totalPoints", 0))
-        key = norm_name(nm)
-        if key not in actual_by_norm or pts > actual_by_norm[key]["pts"]:
-            actual_by_norm[key] = {"name": nm, "pts": pts}
-
-print(f"  {len(actual_by_norm):,} unique rostered players in {TARGET_SEASON}")
-print()
+def head_to_head(h2h: pd.DataFrame, n_boot: int, workers: int, seed: int = 0,
+                 alpha: float = 0.05) -> pd.DataFrame:
+    """
+    One row per metric: EROSP and Steamer point estimates with percentile
+    CIs, and delta = EROSP − Steamer with its CI (|bias| for bias). `better`
+    names a system only when the delta CI excludes 0 ("tie" otherwise; the
+    point-estimate winner when n_boot is 0).
+    """
+    y = h2h["actual_pts"]
+    point = {s: accuracy_metrics(h2h[s], y) for s in ("erosp", "steamer")}
+    reps = bootstrap_replicates(h2h, n_boot, workers, seed) if n_boot > 0 else {}
+    lo_q, hi_q = 100 * alpha / 2, 100 * (1 - alpha / 2)
+
+    def ci(values: np.ndarray) -> tuple:
+        if values is None or not len(values):
+            return np.nan, np.nan
+        return tuple(float(v) for v in np.nanpercentile(values, [lo_q, hi_q]))
+
+    rows = []
+    for metric in METRICS:
+        absolute = metric == "bias"
+        e, s = float(point["erosp"][metric]), float(point["steamer"][metric])
+        e_reps, s_reps = reps.get(f"erosp_{metric}"), reps.get(f"steamer_{metric}")
+        if absolute:
+            e, s = abs(e), abs(s)
+            e_reps = np.abs(e_reps) if e_reps is not None else None
+            s_reps = np.abs(s_reps) if s_reps is not None else None
+        d_lo, d_hi = ci(e_reps - s_reps if e_reps is not None else None)
+        erosp_wins = (e < s) if LOWER_IS_BETTER[metric] else (e > s)
+        if n_boot > 0 and d_lo <= 0 <= d_hi:
+            better = "tie"
+        else:
+            better = "EROSP" if erosp_wins else "Steamer"
+        rows.append({
+            "metric":  "|bias|" if absolute else metric,
+            "erosp":   e, **dict(zip(("erosp_lo", "erosp_hi"), ci(e_reps))),
+            "steamer": s, **dict(zip(("steamer_lo", "steamer_hi"), ci(s_reps))),
+            "delta":   e - s, "delta_lo": d_lo, "delta_hi": d_hi,
+            "better":  better,
+        })
+    return pd.DataFrame(rows)
+
 
 # ---------------------------------------------------------------------------
-# Match and build comparison DataFrame
+# Report
 # ---------------------------------------------------------------------------
-print("─── Step 5: Match Steamer → actual ──────────────────────────────")
-matched = []
-for norm_key, entry in steamer_pool.items():
-    if norm_key in actual_by_norm:
-        act = actual_by_norm[norm_key]
-        matched.append({
-            "name":       entry["name"],
-            "role":       entry["role"],
-            "steamer_fp": entry["steamer_fp"],
-            "actual_pts": act["pts"],
-        })
 
-df_m = pd.DataFrame(matched)
-df_m = df_m[df_m["actual_pts"] > 0].copy()
-df_m["error"]     = df_m["steamer_fp"] - df_m["actual_pts"]
-df_m["abs_error"] = df_m["error"].abs()
-df_m["proj_rank"] = df_m["steamer_fp"].rank(ascending=False).astype(int)
-df_m["act_rank"]  = df_m["actual_pts"].rank(ascending=False).astype(int)
-
-unmatched_steamer = [e["name"] for k, e in steamer_pool.items() if k not in actual_by_norm]
-unmatched_actual  = [v["name"] for k, v in actual_by_norm.items() if k not in steamer_pool]
-print(f"  Matched (>0 actual pts): {len(df_m):,}")
-print(f"  Steamer-only (FA/prospects): {len(unmatched_steamer):,}")
-print(f"  Actual-only (no Steamer proj): {len(unmatched_actual):,}")
-print()
-
-if len(df_m) < 20:
-    print(f"  Not enough matched players ({len(df_m)}).")
-    print(f"  FanGraphs may not have archived {TARGET_SEASON} Steamer projections.")
-    sys.exit(1)
+def _fmt_ci(value: float, lo: float, hi: float, digits: int) -> str:
+    if np.isnan(lo):
+        return f"{value:.{digits}f}"
+    return f"{value:.{digits}f} [{lo:.{digits}f}, {hi:.{digits}f}]"
+
+
+def print_report(df_m: pd.DataFrame, h2h_table: pd.DataFrame, n_common: int,
+                 projection: str, n_boot: int) -> None:
+    x, y = df_m["steamer_fp"], df_m["actual_pts"]
+    acc = accuracy_metrics(x, y)
+
+    print(f"\n{'='*65}")
+    print(f"  RESULTS  (n={len(df_m)})")
+    print(f"{'='*65}\n")
+
+    print("  ── Steamer Overall ─────────────────────────────────────────────")
+    print(f"    Pearson  r  = {acc['pearson']:.3f}")
+    print(f"    Spearman ρ  = {acc['spearman']:.3f}")
+    print(f"    RMSE        = {acc['rmse']:.1f} pts")
+    print(f"    MAE         = {acc['mae']:.1f} pts")
+    print(f"    Bias        = {acc['bias']:+.1f} pts  "
+          f"({'over' if acc['bias'] > 0 else 'under'}-projected on average)")
+    print()
+
+    ci_note = f", {n_boot:,} bootstrap replicates, 95% CI" if n_boot > 0 else ""
+    print(f"  ── Head-to-Head: Steamer vs. EROSP ({projection}) ─────────────")
+    print(f"  n = {n_common} players matched by both{ci_note}")
+    print(f"  {'Metric':<10}  {'EROSP':>24}  {'Steamer':>24}  {'Δ (EROSP−Steamer)':>26}  {'Better':>7}")
+    print(f"  {'-'*99}")
+    for _, r in h2h_table.iterrows():
+        digits = 3 if r["metric"] in ("pearson", "spearman") else 1
+        print(f"  {r['metric']:<10}  {_fmt_ci(r['erosp'], r['erosp_lo'], r['erosp_hi'], digits):>24}  "
+              f"{_fmt_ci(r['steamer'], r['steamer_lo'], r['steamer_hi'], digits):>24}  "
+              f"{_fmt_ci(r['delta'], r['delta_lo'], r['delta_hi'], digits):>26}  {r['better']:>7}")
+    print()
+
+    # ── By role ──
+    print("  ── Accuracy by Role ────────────────────────────────────────────")
+    print(f"  {'Role':<4}  {'n':>4}  {'Pearson r':>9}  {'Spearman ρ':>10}  {'RMSE':>6}  {'MAE':>6}  {'Bias':>7}")
+    print(f"  {'-'*58}")
+    for role in ROLES:
+        sub = df_m[df_m["role"] == role]
+        if len(sub) < MIN_GROUP_SIZE:
+            continue
+        a = accuracy_metrics(sub["steamer_fp"], sub["actual_pts"])
+        print(f"  {role:<4}  {len(sub):>4}  {a['pearson']:>9.3f}  {a['spearman']:>10.3f}  "
+              f"{a['rmse']:>6.1f}  {a['mae']:>6.1f}  {a['bias']:>+7.1f}")
+    print()
+
+    # ── Top 20 by Steamer ──
+    print("  ── Top 20 by Steamer — rank accuracy ──────────────────────────")
+    print(f"  {'#':>3}  {'Name':<26} {'Role':<4} {'Steamer':>7}  {'Actual':>7}  {'Err':>7}  {'ActRk':>6}")
+    print(f"  {'-'*68}")
+    for i, (_, row) in enumerate(df_m.nlargest(20, "steamer_fp").iterrows(), 1):
+        print(f"  #{i:>2}  {row['name']:<26} {row['role']:<4} "
+              f"{row['steamer_fp']:>7.0f}  {row['actual_pts']:>7.0f}  "
+              f"{row['error']:>+7.0f}  #{row['act_rank']:>4}")
+    print()
+
+    # ── Biggest over-projections ──
+    print("  ── Biggest OVER-projections ────────────────────────────────────")
+    print(f"  {'Name':<26} {'Role':<4} {'Steamer':>7}  {'Actual':>7}  {'Error':>7}")
+    print(f"  {'-'*58}")
+    for _, row in df_m.nlargest(12, "error").iterrows():
+        note = " (injury?)" if row["actual_pts"] < row["steamer_fp"] * 0.4 else ""
+        print(f"  {row['name']:<26} {row['role']:<4} {row['steamer_fp']:>7.0f}  "
+              f"{row['actual_pts']:>7.0f}  {row['error']:>+7.0f}{note}")
+    print()
+
+    # ── Biggest under-projections ──
+    print("  ── Biggest UNDER-projections ───────────────────────────────────")
+    print(f"  {'Name':<26} {'Role':<4} {'Steamer':>7}  {'Actual':>7}  {'Error':>7}")
+    print(f"  {'-'*58}")
+    for _, row in df_m.nsmallest(12, "error").iterrows():
+        print(f"  {row['name']:<26} {row['role']:<4} {row['steamer_fp']:>7.0f}  "
+              f"{row['actual_pts']:>7.0f}  {row['error']:>+7.0f}")
+    print()
+
 
 # ---------------------------------------------------------------------------
-# Accuracy stats
+# CLI
 # ---------------------------------------------------------------------------
-x   = df_m["steamer_fp"]
-y   = df_m["actual_pts"]
-r   = pearson_r(x, y)
-rho = spearman_r(x, y)
-rmse = float(np.sqrt(((x - y) ** 2).mean()))
-mae  = float((x - y).abs().mean())
-bias = float((x - y).mean())
-
-print(f"\n{'='*65}")
-print(f"  RESULTS  (n={len(df_m)})")
-print(f"{'='*65}\n")
-
-print("  ── Steamer Overall ─────────────────────────────────────────────")
-print(f"    Pearson  r  = {r:.3f}")
-print(f"    Spearman ρ  = {rho:.3f}")
-print(f"    RMSE        = {rmse:.1f} pts")
-print(f"    MAE         = {mae:.1f} pts")
-print(f"    Bias        = {bias:+.1f} pts  ({'over' if bias > 0 else 'under'}-projected on average)")
-print()
-
-# ── Head-to-head vs EROSP ──
-print("  ── Head-to-Head: Steamer vs. EROSP Backtest ───────────────────")
-print(f"  {'Metric':<14}  {'EROSP':>8}  {'Steamer':>8}  {'Better':>8}")
-print(f"  {'-'*48}")
-
-def winner(erosp_val, stm_val, lower_is_better=False):
-    if lower_is_better:
-        return "EROSP" if erosp_val < stm_val else "Steamer"
-    return "EROSP" if erosp_val > stm_val else "Steamer"
-
-print(f"  {'Pearson r':<14}  {EROSP_STATS['pearson_r']:>8.3f}  {r:>8.3f}  "
-      f"{winner(EROSP_STATS['pearson_r'], r):>8}")
-print(f"  {'Spearman ρ':<14}  {EROSP_STATS['spearman']:>8.3f}  {rho:>8.3f}  "
-      f"{winner(EROSP_STATS['spearman'], rho):>8}")
-print(f"  {'RMSE':<14}  {EROSP_STATS['rmse']:>8.1f}  {rmse:>8.1f}  "
-      f"{winner(EROSP_STATS['rmse'], rmse, lower_is_better=True):>8}")
-print(f"  {'|Bias|':<14}  {abs(EROSP_STATS['bias']):>8.1f}  {abs(bias):>8.1f}  "
-      f"{winner(abs(EROSP_STATS['bias']), abs(bias), lower_is_better=True):>8}")
-print(f"  {'n (matched)':<14}  {EROSP_STATS['n']:>8}  {len(df_m):>8}")
-print()
-
-# ── By role ──
-print("  ── Accuracy by Role ────────────────────────────────────────────")
-print(f"  {'Role':<4}  {'n':>4}  {'Pearson r':>9}  {'Spearman ρ':>10}  {'RMSE':>6}  {'MAE':>6}  {'Bias':>7}")
-print(f"  {'-'*58}")
-for role in ["H", "SP", "RP"]:
-    sub = df_m[df_m["role"] == role]
-    if len(sub) < 5:
-        continue
-    sx, sy = sub["steamer_fp"], sub["actual_pts"]
-    pr   = pearson_r(sx, sy)
-    sr   = spearman_r(sx, sy)
-    rmse_ = float(np.sqrt(((sx - sy) ** 2).mean()))
-    mae_  = float((sx - sy).abs().mean())
-    bias_ = float((sx - sy).mean())
-    print(f"  {role:<4}  {len(sub):>4}  {pr:>9.3f}  {sr:>10.3f}  {rmse_:>6.1f}  {mae_:>6.1f}  {bias_:>+7.1f}")
-print()
-
-# ── Top 20 by Steamer ──
-print("  ── Top 20 by Steamer — rank accuracy ──────────────────────────")
-print(f"  {'#':>3}  {'Name':<26} {'Role':<4} {'Steamer':>7}  {'Actual':>7}  {'Err':>7}  {'ActRk':>6}")
-print(f"  {'-'*68}")
-for i, (_, row) in enumerate(df_m.nlargest(20, "steamer_fp").iterrows(), 1):
-    print(f"  #{i:>2}  {row['name']:<26} {row['role']:<4} "
-          f"{row['steamer_fp']:>7.0f}  {row['actual_pts']:>7.0f}  "
-          f"{row['error']:>+7.0f}  #{row['act_rank']:>4}")
-print()
-
-# ── Biggest over-projections ──
-print("  ── Biggest OVER-projections ────────────────────────────────────")
-print(f"  {'Name':<26} {'Role':<4} {'Steamer':>7}  {'Actual':>7}  {'Error':>7}")
-print(f"  {'-'*58}")
-for _, row in df_m.nlargest(12, "error").iterrows():
-    note = " (injury?)" if row["actual_pts"] < row["steamer_fp"] * 0.4 else ""
-    print(f"  {row['name']:<26} {row['role']:<4} {row['steamer_fp']:>7.0f}  "
-          f"{row['actual_pts']:>7.0f}  {row['error']:>+7.0f}{note}")
-print()
-
-# ── Biggest under-projections ──
-print("  ── Biggest UNDER-projections ───────────────────────────────────")
-print(f"  {'Name':<26} {'Role':<4} {'Steamer':>7}  {'Actual':>7}  {'Error':>7}")
-print(f"  {'-'*58}")
-for _, row in df_m.nsmallest(12, "error").iterrows():
-    print(f"  {row['name']:<26} {row['role']:<4} {row['steamer_fp']:>7.0f}  "
-          f"{row['actual_pts']:>7.0f}  {row['error']:>+7.0f}")
-print()
-
-# ── Save CSV ──
-out_dir  = PROJECT_DIR / "data" / "erosp"
-out_dir.mkdir(exist_ok=True)
-csv_path = out_dir / f"steamer_benchmark_{TARGET_SEASON}.csv"
-df_m.sort_values("steamer_fp", ascending=False).to_csv(csv_path, index=False)
-print(f"  ✓ Saved → {csv_path.relative_to(PROJECT_DIR)}")
-
-print(f"\n{'='*65}")
-print(f"  ✓ Steamer benchmark complete for {TARGET_SEASON}")
-print(f"    {len(df_m):,} matched players")
-print(f"{'='*65}\n")
+
+def run_benchmark(target_season: int, projection: str = "erosp_raw", n_boot: int = 2000,
+                  workers: int = 1, seed: int = 0, refresh: bool = False) -> pd.DataFrame:
+    """Score Steamer for `target_season`, write the CSVs and return the head-to-head table."""
+    print(f"\n{'='*65}")
+    print(f"  STEAMER BENCHMARK  vs.  {target_season} CBA ACTUAL RESULTS")
+    print(f"{'='*65}")
+    print(f"  Target season:  {target_season}")
+    print(f"  Run date:       {datetime.date.today().strftime('%B %d, %Y')}")
+    print(f"{'='*65}\n")
+
+    print("─── Step 1: Steamer projections ──────────────────────────────────")
+    bat_df = load_steamer_raw("bat", target_season, refresh)
+    pit_df = load_steamer_raw("pit", target_season, refresh)
+    print()
+
+    print("─── Step 2: Convert counting stats → CBA fantasy points ──────────")
+    pool, twp_count = steamer_pool(bat_df, pit_df)
+    print(f"  Combined pool: {len(pool):,} unique players ({twp_count} TWP summed)")
+    print()
+
+    print("─── Step 3: Load actual fantasy results + EROSP backtest ────────")
+    actual_by_norm = load_actuals(target_season)
+    if actual_by_norm is None:
+        raise RuntimeError(f"data/historical/{target_season}.json not found")
+    print(f"  {len(actual_by_norm):,} unique rostered players in {target_season}")
+    df_erosp = load_backtest(target_season)
+    print(f"  EROSP backtest: {len(df_erosp):,} matched players")
+    print()
+
+    print("─── Step 4: Match Steamer → actual ──────────────────────────────")
+    df_m, unmatched_steamer, unmatched_actual = match_steamer(pool, actual_by_norm)
+    print(f"  Matched (>0 actual pts): {len(df_m):,}")
+    print(f"  Steamer-only (FA/prospects): {len(unmatched_steamer):,}")
+    print(f"  Actual-only (no Steamer proj): {len(unmatched_actual):,}")
+    if len(df_m) < 20:
+        raise RuntimeError(f"Not enough matched players ({len(df_m)}). "
+                           f"FanGraphs may not have archived {target_season} Steamer projections.")
+    h2h = head_to_head_frame(df_m, df_erosp, projection)
+    print(f"  Matched by both Steamer and EROSP: {len(h2h):,}")
+    print()
+
+    if n_boot > 0:
+        print(f"─── Step 5: Bootstrap ({n_boot:,} replicates, {workers} worker(s)) ─────────────")
+    h2h_table = head_to_head(h2h, n_boot, workers, seed)
+    print_report(df_m, h2h_table, len(h2h), projection, n_boot)
+
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    csv_path = OUTPUT_DIR / f"steamer_benchmark_{target_season}.csv"
+    df_m.sort_values("steamer_fp", ascending=False).to_csv(csv_path, index=False)
+    h2h_path = OUTPUT_DIR / f"steamer_head_to_head_{target_season}.csv"
+    h2h_table.to_csv(h2h_path, index=False)
+    print(f"  ✓ Saved → {csv_path.relative_to(PROJECT_DIR)}")
+    print(f"  ✓ Saved → {h2h_path.relative_to(PROJECT_DIR)}")
+
+    print(f"\n{'='*65}")
+    print(f"  ✓ Steamer benchmark complete for {target_season}")
+    print(f"    {len(df_m):,} matched players")
+    print(f"{'='*65}\n")
+    return h2h_table
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Steamer vs. EROSP and actual CBA results")
+    parser.add_argument("--target-year", type=int, default=2025,
+                        help="Season year to benchmark (default: 2025)")
+    parser.add_argument("--projection", choices=("erosp_raw", "erosp_startable"), default="erosp_raw",
+                        help="EROSP column compared with Steamer (default: erosp_raw)")
+    parser.add_argument("--bootstrap", type=int, default=2000,
+                        help="Bootstrap replicates for the head-to-head CIs; 0 disables (default: 2000)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes for the bootstrap (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0, help="Bootstrap seed (default: 0)")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Re-fetch Steamer from FanGraphs even when cached")
+    args = parser.parse_args(argv)
+
+    try:
+        run_benchmark(args.target_year, args.projection, max(args.bootstrap, 0),
+                      args.workers or os.cpu_count() or 1, args.seed, args.refresh)
+    except RuntimeError as exc:
+        print(f"\nERROR: {exc}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
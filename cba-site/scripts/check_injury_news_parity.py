@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Parity check: fetch_injury_news's streaming page parser vs. the BeautifulSoup
+parsers it replaced.
+
+Runs both on a set of built-in pages covering the selector fallbacks
+(container priority, nested containers, the li/div fallback, the FantasyPros
+date group) and on any saved pages passed on the command line, feeding the
+streaming parser in small chunks so text nodes split across reads. Exits 1 if
+any page disagrees.
+
+Usage:
+    cd /path/to/cba-site/scripts
+    python3 check_injury_news_parity.py
+    python3 check_injury_news_parity.py --rotowire page.html --fantasypros page2.html
+
+Dependencies: requests beautifulsoup4
+  pip install requests beautifulsoup4
+"""
+
+import argparse
+import datetime
+import re
+import sys
+from pathlib import Path
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    raise ImportError("beautifulsoup4 not installed: pip install beautifulsoup4")
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from erosp.names import normalize
+from fetch_injury_news import (
+    FANTASYPROS_LAYOUT, NEWS_MAX_CHARS, ROTOWIRE_LAYOUT, parse_news_page,
+)
+
+CHUNK_BYTES = 7
+
+
+# ─────────────────────────────────────────────────────────────────
+# Reference — the BeautifulSoup parsers, as they were
+# ─────────────────────────────────────────────────────────────────
+
+def _ref_result(items, source, max_name_len, name_of, text_of, date_of) -> dict:
+    today = datetime.date.today().isoformat()
+    result: dict = {}
+    for item in items:
+        name_el = name_of(item)
+        if not name_el:
+            continue
+        player_name = name_el.get_text(strip=True)
+        if not player_name or len(player_name) > max_name_len:
+            continue
+        text_el = text_of(item)
+        if not text_el:
+            continue
+        news_text = text_el.get_text(" ", strip=True)
+        if len(news_text) < 20:
+            continue
+        date_str = today
+        date_el = date_of(item)
+        if date_el:
+            dt = date_el.get("datetime", "") or date_el.get_text(strip=True)
+            m = re.search(r"(\d{4}-\d{2}-\d{2})", dt)
+            if m:
+                date_str = m.group(1)
+        key = normalize(player_name)
+        if key not in result or date_str > result[key]["date"]:
+            result[key] = {"text": news_text[:NEWS_MAX_CHARS], "source": source, "date": date_str}
+    return result
+
+
+def ref_rotowire(html: str) -> dict:
+    soup = BeautifulSoup(html, "html.parser")
+    player = re.compile(r"/baseball/player/")
+    items = (
+        soup.select("li.news-list__item")
+        or soup.select(".player-news__item")
+        or soup.select(".news-item")
+        or soup.select("article")
+    )
+    if not items:
+        items = [el for el in soup.find_all(["li", "div"])
+                 if el.find("a", href=player) and el.find("p")]
+    return _ref_result(
+        items, "Rotowire", 60,
+        lambda el: (el.select_one(".news-player-name") or el.select_one(".news-player")
+                    or el.find("a", href=player)),
+        lambda el: (el.select_one(".news-item__text") or el.select_one(".news-body")
+                    or el.select_one(".news-content") or el.find("p")),
+        lambda el: el.find("time") or el.select_one(".news-timestamp"),
+    )
+
+
+def ref_fantasypros(html: str) -> dict:
+    soup = BeautifulSoup(html, "html.parser")
+    player = re.compile(r"/mlb/players/")
+    items = (
+        soup.select(".news-item")
+        or soup.select("article")
+        or soup.select(".article-item")
+        or soup.select(".player-news-item")
+    )
+    if not items:
+        items = [el for el in soup.find_all(["div", "article"])
+                 if el.find("a", href=player) and el.find("p")]
+    return _ref_result(
+        items, "FantasyPros", 50,
+        lambda el: (el.find("a", href=player) or el.select_one(".player-name")
+                    or el.find("h4") or el.find("h3")),
+        lambda el: (el.select_one(".news-item__body") or el.select_one(".article-body")
+                    or el.select_one(".news-content") or el.find("p")),
+        lambda el: el.find("time") or el.select_one(".date, .timestamp, .article-date"),
+    )
+
+
+SITES = {
+    "Rotowire":    (ROTOWIRE_LAYOUT, ref_rotowire),
+    "FantasyPros": (FANTASYPROS_LAYOUT, ref_fantasypros),
+}
+
+
+# ─────────────────────────────────────────────────────────────────
+# Built-in pages
+# ─────────────────────────────────────────────────────────────────
+
+_BLURB = "was placed on the 10-day injured list with a strained hamstring"
+
+
+def _rw_li(name: str, date: str, cls: str = "news-list__item", tag: str = "li") -> str:
+    return (f'<{tag} class="{cls}"><a href="/baseball/player/{name.lower().replace(" ", "-")}">'
+            f'{name}</a> <time datetime="{date}">x</time><p>{name} {_BLURB}.</p></{tag}>')
+
+
+def _fp_item(name: str, cls: str = "news-item", tag: str = "div", extra: str = "") -> str:
+    return (f'<{tag} class="{cls}"><h4>{name}</h4>{extra}'
+            f'<div class="news-item__body">{name} {_BLURB}.</div></{tag}>')
+
+
+PAGES = [
+    ("Rotowire", "list", "<ul>" + "".join(
+        _rw_li(n, d) for n, d in [("Mike Trout", "2026-06-03"), ("Aaron Judge", "2026-06-02"),
+                                  ("Juan Soto", "2026-06-01")]) + "</ul>"),
+    ("Rotowire", "article wrapping the list", "<article><ul>" + "".join(
+        _rw_li(n, d) for n, d in [("Mike Trout", "2026-06-03"), ("Aaron Judge", "2026-06-02"),
+                                  ("Juan Soto", "2026-06-01")]) + "</ul></article>"),
+    ("Rotowire", "lower selector before higher", "<div>"
+        + _rw_li("Mookie Betts", "2026-06-04", cls="news-item", tag="div")
+        + "</div><ul>" + _rw_li("Mike Trout", "2026-06-03") + "</ul>"),
+    ("Rotowire", "nested containers", '<div class="news-item">'
+        + _rw_li("Mike Trout", "2026-06-03", cls="news-item", tag="div")
+        + _rw_li("Aaron Judge", "2026-06-02", cls="news-item", tag="div") + "</div>"),
+    ("Rotowire", "fallback", "<div id=feed>" + "".join(
+        _rw_li(n, d, cls="entry", tag="div") for n, d in
+        [("Mike Trout", "2026-06-03"), ("Juan Soto", "2026-06-01")]) + "</div>"),
+    ("Rotowire", "text split by markup", '<ul><li class="news-list__item">'
+        '<span class="news-player-name">Ronald <b>Acuña</b> Jr.</span>'
+        '<div class="news-item__text">Acuña &amp; the <i>Braves</i> expect him back '
+        '<!-- note -->next week after a wrist injury.</div>'
+        '<span class="news-timestamp">2026-06-05</span></li></ul>'),
+    ("FantasyPros", "date group in document order",
+        _fp_item("Shohei Ohtani", extra='<span class="timestamp">2026-06-01</span>'
+                 '<span class="date">2026-06-09</span>')),
+    ("FantasyPros", "article before .news-item", "<article>"
+        + _fp_item("Gerrit Cole", cls="x", extra='<span class="date">2026-06-02</span>')
+        + "</article>" + _fp_item("Corbin Burnes", extra='<time datetime="2026-06-03"></time>')),
+    ("FantasyPros", "fallback with player links", "<div>" + "".join(
+        f'<article class="n"><a href="/mlb/players/{n}.php">{n}</a><p>{n} {_BLURB}.</p></article>'
+        for n in ("Spencer Strider", "Zack Wheeler")) + "</div>"),
+]
+
+
+# ─────────────────────────────────────────────────────────────────
+# Comparison
+# ─────────────────────────────────────────────────────────────────
+
+class _PageResponse:
+    """Just enough of a streamed requests.Response for parse_news_page."""
+    encoding = "utf-8"
+
+    def __init__(self, html: str, chunk_bytes: int):
+        self._body = html.encode("utf-8")
+        self._chunk_bytes = chunk_bytes
+
+    def iter_content(self, _size):
+        for i in range(0, len(self._body), self._chunk_bytes):
+            yield self._body[i:i + self._chunk_bytes]
+
+
+def check(site: str, label: str, html: str, chunk_bytes: int = CHUNK_BYTES) -> bool:
+    layout, reference = SITES[site]
+    want = reference(html)
+    got = parse_news_page(site, layout, _PageResponse(html, chunk_bytes))
+    if got == want:
+        print(f"  ok    {site}: {label} ({len(want)} items)")
+        return True
+    print(f"  FAIL  {site}: {label}")
+    for key in sorted(set(want) | set(got)):
+        if want.get(key) != got.get(key):
+            print(f"        {key}: bs4={want.get(key)}  streaming={got.get(key)}")
+    return False
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--rotowire", nargs="*", default=[], metavar="HTML",
+                        help="Saved Rotowire injury-news pages to check")
+    parser.add_argument("--fantasypros", nargs="*", default=[], metavar="HTML",
+                        help="Saved FantasyPros injury-news pages to check")
+    args = parser.parse_args(argv)
+
+    pages = list(PAGES)
+    for site, paths in (("Rotowire", args.rotowire), ("FantasyPros", args.fantasypros)):
+        pages += [(site, path, Path(path).read_text(errors="replace")) for path in paths]
+
+    ok = all([check(site, label, html) for site, label, html in pages])
+    print("Parity OK" if ok else "Parity FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
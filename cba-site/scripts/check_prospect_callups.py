@@ -8,26 +8,47 @@ to the majors by checking MLB Stats API 26-man active rosters.
 Reads:  ../data/prospect-protections.json
 Writes: ../data/prospect-protections.json  (patches calledUp + calledUpDate)
 
+By default the check is batched: each MLB team that any pending prospect
+belongs to has its 26-man roster fetched once (concurrently, through the
+shared erosp.statsapi MLB client), and every prospect not found there is
+resolved with a single people?personIds=…&hydrate=rosterEntries call.
+--serial keeps the old one-roster-plus-one-lookup-per-prospect path.
+
 Run daily via GitHub Actions (update-prospect-callups.yml).
-Can also be run locally: python3 check_prospect_callups.py
+Can also be run locally: python3 check_prospect_callups.py [--serial]
+
+--replay serves a fixture's responses from a local server, runs the check
+over the fixture's prospects and compares against its expected call-ups,
+without reading or writing the data files:
+  python3 check_prospect_callups.py --replay fixtures/prospect_callups_2026.json [--serial]
+Both modes also honour MLB_STATS_API_BASE for pointing at any other server.
+
+Dependencies: requests
+  pip install requests
 """
 
+import argparse
 import json
 import os
 import sys
 import datetime
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import requests
 
+from erosp.statsapi import MLB_STATS_API_BASE, MLBStatsClient
+
 SCRIPT_DIR         = os.path.dirname(os.path.abspath(__file__))
 DATA_FILE          = os.path.normpath(os.path.join(SCRIPT_DIR, '..', 'data', 'prospect-protections.json'))
 RECOMPUTE_FLAG     = os.path.normpath(os.path.join(SCRIPT_DIR, '..', 'data', 'erosp', 'pending_callup_recompute.json'))
-MLB_BASE           = 'https://statsapi.mlb.com/api/v1'
 HEADERS            = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'}
 
 
-def get_active_roster(mlb_team_id: int) -> set:
+def get_active_roster(mlb_team_id: int, base_url: str = None) -> set:
     """Returns set of mlbamIds currently on the 26-man active roster."""
-    url = f'{MLB_BASE}/teams/{mlb_team_id}/roster?rosterType=26Man'
+    url = f'{base_url or MLB_STATS_API_BASE}/teams/{mlb_team_id}/roster?rosterType=26Man'
     try:
         r = requests.get(url, headers=HEADERS, timeout=10)
         r.raise_for_status()
@@ -38,13 +59,13 @@ def get_active_roster(mlb_team_id: int) -> set:
         return set()
 
 
-def verify_via_player_lookup(mlbam_id: int) -> bool:
+def verify_via_player_lookup(mlbam_id: int, base_url: str = None) -> bool:
     """
     Secondary check: look up the player directly and see if they appear
     on an MLB 26-man roster in the current season.
     Used when mlbTeamId is stale (player was traded to a different org).
     """
-    url = f'{MLB_BASE}/people/{mlbam_id}?hydrate=currentTeam,rosterEntries'
+    url = f'{base_url or MLB_STATS_API_BASE}/people/{mlbam_id}?hydrate=currentTeam,rosterEntries'
     try:
         r = requests.get(url, headers=HEADERS, timeout=10)
         r.raise_for_status()
@@ -52,21 +73,134 @@ def verify_via_player_lookup(mlbam_id: int) -> bool:
         people = data.get('people', [])
         if not people:
             return False
-        person = people[0]
-        # rosterEntries: look for an active MLB-level (sportId=1) 26-man entry
-        for entry in person.get('rosterEntries', []):
-            sport_id   = entry.get('team', {}).get('sport', {}).get('id')
-            status     = entry.get('status', {}).get('code', '')
-            roster_id  = entry.get('rosterId')  # 26 = 26-man, 40 = 40-man
-            if sport_id == 1 and status == 'A' and roster_id == 26:
-                return True
-        return False
+        return on_active_mlb_roster(people[0])
     except Exception as e:
         print(f'  Warning: player lookup failed for mlbamId {mlbam_id}: {e}', file=sys.stderr)
         return False
 
 
-def main():
+def on_active_mlb_roster(person: dict) -> bool:
+    """True if a hydrated person has an active MLB-level (sportId=1) 26-man rosterEntry."""
+    for entry in person.get('rosterEntries', []):
+        sport_id   = entry.get('team', {}).get('sport', {}).get('id')
+        status     = entry.get('status', {}).get('code', '')
+        roster_id  = entry.get('rosterId')  # 26 = 26-man, 40 = 40-man
+        if sport_id == 1 and status == 'A' and roster_id == 26:
+            return True
+    return False
+
+
+def check_serial(prospects: list, base_url: str = None) -> dict:
+    """mlbamId → called up, one roster fetch + one player lookup per prospect."""
+    result = {}
+    for p in prospects:
+        is_up = False
+        # Primary check: known MLB team's 26-man roster
+        if p.get('mlbTeamId'):
+            is_up = p['mlbamId'] in get_active_roster(p['mlbTeamId'], base_url)
+        # Secondary check: direct player lookup (catches trades to new org)
+        if not is_up:
+            is_up = verify_via_player_lookup(p['mlbamId'], base_url)
+        result[p['mlbamId']] = is_up
+    return result
+
+
+def check_batched(prospects: list, client=None, season: int = None) -> dict:
+    """
+    mlbamId → called up. Each distinct MLB team's 26-man roster is fetched
+    once (concurrently); the misses go through one bulk people lookup.
+    """
+    client = client or MLBStatsClient(base_url=MLB_STATS_API_BASE)
+    season = season or datetime.date.today().year
+
+    team_ids = sorted({p['mlbTeamId'] for p in prospects if p.get('mlbTeamId')})
+    rosters = client.team_rosters(season, roster_type='26Man', fields='roster,person,id',
+                                  team_ids=team_ids) if team_ids else {}
+    active = {}
+    for team_id, roster in rosters.items():
+        if roster is None:
+            print(f'  Warning: could not fetch roster for MLB team {team_id}', file=sys.stderr)
+            continue
+        active[team_id] = {entry['person']['id'] for entry in roster}
+
+    result = {p['mlbamId']: p['mlbamId'] in active.get(p.get('mlbTeamId'), ()) for p in prospects}
+
+    # Secondary check for every miss at once (catches trades to new org)
+    misses = [mlbam_id for mlbam_id, is_up in result.items() if not is_up]
+    if misses:
+        for person in client.people(misses, hydrate='currentTeam,rosterEntries'):
+            if person.get('id') in result and on_active_mlb_roster(person):
+                result[person['id']] = True
+    print(f'  Checked {len(prospects)} prospect(s): {len(team_ids)} roster call(s), '
+          f'{1 if misses else 0} bulk player lookup.')
+    return result
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    """Answers GETs from server.responses by exact path + query params; 404 otherwise."""
+
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        path, params = url.path.strip('/'), dict(urllib.parse.parse_qsl(url.query))
+        self.server.requests.append(self.path)
+        for rec in self.server.responses:
+            if rec['path'] == path and rec['params'] == params:
+                body = json.dumps(rec['body']).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+        self.send_error(404)
+
+    def log_message(self, *args):
+        pass
+
+
+def replay(fixture_path: str, serial: bool = False) -> bool:
+    """Run the check against a fixture's responses; True if it matches `expected`."""
+    with open(fixture_path) as f:
+        fixture = json.load(f)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _ReplayHandler)
+    server.responses, server.requests = fixture['responses'], []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f'http://127.0.0.1:{server.server_address[1]}'
+    prospects = fixture['prospects']
+    try:
+        if serial:
+            called_up = check_serial(prospects, base_url=base_url)
+        else:
+            called_up = check_batched(prospects, client=MLBStatsClient(base_url=base_url),
+                                      season=fixture['season'])
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    expected = {int(k): v for k, v in fixture['expected'].items()}
+    ok = called_up == expected
+    for p in prospects:
+        got, want = called_up.get(p['mlbamId']), expected.get(p['mlbamId'])
+        print(f'  {p["name"]}: {"called up" if got else "in minors"}'
+              + ('' if got == want else f'  MISMATCH (expected {"called up" if want else "in minors"})'))
+    print(f'\nReplay {"OK" if ok else "FAILED"}: {len(server.requests)} request(s) '
+          f'({"serial" if serial else "batched"}).')
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Mark protected prospects who have been called up.')
+    parser.add_argument('--serial', action='store_true',
+                        help='One roster fetch and player lookup per prospect (pre-batching behaviour).')
+    parser.add_argument('--replay', metavar='FIXTURE',
+                        help='Check the fixture\'s prospects against its responses '
+                             '(e.g. fixtures/prospect_callups_2026.json); data files are untouched.')
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        sys.exit(0 if replay(args.replay, args.serial) else 1)
+
     if not os.path.exists(DATA_FILE):
         print(f'Error: {DATA_FILE} not found', file=sys.stderr)
         sys.exit(1)
@@ -78,11 +212,11 @@ def main():
     changed     = False
     new_callups = []  # track first-time call-ups to trigger EROSP recompute
 
+    pending = []  # (entry, prospect) still to check
     for team_id, entry in data.items():
         prospect = entry.get('prospect', {})
         name         = prospect.get('name', 'TBD')
         mlbam_id     = prospect.get('mlbamId')
-        mlb_team_id  = prospect.get('mlbTeamId')
         already_up   = prospect.get('calledUp', False)
 
         # Skip if data not filled in yet or already marked as called up
@@ -91,26 +225,20 @@ def main():
         if already_up:
             print(f'  {name} ({entry["teamName"]}): already marked called up on {prospect.get("calledUpDate")}')
             continue
+        pending.append((entry, prospect))
 
-        print(f'Checking {name} ({entry["teamName"]})...', end=' ', flush=True)
-
-        is_up = False
-
-        # Primary check: known MLB team's 26-man roster
-        if mlb_team_id:
-            roster = get_active_roster(mlb_team_id)
-            is_up = mlbam_id in roster
-
-        # Secondary check: direct player lookup (catches trades to new org)
-        if not is_up:
-            is_up = verify_via_player_lookup(mlbam_id)
+    prospects = [prospect for _, prospect in pending]
+    called_up = check_serial(prospects) if args.serial else check_batched(prospects)
 
-        if is_up:
+    for entry, prospect in pending:
+        name = prospect['name']
+        print(f'Checking {name} ({entry["teamName"]})...', end=' ')
+        if called_up.get(prospect['mlbamId']):
             print(f'CALLED UP! 🚀')
             prospect['calledUp']     = True
             prospect['calledUpDate'] = today
             changed = True
-            new_callups.append({'name': name, 'mlbamId': mlbam_id})
+            new_callups.append({'name': name, 'mlbamId': prospect['mlbamId']})
         else:
             print('still in minors')
 
@@ -4,8 +4,20 @@ Compute EROSP — Expected Rest of Season Fantasy Points
 =======================================================
 Orchestrates all EROSP sub-modules and writes data/erosp/latest.json.
 
+The steps are declared as pipeline stages (see STAGES below and
+erosp/pipeline.py). Each stage's outputs are checkpointed under
+erosp_cache/checkpoints/, so partial re-runs reuse upstream work.
+
 Usage:
-    python compute_erosp.py
+    python compute_erosp.py                          # fetch fresh, reuse unchanged compute
+    python compute_erosp.py --from-stage playing_time
+    python compute_erosp.py --refresh injuries       # only the injury map changed
+    python compute_erosp.py --force                  # ignore all checkpoints
+    python compute_erosp.py --players 703601,808959  # incremental: these players only
+    python compute_erosp.py --callup-flag            # incremental: ids from pending_callup_recompute.json
+    python compute_erosp.py --sims 2000              # fewer Monte Carlo seasons (0 = skip)
+    python compute_erosp.py --pretty                 # indented latest.json (default: one player per line)
+    python compute_erosp.py --list-stages
 
 Requirements:
     pip install pybaseball pandas numpy requests python-mlb-statsapi
@@ -15,6 +27,7 @@ import os
 import sys
 import json
 import time
+import argparse
 import datetime
 import warnings
 from pathlib import Path
@@ -31,6 +44,7 @@ SCRIPT_DIR  = Path(__file__).parent
 PROJECT_DIR = SCRIPT_DIR.parent
 DATA_DIR    = PROJECT_DIR / "data" / "erosp"
 DATA_DIR.mkdir(exist_ok=True)
+CHECKPOINT_DIR = SCRIPT_DIR / "erosp_cache" / "checkpoints"
 
 sys.path.insert(0, str(SCRIPT_DIR))
 
@@ -45,10 +59,10 @@ except ImportError:
     sys.exit(1)
 
 from erosp.config import (
-    PARK_FACTORS, TEAM_NORMALIZE, MLB_TEAM_ID_TO_ABBREV, FULL_SEASON_GAMES,
+    TEAM_NORMALIZE, MLB_TEAM_ID_TO_ABBREV, DEFAULT_CONFIG,
 )
 from erosp.ingest import (
-    fetch_id_map, fetch_player_info,
+    load_id_index, fetch_player_info,
     fetch_batting_stats, fetch_pitching_stats,
     fetch_statcast_xwoba, fetch_sprint_speed,
     fetch_schedule_summary,
@@ -57,13 +71,23 @@ from erosp.ingest import (
     fetch_active_40man_team_map,
     fetch_mlb_ytd_pitcher_gs,
     load_espn_data,
-    build_name_to_mlbam, build_name_to_mlbam_from_chadwick,
-    build_fangraphs_to_mlbam, espn_name_to_mlbam,
+    espn_name_to_mlbam,
 )
+from erosp.names import normalize_many
 from erosp.talent import estimate_hitter_talent, estimate_pitcher_talent, LG_AVG_PITCH, PITCH_RATE_COLS
 from erosp.playing_time import build_playing_time
 from erosp.projection import compute_all_erosp_raw, fp_per_pa as _fp_per_pa, fp_per_start as _fp_per_start
 from erosp.startability import compute_replacement_levels, compute_erosp_startable
+from erosp.simulation import simulate_rest_of_season
+from erosp.sources import (
+    ProjectionSource, load_sources, blend_rates, backtest_weights, ensemble_weights,
+    preseason_weights, season_remaining_share, talent_rates, steamer_rates, projections_rates, espn_rates,
+    international_rates, international_hitter_rates, international_sp_rates,
+    STEAMER_BAT_COLUMNS, STEAMER_PIT_COLUMNS,
+)
+from erosp.pipeline import Stage, Pipeline, code_fingerprint
+from erosp.incremental import team_scope, splice_rows, replacement_crossings
+from erosp.output import PlayerJsonWriter
 
 
 # ---------------------------------------------------------------------------
@@ -92,401 +116,448 @@ SEASON_STARTED = (
     datetime.date(TARGET_SEASON, 3, 25) <= today < datetime.date(TARGET_SEASON, 10, 5)
 )
 
-print(f"\n{'='*65}")
-print(f"  EROSP — Expected Rest of Season Fantasy Points")
-print(f"{'='*65}")
-print(f"  Target season:  {TARGET_SEASON}")
-print(f"  History years:  {Y1}, {Y2}, {Y3}")
-print(f"  Season started: {SEASON_STARTED}")
-print(f"  Run date:       {today.strftime('%B %d, %Y')}")
-print(f"{'='*65}\n")
+RUN_CONTEXT = {
+    "run_date":            today.isoformat(),
+    "target_season":       TARGET_SEASON,
+    "historical_years":    HISTORICAL_YEARS,
+    "pitcher_extra_years": PITCHER_EXTRA_YEARS,
+    "season_started":      SEASON_STARTED,
+    "config":              DEFAULT_CONFIG,   # erosp.config.EROSPConfig read by every compute stage
+    "n_sims":              DEFAULT_CONFIG.sim_n_sims,
+    "sim_seed":            DEFAULT_CONFIG.sim_seed,
+    "pretty_output":       False,
+}
 
 
 # ---------------------------------------------------------------------------
 # STEP 1: ID mapping
 # ---------------------------------------------------------------------------
-print("─── Step 1: ID mapping ───────────────────────────────────────────")
-id_map_df      = fetch_id_map()
-fg_to_mlbam    = build_fangraphs_to_mlbam(id_map_df)
-# Manual FG ID overrides for players whose Chadwick key_fangraphs is still -1
-# but FanGraphs has assigned them an ID. Add new entries as they appear.
-# Format: {fangraphs_playerid: mlbam_id}
-_FG_MANUAL_OVERRIDES = {
-    37120: 808959,   # Munetaka Murakami (CWS 3B, 2026 debutant)
-    37124: 837227,   # Tatsuya Imai (HOU SP, 2026 debutant) — Chadwick lacks this mapping
-}
-fg_to_mlbam.update(_FG_MANUAL_OVERRIDES)
-# Use raw Chadwick (no key_fangraphs dedup) so players with key_fangraphs=-1
-# (e.g. James Wood, Paul Skenes, Nick Kurtz, Roman Anthony) are included.
-name_to_mlbam  = build_name_to_mlbam_from_chadwick()
-print()
+def stage_ids(ctx) -> dict:
+    print("─── Step 1: ID mapping ───────────────────────────────────────────")
+    index = load_id_index()
+    if index is None:
+        raise RuntimeError("Could not load Chadwick register.")
+    fg_to_mlbam    = index.fangraphs_to_mlbam()
+    # Manual FG ID overrides for players whose Chadwick key_fangraphs is still -1
+    # but FanGraphs has assigned them an ID. Add new entries as they appear.
+    # Format: {fangraphs_playerid: mlbam_id}
+    _FG_MANUAL_OVERRIDES = {
+        37120: 808959,   # Munetaka Murakami (CWS 3B, 2026 debutant)
+        37124: 837227,   # Tatsuya Imai (HOU SP, 2026 debutant) — Chadwick lacks this mapping
+    }
+    fg_to_mlbam.update(_FG_MANUAL_OVERRIDES)
+    # Names come from raw Chadwick (no key_fangraphs dedup) so players with key_fangraphs=-1
+    # (e.g. James Wood, Paul Skenes, Nick Kurtz, Roman Anthony) are included.
+    name_to_mlbam  = index.name_to_mlbam()
+    print(f"    ID index: {len(fg_to_mlbam):,} FanGraphs IDs, {len(name_to_mlbam):,} unambiguous names "
+          f"({index.n_ambiguous:,} ambiguous excluded).")
+    print()
+    return {"fg_to_mlbam": fg_to_mlbam, "name_to_mlbam": name_to_mlbam}
 
 
 # ---------------------------------------------------------------------------
 # STEP 2: Batting statistics
 # ---------------------------------------------------------------------------
-print("─── Step 2: Batting statistics ──────────────────────────────────")
-batting_by_year = fetch_batting_stats(HISTORICAL_YEARS, min_pa=100)
-if SEASON_STARTED:
-    cur_bat = fetch_batting_stats([TARGET_SEASON], min_pa=10)
-    batting_by_year.update(cur_bat)
-
-if not batting_by_year:
-    print("ERROR: No batting data. Exiting.")
-    sys.exit(1)
-print()
+def stage_batting(ctx) -> dict:
+    print("─── Step 2: Batting statistics ──────────────────────────────────")
+    batting_by_year = fetch_batting_stats(HISTORICAL_YEARS, min_pa=100)
+    if SEASON_STARTED:
+        cur_bat = fetch_batting_stats([TARGET_SEASON], min_pa=10)
+        batting_by_year.update(cur_bat)
+
+    if not batting_by_year:
+        print("ERROR: No batting data. Exiting.")
+        sys.exit(1)
+    print()
+    return {"batting_by_year": batting_by_year}
 
 
 # ---------------------------------------------------------------------------
 # STEP 3: Pitching statistics
 # ---------------------------------------------------------------------------
-print("─── Step 3: Pitching statistics ─────────────────────────────────")
-pitching_by_year = fetch_pitching_stats(HISTORICAL_YEARS, min_ip=20)
-if SEASON_STARTED:
-    cur_pit = fetch_pitching_stats([TARGET_SEASON], min_ip=5)
-    pitching_by_year.update(cur_pit)
-    # Fix L: MLB Stats API fallback when FanGraphs is unavailable (403).
-    # Provides GS/IP/rate stats so Fix H (YTD start-pace anchor) and Fix K (RP anchor) can fire.
-    if TARGET_SEASON not in pitching_by_year:
-        mlbam_to_fg = {v: k for k, v in fg_to_mlbam.items()}
-        mlb_ytd_df = fetch_mlb_ytd_pitcher_gs(TARGET_SEASON, mlbam_to_fg)
-        if not mlb_ytd_df.empty:
-            pitching_by_year[TARGET_SEASON] = mlb_ytd_df
-# Fix 2: fetch extra years (y4, y5) for extended pitcher lookback
-pitcher_extra = fetch_pitching_stats(PITCHER_EXTRA_YEARS, min_ip=20)
-pitching_by_year.update(pitcher_extra)
-extra_rows = sum(len(v) for v in pitcher_extra.values())
-print(f"  Extra pitcher years ({Y4}, {Y5}): {extra_rows:,} entries fetched.")
-print()
+def stage_pitching(ctx, fg_to_mlbam) -> dict:
+    print("─── Step 3: Pitching statistics ─────────────────────────────────")
+    pitching_by_year = fetch_pitching_stats(HISTORICAL_YEARS, min_ip=20)
+    if SEASON_STARTED:
+        cur_pit = fetch_pitching_stats([TARGET_SEASON], min_ip=5)
+        pitching_by_year.update(cur_pit)
+        # Fix L: MLB Stats API fallback when FanGraphs is unavailable (403).
+        # Provides GS/IP/rate stats so Fix H (YTD start-pace anchor) and Fix K (RP anchor) can fire.
+        if TARGET_SEASON not in pitching_by_year:
+            mlbam_to_fg = {v: k for k, v in fg_to_mlbam.items()}
+            mlb_ytd_df = fetch_mlb_ytd_pitcher_gs(TARGET_SEASON, mlbam_to_fg)
+            if not mlb_ytd_df.empty:
+                pitching_by_year[TARGET_SEASON] = mlb_ytd_df
+    # Fix 2: fetch extra years (y4, y5) for extended pitcher lookback
+    pitcher_extra = fetch_pitching_stats(PITCHER_EXTRA_YEARS, min_ip=20)
+    pitching_by_year.update(pitcher_extra)
+    extra_rows = sum(len(v) for v in pitcher_extra.values())
+    print(f"  Extra pitcher years ({Y4}, {Y5}): {extra_rows:,} entries fetched.")
+    print()
+    return {"pitching_by_year": pitching_by_year}
 
 
 # ---------------------------------------------------------------------------
 # STEP 4: Statcast xwOBA
 # ---------------------------------------------------------------------------
-print("─── Step 4: Statcast xwOBA ───────────────────────────────────────")
-xwoba_by_year = fetch_statcast_xwoba([Y1, Y2] if Y1 else [Y2])
-print()
+def stage_xwoba(ctx) -> dict:
+    print("─── Step 4: Statcast xwOBA ───────────────────────────────────────")
+    xwoba_by_year = fetch_statcast_xwoba([Y1, Y2] if Y1 else [Y2])
+    print()
+    return {"xwoba_by_year": xwoba_by_year}
 
 
 # ---------------------------------------------------------------------------
 # STEP 5: Sprint speed
 # ---------------------------------------------------------------------------
-print(f"─── Step 5: Sprint speed ({Y1}) ──────────────────────────────────")
-sprint_speed_df = fetch_sprint_speed(Y1)
-print()
+def stage_sprint_speed(ctx) -> dict:
+    print(f"─── Step 5: Sprint speed ({Y1}) ──────────────────────────────────")
+    sprint_speed_df = fetch_sprint_speed(Y1)
+    print()
+    return {"sprint_speed_df": sprint_speed_df}
 
 
 # ---------------------------------------------------------------------------
 # STEP 6: Player info (birth dates + positions)
 # ---------------------------------------------------------------------------
-print("─── Step 6: Player info (ages + positions) ───────────────────────")
-all_fgids   = set()
-for df in batting_by_year.values():
-    all_fgids |= set(df["IDfg"].dropna().astype(int).tolist())
-for df in pitching_by_year.values():
-    all_fgids |= set(df["IDfg"].dropna().astype(int).tolist())
-
-all_mlbam_ids = [fg_to_mlbam[fgid] for fgid in all_fgids if fgid in fg_to_mlbam]
-# Also include MLBAM IDs from the name fallback (players with key_fangraphs=-1)
-name_fallback_ids = list(name_to_mlbam.values())
-all_mlbam_ids = list(set(all_mlbam_ids) | set(name_fallback_ids))
-player_info_df = fetch_player_info(all_mlbam_ids)
-print()
+def stage_player_info(ctx, batting_by_year, pitching_by_year, fg_to_mlbam, name_to_mlbam) -> dict:
+    print("─── Step 6: Player info (ages + positions) ───────────────────────")
+    all_fgids   = set()
+    for df in batting_by_year.values():
+        all_fgids |= set(df["IDfg"].dropna().astype(int).tolist())
+    for df in pitching_by_year.values():
+        all_fgids |= set(df["IDfg"].dropna().astype(int).tolist())
+
+    all_mlbam_ids = [fg_to_mlbam[fgid] for fgid in all_fgids if fgid in fg_to_mlbam]
+    # Also include MLBAM IDs from the name fallback (players with key_fangraphs=-1)
+    name_fallback_ids = list(name_to_mlbam.values())
+    all_mlbam_ids = list(set(all_mlbam_ids) | set(name_fallback_ids))
+    player_info_df = fetch_player_info(all_mlbam_ids)
+    print()
+    return {"player_info_df": player_info_df}
 
 
 # ---------------------------------------------------------------------------
 # STEP 7: MLB schedule summary
 # ---------------------------------------------------------------------------
-print("─── Step 7: MLB schedule ─────────────────────────────────────────")
-schedule_summary = fetch_schedule_summary(TARGET_SEASON)
-# Build abbrev → MLB team ID reverse map
-abbrev_to_team_id = {v["abbrev"]: k for k, v in schedule_summary.items()}
-print()
+def stage_schedule(ctx) -> dict:
+    print("─── Step 7: MLB schedule ─────────────────────────────────────────")
+    schedule_summary = fetch_schedule_summary(TARGET_SEASON)
+    print()
+    return {"schedule_summary": schedule_summary}
 
 
 # ---------------------------------------------------------------------------
 # STEP 8: Talent estimation
 # ---------------------------------------------------------------------------
-print("─── Step 8: Talent estimation ────────────────────────────────────")
-print("  Hitters:")
-hitter_talent_df = estimate_hitter_talent(
-    batting_by_year    = batting_by_year,
-    historical_years   = HISTORICAL_YEARS,
-    player_info_df     = player_info_df,
-    xwoba_by_year      = xwoba_by_year,
-    sprint_speed_df    = sprint_speed_df,
-    target_season      = TARGET_SEASON,
-    fg_to_mlbam        = fg_to_mlbam,
-    name_to_mlbam      = name_to_mlbam,
-    in_season_year     = TARGET_SEASON if SEASON_STARTED else None,  # Fix I
-)
+def stage_talent(ctx, batting_by_year, pitching_by_year, player_info_df, xwoba_by_year,
+                 sprint_speed_df, fg_to_mlbam, name_to_mlbam) -> dict:
+    print("─── Step 8: Talent estimation ────────────────────────────────────")
+    print("  Hitters:")
+    hitter_talent_df = estimate_hitter_talent(
+        batting_by_year    = batting_by_year,
+        historical_years   = HISTORICAL_YEARS,
+        player_info_df     = player_info_df,
+        xwoba_by_year      = xwoba_by_year,
+        sprint_speed_df    = sprint_speed_df,
+        target_season      = TARGET_SEASON,
+        fg_to_mlbam        = fg_to_mlbam,
+        name_to_mlbam      = name_to_mlbam,
+        in_season_year     = TARGET_SEASON if SEASON_STARTED else None,  # Fix I
+        config             = ctx["config"],
+    )
 
-print("  Pitchers:")
-pitcher_talent_df = estimate_pitcher_talent(
-    pitching_by_year = pitching_by_year,
-    historical_years = HISTORICAL_YEARS,
-    player_info_df   = player_info_df,
-    target_season    = TARGET_SEASON,
-    fg_to_mlbam      = fg_to_mlbam,
-    name_to_mlbam    = name_to_mlbam,
-    extra_years      = PITCHER_EXTRA_YEARS,   # Fix 2: 5yr lookback for TJ returnees
-    in_season_year   = TARGET_SEASON if SEASON_STARTED else None,  # Fix I
-)
-print()
-
-
-# ---------------------------------------------------------------------------
-# STEP 8b: 40-man floor for returning/prospect pitchers (Fix 1)
-#
-# TJ returnees and top prospects with <30 total IP across all history years
-# are projected near zero because the model assigns them fringe playing time.
-# Override their per-IP rates with league-average values so the rotation-
-# quality ranker doesn't push them to 3 emergency starts per season.
-# ---------------------------------------------------------------------------
-print("─── Step 8b: Pitcher floor (TJ returnees / prospects) ───────────")
-if not pitcher_talent_df.empty:
-    # Build mlbam → total historical IP across all fetched seasons
-    mlbam_to_total_ip: dict = {}
-    for _yr, _pit_df in pitching_by_year.items():
-        if _yr >= TARGET_SEASON:          # skip current season
-            continue
-        for _, _row in _pit_df.iterrows():
-            _fgid  = int(_row.get("IDfg", 0) or 0)
-            _mlbam = fg_to_mlbam.get(_fgid)
-            if _mlbam:
-                mlbam_to_total_ip[_mlbam] = (
-                    mlbam_to_total_ip.get(_mlbam, 0.0) + float(_row.get("IP", 0) or 0)
-                )
-
-    # Build set of confirmed pitcher MLB positions from player_info_df
-    _pitcher_positions = {"P", "SP", "RP"}
-    _pitcher_mlbam_set: set = set()
-    if not player_info_df.empty and "mlb_position" in player_info_df.columns:
-        for _, _prow in player_info_df.iterrows():
-            _mid = int(_prow.get("mlbam_id", 0) or 0)
-            _pos = str(_prow.get("mlb_position", "")).upper()
-            if _mid and _pos in _pitcher_positions:
-                _pitcher_mlbam_set.add(_mid)
-
-    # Build set of MLBAM IDs that appeared in pitching data for y1 or y2
-    # (these are recent-activity pitchers — NOT TJ returnees)
-    _recent_activity_set: set = set()
-    for _yr in [Y1, Y2]:
-        if _yr and _yr in pitching_by_year:
-            for _, _row in pitching_by_year[_yr].iterrows():
-                _fgid = int(_row.get("IDfg", 0) or 0)
-                _m = fg_to_mlbam.get(_fgid)
-                if _m:
-                    _recent_activity_set.add(_m)
-
-    # Apply floor to pitchers with < 30 total historical IP that are:
-    #   1. Confirmed MLB pitchers (from player_info_df)
-    #   2. Currently classified as SP (not RP)
-    #   3. Absent from y1 AND y2 data (true TJ returnees / returning prospects)
-    _floor_count = 0
-    _IP_FLOOR_THRESHOLD = 30.0
-    for _mid in list(pitcher_talent_df.index):
-        if int(_mid) not in _pitcher_mlbam_set:
-            continue                                     # not a confirmed pitcher
-        if mlbam_to_total_ip.get(int(_mid), 0.0) >= _IP_FLOOR_THRESHOLD:
-            continue                                     # enough history — skip
-        if pitcher_talent_df.at[_mid, "role"] != "SP":
-            continue                                     # relievers stay as-is
-        if int(_mid) in _recent_activity_set:
-            continue                                     # had recent activity — not TJ returnee
-        # Replace per-IP rates with league-average (~100 IP equivalent projection)
-        for _col in PITCH_RATE_COLS:
-            if _col in pitcher_talent_df.columns:
-                pitcher_talent_df.at[_mid, _col] = round(LG_AVG_PITCH[_col], 6)
-        _floor_count += 1
-
-    print(f"  Floor applied to {_floor_count} pitcher(s) with < {_IP_FLOOR_THRESHOLD:.0f} total IP (SP, absent y1/y2).")
-print()
+    print("  Pitchers:")
+    pitcher_talent_df = estimate_pitcher_talent(
+        pitching_by_year = pitching_by_year,
+        historical_years = HISTORICAL_YEARS,
+        player_info_df   = player_info_df,
+        target_season    = TARGET_SEASON,
+        fg_to_mlbam      = fg_to_mlbam,
+        name_to_mlbam    = name_to_mlbam,
+        extra_years      = PITCHER_EXTRA_YEARS,   # Fix 2: 5yr lookback for TJ returnees
+        in_season_year   = TARGET_SEASON if SEASON_STARTED else None,  # Fix I
+        config           = ctx["config"],
+    )
+    print()
+
+
+    # ---------------------------------------------------------------------------
+    # STEP 8b: 40-man floor for returning/prospect pitchers (Fix 1)
+    #
+    # TJ returnees and top prospects with <30 total IP across all history years
+    # are projected near zero because the model assigns them fringe playing time.
+    # Override their per-IP rates with league-average values so the rotation-
+    # quality ranker doesn't push them to 3 emergency starts per season.
+    # ---------------------------------------------------------------------------
+    print("─── Step 8b: Pitcher floor (TJ returnees / prospects) ───────────")
+    if not pitcher_talent_df.empty:
+        # Build mlbam → total historical IP across all fetched seasons
+        mlbam_to_total_ip: dict = {}
+        for _yr, _pit_df in pitching_by_year.items():
+            if _yr >= TARGET_SEASON:          # skip current season
+                continue
+            for _, _row in _pit_df.iterrows():
+                _fgid  = int(_row.get("IDfg", 0) or 0)
+                _mlbam = fg_to_mlbam.get(_fgid)
+                if _mlbam:
+                    mlbam_to_total_ip[_mlbam] = (
+                        mlbam_to_total_ip.get(_mlbam, 0.0) + float(_row.get("IP", 0) or 0)
+                    )
+
+        # Build set of confirmed pitcher MLB positions from player_info_df
+        _pitcher_positions = {"P", "SP", "RP"}
+        _pitcher_mlbam_set: set = set()
+        if not player_info_df.empty and "mlb_position" in player_info_df.columns:
+            for _, _prow in player_info_df.iterrows():
+                _mid = int(_prow.get("mlbam_id", 0) or 0)
+                _pos = str(_prow.get("mlb_position", "")).upper()
+                if _mid and _pos in _pitcher_positions:
+                    _pitcher_mlbam_set.add(_mid)
+
+        # Build set of MLBAM IDs that appeared in pitching data for y1 or y2
+        # (these are recent-activity pitchers — NOT TJ returnees)
+        _recent_activity_set: set = set()
+        for _yr in [Y1, Y2]:
+            if _yr and _yr in pitching_by_year:
+                for _, _row in pitching_by_year[_yr].iterrows():
+                    _fgid = int(_row.get("IDfg", 0) or 0)
+                    _m = fg_to_mlbam.get(_fgid)
+                    if _m:
+                        _recent_activity_set.add(_m)
+
+        # Apply floor to pitchers with < 30 total historical IP that are:
+        #   1. Confirmed MLB pitchers (from player_info_df)
+        #   2. Currently classified as SP (not RP)
+        #   3. Absent from y1 AND y2 data (true TJ returnees / returning prospects)
+        _floor_count = 0
+        _IP_FLOOR_THRESHOLD = 30.0
+        for _mid in list(pitcher_talent_df.index):
+            if int(_mid) not in _pitcher_mlbam_set:
+                continue                                     # not a confirmed pitcher
+            if mlbam_to_total_ip.get(int(_mid), 0.0) >= _IP_FLOOR_THRESHOLD:
+                continue                                     # enough history — skip
+            if pitcher_talent_df.at[_mid, "role"] != "SP":
+                continue                                     # relievers stay as-is
+            if int(_mid) in _recent_activity_set:
+                continue                                     # had recent activity — not TJ returnee
+            # Replace per-IP rates with league-average (~100 IP equivalent projection)
+            for _col in PITCH_RATE_COLS:
+                if _col in pitcher_talent_df.columns:
+                    pitcher_talent_df.at[_mid, _col] = round(LG_AVG_PITCH[_col], 6)
+            _floor_count += 1
+
+        print(f"  Floor applied to {_floor_count} pitcher(s) with < {_IP_FLOOR_THRESHOLD:.0f} total IP (SP, absent y1/y2).")
+    print()
+    return {"hitter_talent_df": hitter_talent_df, "pitcher_talent_df": pitcher_talent_df}
 
 
 # ---------------------------------------------------------------------------
 # STEP 9: Playing time
 # ---------------------------------------------------------------------------
-print("─── Step 9: Playing time ────────────────────────────────────────")
+def stage_steamer(ctx) -> dict:
+    print("─── Step 9: Playing time ────────────────────────────────────────")
 
-# Steamer PA projections (optional — same fetch as generate_projections.py)
-steamer_pa_map: dict = {}
-try:
-    import requests
-    steamer_url = (
-        "https://www.fangraphs.com/api/projections"
-        "?type=steamer&stats=bat&pos=all&team=0&players=0&lg=all"
-    )
-    resp = requests.get(steamer_url, timeout=12,
-                        headers={"User-Agent": "Mozilla/5.0"})
-    if resp.status_code == 200:
-        proj_data = resp.json()
-        if proj_data and isinstance(proj_data, list) and len(proj_data) > 50:
-            proj_df = pd.DataFrame(proj_data)
-            if "PA" in proj_df.columns and "playerid" in proj_df.columns:
-                proj_df["playerid"] = pd.to_numeric(proj_df["playerid"], errors="coerce")
-                proj_df["PA"]       = pd.to_numeric(proj_df["PA"], errors="coerce")
-                steamer_pa_map = dict(
-                    zip(proj_df["playerid"].dropna().astype(int),
-                        proj_df["PA"].fillna(0))
-                )
-                print(f"  Steamer PA projections: {len(steamer_pa_map):,} players.")
-except Exception as exc:
-    print(f"  Steamer projections unavailable ({exc}); using defaults.")
-
-# Steamer GS/IP projections for SPs (overrides rotation-tiering heuristic)
-steamer_gs_map: dict = {}
-steamer_ip_map: dict = {}
-try:
-    import requests as _requests
-    steamer_pit_url = (
-        "https://www.fangraphs.com/api/projections"
-        "?type=steamer&stats=pit&pos=all&team=0&players=0&lg=all"
-    )
-    resp_pit = _requests.get(steamer_pit_url, timeout=12,
-                             headers={"User-Agent": "Mozilla/5.0"})
-    if resp_pit.status_code == 200:
-        pit_data = resp_pit.json()
-        if pit_data and isinstance(pit_data, list) and len(pit_data) > 50:
-            pit_df = pd.DataFrame(pit_data)
-            if "GS" in pit_df.columns and "IP" in pit_df.columns and "playerid" in pit_df.columns:
-                pit_df["playerid"] = pd.to_numeric(pit_df["playerid"], errors="coerce")
-                pit_df["GS"]       = pd.to_numeric(pit_df["GS"],       errors="coerce")
-                pit_df["IP"]       = pd.to_numeric(pit_df["IP"],       errors="coerce")
-                valid_pit = pit_df.dropna(subset=["playerid", "GS"])
-                steamer_gs_map = dict(zip(valid_pit["playerid"].astype(int), valid_pit["GS"].fillna(0)))
-                steamer_ip_map = dict(zip(valid_pit["playerid"].astype(int), valid_pit["IP"].fillna(0)))
-                print(f"  Steamer GS/IP projections: {len(steamer_gs_map):,} pitchers.")
-except Exception as exc:
-    print(f"  Steamer pitcher projections unavailable ({exc}); using rotation heuristic.")
-
-playing_time_df = build_playing_time(
-    hitter_talent_df  = hitter_talent_df,
-    pitcher_talent_df = pitcher_talent_df,
-    batting_by_year   = batting_by_year,
-    pitching_by_year  = pitching_by_year,
-    target_season     = TARGET_SEASON,
-    steamer_pa_map    = steamer_pa_map if steamer_pa_map else None,
-    steamer_gs_map    = steamer_gs_map if steamer_gs_map else None,
-    steamer_ip_map    = steamer_ip_map if steamer_ip_map else None,
-)
-print()
+    # Steamer PA projections (optional — same fetch as generate_projections.py)
+    steamer_pa_map: dict = {}
+    steamer_bat_df = pd.DataFrame()
+    try:
+        import requests
+        steamer_url = (
+            "https://www.fangraphs.com/api/projections"
+            "?type=steamer&stats=bat&pos=all&team=0&players=0&lg=all"
+        )
+        resp = requests.get(steamer_url, timeout=12,
+                            headers={"User-Agent": "Mozilla/5.0"})
+        if resp.status_code == 200:
+            proj_data = resp.json()
+            if proj_data and isinstance(proj_data, list) and len(proj_data) > 50:
+                proj_df = pd.DataFrame(proj_data)
+                if "PA" in proj_df.columns and "playerid" in proj_df.columns:
+                    proj_df["playerid"] = pd.to_numeric(proj_df["playerid"], errors="coerce")
+                    proj_df["PA"]       = pd.to_numeric(proj_df["PA"], errors="coerce")
+                    steamer_pa_map = dict(
+                        zip(proj_df["playerid"].dropna().astype(int),
+                            proj_df["PA"].fillna(0))
+                    )
+                    # counting stats kept for the ensemble's Steamer source (Step 9e)
+                    steamer_bat_df = proj_df[[c for c in STEAMER_BAT_COLUMNS if c in proj_df.columns]]
+                    print(f"  Steamer PA projections: {len(steamer_pa_map):,} players.")
+    except Exception as exc:
+        print(f"  Steamer projections unavailable ({exc}); using defaults.")
 
+    # Steamer GS/IP projections for SPs (overrides rotation-tiering heuristic)
+    steamer_gs_map: dict = {}
+    steamer_ip_map: dict = {}
+    steamer_pit_df = pd.DataFrame()
+    try:
+        import requests as _requests
+        steamer_pit_url = (
+            "https://www.fangraphs.com/api/projections"
+            "?type=steamer&stats=pit&pos=all&team=0&players=0&lg=all"
+        )
+        resp_pit = _requests.get(steamer_pit_url, timeout=12,
+                                 headers={"User-Agent": "Mozilla/5.0"})
+        if resp_pit.status_code == 200:
+            pit_data = resp_pit.json()
+            if pit_data and isinstance(pit_data, list) and len(pit_data) > 50:
+                pit_df = pd.DataFrame(pit_data)
+                if "GS" in pit_df.columns and "IP" in pit_df.columns and "playerid" in pit_df.columns:
+                    pit_df["playerid"] = pd.to_numeric(pit_df["playerid"], errors="coerce")
+                    pit_df["GS"]       = pd.to_numeric(pit_df["GS"],       errors="coerce")
+                    pit_df["IP"]       = pd.to_numeric(pit_df["IP"],       errors="coerce")
+                    valid_pit = pit_df.dropna(subset=["playerid", "GS"])
+                    steamer_gs_map = dict(zip(valid_pit["playerid"].astype(int), valid_pit["GS"].fillna(0)))
+                    steamer_ip_map = dict(zip(valid_pit["playerid"].astype(int), valid_pit["IP"].fillna(0)))
+                    steamer_pit_df = valid_pit[[c for c in STEAMER_PIT_COLUMNS if c in valid_pit.columns]]
+                    print(f"  Steamer GS/IP projections: {len(steamer_gs_map):,} pitchers.")
+    except Exception as exc:
+        print(f"  Steamer pitcher projections unavailable ({exc}); using rotation heuristic.")
+    return {
+        "steamer_pa_map": steamer_pa_map,
+        "steamer_gs_map": steamer_gs_map,
+        "steamer_ip_map": steamer_ip_map,
+        "steamer_bat_df": steamer_bat_df,
+        "steamer_pit_df": steamer_pit_df,
+    }
 
-# ---------------------------------------------------------------------------
-# STEP 9b: Injury map
-# ---------------------------------------------------------------------------
-print("─── Step 9b: Injury map ─────────────────────────────────────────")
-injury_map: dict = {}
-try:
-    injury_map = fetch_injured_players(TARGET_SEASON)
-except Exception as exc:
-    print(f"  WARNING: Could not fetch injury data ({exc}). Proceeding without.")
-print()
-
-
-# ---------------------------------------------------------------------------
-# STEP 9b-DTD: Supplement injury_map with day-to-day estimates from injury news
-# ---------------------------------------------------------------------------
-# Reads the most recent cached injury news (written by patch_injury_status.py).
-# For players NOT already on the IL, parses DTD/week-to-week keywords and adds
-# a small games_missed_est so games_remaining is discounted for nagging injuries.
-if SEASON_STARTED and injury_map is not None:
-    import re as _re
-    import unicodedata as _ud
-
-    def _norm_name(name: str) -> str:
-        n = _ud.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
-        n = _re.sub(r"\s+(jr\.?|sr\.?|ii|iii|iv)\.?\s*$", "", n, flags=_re.IGNORECASE)
-        return _re.sub(r"[^a-z0-9]", "", n.lower()).strip()
-
-    # Build normalized name → mlbam_id from talent DataFrames
-    _name_to_id: dict = {}
-    for _df in [hitter_talent_df, pitcher_talent_df]:
-        if _df.empty:
-            continue
-        for _mid, _row in _df.iterrows():
-            _n = _norm_name(str(_row.get("name", "")))
-            if _n:
-                _name_to_id[_n] = int(_mid)
-
-    # Find most recent injury news cache
-    _cache_files = sorted(
-        (SCRIPT_DIR / "erosp_cache").glob(f"injury_news_{TARGET_SEASON}_*.json"),
-        reverse=True,
+
+def stage_playing_time(ctx, hitter_talent_df, pitcher_talent_df, batting_by_year, pitching_by_year,
+                       steamer_pa_map, steamer_gs_map, steamer_ip_map) -> dict:
+    playing_time_df = build_playing_time(
+        hitter_talent_df  = hitter_talent_df,
+        pitcher_talent_df = pitcher_talent_df,
+        batting_by_year   = batting_by_year,
+        pitching_by_year  = pitching_by_year,
+        target_season     = TARGET_SEASON,
+        steamer_pa_map    = steamer_pa_map if steamer_pa_map else None,
+        steamer_gs_map    = steamer_gs_map if steamer_gs_map else None,
+        steamer_ip_map    = steamer_ip_map if steamer_ip_map else None,
+        config            = ctx["config"],
     )
-    if _cache_files:
-        with open(_cache_files[0]) as _f:
-            _news_map: dict = json.load(_f)
-
-        _dtd_count = 0
-        for _norm_key, _entry in _news_map.items():
-            _mid = _name_to_id.get(_norm_key)
-            if not _mid or _mid in injury_map:
-                continue  # already on IL — don't double-count
-            _text = _entry.get("text", "").lower()
-            _games_est = 0
-            if "day-to-day" in _text or "day to day" in _text:
-                _games_est = 5
-            elif "week-to-week" in _text or "week to week" in _text:
-                _games_est = 12
-            else:
-                _wm = _re.search(r"out\s+(?:approximately\s+)?(\d+)\s+week", _text)
-                if _wm:
-                    _weeks = int(_wm.group(1))
-                    if _weeks <= 3:  # >3 weeks → assume already on IL or about to be
-                        _games_est = _weeks * 7
-            if _games_est > 0:
-                injury_map[_mid] = {"il_type": "DTD", "games_missed_est": _games_est}
-                _dtd_count += 1
-
-        if _dtd_count:
-            print(f"  DTD supplement: {_dtd_count} non-IL players discounted from injury news "
-                  f"({_cache_files[0].name}).")
-        else:
-            print(f"  DTD supplement: no DTD players found in {_cache_files[0].name}.")
-    else:
-        print("  DTD supplement: no injury news cache found — skipping.")
-print()
+    print()
+    return {"playing_time_df": playing_time_df}
 
 
 # ---------------------------------------------------------------------------
-# STEP 9c: Active 40-man roster filter — exclude released/non-rostered players
+# STEP 9b: Injury map
 # ---------------------------------------------------------------------------
-print("─── Step 9c: Active roster filter ───────────────────────────────")
-active_40man_ids: set = set()
-if SEASON_STARTED:
+def stage_injuries(ctx, hitter_talent_df, pitcher_talent_df) -> dict:
+    print("─── Step 9b: Injury map ─────────────────────────────────────────")
+    injury_map: dict = {}
     try:
-        active_40man_ids = fetch_active_40man_mlbam_ids(TARGET_SEASON)
-        print(f"  Will filter hitters/pitchers to active 40-man only ({len(active_40man_ids):,} IDs).")
+        injury_map = fetch_injured_players(TARGET_SEASON)
     except Exception as exc:
-        print(f"  WARNING: Could not fetch 40-man roster ({exc}). Skipping filter.")
-else:
-    print("  Pre-season — skipping active roster filter (spring training rosters not stable).")
-print()
+        print(f"  WARNING: Could not fetch injury data ({exc}). Proceeding without.")
+    print()
 
 
-# Apply active 40-man filter to talent DFs (in-season only)
-if active_40man_ids and not hitter_talent_df.empty:
-    before_h = len(hitter_talent_df)
-    hitter_talent_df = hitter_talent_df[hitter_talent_df.index.isin(active_40man_ids)]
-    print(f"  Active roster filter: {before_h:,} → {len(hitter_talent_df):,} hitters")
-if active_40man_ids and not pitcher_talent_df.empty:
-    before_p = len(pitcher_talent_df)
-    pitcher_talent_df = pitcher_talent_df[pitcher_talent_df.index.isin(active_40man_ids)]
-    print(f"  Active roster filter: {before_p:,} → {len(pitcher_talent_df):,} pitchers")
-print()
+    # ---------------------------------------------------------------------------
+    # STEP 9b-DTD: Supplement injury_map with day-to-day estimates from injury news
+    # ---------------------------------------------------------------------------
+    # Reads the most recent cached injury news (written by patch_injury_status.py).
+    # For players NOT already on the IL, parses DTD/week-to-week keywords and adds
+    # a small games_missed_est so games_remaining is discounted for nagging injuries.
+    if SEASON_STARTED and injury_map is not None:
+        import re as _re
+
+        # Build normalized name → mlbam_id from talent DataFrames (keys match
+        # fetch_injury_news.py, which normalizes with the same erosp.names.normalize)
+        _name_to_id: dict = {}
+        for _df in [hitter_talent_df, pitcher_talent_df]:
+            if _df.empty or "name" not in _df.columns:
+                continue
+            for _n, _mid in zip(normalize_many(_df["name"]), _df.index):
+                if _n:
+                    _name_to_id[_n] = int(_mid)
+
+        # Find most recent injury news cache
+        _cache_files = sorted(
+            (SCRIPT_DIR / "erosp_cache").glob(f"injury_news_{TARGET_SEASON}_*.json"),
+            reverse=True,
+        )
+        if _cache_files:
+            with open(_cache_files[0]) as _f:
+                _news_map: dict = json.load(_f)
+
+            _dtd_count = 0
+            for _norm_key, _entry in _news_map.items():
+                _mid = _name_to_id.get(_norm_key)
+                if not _mid or _mid in injury_map:
+                    continue  # already on IL — don't double-count
+                _text = _entry.get("text", "").lower()
+                _games_est = 0
+                if "day-to-day" in _text or "day to day" in _text:
+                    _games_est = 5
+                elif "week-to-week" in _text or "week to week" in _text:
+                    _games_est = 12
+                else:
+                    _wm = _re.search(r"out\s+(?:approximately\s+)?(\d+)\s+week", _text)
+                    if _wm:
+                        _weeks = int(_wm.group(1))
+                        if _weeks <= 3:  # >3 weeks → assume already on IL or about to be
+                            _games_est = _weeks * 7
+                if _games_est > 0:
+                    injury_map[_mid] = {"il_type": "DTD", "games_missed_est": _games_est}
+                    _dtd_count += 1
+
+            if _dtd_count:
+                print(f"  DTD supplement: {_dtd_count} non-IL players discounted from injury news "
+                      f"({_cache_files[0].name}).")
+            else:
+                print(f"  DTD supplement: no DTD players found in {_cache_files[0].name}.")
+        else:
+            print("  DTD supplement: no injury news cache found — skipping.")
+    print()
+    return {"injury_map": injury_map}
 
 
 # ---------------------------------------------------------------------------
-# STEP 9d: Correct stale mlb_team values using live 40-man roster data
-# FanGraphs team assignments lag trades/free-agent signings; MLB Stats API
-# is authoritative for current team.
+# STEP 9c: Active 40-man roster filter — exclude released/non-rostered players
 # ---------------------------------------------------------------------------
-if SEASON_STARTED:
-    print("─── Step 9d: Refresh mlb_team from live roster data ─────────────")
-    try:
-        team_map = fetch_active_40man_team_map(TARGET_SEASON)
+def stage_rosters(ctx) -> dict:
+    print("─── Step 9c: Active roster filter ───────────────────────────────")
+    active_40man_ids: set = set()
+    if SEASON_STARTED:
+        try:
+            active_40man_ids = fetch_active_40man_mlbam_ids(TARGET_SEASON)
+            print(f"  Will filter hitters/pitchers to active 40-man only ({len(active_40man_ids):,} IDs).")
+        except Exception as exc:
+            print(f"  WARNING: Could not fetch 40-man roster ({exc}). Skipping filter.")
+    else:
+        print("  Pre-season — skipping active roster filter (spring training rosters not stable).")
+    team_map: dict = {}
+    if SEASON_STARTED:
+        try:
+            team_map = fetch_active_40man_team_map(TARGET_SEASON)
+        except Exception as exc:
+            print(f"  WARNING: Could not refresh mlb_team ({exc}). Proceeding with FanGraphs values.")
+    print()
+    return {"active_40man_ids": active_40man_ids, "team_map": team_map}
+
+
+def stage_roster_filter(ctx, hitter_talent_df, pitcher_talent_df, active_40man_ids, team_map) -> dict:
+    # Apply active 40-man filter to talent DFs (in-season only)
+    if active_40man_ids and not hitter_talent_df.empty:
+        before_h = len(hitter_talent_df)
+        hitter_talent_df = hitter_talent_df[hitter_talent_df.index.isin(active_40man_ids)]
+        print(f"  Active roster filter: {before_h:,} → {len(hitter_talent_df):,} hitters")
+    if active_40man_ids and not pitcher_talent_df.empty:
+        before_p = len(pitcher_talent_df)
+        pitcher_talent_df = pitcher_talent_df[pitcher_talent_df.index.isin(active_40man_ids)]
+        print(f"  Active roster filter: {before_p:,} → {len(pitcher_talent_df):,} pitchers")
+    print()
+    # Work on copies so the checkpointed talent frames stay untouched
+    hitter_talent_df  = hitter_talent_df.copy()
+    pitcher_talent_df = pitcher_talent_df.copy()
+
+    # ---------------------------------------------------------------------------
+    # STEP 9d: Correct stale mlb_team values using live 40-man roster data
+    # FanGraphs team assignments lag trades/free-agent signings; MLB Stats API
+    # is authoritative for current team.
+    # ---------------------------------------------------------------------------
+    if SEASON_STARTED and team_map:
+        print("─── Step 9d: Refresh mlb_team from live roster data ─────────────")
         updated_h = updated_p = 0
         if "mlb_team" in hitter_talent_df.columns:
             for mlbam_id, abbrev in team_map.items():
@@ -503,414 +574,765 @@ if SEASON_STARTED:
                         pitcher_talent_df.at[mlbam_id, "mlb_team"] = abbrev
                         updated_p += 1
         print(f"  Updated mlb_team: {updated_h} hitters, {updated_p} pitchers corrected.")
-    except Exception as exc:
-        print(f"  WARNING: Could not refresh mlb_team ({exc}). Proceeding with FanGraphs values.")
+        print()
+    return {"hitter_pool_df": hitter_talent_df, "pitcher_pool_df": pitcher_talent_df}
+
+
+# ---------------------------------------------------------------------------
+# STEP 9e: Projection-source ensemble
+# ---------------------------------------------------------------------------
+PROJECTIONS_PATH    = SCRIPT_DIR / f"fantasy_projections_{TARGET_SEASON}.csv"   # generate_projections.py
+ESPN_PROJ_PATH      = PROJECT_DIR / "data" / "espn-projections" / f"{TARGET_SEASON}.json"
+INTL_OVERRIDES_PATH = DATA_DIR / "international_overrides.json"
+
+
+def stage_ensemble(ctx, hitter_pool_df, pitcher_pool_df, playing_time_df, steamer_bat_df, steamer_pit_df,
+                   fg_to_mlbam, name_to_mlbam, espn_id_to_mlbam, schedule_summary) -> dict:
+    print("─── Step 9e: Projection-source ensemble ─────────────────────────")
+    config = ctx["config"]
+    measured = backtest_weights(DATA_DIR)
+    # Preseason projections fade as the season is played
+    weights = preseason_weights(ensemble_weights(config.source_weights, measured),
+                                season_remaining_share(schedule_summary, config))
+    if measured:
+        print("  Backtest weights: " + ", ".join(f"{n} {w:.0%}" for n, w in measured.items()))
+    sources = [
+        ProjectionSource("erosp",         lambda: talent_rates(hitter_pool_df, pitcher_pool_df)),
+        ProjectionSource("steamer",       lambda: steamer_rates(steamer_bat_df, steamer_pit_df, fg_to_mlbam)),
+        ProjectionSource("projections",   lambda: projections_rates(PROJECTIONS_PATH)),
+        ProjectionSource("espn",          lambda: espn_rates(ESPN_PROJ_PATH, espn_id_to_mlbam, name_to_mlbam)),
+        ProjectionSource("international", lambda: international_rates(INTL_OVERRIDES_PATH)),
+    ]
+    rates = load_sources(sources, weights)
+    hitter_blend_df, pitcher_blend_df = blend_rates(
+        hitter_pool_df, pitcher_pool_df, playing_time_df, rates, weights, config=config,
+    )
     print()
+    return {"hitter_blend_df": hitter_blend_df, "pitcher_blend_df": pitcher_blend_df}
 
 
 # ---------------------------------------------------------------------------
 # STEP 10: EROSP raw
 # ---------------------------------------------------------------------------
-print("─── Step 10: EROSP raw ──────────────────────────────────────────")
-projection_df = compute_all_erosp_raw(
-    hitter_talent_df      = hitter_talent_df,
-    pitcher_talent_df     = pitcher_talent_df,
-    playing_time_df       = playing_time_df,
-    schedule_summary      = schedule_summary,
-    mlb_team_abbrev_to_id = abbrev_to_team_id,
-    injury_map            = injury_map if injury_map else None,
-)
-print()
+def stage_erosp_raw(ctx, hitter_blend_df, pitcher_blend_df, playing_time_df, schedule_summary,
+                    injury_map) -> dict:
+    print("─── Step 10: EROSP raw ──────────────────────────────────────────")
+    # Build abbrev → MLB team ID reverse map
+    abbrev_to_team_id = {v["abbrev"]: k for k, v in schedule_summary.items()}
+    projection_df = compute_all_erosp_raw(
+        hitter_talent_df      = hitter_blend_df,
+        pitcher_talent_df     = pitcher_blend_df,
+        playing_time_df       = playing_time_df,
+        schedule_summary      = schedule_summary,
+        mlb_team_abbrev_to_id = abbrev_to_team_id,
+        injury_map            = injury_map if injury_map else None,
+        config                = ctx["config"],
+    )
+    print()
+    return {"raw_projection_df": projection_df}
+
+
+# ---------------------------------------------------------------------------
+# STEP 10b: Rest-of-season distribution (Monte Carlo)
+# ---------------------------------------------------------------------------
+def stage_distribution(ctx, raw_projection_df, hitter_blend_df, pitcher_blend_df, playing_time_df) -> dict:
+    print("─── Step 10b: Rest-of-season distribution ───────────────────────")
+    dist_df = simulate_rest_of_season(
+        raw_projection_df = raw_projection_df,
+        hitter_talent_df  = hitter_blend_df,
+        pitcher_talent_df = pitcher_blend_df,
+        playing_time_df   = playing_time_df,
+        n_sims            = ctx["n_sims"],
+        seed              = ctx["sim_seed"],
+        config            = ctx["config"],
+    )
+    print()
+    return {"erosp_dist_df": dist_df}
 
 
 # ---------------------------------------------------------------------------
 # STEP 11: Replacement levels + startability
 # ---------------------------------------------------------------------------
-print("─── Step 11: Replacement levels + startability ──────────────────")
-h_proj = projection_df[projection_df["player_type"] == "hitter"] if not projection_df.empty else pd.DataFrame()
-p_proj = projection_df[projection_df["player_type"].isin(["sp", "rp"])] if not projection_df.empty else pd.DataFrame()
+def stage_replacement(ctx, raw_projection_df, hitter_pool_df, pitcher_pool_df) -> dict:
+    print("─── Step 11: Replacement levels + startability ──────────────────")
+    projection_df = raw_projection_df
+    h_proj = projection_df[projection_df["player_type"] == "hitter"] if not projection_df.empty else pd.DataFrame()
+    p_proj = projection_df[projection_df["player_type"].isin(["sp", "rp"])] if not projection_df.empty else pd.DataFrame()
+
+    replacement_levels = compute_replacement_levels(
+        hitter_projection_df = h_proj,
+        pitcher_projection_df = p_proj,
+        hitter_talent_df     = hitter_pool_df,
+        pitcher_talent_df    = pitcher_pool_df,
+        config               = ctx["config"],
+    )
+    return {"replacement_levels": replacement_levels}
 
-replacement_levels = compute_replacement_levels(
-    hitter_projection_df = h_proj,
-    pitcher_projection_df = p_proj,
-    hitter_talent_df     = hitter_talent_df,
-    pitcher_talent_df    = pitcher_talent_df,
-)
 
-# Load ESPN data for fantasy team assignments
-rostered_players, free_agents, espn_to_team = load_espn_data()
-print()
-
-# Build ESPN player ID → mlbam_id mapping (name-based)
-espn_id_to_mlbam: dict = {}
-mlbam_to_fantasy_team: dict = {}
-mlbam_to_espn_id: dict = {}
-mlbam_to_fa_status: dict = {}
-
-all_espn_players = [
-    {"playerName": p.get("playerName", ""), "playerId": p.get("playerId", ""),
-     "fantasyTeamId": p.get("fantasyTeamId"), "position": p.get("position", "")}
-    for p in rostered_players
-] + [
-    {"playerName": p.get("playerName", ""), "playerId": p.get("playerId", ""),
-     "fantasyTeamId": None, "position": p.get("position", "")}
-    for p in free_agents
-]
+def stage_espn(ctx, name_to_mlbam) -> dict:
+    # Load ESPN data for fantasy team assignments
+    rostered_players, free_agents, espn_to_team = load_espn_data()
+    print()
+
+    # Build ESPN player ID → mlbam_id mapping (name-based)
+    index = load_id_index()
+    espn_id_to_mlbam: dict = {}
+    mlbam_to_fantasy_team: dict = {}
+    mlbam_to_espn_id: dict = {}
+    mlbam_to_fa_status: dict = {}
+
+    all_espn_players = [
+        {"playerName": p.get("playerName", ""), "playerId": p.get("playerId", ""),
+         "fantasyTeamId": p.get("fantasyTeamId"), "position": p.get("position", "")}
+        for p in rostered_players
+    ] + [
+        {"playerName": p.get("playerName", ""), "playerId": p.get("playerId", ""),
+         "fantasyTeamId": None, "position": p.get("position", "")}
+        for p in free_agents
+    ]
+
+    for p in all_espn_players:
+        espn_name  = str(p.get("playerName", ""))
+        espn_id    = str(p.get("playerId", ""))
+        team_id    = p.get("fantasyTeamId")
+        is_fa      = team_id is None
+
+        # Name first; the ESPN ID link learned on an earlier run covers renames
+        # and names that have since become ambiguous in Chadwick
+        mlbam = espn_name_to_mlbam(espn_name, name_to_mlbam)
+        if not mlbam and index is not None:
+            mlbam = index.espn_to_mlbam(espn_id)
+        if mlbam:
+            espn_id_to_mlbam[espn_id]    = mlbam
+            mlbam_to_fantasy_team[mlbam] = team_id if team_id else 0
+            mlbam_to_espn_id[mlbam]      = espn_id
+            mlbam_to_fa_status[mlbam]    = is_fa
+
+    if index is not None:
+        index.link_espn(espn_id_to_mlbam)
+
+    print(f"  ESPN name→MLBAM: {len(mlbam_to_espn_id):,} players matched.")
+    return {
+        "rostered_players":      rostered_players,
+        "espn_id_to_mlbam":      espn_id_to_mlbam,
+        "mlbam_to_fantasy_team": mlbam_to_fantasy_team,
+        "mlbam_to_espn_id":      mlbam_to_espn_id,
+        "mlbam_to_fa_status":    mlbam_to_fa_status,
+    }
 
-for p in all_espn_players:
-    espn_name  = str(p.get("playerName", ""))
-    espn_id    = str(p.get("playerId", ""))
-    team_id    = p.get("fantasyTeamId")
-    is_fa      = team_id is None
-
-    mlbam = espn_name_to_mlbam(espn_name, name_to_mlbam)
-    if mlbam:
-        mlbam_to_fantasy_team[mlbam] = team_id if team_id else 0
-        mlbam_to_espn_id[mlbam]      = espn_id
-        mlbam_to_fa_status[mlbam]    = is_fa
-
-print(f"  ESPN name→MLBAM: {len(mlbam_to_espn_id):,} players matched.")
-
-projection_df = compute_erosp_startable(
-    projection_df    = projection_df,
-    hitter_talent_df = hitter_talent_df,
-    pitcher_talent_df = pitcher_talent_df,
-    espn_roster_map  = {str(k): v for k, v in mlbam_to_fantasy_team.items()},
-    replacement_levels = replacement_levels,
-)
-print()
+
+def stage_startability(ctx, raw_projection_df, hitter_pool_df, pitcher_pool_df, replacement_levels,
+                       mlbam_to_fantasy_team) -> dict:
+    projection_df = compute_erosp_startable(
+        projection_df    = raw_projection_df,
+        hitter_talent_df = hitter_pool_df,
+        pitcher_talent_df = pitcher_pool_df,
+        espn_roster_map  = {str(k): v for k, v in mlbam_to_fantasy_team.items()},
+        replacement_levels = replacement_levels,
+        config           = ctx["config"],
+    )
+    print()
+    return {"startable_df": projection_df}
 
 
 # ---------------------------------------------------------------------------
 # STEP 12: Attach position + fantasy team info
 # ---------------------------------------------------------------------------
-print("─── Step 12: Attach metadata ────────────────────────────────────")
-
-position_map: dict = {}
-if not hitter_talent_df.empty:
-    position_map.update(hitter_talent_df["mlb_position"].to_dict())
-if not pitcher_talent_df.empty:
-    for mid, row in pitcher_talent_df.iterrows():
-        pos = str(row.get("mlb_position", row.get("role", "SP"))).upper()
-        # Normalize: generic 'P' from MLB API → use fantasy role (SP/RP)
-        if pos == "P":
-            pos = str(row.get("role", "SP")).upper()
-        if pos in ("SP", "RP"):
-            position_map[mid] = pos
-        elif pos not in position_map:
-            position_map[mid] = pos
-
-POS_NORMALIZE = {"LF": "OF", "CF": "OF", "RF": "OF"}
-
-projection_df["position"]       = projection_df.index.map(
-    lambda mid: POS_NORMALIZE.get(str(position_map.get(mid, "—")),
-                                   str(position_map.get(mid, "—")))
-)
-projection_df["fantasy_team_id"] = projection_df.index.map(
-    lambda mid: mlbam_to_fantasy_team.get(mid, 0)
-)
-projection_df["espn_id"]         = projection_df.index.map(
-    lambda mid: mlbam_to_espn_id.get(mid, "")
-)
-projection_df["is_fa"]           = projection_df.index.map(
-    lambda mid: mlbam_to_fa_status.get(mid, True)
-)
+def stage_metadata(ctx, startable_df, hitter_pool_df, pitcher_pool_df, mlbam_to_fantasy_team,
+                   mlbam_to_espn_id, mlbam_to_fa_status, rostered_players, espn_id_to_mlbam,
+                   injury_map, erosp_dist_df) -> dict:
+    print("─── Step 12: Attach metadata ────────────────────────────────────")
+    full_season_games = ctx["config"].full_season_games
+
+    projection_df = startable_df.copy()
+    position_map: dict = {}
+    if not hitter_pool_df.empty:
+        position_map.update(hitter_pool_df["mlb_position"].to_dict())
+    if not pitcher_pool_df.empty:
+        for mid, row in pitcher_pool_df.iterrows():
+            pos = str(row.get("mlb_position", row.get("role", "SP"))).upper()
+            # Normalize: generic 'P' from MLB API → use fantasy role (SP/RP)
+            if pos == "P":
+                pos = str(row.get("role", "SP")).upper()
+            if pos in ("SP", "RP"):
+                position_map[mid] = pos
+            elif pos not in position_map:
+                position_map[mid] = pos
+
+    POS_NORMALIZE = {"LF": "OF", "CF": "OF", "RF": "OF"}
+
+    projection_df["position"]       = projection_df.index.map(
+        lambda mid: POS_NORMALIZE.get(str(position_map.get(mid, "—")),
+                                       str(position_map.get(mid, "—")))
+    )
+    projection_df["fantasy_team_id"] = projection_df.index.map(
+        lambda mid: mlbam_to_fantasy_team.get(mid, 0)
+    )
+    projection_df["espn_id"]         = projection_df.index.map(
+        lambda mid: mlbam_to_espn_id.get(mid, "")
+    )
+    projection_df["is_fa"]           = projection_df.index.map(
+        lambda mid: mlbam_to_fa_status.get(mid, True)
+    )
 
-# erosp per remaining game
-projection_df["games_remaining"] = projection_df["games_remaining"].fillna(FULL_SEASON_GAMES).astype(int)
-projection_df["erosp_per_game"] = (
-    projection_df["erosp_startable"] / projection_df["games_remaining"].clip(lower=1)
-).round(3)
-
-# Deduplicate index (duplicate mlbam_ids cause .at[] to return a Series)
-if projection_df.index.duplicated().any():
-    n_dups = projection_df.index.duplicated().sum()
-    print(f"  Warning: {n_dups} duplicate mlbam_id(s) in projection_df — dropping extras.")
-    projection_df = projection_df[~projection_df.index.duplicated(keep="first")]
-
-# YTD floor: erosp_raw must not be lower than current season points already earned.
-# If the model has a near-zero start_probability for an active player, this prevents
-# absurdly low projections for players who are clearly performing. Active rostered players
-# only (excludes genuinely injured players on D60/SUSP who can't play rest of season).
-if SEASON_STARTED:
-    mlbam_to_ytd_pts: dict = {}
-    for _p in rostered_players:
-        _name     = str(_p.get("playerName", ""))
-        _ytd      = float(_p.get("totalPoints", 0) or 0)
-        if _ytd > 0:
-            _mid = espn_name_to_mlbam(_name, name_to_mlbam)
-            if _mid:
-                mlbam_to_ytd_pts[_mid] = _ytd
-
-    ytd_floor_count = 0
-    for _mid in projection_df.index:
-        _ytd_pts = mlbam_to_ytd_pts.get(_mid, 0)
-        if _ytd_pts <= 0:
-            continue
-        # Skip players on long-term IL — their low EROSP is intentional
-        if injury_map and _mid in injury_map:
-            il = injury_map[_mid].get("il_type", "")
-            days = int(injury_map[_mid].get("games_missed_est", 0))
-            if il in ("D60", "SUSP") and days > 21:
+    # erosp per remaining game
+    projection_df["games_remaining"] = projection_df["games_remaining"].fillna(full_season_games).astype(int)
+    projection_df["erosp_per_game"] = (
+        projection_df["erosp_startable"] / projection_df["games_remaining"].clip(lower=1)
+    ).round(3)
+
+    # Simulated percentiles are on the raw scale; startable = raw × start_prob × cap_factor
+    if not erosp_dist_df.empty:
+        dist = erosp_dist_df[~erosp_dist_df.index.duplicated()].reindex(projection_df.index)
+        scale = projection_df["start_probability"] * projection_df["cap_factor"]
+        for pct in ("p10", "p50", "p90"):
+            projection_df[f"erosp_{pct}"] = (dist[f"erosp_raw_{pct}"] * scale).clip(lower=0).round(1)
+        projection_df["downside_risk"] = dist["downside_risk"]
+
+    # Deduplicate index (duplicate mlbam_ids cause .at[] to return a Series)
+    if projection_df.index.duplicated().any():
+        n_dups = projection_df.index.duplicated().sum()
+        print(f"  Warning: {n_dups} duplicate mlbam_id(s) in projection_df — dropping extras.")
+        projection_df = projection_df[~projection_df.index.duplicated(keep="first")]
+
+    # YTD floor: erosp_raw must not be lower than current season points already earned.
+    # If the model has a near-zero start_probability for an active player, this prevents
+    # absurdly low projections for players who are clearly performing. Active rostered players
+    # only (excludes genuinely injured players on D60/SUSP who can't play rest of season).
+    if SEASON_STARTED:
+        mlbam_to_ytd_pts: dict = {}
+        for _p in rostered_players:
+            _ytd      = float(_p.get("totalPoints", 0) or 0)
+            if _ytd > 0:
+                _mid = espn_id_to_mlbam.get(str(_p.get("playerId", "")))
+                if _mid:
+                    mlbam_to_ytd_pts[_mid] = _ytd
+
+        ytd_floor_count = 0
+        for _mid in projection_df.index:
+            _ytd_pts = mlbam_to_ytd_pts.get(_mid, 0)
+            if _ytd_pts <= 0:
                 continue
-        if projection_df.at[_mid, "erosp_raw"] < _ytd_pts:
-            projection_df.at[_mid, "erosp_raw"] = round(_ytd_pts, 1)
-            ytd_floor_count += 1
-
-    if ytd_floor_count:
-        print(f"  YTD floor: raised erosp_raw for {ytd_floor_count} player(s) to match "
-              f"season pts already earned.")
+            # Skip players on long-term IL — their low EROSP is intentional
+            if injury_map and _mid in injury_map:
+                il = injury_map[_mid].get("il_type", "")
+                days = int(injury_map[_mid].get("games_missed_est", 0))
+                if il in ("D60", "SUSP") and days > 21:
+                    continue
+            if projection_df.at[_mid, "erosp_raw"] < _ytd_pts:
+                projection_df.at[_mid, "erosp_raw"] = round(_ytd_pts, 1)
+                ytd_floor_count += 1
+
+        if ytd_floor_count:
+            print(f"  YTD floor: raised erosp_raw for {ytd_floor_count} player(s) to match "
+                  f"season pts already earned.")
+    return {"projection_df": projection_df}
 
 
 # ---------------------------------------------------------------------------
 # STEP 13: Output
 # ---------------------------------------------------------------------------
-print("─── Step 13: Writing output ─────────────────────────────────────")
-
-output_players = []
-seen_mlbam: set = set()
-for mlbam_id, row in projection_df.sort_values("erosp_startable", ascending=False).iterrows():
-    if mlbam_id in seen_mlbam:
-        continue
-    seen_mlbam.add(mlbam_id)
-    erosp_startable = float(row.get("erosp_startable", 0))
-    erosp_raw       = float(row.get("erosp_raw", 0))
-
-    # Only include players with meaningful projections (>5 startable pts)
-    if erosp_startable < 5.0 and erosp_raw < 5.0:
-        continue
-
-    player: dict = {
-        "mlbam_id":        int(mlbam_id),
-        "espn_id":         str(row.get("espn_id", "")),
-        "name":            str(row.get("name", "")),
-        "position":        str(row.get("position", "—")),
-        "mlb_team":        str(row.get("mlb_team", "")),
-        "role":            str(row.get("role", "H")),
-        "fantasy_team_id": int(row.get("fantasy_team_id", 0)) if row.get("fantasy_team_id") else 0,
-        "is_fa":           bool(row.get("is_fa", True)),
-        "erosp_raw":       round(erosp_raw, 1),
-        "erosp_startable": round(erosp_startable, 1),
-        "erosp_per_game":  round(float(row.get("erosp_per_game", 0)), 3),
-        "games_remaining": int(row.get("games_remaining", FULL_SEASON_GAMES)),
-        "start_probability": round(float(row.get("start_probability", 1.0)), 3),
-        "cap_factor":      round(float(row.get("cap_factor", 1.0)), 3),
+def stage_output(ctx, projection_df, schedule_summary, injury_map, mlbam_to_fa_status) -> dict:
+    print("─── Step 13: Writing output ─────────────────────────────────────")
+    config = ctx["config"]
+    full_season_games = config.full_season_games
+
+    # Season games remaining (average across all teams)
+    avg_games_remaining = int(
+        projection_df["games_remaining"].median()
+    ) if not projection_df.empty else full_season_games
+
+    header = {
+        "generated_at":   datetime.datetime.utcnow().isoformat() + "Z",
+        "season":         TARGET_SEASON,
+        "games_remaining": avg_games_remaining,
+        "season_started": SEASON_STARTED,
     }
 
-    # IL status — include if player is currently on IL
-    if injury_map and mlbam_id in injury_map:
-        player["il_type"] = injury_map[mlbam_id]["il_type"]
-        player["il_days_remaining"] = int(injury_map[mlbam_id].get("games_missed_est", 0))
-
-    # Role-specific extras
-    if row.get("player_type") == "hitter":
-        player["pa_per_game"]  = round(float(row.get("daily_ev_raw", 0) / max(
-            abs(float(row.get("fp_per_pa", 0.001))), 0.001)), 2)
-        player["fp_per_pa"]    = round(float(row.get("fp_per_pa", 0)), 3)
-    elif row.get("player_type") == "sp":
-        player["projected_starts"] = round(float(row.get("projected_starts", 0)), 1)
-        player["fp_per_start"]     = round(float(row.get("fp_per_start", 0)), 2)
-    elif row.get("player_type") == "rp":
-        player["rp_role"] = str(row.get("rp_role", "middle"))
-
-    output_players.append(player)
-
-# ---------------------------------------------------------------------------
-# STEP 13b: International player overrides
-# ---------------------------------------------------------------------------
-# Merges manual projections for international debutants (NPB/KBO etc.) who
-# have no FanGraphs historical data and are absent from the main pipeline.
-# Skipped for any player already present in seen_mlbam.
-_intl_path = DATA_DIR / "international_overrides.json"
-if _intl_path.exists():
-    print("─── Step 13b: International player overrides ────────────────────")
-
-    # Build abbrev → schedule info (same pattern as projection.py internal logic)
-    _abbrev_to_sched = {
-        _info.get("abbrev", ""): _info
-        for _info in schedule_summary.values()
-        if _info.get("abbrev")
-    }
+    # Records are streamed to disk as they are built (compact, one per line unless
+    # --pretty); erosp/output.py also writes latest.index.json for the patchers.
+    output_path = DATA_DIR / "latest.json"
+    top5: list = []
+    with PlayerJsonWriter(output_path, header, pretty=ctx.get("pretty_output", False)) as out:
+        seen_mlbam: set = set()
+        for mlbam_id, row in projection_df.sort_values("erosp_startable", ascending=False).iterrows():
+            if mlbam_id in seen_mlbam:
+                continue
+            seen_mlbam.add(mlbam_id)
+            erosp_startable = float(row.get("erosp_startable", 0))
+            erosp_raw       = float(row.get("erosp_raw", 0))
 
-    def _intl_hitter_rates(rates: dict) -> dict:
-        """Convert avg/obp/slg/k_rate/bb_rate/hr_rate to per-PA rates for fp_per_pa()."""
-        avg      = float(rates.get("avg",      0.250))
-        obp      = float(rates.get("obp",      0.320))
-        slg      = float(rates.get("slg",      0.400))
-        k_rate   = float(rates.get("k_rate",   0.220))
-        bb_rate  = float(rates.get("bb_rate",  0.090))
-        hr_rate  = float(rates.get("hr_rate",  0.025))  # per PA
-        sb_rate  = float(rates.get("sb_rate",  0.005))
-        hbp_rate = float(rates.get("hbp_rate", 0.010))
-
-        ab_per_pa   = max(0.01, 1.0 - bb_rate - hbp_rate)
-        hit_per_pa  = avg * ab_per_pa
-        tb_per_pa   = slg * ab_per_pa
-        # xb_per_pa = 1×2B + 2×3B + 3×HR; solve for 2B and 3B assuming 3B≈0.176×2B
-        xb_per_pa   = max(0.0, tb_per_pa - hit_per_pa)
-        remaining   = max(0.0, xb_per_pa - 3.0 * hr_rate)
-        double_rate = remaining / 1.353
-        triple_rate = double_rate * 0.176
-        single_rate = max(0.0, hit_per_pa - hr_rate - double_rate - triple_rate)
-
-        return {
-            "single_rate": single_rate,
-            "double_rate": double_rate,
-            "triple_rate": triple_rate,
-            "hr_rate":     hr_rate,
-            "r_per_pa":    obp * 0.67,   # empirical correlation
-            "rbi_per_pa":  slg * 0.28,   # empirical correlation
-            "bb_rate":     bb_rate,
-            "hbp_rate":    hbp_rate,
-            "k_rate":      k_rate,
-            "sb_rate":     sb_rate,
-            "cs_rate":     sb_rate * 0.20,
-            "gidp_rate":   0.035,
-        }
-
-    def _intl_sp_rates(rates: dict) -> dict:
-        """Convert ERA/K9/BB9/H9 to per-IP rates for fp_per_start()."""
-        era     = float(rates.get("era",     4.00))
-        k_per_9 = float(rates.get("k_per_9", 8.00))
-        bb_per_9 = float(rates.get("bb_per_9", 3.00))
-        h_per_9  = float(rates.get("h_per_9",  9.00 - k_per_9 * 0.35))
-        return {
-            "h_per_ip":  h_per_9  / 9.0,
-            "er_per_ip": era      / 9.0,
-            "bb_per_ip": bb_per_9 / 9.0,
-            "k_per_ip":  k_per_9  / 9.0,
-            "w_per_gs":  float(rates.get("w_per_gs",  0.33)),
-            "qs_per_gs": float(rates.get("qs_per_gs", 0.44)),
-        }
-
-    with open(_intl_path) as _f:
-        _intl_data = json.load(_f)
-
-    _intl_added = 0
-    for _ovr in _intl_data.get("players", []):
-        _mid = int(_ovr.get("mlbam_id", 0))
-        if not _mid or _mid in seen_mlbam:
-            continue  # already produced by main pipeline — skip
-
-        _name    = _ovr.get("name", "Unknown")
-        _role    = _ovr.get("role", "H")
-        _team    = _ovr.get("mlb_team", "")
-        _pos     = _ovr.get("position", "—")
-        _ftid    = int(_ovr.get("fantasy_team_id", 0))
-        _espnid  = str(_ovr.get("espn_id", ""))
-        _rates   = _ovr.get("rates", {})
-
-        _sched      = _abbrev_to_sched.get(_team, {})
-        _games_rem  = int(_sched.get("games_remaining", FULL_SEASON_GAMES))
-        _park_factor = float(_sched.get("avg_park_factor_remaining",
-                                        PARK_FACTORS.get(_team, 1.0)))
-
-        # Apply IL discount if player is on injured list
-        _il_info = (injury_map or {}).get(_mid, {})
-        if _il_info:
-            _games_rem = max(0, _games_rem - int(_il_info.get("games_missed_est", 0)))
-
-        _is_fa = mlbam_to_fa_status.get(_mid, _ftid == 0)
-
-        if _role == "H":
-            _pr   = _intl_hitter_rates(_rates)
-            _fp_pp = _fp_per_pa(_pr)
-            _pa_per_162 = float(_ovr.get("pa_per_162", 500))
-            _pa_per_game = _pa_per_162 / 162.0
-            _daily_ev    = _fp_pp * _pa_per_game * 0.85 * _park_factor
-            _erosp_raw   = round(_daily_ev * _games_rem, 1)
-
-            _player: dict = {
-                "mlbam_id":          _mid,
-                "espn_id":           _espnid,
-                "name":              _name,
-                "position":          _pos,
-                "mlb_team":          _team,
-                "role":              "H",
-                "fantasy_team_id":   _ftid,
-                "is_fa":             _is_fa,
-                "erosp_raw":         _erosp_raw,
-                "erosp_startable":   _erosp_raw,  # rostered star: start_probability = 1.0
-                "erosp_per_game":    round(_daily_ev, 3),
-                "games_remaining":   _games_rem,
-                "start_probability": 1.0,
-                "cap_factor":        1.0,
-                "fp_per_pa":         round(_fp_pp, 3),
+            # Only include players with meaningful projections (>5 startable pts)
+            if erosp_startable < 5.0 and erosp_raw < 5.0:
+                continue
+
+            player: dict = {
+                "mlbam_id":        int(mlbam_id),
+                "espn_id":         str(row.get("espn_id", "")),
+                "name":            str(row.get("name", "")),
+                "position":        str(row.get("position", "—")),
+                "mlb_team":        str(row.get("mlb_team", "")),
+                "role":            str(row.get("role", "H")),
+                "fantasy_team_id": int(row.get("fantasy_team_id", 0)) if row.get("fantasy_team_id") else 0,
+                "is_fa":           bool(row.get("is_fa", True)),
+                "erosp_raw":       round(erosp_raw, 1),
+                "erosp_startable": round(erosp_startable, 1),
+                "erosp_per_game":  round(float(row.get("erosp_per_game", 0)), 3),
+                "games_remaining": int(row.get("games_remaining", full_season_games)),
+                "start_probability": round(float(row.get("start_probability", 1.0)), 3),
+                "cap_factor":      round(float(row.get("cap_factor", 1.0)), 3),
             }
 
-        elif _role == "SP":
-            _pr        = _intl_sp_rates(_rates)
-            _ip_per_gs = float(_ovr.get("ip_per_gs", 5.8))
-            _fp_ps     = _fp_per_start(_pr, _ip_per_gs)
-            _gs_per_162 = float(_ovr.get("gs_per_162", 25))
-            _p_start_day = _gs_per_162 / 162.0
-            _daily_ev    = _fp_ps * _p_start_day * _park_factor
-            _erosp_raw   = round(_daily_ev * _games_rem, 1)
-
-            _player = {
-                "mlbam_id":          _mid,
-                "espn_id":           _espnid,
-                "name":              _name,
-                "position":          "SP",
-                "mlb_team":          _team,
-                "role":              "SP",
-                "fantasy_team_id":   _ftid,
-                "is_fa":             _is_fa,
-                "erosp_raw":         _erosp_raw,
-                "erosp_startable":   _erosp_raw,
-                "erosp_per_game":    round(_daily_ev, 3),
-                "games_remaining":   _games_rem,
-                "start_probability": 1.0,
-                "cap_factor":        1.0,
-                "projected_starts":  round(_gs_per_162 * _games_rem / 162.0, 1),
-                "fp_per_start":      round(_fp_ps, 2),
+            # Rest-of-season distribution (Step 10b), startable scale
+            if pd.notna(row.get("erosp_p50", np.nan)):
+                for pct in ("p10", "p50", "p90"):
+                    player[f"erosp_{pct}"] = round(float(row[f"erosp_{pct}"]), 1)
+                player["downside_risk"] = round(float(row.get("downside_risk", 0)), 3)
+
+            # IL status — include if player is currently on IL
+            if injury_map and mlbam_id in injury_map:
+                player["il_type"] = injury_map[mlbam_id]["il_type"]
+                player["il_days_remaining"] = int(injury_map[mlbam_id].get("games_missed_est", 0))
+
+            # Role-specific extras
+            if row.get("player_type") == "hitter":
+                player["pa_per_game"]  = round(float(row.get("daily_ev_raw", 0) / max(
+                    abs(float(row.get("fp_per_pa", 0.001))), 0.001)), 2)
+                player["fp_per_pa"]    = round(float(row.get("fp_per_pa", 0)), 3)
+            elif row.get("player_type") == "sp":
+                player["projected_starts"] = round(float(row.get("projected_starts", 0)), 1)
+                player["fp_per_start"]     = round(float(row.get("fp_per_start", 0)), 2)
+            elif row.get("player_type") == "rp":
+                player["rp_role"] = str(row.get("rp_role", "middle"))
+
+            out.write(player)
+            if len(top5) < 5:
+                top5.append(player)
+
+        # ---------------------------------------------------------------------------
+        # STEP 13b: International player overrides
+        # ---------------------------------------------------------------------------
+        # Merges manual projections for international debutants (NPB/KBO etc.) who
+        # have no FanGraphs historical data and are absent from the main pipeline.
+        # Skipped for any player already present in seen_mlbam (those get the
+        # override through the Step 9e ensemble instead).
+        _intl_path = INTL_OVERRIDES_PATH
+        if _intl_path.exists():
+            print("─── Step 13b: International player overrides ────────────────────")
+
+            # Build abbrev → schedule info (same pattern as projection.py internal logic)
+            _abbrev_to_sched = {
+                _info.get("abbrev", ""): _info
+                for _info in schedule_summary.values()
+                if _info.get("abbrev")
             }
 
-        else:
-            print(f"  Skipping {_name}: unsupported role '{_role}'")
-            continue
-
-        # Attach IL status if applicable
-        if _il_info:
-            _player["il_type"]           = _il_info["il_type"]
-            _player["il_days_remaining"] = int(_il_info.get("games_missed_est", 0))
-
-        output_players.append(_player)
-        seen_mlbam.add(_mid)
-        _intl_added += 1
-        print(f"  Override added: {_name} ({_pos}, {_team})"
-              f"  EROSP_R={_erosp_raw:.0f}  games_rem={_games_rem}")
-
-    print(f"  International overrides: {_intl_added} player(s) added.\n")
-
-# Season games remaining (average across all teams)
-avg_games_remaining = int(
-    projection_df["games_remaining"].median()
-) if not projection_df.empty else FULL_SEASON_GAMES
-
-output = {
-    "generated_at":   datetime.datetime.utcnow().isoformat() + "Z",
-    "season":         TARGET_SEASON,
-    "games_remaining": avg_games_remaining,
-    "season_started": SEASON_STARTED,
-    "total_players":  len(output_players),
-    "players":        output_players,
-}
+            with open(_intl_path) as _f:
+                _intl_data = json.load(_f)
+
+            _intl_added = 0
+            for _ovr in _intl_data.get("players", []):
+                _mid = int(_ovr.get("mlbam_id", 0))
+                if not _mid or _mid in seen_mlbam:
+                    continue  # already produced by main pipeline — skip
+
+                _name    = _ovr.get("name", "Unknown")
+                _role    = _ovr.get("role", "H")
+                _team    = _ovr.get("mlb_team", "")
+                _pos     = _ovr.get("position", "—")
+                _ftid    = int(_ovr.get("fantasy_team_id", 0))
+                _espnid  = str(_ovr.get("espn_id", ""))
+                _rates   = _ovr.get("rates", {})
+
+                _sched      = _abbrev_to_sched.get(_team, {})
+                _games_rem  = int(_sched.get("games_remaining", full_season_games))
+                _park_factor = float(_sched.get("avg_park_factor_remaining",
+                                                config.park_factors.get(_team, 1.0)))
+
+                # Apply IL discount if player is on injured list
+                _il_info = (injury_map or {}).get(_mid, {})
+                if _il_info:
+                    _games_rem = max(0, _games_rem - int(_il_info.get("games_missed_est", 0)))
+
+                _is_fa = mlbam_to_fa_status.get(_mid, _ftid == 0)
+
+                if _role == "H":
+                    _pr   = international_hitter_rates(_rates)
+                    _fp_pp = _fp_per_pa(_pr, config)
+                    _pa_per_162 = float(_ovr.get("pa_per_162", 500))
+                    _pa_per_game = _pa_per_162 / 162.0
+                    _daily_ev    = _fp_pp * _pa_per_game * 0.85 * _park_factor
+                    _erosp_raw   = round(_daily_ev * _games_rem, 1)
+
+                    _player: dict = {
+                        "mlbam_id":          _mid,
+                        "espn_id":           _espnid,
+                        "name":              _name,
+                        "position":          _pos,
+                        "mlb_team":          _team,
+                        "role":              "H",
+                        "fantasy_team_id":   _ftid,
+                        "is_fa":             _is_fa,
+                        "erosp_raw":         _erosp_raw,
+                        "erosp_startable":   _erosp_raw,  # rostered star: start_probability = 1.0
+                        "erosp_per_game":    round(_daily_ev, 3),
+                        "games_remaining":   _games_rem,
+                        "start_probability": 1.0,
+                        "cap_factor":        1.0,
+                        "fp_per_pa":         round(_fp_pp, 3),
+                    }
+
+                elif _role == "SP":
+                    _pr        = international_sp_rates(_rates)
+                    _ip_per_gs = float(_ovr.get("ip_per_gs", 5.8))
+                    _fp_ps     = _fp_per_start(_pr, _ip_per_gs, config)
+                    _gs_per_162 = float(_ovr.get("gs_per_162", 25))
+                    _p_start_day = _gs_per_162 / 162.0
+                    _daily_ev    = _fp_ps * _p_start_day * _park_factor
+                    _erosp_raw   = round(_daily_ev * _games_rem, 1)
+
+                    _player = {
+                        "mlbam_id":          _mid,
+                        "espn_id":           _espnid,
+                        "name":              _name,
+                        "position":          "SP",
+                        "mlb_team":          _team,
+                        "role":              "SP",
+                        "fantasy_team_id":   _ftid,
+                        "is_fa":             _is_fa,
+                        "erosp_raw":         _erosp_raw,
+                        "erosp_startable":   _erosp_raw,
+                        "erosp_per_game":    round(_daily_ev, 3),
+                        "games_remaining":   _games_rem,
+                        "start_probability": 1.0,
+                        "cap_factor":        1.0,
+                        "projected_starts":  round(_gs_per_162 * _games_rem / 162.0, 1),
+                        "fp_per_start":      round(_fp_ps, 2),
+                    }
+
+                else:
+                    print(f"  Skipping {_name}: unsupported role '{_role}'")
+                    continue
+
+                # Attach IL status if applicable
+                if _il_info:
+                    _player["il_type"]           = _il_info["il_type"]
+                    _player["il_days_remaining"] = int(_il_info.get("games_missed_est", 0))
+
+                out.write(_player)
+                seen_mlbam.add(_mid)
+                _intl_added += 1
+                print(f"  Override added: {_name} ({_pos}, {_team})"
+                      f"  EROSP_R={_erosp_raw:.0f}  games_rem={_games_rem}")
+
+            print(f"  International overrides: {_intl_added} player(s) added.\n")
+
+        out.footer["total_players"] = out.count
+
+    print(f"  ✓ Wrote {out.count:,} players to {output_path}")
+    print(f"\n{'='*65}")
+    print(f"  ✓ EROSP computation complete!")
+    print(f"    Season:       {TARGET_SEASON}")
+    print(f"    Players:      {out.count:,}")
+    print(f"    Output:       {output_path.relative_to(PROJECT_DIR)}")
+    if top5:
+        print(f"    Top 5 (startable):")
+        for p in top5:
+            print(f"      {p['name']:<24} {p['position']:<4} {p['mlb_team']:<4} "
+                  f"EROSP_S={p['erosp_startable']:.0f}  EROSP_R={p['erosp_raw']:.0f}")
+    print(f"{'='*65}\n")
+    return {}
+
+# ---------------------------------------------------------------------------
+# Pipeline definition
+# ---------------------------------------------------------------------------
+# Fetch stages are volatile (always re-run; their own caches decide whether to
+# hit the network). Compute stages are skipped when their inputs' content
+# hashes and declared params match the last checkpoint. Stages that read the
+# EROSPConfig declare "config", so a different parameter set recomputes them.
+_SEASON = ("target_season", "historical_years", "season_started")
+
+STAGES = [
+    Stage("ids",            stage_ids,          outputs=["fg_to_mlbam", "name_to_mlbam"], volatile=True),
+    Stage("batting",        stage_batting,      outputs=["batting_by_year"], params=_SEASON, volatile=True),
+    Stage("pitching",       stage_pitching,     inputs=["fg_to_mlbam"], outputs=["pitching_by_year"],
+          params=_SEASON + ("pitcher_extra_years",), volatile=True),
+    Stage("xwoba",          stage_xwoba,        outputs=["xwoba_by_year"], params=_SEASON, volatile=True),
+    Stage("sprint_speed",   stage_sprint_speed, outputs=["sprint_speed_df"], params=_SEASON, volatile=True),
+    Stage("player_info",    stage_player_info,
+          inputs=["batting_by_year", "pitching_by_year", "fg_to_mlbam", "name_to_mlbam"],
+          outputs=["player_info_df"], volatile=True),
+    Stage("schedule",       stage_schedule,     outputs=["schedule_summary"], params=_SEASON, volatile=True),
+    Stage("talent",         stage_talent,
+          inputs=["batting_by_year", "pitching_by_year", "player_info_df", "xwoba_by_year",
+                  "sprint_speed_df", "fg_to_mlbam", "name_to_mlbam"],
+          outputs=["hitter_talent_df", "pitcher_talent_df"],
+          params=_SEASON + ("pitcher_extra_years", "config")),
+    Stage("steamer",        stage_steamer,
+          outputs=["steamer_pa_map", "steamer_gs_map", "steamer_ip_map", "steamer_bat_df", "steamer_pit_df"],
+          volatile=True),
+    Stage("playing_time",   stage_playing_time,
+          inputs=["hitter_talent_df", "pitcher_talent_df", "batting_by_year", "pitching_by_year",
+                  "steamer_pa_map", "steamer_gs_map", "steamer_ip_map"],
+          outputs=["playing_time_df"],
+          params=("target_season", "run_date", "config")),    # pace math uses today's date
+    Stage("injuries",       stage_injuries,
+          inputs=["hitter_talent_df", "pitcher_talent_df"], outputs=["injury_map"],
+          params=_SEASON, volatile=True),
+    Stage("rosters",        stage_rosters,
+          outputs=["active_40man_ids", "team_map"], params=_SEASON, volatile=True),
+    Stage("roster_filter",  stage_roster_filter,
+          inputs=["hitter_talent_df", "pitcher_talent_df", "active_40man_ids", "team_map"],
+          outputs=["hitter_pool_df", "pitcher_pool_df"], params=_SEASON),
+    Stage("espn",           stage_espn,
+          inputs=["name_to_mlbam"],
+          outputs=["rostered_players", "espn_id_to_mlbam", "mlbam_to_fantasy_team", "mlbam_to_espn_id",
+                   "mlbam_to_fa_status"], volatile=True),
+    # reads generate_projections / ESPN / override files and the backtest weights
+    Stage("ensemble",       stage_ensemble,
+          inputs=["hitter_pool_df", "pitcher_pool_df", "playing_time_df", "steamer_bat_df", "steamer_pit_df",
+                  "fg_to_mlbam", "name_to_mlbam", "espn_id_to_mlbam", "schedule_summary"],
+          outputs=["hitter_blend_df", "pitcher_blend_df"], params=_SEASON + ("config",), volatile=True),
+    Stage("erosp_raw",      stage_erosp_raw,
+          inputs=["hitter_blend_df", "pitcher_blend_df", "playing_time_df", "schedule_summary",
+                  "injury_map"],
+          outputs=["raw_projection_df"], params=("config",)),
+    Stage("distribution",   stage_distribution,
+          inputs=["raw_projection_df", "hitter_blend_df", "pitcher_blend_df", "playing_time_df"],
+          outputs=["erosp_dist_df"], params=("n_sims", "sim_seed", "config")),
+    Stage("replacement",    stage_replacement,
+          inputs=["raw_projection_df", "hitter_pool_df", "pitcher_pool_df"],
+          outputs=["replacement_levels"], params=("config",)),
+    Stage("startability",   stage_startability,
+          inputs=["raw_projection_df", "hitter_pool_df", "pitcher_pool_df", "replacement_levels",
+                  "mlbam_to_fantasy_team"],
+          outputs=["startable_df"], params=("config",)),
+    Stage("metadata",       stage_metadata,
+          inputs=["startable_df", "hitter_pool_df", "pitcher_pool_df", "mlbam_to_fantasy_team",
+                  "mlbam_to_espn_id", "mlbam_to_fa_status", "rostered_players", "espn_id_to_mlbam",
+                  "injury_map", "erosp_dist_df"],
+          outputs=["projection_df"], params=_SEASON + ("config",)),
+    Stage("output",         stage_output,
+          inputs=["projection_df", "schedule_summary", "injury_map", "mlbam_to_fa_status"],
+          params=_SEASON + ("config",), volatile=True, checkpoint=False),
+]
+
+
+def build_pipeline() -> Pipeline:
+    code_files = list((SCRIPT_DIR / "erosp").glob("*.py")) + [Path(__file__)]
+    return Pipeline(STAGES, CHECKPOINT_DIR, code_hash=code_fingerprint(code_files))
+
+
+# ---------------------------------------------------------------------------
+# Incremental mode — recompute a handful of players from the last checkpoints
+# ---------------------------------------------------------------------------
+CALLUP_FLAG_PATH = DATA_DIR / "pending_callup_recompute.json"
+
+
+def load_callup_ids(path: Path = CALLUP_FLAG_PATH) -> list:
+    """mlbam_ids listed in the recompute flag written by check_prospect_callups.py."""
+    if not path.exists():
+        return []
+    with open(path) as f:
+        data = json.load(f)
+    return [int(c["mlbamId"]) for c in data.get("new_callups", []) if c.get("mlbamId")]
+
+
+def _rows(df: pd.DataFrame, ids) -> pd.DataFrame:
+    return df[df.index.isin(ids)] if not df.empty else df
+
+
+def run_incremental(pipeline: Pipeline, changed_ids) -> bool:
+    """
+    Recompute talent, playing time, the source ensemble, EROSP raw, its
+    simulated distribution and startability for `changed_ids` only, then rewrite latest.json from the merged frames.
+
+    Scope is widened to the SPs sharing an MLB team with any changed SP
+    (rotation tiering and the weekly start cap are per team). Replacement
+    levels are refreshed only if a changed player crosses a slot's pool
+    threshold; otherwise startability is recomputed for the scope alone.
+
+    Returns False when there are no checkpoints to start from.
+    """
+    loaded = pipeline.load_artifacts()
+    if loaded is None:
+        return False
+    art, hashes = loaded["artifacts"], loaded["hashes"]
+    ctx = RUN_CONTEXT
+    changed = set(int(x) for x in changed_ids)
+    print(f"─── Incremental recompute: {len(changed)} player(s) ─────────────────────")
+    t0 = time.perf_counter()
+
+    old_h_pool, old_p_pool = art["hitter_pool_df"], art["pitcher_pool_df"]
+    old_raw = art["raw_projection_df"]
+    old_hitter_pos = old_h_pool["mlb_position"].to_dict() if not old_h_pool.empty else {}
+
+    # Inputs a call-up or IL move can change (cached fetches — cheap)
+    for name in ("batting", "pitching", "player_info", "schedule"):
+        pipeline.run_stage(name, ctx, art, hashes)
+
+    # Talent — blending is per player, so feed only the changed players' rows
+    fg_to_mlbam = art["fg_to_mlbam"]
+    fgids = {fg for fg, mid in fg_to_mlbam.items() if mid in changed}
+    for df in (art["hitter_talent_df"], art["pitcher_talent_df"]):
+        if not df.empty and "fgid" in df.columns:
+            fgids.update(int(x) for x in df.loc[df.index.isin(changed), "fgid"].dropna())
+    sub = stage_talent(
+        ctx,
+        {y: d[d["IDfg"].isin(fgids)] for y, d in art["batting_by_year"].items()},
+        {y: d[d["IDfg"].isin(fgids)] for y, d in art["pitching_by_year"].items()},
+        art["player_info_df"], art["xwoba_by_year"], art["sprint_speed_df"],
+        fg_to_mlbam, art["name_to_mlbam"],
+    )
+    talent = {
+        key: splice_rows(art[key], changed, _rows(sub[key], changed))
+        for key in ("hitter_talent_df", "pitcher_talent_df")
+    }
+    pipeline.commit("talent", ctx, art, hashes, talent, patched=True)
+    h_talent, p_talent = art["hitter_talent_df"], art["pitcher_talent_df"]
+
+    for name in ("injuries", "rosters", "espn"):
+        pipeline.run_stage(name, ctx, art, hashes)
+
+    # Roster pool — refreshed team may pull in a new rotation, so widen twice
+    scope = team_scope(changed, [p_talent, old_p_pool])
+    pools = stage_roster_filter(ctx, _rows(h_talent, scope), _rows(p_talent, scope),
+                                art["active_40man_ids"], art["team_map"])
+    scope = team_scope(changed, [p_talent, old_p_pool, pools["pitcher_pool_df"]])
+    pools = stage_roster_filter(ctx, _rows(h_talent, scope), _rows(p_talent, scope),
+                                art["active_40man_ids"], art["team_map"])
+    pipeline.commit("roster_filter", ctx, art, hashes, {
+        "hitter_pool_df":  splice_rows(old_h_pool, scope, pools["hitter_pool_df"]),
+        "pitcher_pool_df": splice_rows(old_p_pool, scope, pools["pitcher_pool_df"]),
+    }, patched=True)
+
+    # Playing time — SP tiering ranks every SP on the (FanGraphs) team
+    pt_scope = team_scope(scope, [p_talent])
+    pt = stage_playing_time(
+        ctx, _rows(h_talent, pt_scope), _rows(p_talent, pt_scope),
+        art["batting_by_year"], art["pitching_by_year"],
+        art["steamer_pa_map"], art["steamer_gs_map"], art["steamer_ip_map"],
+    )["playing_time_df"]
+    pipeline.commit("playing_time", ctx, art, hashes, {
+        "playing_time_df": splice_rows(art["playing_time_df"], pt_scope, pt),
+    }, patched=True)
+
+    # Ensemble + EROSP raw for everyone whose talent, pool row or playing time moved
+    scope |= pt_scope
+    blend = stage_ensemble(
+        ctx, _rows(art["hitter_pool_df"], scope), _rows(art["pitcher_pool_df"], scope),
+        art["playing_time_df"], art["steamer_bat_df"], art["steamer_pit_df"],
+        fg_to_mlbam, art["name_to_mlbam"], art["espn_id_to_mlbam"], art["schedule_summary"],
+    )
+    pipeline.commit("ensemble", ctx, art, hashes, {
+        key: splice_rows(art[key], scope, blend[key]) for key in ("hitter_blend_df", "pitcher_blend_df")
+    }, patched=True)
+    raw = stage_erosp_raw(
+        ctx, _rows(art["hitter_blend_df"], scope), _rows(art["pitcher_blend_df"], scope),
+        art["playing_time_df"], art["schedule_summary"], art["injury_map"],
+    )["raw_projection_df"]
+    pipeline.commit("erosp_raw", ctx, art, hashes, {
+        "raw_projection_df": splice_rows(old_raw, scope, raw),
+    }, patched=True)
+
+    # Distribution — simulated per player, so only the scope is re-drawn
+    dist = stage_distribution(
+        ctx, _rows(art["raw_projection_df"], scope), art["hitter_blend_df"], art["pitcher_blend_df"],
+        art["playing_time_df"],
+    )["erosp_dist_df"]
+    pipeline.commit("distribution", ctx, art, hashes, {
+        "erosp_dist_df": splice_rows(art["erosp_dist_df"], scope, dist),
+    }, patched=True)
+
+    new_hitter_pos = art["hitter_pool_df"]["mlb_position"].to_dict() if not art["hitter_pool_df"].empty else {}
+    crossed = replacement_crossings(old_raw, art["raw_projection_df"], scope,
+                                    old_hitter_pos, new_hitter_pos, art["replacement_levels"],
+                                    config=ctx["config"])
+    if crossed:
+        print(f"  Replacement pool threshold crossed at {', '.join(crossed)} — refreshing levels.")
+        pipeline.run_stage("replacement", ctx, art, hashes)
+        pipeline.run_stage("startability", ctx, art, hashes)
+    else:
+        print("  Replacement levels unchanged — startability for changed scope only.")
+        # SP cap factor sums projected starts over each MLB team's rotation
+        st_scope = team_scope(scope, [old_raw, art["raw_projection_df"]])
+        part = compute_erosp_startable(
+            projection_df      = _rows(art["raw_projection_df"], st_scope),
+            hitter_talent_df   = art["hitter_pool_df"],
+            pitcher_talent_df  = art["pitcher_pool_df"],
+            espn_roster_map    = {str(k): v for k, v in art["mlbam_to_fantasy_team"].items()},
+            replacement_levels = art["replacement_levels"],
+            config             = ctx["config"],
+        )
+        pipeline.commit("startability", ctx, art, hashes, {
+            "startable_df": splice_rows(art["startable_df"], st_scope, part),
+        }, patched=True)
+
+    pipeline.run_stage("metadata", ctx, art, hashes)
+    pipeline.run_stage("output", ctx, art, hashes)
+    print(f"  Incremental recompute finished in {time.perf_counter() - t0:.1f}s "
+          f"({len(scope)} player(s) in scope).")
+    return True
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Compute EROSP and write data/erosp/latest.json.")
+    parser.add_argument("--from-stage", metavar="STAGE",
+                        help="Reuse checkpoints for every stage before STAGE; recompute STAGE onward.")
+    parser.add_argument("--refresh", metavar="STAGE", action="append", default=[],
+                        help="Recompute STAGE and its dependents only (repeatable or comma-separated).")
+    parser.add_argument("--force", action="store_true", help="Ignore all checkpoints.")
+    parser.add_argument("--players", metavar="IDS",
+                        help="Comma-separated mlbam_ids: incremental recompute from the last checkpoints.")
+    parser.add_argument("--callup-flag", nargs="?", const=str(CALLUP_FLAG_PATH), metavar="PATH",
+                        help="Incremental recompute for the call-ups in pending_callup_recompute.json.")
+    parser.add_argument("--sims", type=int, default=DEFAULT_CONFIG.sim_n_sims, metavar="N",
+                        help=f"Monte Carlo seasons per player for percentiles "
+                             f"(default {DEFAULT_CONFIG.sim_n_sims}; 0 = skip).")
+    parser.add_argument("--pretty", action="store_true",
+                        help="Write latest.json indented (default: compact, one player per line).")
+    parser.add_argument("--list-stages", action="store_true", help="Print stage names and exit.")
+    args = parser.parse_args(argv)
+    RUN_CONTEXT["n_sims"] = max(0, args.sims)
+    RUN_CONTEXT["pretty_output"] = args.pretty
+
+    pipeline = build_pipeline()
+    if args.list_stages:
+        for s in pipeline.stages:
+            deps = ", ".join(s.inputs) or "—"
+            print(f"  {s.name:<14} {'(volatile) ' if s.volatile else ''}← {deps}")
+        return
+
+    refresh = [n.strip() for r in args.refresh for n in r.split(",") if n.strip()]
+
+    print(f"\n{'='*65}")
+    print(f"  EROSP — Expected Rest of Season Fantasy Points")
+    print(f"{'='*65}")
+    print(f"  Target season:  {TARGET_SEASON}")
+    print(f"  History years:  {Y1}, {Y2}, {Y3}")
+    print(f"  Season started: {SEASON_STARTED}")
+    print(f"  Run date:       {today.strftime('%B %d, %Y')}")
+    if args.from_stage or refresh:
+        print(f"  Partial run:    from={args.from_stage or '—'}  refresh={','.join(refresh) or '—'}")
+    print(f"{'='*65}\n")
+
+    changed: list = []
+    if args.players:
+        changed += [int(x) for x in args.players.split(",") if x.strip()]
+    if args.callup_flag:
+        changed += load_callup_ids(Path(args.callup_flag))
+    if changed and not args.force:
+        if run_incremental(pipeline, changed):
+            return
+        print("  Falling back to a full run.\n")
+    elif args.players is not None or args.callup_flag:
+        print("  No player IDs supplied — running the full pipeline.\n")
+
+    try:
+        pipeline.run(RUN_CONTEXT, from_stage=args.from_stage, refresh=refresh, force=args.force)
+    except KeyError as exc:
+        parser.error(str(exc.args[0]))
+
 
-output_path = DATA_DIR / "latest.json"
-with open(output_path, "w") as f:
-    json.dump(output, f, indent=2)
-
-print(f"  ✓ Wrote {len(output_players):,} players to {output_path}")
-print(f"\n{'='*65}")
-print(f"  ✓ EROSP computation complete!")
-print(f"    Season:       {TARGET_SEASON}")
-print(f"    Players:      {len(output_players):,}")
-print(f"    Output:       {output_path.relative_to(PROJECT_DIR)}")
-if output_players:
-    top5 = output_players[:5]
-    print(f"    Top 5 (startable):")
-    for p in top5:
-        print(f"      {p['name']:<24} {p['position']:<4} {p['mlb_team']:<4} "
-              f"EROSP_S={p['erosp_startable']:.0f}  EROSP_R={p['erosp_raw']:.0f}")
-print(f"{'='*65}\n")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""
+Content-addressed DataFrame cache shared by compute_erosp.py and
+generate_projections.py.
+
+Entries are keyed by the fetch function plus its arguments, so
+batting_stats(2026, qual=10) and batting_stats(2026, qual=100) no longer
+collide on one CSV. Each entry carries its own TTL:
+  - completed seasons never expire — a season counts as complete from
+    SEASON_END (month, day) of its own year, after the World Series
+  - the in-progress season expires after YTD_TTL_HOURS
+  - season-less reference data (Chadwick) expires after REFERENCE_TTL_HOURS
+
+An expired entry stays on disk until a refetch replaces it: when the
+refetch fails, fetch() serves the stale frame (with a warning) instead of
+nothing. seed_csv() imports a legacy CSV as such an already-expired entry.
+
+Frames are stored as Parquet when pyarrow is available and as pickle
+otherwise (both round-trip dtypes, unlike CSV). A JSON manifest tracks size
+and last access; it is rewritten when entries change and, for access times
+only, once at exit. Once the store exceeds max_bytes the least-recently-used
+entries are evicted, which keeps the GitHub Actions cache artifact small.
+"""
+
+import atexit
+import datetime
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+import pandas as pd
+
+YTD_TTL_HOURS       = 6.0
+SEASON_END          = (11, 1)   # (month, day) after which the year's season is final
+REFERENCE_TTL_HOURS = 24.0 * 7
+DEFAULT_MAX_MB      = float(os.environ.get("EROSP_CACHE_MAX_MB", "128"))
+
+MANIFEST_NAME = "manifest.json"
+
+
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def season_ttl_hours(season: Optional[int], today: Optional[datetime.date] = None,
+                     season_end: tuple = SEASON_END) -> Optional[float]:
+    """
+    TTL for data belonging to `season`.
+
+    None means the entry never expires (a completed season's stats are final):
+    any earlier year, and the current one from its `season_end` (month, day).
+    """
+    if season is None:
+        return REFERENCE_TTL_HOURS
+    today = today or datetime.date.today()
+    if season < today.year or (season == today.year and today >= datetime.date(season, *season_end)):
+        return None
+    return YTD_TTL_HOURS
+
+
+def cache_key(func: Callable, args: tuple, kwargs: dict) -> str:
+    """Stable hash of fully-qualified function name + call arguments."""
+    name = f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}"
+    payload = json.dumps([name, list(args), kwargs], sort_keys=True, default=repr)
+    return hashlib.sha256(payload.encode()).hexdigest()[:24]
+
+
+class DataCache:
+    """
+    On-disk DataFrame store under `root/frames/`.
+
+    Usage:
+        cache = DataCache(CACHE_DIR)
+        df = cache.fetch(batting_stats, 2025, qual=100, season=2025,
+                         label="batting_stats(2025)")
+    """
+
+    def __init__(self, root: Path, max_bytes: Optional[int] = None):
+        self.dir = Path(root) / "frames"
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_bytes if max_bytes is not None else DEFAULT_MAX_MB * 1024 * 1024)
+        self._manifest_path = self.dir / MANIFEST_NAME
+        self._manifest: Dict[str, dict] = self._load_manifest()
+        self._parquet = _has_pyarrow()
+        self._dirty = False
+        atexit.register(self.flush)
+
+    # -- manifest -----------------------------------------------------------
+
+    def _load_manifest(self) -> Dict[str, dict]:
+        if not self._manifest_path.exists():
+            return {}
+        try:
+            with open(self._manifest_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            print("    WARNING: cache manifest unreadable — starting fresh.")
+            return {}
+
+    def _save_manifest(self) -> None:
+        tmp = self._manifest_path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(self._manifest, f, indent=1, sort_keys=True)
+        os.replace(tmp, self._manifest_path)
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Write access times recorded by get() since the last manifest save."""
+        if self._dirty:
+            self._save_manifest()
+
+    # -- entries ------------------------------------------------------------
+
+    def _is_fresh(self, entry: dict, now: float) -> bool:
+        ttl = entry.get("ttl_hours")
+        return ttl is None or now - entry["created"] < ttl * 3600.0
+
+    def _drop(self, key: str) -> None:
+        entry = self._manifest.pop(key, None)
+        if entry:
+            (self.dir / entry["file"]).unlink(missing_ok=True)
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Return the cached frame for `key` if present and unexpired (or, with
+        allow_stale, present at all). Expired entries are kept, not dropped.
+        """
+        entry = self._manifest.get(key)
+        if entry is None:
+            return None
+        now = time.time()
+        path = self.dir / entry["file"]
+        if not path.exists():
+            self._drop(key)
+            self._save_manifest()
+            return None
+        if not allow_stale and not self._is_fresh(entry, now):
+            return None
+        try:
+            if entry["format"] == "parquet":
+                df = pd.read_parquet(path)
+            else:
+                df = pd.read_pickle(path)
+        except Exception as exc:
+            print(f"    WARNING: cache entry {entry.get('label', key)} unreadable ({exc}) — refetching.")
+            self._drop(key)
+            self._save_manifest()
+            return None
+        entry["accessed"] = now
+        self._dirty = True
+        return df
+
+    def put(self, key: str, df: pd.DataFrame, ttl_hours: Optional[float], label: str = "",
+            created: Optional[float] = None) -> None:
+        """
+        Store `df` under `key`, then evict LRU entries beyond max_bytes.
+        `created` backdates the entry (default: now).
+        """
+        self._drop(key)
+        fmt = "pickle"
+        path = self.dir / f"{key}.pkl"
+        if self._parquet:
+            try:
+                pq_path = self.dir / f"{key}.parquet"
+                df.to_parquet(pq_path, index=False)
+                fmt, path = "parquet", pq_path
+            except Exception:
+                # Mixed-type object columns can't be written as Parquet
+                (self.dir / f"{key}.parquet").unlink(missing_ok=True)
+        if fmt == "pickle":
+            df.to_pickle(path)
+        now = time.time()
+        self._manifest[key] = {
+            "file":      path.name,
+            "format":    fmt,
+            "label":     label,
+            "bytes":     path.stat().st_size,
+            "created":   now if created is None else created,
+            "accessed":  now,
+            "ttl_hours": ttl_hours,
+        }
+        self.evict(keep=key)
+        self._save_manifest()
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """
+        Drop least-recently-used entries while the store is over max_bytes.
+        Expired entries are not dropped for being expired: they are the
+        fallback when a refetch fails.
+        """
+        removed = 0
+        total = sum(e["bytes"] for e in self._manifest.values())
+        for key, entry in sorted(self._manifest.items(), key=lambda kv: kv[1]["accessed"]):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= entry["bytes"]
+            self._drop(key)
+            removed += 1
+
+        if removed:
+            print(f"    Cache eviction: removed {removed} entr{'y' if removed == 1 else 'ies'} "
+                  f"({total / 1024 / 1024:.1f} MB retained).")
+        return removed
+
+    # -- high-level ---------------------------------------------------------
+
+    def lookup(self, fetch_func: Callable, *args, **kwargs) -> Optional[pd.DataFrame]:
+        """Return the cached result of fetch_func(*args, **kwargs) without fetching."""
+        return self.get(cache_key(fetch_func, args, kwargs))
+
+    def version(self, fetch_func: Callable, *args, allow_stale: bool = False,
+                **kwargs) -> Optional[str]:
+        """
+        Identifier of the cached fetch_func(*args, **kwargs) frame — changes
+        whenever it is refetched. None if not cached, or expired unless
+        allow_stale. Reads only the manifest, so derived artifacts (e.g.
+        ids.IdIndex) can check staleness without loading the frame.
+        """
+        key = cache_key(fetch_func, args, kwargs)
+        entry = self._manifest.get(key)
+        if entry is None or (not allow_stale and not self._is_fresh(entry, time.time())):
+            return None
+        if not (self.dir / entry["file"]).exists():
+            return None
+        return f"{key}-{int(entry['created'])}"
+
+    def fetch(
+        self,
+        fetch_func: Callable,
+        *args,
+        season: Optional[int] = None,
+        ttl_hours: Optional[float] = -1,
+        label: str = "",
+        retry: Optional[Callable] = None,
+        **kwargs,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Return fetch_func(*args, **kwargs), served from cache when fresh.
+
+        TTL defaults to season_ttl_hours(season); pass ttl_hours explicitly
+        (None = never expires) to override. `retry` wraps the live call,
+        e.g. ingest._retry. If the live call fails or returns nothing, an
+        expired entry is served in its place until a refetch succeeds.
+        """
+        label = label or getattr(fetch_func, "__name__", "fetch")
+        key = cache_key(fetch_func, args, kwargs)
+        df = self.get(key)
+        if df is not None:
+            print(f"    Cache hit  → {label}")
+            return df
+
+        print(f"    Fetching   → {label}")
+        try:
+            if retry is not None:
+                df = retry(fetch_func, *args, label=label, **kwargs)
+            else:
+                df = fetch_func(*args, **kwargs)
+        except Exception:
+            if key not in self._manifest:
+                raise
+            df = None
+        if df is not None and not df.empty:
+            ttl = season_ttl_hours(season) if ttl_hours == -1 else ttl_hours
+            self.put(key, df, ttl, label=label)
+            return df
+
+        stale = self.get(key, allow_stale=True)
+        if stale is not None:
+            created = self._manifest[key]["created"]
+            age = f"{(time.time() - created) / 3600.0:.0f}h old" if created else "seeded from CSV"
+            print(f"    WARNING: {label} fetch failed — serving stale cache entry ({age}).")
+            return stale
+        return df
+
+    def seed_csv(self, path: Path, fetch_func: Callable, *args, label: str = "",
+                 **kwargs) -> bool:
+        """
+        Import the CSV at `path` as the (already expired) entry for
+        fetch_func(*args, **kwargs), unless that key is cached already. The
+        next fetch() tries a live refetch and falls back to the seed, so
+        CSVs from the old per-file cache keep offline runs working without
+        being trusted as fresh. Returns True if the CSV was imported.
+        """
+        path = Path(path)
+        key = cache_key(fetch_func, args, kwargs)
+        if key in self._manifest or not path.exists():
+            return False
+        df = pd.read_csv(path, low_memory=False)
+        if df.empty:
+            return False
+        self.put(key, df, ttl_hours=0.0, label=label or path.stem, created=0.0)
+        return True
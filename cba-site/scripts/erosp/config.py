@@ -7,7 +7,9 @@ CBA League Scoring:
   (Ignored in v1: GWRBI, CYC, OFAST, DPT, PKO, E, NH, PG, CG, SO bonus, GWRBI)
 """
 
-from typing import Dict, List
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 
 # ---------------------------------------------------------------------------
 # Per-event scoring values
@@ -196,3 +198,136 @@ MLB_TEAM_ID_TO_ABBREV: Dict[int, str] = {
     139: "TB",  140: "TEX", 141: "TOR", 142: "MIN", 143: "PHI",
     144: "ATL", 145: "CWS", 146: "MIA", 147: "NYY", 158: "MIL",
 }
+
+# ---------------------------------------------------------------------------
+# Monte Carlo rest-of-season distribution (simulation.py)
+# ---------------------------------------------------------------------------
+SIM_N_SIMS              = 10_000
+SIM_SEED                = 20260401
+SIM_INJURY_RATE_HITTER  = 0.005   # P(new IL stint starts) per team game — ~0.8 stints/season
+SIM_INJURY_RATE_PITCHER = 0.006
+SIM_INJURY_GAMES_HITTER  = 18.0   # mean IL stint length in team games (geometric)
+SIM_INJURY_GAMES_PITCHER = 28.0
+SIM_IP_SD_PER_START     = 1.4     # start-to-start IP spread
+SIM_IP_SD_PER_APP       = 0.35    # relief-appearance IP spread
+SIM_DOWNSIDE_TAIL       = 0.10    # downside_risk = shortfall of the worst 10% of sims
+
+# ---------------------------------------------------------------------------
+# Projection-source ensemble (sources.py)
+# ---------------------------------------------------------------------------
+# Prior weight of each source in the rate blend, renormalized per player over
+# the sources that project him. Only erosp is weighted until the others have
+# weights measured by backtest: when benchmark_steamer.py has written
+# steamer_head_to_head_{year}.csv, the erosp share is re-split with steamer by
+# inverse backtest MSE (sources.ensemble_weights). Preseason sources are
+# scaled by the share of the season left (sources.preseason_weights).
+SOURCE_WEIGHTS: Dict[str, float] = {
+    "erosp":         1.0,   # talent.py estimates
+    "steamer":       0.0,   # FanGraphs Steamer counting stats
+    "projections":   0.0,   # generate_projections.py ProjectedFP
+    "espn":          0.0,   # data/espn-projections/{season}.json projectedFP
+    "international": 0.0,   # international_overrides.json (NPB/KBO debutants)
+}
+
+
+# ---------------------------------------------------------------------------
+# Injectable parameter set
+# ---------------------------------------------------------------------------
+
+def _frozen(mapping: Mapping) -> Mapping:
+    """Read-only copy of `mapping`; list values (slot eligibility) become tuples."""
+    return MappingProxyType({k: tuple(v) if isinstance(v, list) else v for k, v in mapping.items()})
+
+
+@dataclass(frozen=True, slots=True)
+class EROSPConfig:
+    """
+    The constants above that the stage modules read (talent, playing_time,
+    projection, startability, simulation, sources), as one immutable value.
+
+    Every stage function takes `config=None`, meaning DEFAULT_CONFIG — the
+    module values; compute_erosp.py passes its run config to each stage
+    through the pipeline context. Variants are built with
+    dataclasses.replace(), e.g.
+
+        alt = replace(DEFAULT_CONFIG, sigmoid_tau=0.25, scoring={**SCORING, "qs": 5.0})
+
+    so several scoring systems or parameter sets can be evaluated side by side
+    in one process. Mapping fields are stored as read-only copies
+    (MappingProxyType), so a config can't be changed after it is built.
+    """
+    scoring:                     Mapping[str, float] = field(default_factory=lambda: SCORING)
+    hitter_slots:                Mapping[str, int] = field(default_factory=lambda: HITTER_SLOTS)
+    pitcher_slots:               Mapping[str, int] = field(default_factory=lambda: PITCHER_SLOTS)
+    position_eligibility:        Mapping[str, Tuple[str, ...]] = field(default_factory=lambda: POSITION_ELIGIBILITY)
+    league_teams:                int   = LEAGUE_TEAMS
+    sp_weekly_cap:               int   = SP_WEEKLY_CAP
+    rp_daily_starts:             int   = RP_DAILY_STARTS
+    replacement_pool_multiplier: float = REPLACEMENT_POOL_MULTIPLIER
+
+    blend_weights_3yr:           Tuple[float, ...] = tuple(BLEND_WEIGHTS_3YR)
+    blend_weights_2yr:           Tuple[float, ...] = tuple(BLEND_WEIGHTS_2YR)
+    blend_weights_5yr:           Tuple[float, ...] = tuple(BLEND_WEIGHTS_5YR)
+    blend_weight_ytd:            float = BLEND_WEIGHT_YTD
+    mean_regression:             float = MEAN_REGRESSION
+    mean_regression_high:        float = MEAN_REGRESSION_HIGH
+    mean_regression_low:         float = MEAN_REGRESSION_LOW
+    pa_full_season:              float = PA_FULL_SEASON
+    ip_full_season:              float = IP_FULL_SEASON
+
+    age_peak:                    float = AGE_PEAK
+    age_growth_rate:             float = AGE_GROWTH_RATE
+    age_decline_early:           float = AGE_DECLINE_EARLY
+    age_decline_late:            float = AGE_DECLINE_LATE
+    age_decline_fast_threshold:  float = AGE_DECLINE_FAST_THRESHOLD
+    age_pitcher_decline_mult:    float = AGE_PITCHER_DECLINE_MULT
+    age_mod_min:                 float = AGE_MOD_MIN
+    age_mod_max:                 float = AGE_MOD_MAX
+
+    xwoba_damp:                  float = XWOBA_DAMP
+    xwoba_lg_avg:                float = XWOBA_LG_AVG
+    sigmoid_tau:                 float = SIGMOID_TAU
+
+    default_p_play_hitter:       float = DEFAULT_P_PLAY_HITTER
+    default_pa_per_game:         float = DEFAULT_PA_PER_GAME
+    default_p_play_catcher:      float = DEFAULT_P_PLAY_CATCHER
+    default_pa_per_game_catcher: float = DEFAULT_PA_PER_GAME_CATCHER
+    default_ip_per_start:        float = DEFAULT_IP_PER_START
+    default_p_appear_rp:         float = DEFAULT_P_APPEAR_RP
+    default_ip_per_app:          float = DEFAULT_IP_PER_APP
+    rotation_days:               float = ROTATION_DAYS
+    full_season_games:           int   = FULL_SEASON_GAMES
+
+    park_factors:                Mapping[str, float] = field(default_factory=lambda: PARK_FACTORS)
+
+    sim_n_sims:                  int   = SIM_N_SIMS
+    sim_seed:                    int   = SIM_SEED
+    sim_injury_rate_hitter:      float = SIM_INJURY_RATE_HITTER
+    sim_injury_rate_pitcher:     float = SIM_INJURY_RATE_PITCHER
+    sim_injury_games_hitter:     float = SIM_INJURY_GAMES_HITTER
+    sim_injury_games_pitcher:    float = SIM_INJURY_GAMES_PITCHER
+    sim_ip_sd_per_start:         float = SIM_IP_SD_PER_START
+    sim_ip_sd_per_app:           float = SIM_IP_SD_PER_APP
+    sim_downside_tail:           float = SIM_DOWNSIDE_TAIL
+
+    source_weights:              Mapping[str, float] = field(default_factory=lambda: SOURCE_WEIGHTS)
+
+    def __post_init__(self) -> None:
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if isinstance(value, Mapping):
+                object.__setattr__(self, f.name, _frozen(value))
+            elif isinstance(value, list):
+                object.__setattr__(self, f.name, tuple(value))
+
+    def __reduce__(self):
+        # MappingProxyType doesn't pickle (process pools, checkpoints): rebuild from dicts
+        return (type(self), tuple(dict(v) if isinstance(v, Mapping) else v
+                                  for v in (getattr(self, f.name) for f in fields(self))))
+
+    @property
+    def hitter_slot_names(self) -> List[str]:
+        return list(self.hitter_slots)
+
+
+DEFAULT_CONFIG = EROSPConfig()
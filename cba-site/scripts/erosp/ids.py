@@ -0,0 +1,214 @@
+"""
+Persistent player identity index (FanGraphs ID / MLBAM ID / ESPN ID / name).
+
+Every script used to rebuild its own ID maps from the Chadwick register:
+fetch_id_map() for FanGraphs → MLBAM, build_name_to_mlbam_from_chadwick()
+walking every row with iterrows() for names, and espn_name_to_mlbam()
+re-running its regexes for every ESPN player. IdIndex does that work once
+per Chadwick version and stores the result under erosp_cache/id_index/ as
+plain .npy arrays plus a small meta.json, so later runs np.load them with
+mmap_mode="r" in a few milliseconds.
+
+Tables (all int64 IDs; name tables sorted for np.searchsorted):
+  fangraphs / fg_mlbam        FanGraphs ID → MLBAM, first Chadwick row per
+                              FanGraphs ID (same rule as fetch_id_map)
+  names / name_mlbam          names.normalize(first + last) → MLBAM, names
+                              shared by different MLBAM IDs excluded
+  flipped / flipped_mlbam     "last first" spelling of each multi-word name,
+                              so a "Last First" query resolves in one lookup
+  espn / espn_mlbam           ESPN player ID → MLBAM, learned from name
+                              matches and carried across Chadwick versions
+
+The index is rebuilt whenever the Chadwick frame in the DataCache changes
+(see DataCache.version and ingest.load_id_index).
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from .names import normalize, normalize_many
+
+INDEX_SCHEMA = 2
+META_NAME    = "meta.json"
+
+_TABLES = (
+    "fangraphs", "fg_mlbam",
+    "names", "name_mlbam",
+    "flipped", "flipped_mlbam",
+    "espn", "espn_mlbam",
+)
+
+
+def _unflip(key: str) -> str:
+    """Inverse of names.flip: the query spelling that flips to `key`."""
+    parts = key.split()
+    return " ".join(parts[1:] + parts[:1])
+
+
+def _sorted_table(keys: np.ndarray, values: np.ndarray):
+    order = np.argsort(keys, kind="stable")
+    return keys[order], values[order]
+
+
+def _search(keys: np.ndarray, values: np.ndarray, key) -> Optional[int]:
+    if len(keys) == 0:
+        return None
+    i = int(np.searchsorted(keys, key))
+    if i < len(keys) and keys[i] == key:
+        return int(values[i])
+    return None
+
+
+class IdIndex:
+    """
+    Read-only lookups over the identity tables, plus ESPN link persistence.
+
+    Build with IdIndex.build(chadwick_df, version), persist with save(),
+    reopen with IdIndex.load(path) — normally via ingest.load_id_index().
+    """
+
+    def __init__(self, tables: Dict[str, np.ndarray], version: str = "",
+                 path: Optional[Path] = None, n_ambiguous: int = 0):
+        self.tables = tables
+        self.version = version
+        self.path = Path(path) if path is not None else None
+        self.n_ambiguous = n_ambiguous
+
+    def __len__(self) -> int:
+        return len(self.tables["names"])
+
+    # -- construction -------------------------------------------------------
+
+    @classmethod
+    def build(cls, chadwick: pd.DataFrame, version: str = "",
+              espn_links: Optional[Dict[int, int]] = None) -> "IdIndex":
+        """Build every table from a raw chadwick_register() frame (vectorized)."""
+        fg    = pd.to_numeric(chadwick["key_fangraphs"], errors="coerce")
+        mlbam = pd.to_numeric(chadwick["key_mlbam"],     errors="coerce")
+        first = chadwick["name_first"]
+        last  = chadwick["name_last"]
+
+        # FanGraphs → MLBAM (keeps key_fangraphs = -1 rows exactly as fetch_id_map did)
+        pairs = pd.DataFrame({"fg": fg, "mlbam": mlbam}).dropna()
+        pairs = pairs.astype(np.int64).drop_duplicates(subset=["fg"])
+
+        # Normalized names — no key_fangraphs dedup, so FanGraphs-less rookies are included
+        has_id = mlbam.notna()
+        full = (first[has_id].fillna("").astype(str).str.strip() + " " +
+                last[has_id].fillna("").astype(str).str.strip()).str.strip()
+        named = pd.DataFrame({"name": normalize_many(full),
+                              "mlbam": mlbam[has_id].astype(np.int64)})
+        named = named[named["name"].str.len() > 0]
+        n_ids = named.drop_duplicates().groupby("name")["mlbam"].size()
+        unique = named[named["name"].isin(n_ids.index[n_ids == 1])].drop_duplicates(subset=["name"])
+        names, name_mlbam = _sorted_table(unique["name"].to_numpy(str),
+                                          unique["mlbam"].to_numpy(np.int64))
+
+        multi = np.char.count(names, " ") > 0 if len(names) else np.zeros(0, bool)
+        flipped, flipped_mlbam = _sorted_table(
+            np.array([_unflip(n) for n in names[multi]], dtype=names.dtype),
+            name_mlbam[multi],
+        )
+
+        links = espn_links or {}
+        espn, espn_mlbam = _sorted_table(np.fromiter(links.keys(), np.int64, len(links)),
+                                         np.fromiter(links.values(), np.int64, len(links)))
+
+        tables = {
+            "fangraphs":     pairs["fg"].to_numpy(np.int64),
+            "fg_mlbam":      pairs["mlbam"].to_numpy(np.int64),
+            "names":         names,
+            "name_mlbam":    name_mlbam,
+            "flipped":       flipped,
+            "flipped_mlbam": flipped_mlbam,
+            "espn":          espn,
+            "espn_mlbam":    espn_mlbam,
+        }
+        return cls(tables, version=version, n_ambiguous=int((n_ids > 1).sum()))
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["IdIndex"]:
+        """Memory-map a saved index; None if missing, partial or an older schema."""
+        path = Path(path)
+        try:
+            with open(path / META_NAME) as f:
+                meta = json.load(f)
+            if meta.get("schema") != INDEX_SCHEMA:
+                return None
+            tables = {name: np.load(path / f"{name}.npy", mmap_mode="r") for name in _TABLES}
+        except (OSError, ValueError):
+            return None
+        return cls(tables, version=meta.get("version", ""), path=path,
+                   n_ambiguous=meta.get("n_ambiguous", 0))
+
+    def save(self, path: Optional[Path] = None) -> None:
+        """Write arrays first and meta.json last, so a half-written index never loads."""
+        path = Path(path or self.path)
+        path.mkdir(parents=True, exist_ok=True)
+        (path / META_NAME).unlink(missing_ok=True)
+        for name in _TABLES:
+            tmp = path / f"{name}.tmp.npy"
+            np.save(tmp, np.asarray(self.tables[name]))
+            os.replace(tmp, path / f"{name}.npy")
+        meta = {"schema": INDEX_SCHEMA, "version": self.version,
+                "n_ambiguous": self.n_ambiguous,
+                "rows": {name: int(len(self.tables[name])) for name in _TABLES}}
+        with open(path / META_NAME, "w") as f:
+            json.dump(meta, f, indent=1)
+        self.path = path
+
+    # -- lookups ------------------------------------------------------------
+
+    def fangraphs_to_mlbam(self) -> Dict[int, int]:
+        return dict(zip(self.tables["fangraphs"].tolist(), self.tables["fg_mlbam"].tolist()))
+
+    def name_to_mlbam(self) -> Dict[str, int]:
+        return dict(zip(self.tables["names"].tolist(), self.tables["name_mlbam"].tolist()))
+
+    def lookup_name(self, name: str) -> Optional[int]:
+        """Normalized exact match, then the 'Last First' spelling."""
+        key = normalize(name)
+        mid = _search(self.tables["names"], self.tables["name_mlbam"], key)
+        if mid is None and " " in key:
+            mid = _search(self.tables["flipped"], self.tables["flipped_mlbam"], key)
+        return mid
+
+    def espn_to_mlbam(self, espn_id) -> Optional[int]:
+        try:
+            key = int(espn_id)
+        except (TypeError, ValueError):
+            return None
+        return _search(self.tables["espn"], self.tables["espn_mlbam"], key)
+
+    def espn_links(self) -> Dict[int, int]:
+        return dict(zip(self.tables["espn"].tolist(), self.tables["espn_mlbam"].tolist()))
+
+    # -- ESPN links ---------------------------------------------------------
+
+    def link_espn(self, espn_id_to_mlbam: Dict[str, int]) -> int:
+        """
+        Record ESPN ID → MLBAM matches (newest wins) and re-save if anything
+        changed. Returns the number of new or changed links.
+        """
+        links = self.espn_links()
+        changed = 0
+        for espn_id, mid in espn_id_to_mlbam.items():
+            try:
+                key, mid = int(espn_id), int(mid)
+            except (TypeError, ValueError):
+                continue
+            if links.get(key) != mid:
+                links[key] = mid
+                changed += 1
+        if changed:
+            espn, espn_mlbam = _sorted_table(np.fromiter(links.keys(), np.int64, len(links)),
+                                             np.fromiter(links.values(), np.int64, len(links)))
+            self.tables = {**self.tables, "espn": espn, "espn_mlbam": espn_mlbam}
+            if self.path is not None:
+                self.save()
+        return changed
@@ -0,0 +1,141 @@
+"""
+Helpers for incremental EROSP recomputes.
+
+When only a handful of players change (a prospect call-up, an IL move), the
+full pipeline is wasted work: talent blending is per-player, and playing time /
+startability only couple players through their MLB team (SP rotation tiering,
+SP weekly cap). This module works out that dependency scope, splices the
+recomputed rows back into the checkpointed frames, and decides whether the
+changed players moved across a position's replacement-pool threshold.
+"""
+
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+from .config import DEFAULT_CONFIG, EROSPConfig
+from .startability import slot_eligibility
+
+
+def team_scope(
+    changed_ids: Iterable[int],
+    pitcher_frames: Iterable[pd.DataFrame],
+) -> Set[int]:
+    """
+    Expand `changed_ids` to every SP sharing an MLB team with a changed SP.
+
+    Each frame must be indexed by mlbam_id with `role` and `mlb_team` columns
+    (talent, pool or raw projection frames). Old and new frames should both be
+    passed so a traded pitcher refreshes his former rotation too.
+    """
+    changed = set(int(x) for x in changed_ids)
+    teams: Set[str] = set()
+    frames = [f for f in pitcher_frames if f is not None and not f.empty and "role" in f.columns]
+    for f in frames:
+        hit = f[f.index.isin(changed) & (f["role"] == "SP")]
+        teams.update(hit["mlb_team"].astype(str))
+    scope = set(changed)
+    for f in frames:
+        mates = f[(f["role"] == "SP") & f["mlb_team"].astype(str).isin(teams)]
+        scope.update(int(x) for x in mates.index)
+    return scope
+
+
+def splice_rows(base: pd.DataFrame, scope: Iterable[int], new_rows: pd.DataFrame) -> pd.DataFrame:
+    """
+    Replace rows of `base` whose index is in `scope` with `new_rows`.
+
+    Replacements keep the position of the row they replace and unseen ids are
+    appended, so a patched frame lists players in the same order a full run
+    would (latest.json ordering follows these frames).
+    """
+    scope = set(scope)
+    kept = base[~base.index.isin(scope)] if not base.empty else base
+    if new_rows is None or new_rows.empty:
+        return kept
+    if kept.empty and base.empty:
+        return new_rows.copy()
+    first_pos: Dict[int, int] = {}
+    for i, mid in enumerate(base.index):
+        first_pos.setdefault(mid, i)
+    tail = len(base)
+    order = [i for i, mid in enumerate(base.index) if mid not in scope]
+    order += [first_pos.get(mid, tail) for mid in new_rows.index]
+    merged = pd.concat([kept, new_rows])
+    return merged.iloc[np.argsort(order, kind="stable")]
+
+
+def _slot_members(
+    raw_df: pd.DataFrame,
+    hitter_pos: Dict[int, str],
+    cfg: EROSPConfig,
+) -> Dict[str, pd.Series]:
+    """slot → daily_ev_raw of eligible players (mirrors compute_replacement_levels)."""
+    out: Dict[str, pd.Series] = {}
+    if raw_df.empty:
+        return out
+    h = raw_df[raw_df["player_type"] == "hitter"]
+    if not h.empty:
+        slot_names = cfg.hitter_slot_names
+        elig = slot_eligibility([str(hitter_pos.get(m, "OF")) for m in h.index], slot_names, config=cfg)
+        for j, slot in enumerate(slot_names):
+            out[slot] = h.loc[elig[:, j], "daily_ev_raw"]
+    for role in ("SP", "RP"):
+        out[role] = raw_df.loc[raw_df["role"] == role, "daily_ev_raw"]
+    return out
+
+
+def replacement_crossings(
+    old_raw: pd.DataFrame,
+    new_raw: pd.DataFrame,
+    changed_ids: Iterable[int],
+    hitter_pos_old: Dict[int, str],
+    hitter_pos_new: Dict[int, str],
+    replacement_levels: Dict[str, float],
+    config: Optional[EROSPConfig] = None,
+) -> List[str]:
+    """
+    Slots whose replacement level can move because of `changed_ids`.
+
+    The replacement level is the k-th best daily_ev_raw among eligible players
+    (k = slots × replacement_pool_multiplier); `config` must be the one the
+    levels were computed under. A player moving while staying
+    strictly on one side of that value leaves the k-th value unchanged; a
+    player crossing it, landing on it, or a pool at/below k entries does not.
+    Absent/ineligible counts as "below".
+    """
+    changed = set(int(x) for x in changed_ids)
+    cfg = config or DEFAULT_CONFIG
+    old_members = _slot_members(old_raw, hitter_pos_old, cfg)
+    new_members = _slot_members(new_raw, hitter_pos_new, cfg)
+    n_slots = {**cfg.hitter_slots, **{k: cfg.pitcher_slots[k] for k in ("SP", "RP")}}
+
+    crossed: List[str] = []
+    for slot, n in n_slots.items():
+        old_s = old_members.get(slot, pd.Series(dtype=float))
+        new_s = new_members.get(slot, pd.Series(dtype=float))
+        k = int(n * cfg.replacement_pool_multiplier)
+        threshold: Optional[float] = replacement_levels.get(slot)
+        if threshold is None:
+            if not old_s[old_s.index.isin(changed)].empty or not new_s[new_s.index.isin(changed)].empty:
+                crossed.append(slot)
+            continue
+        touched = old_s.index.isin(changed).any() or new_s.index.isin(changed).any()
+        if not touched:
+            continue
+        if len(old_s) <= k or len(new_s) <= k:
+            crossed.append(slot)
+            continue
+        for mid in changed:
+            before = float(old_s[mid].max()) if mid in old_s.index else None
+            after  = float(new_s[mid].max()) if mid in new_s.index else None
+            if before == threshold or after == threshold:
+                crossed.append(slot)
+                break
+            above_before = before is not None and before > threshold
+            above_after  = after is not None and after > threshold
+            if above_before != above_after:
+                crossed.append(slot)
+                break
+    return crossed
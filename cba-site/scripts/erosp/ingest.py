@@ -5,6 +5,7 @@ Fetches and caches:
   - FanGraphs batting + pitching stats (pybaseball)
   - Statcast xwOBA and sprint speed (pybaseball)
   - MLB schedule for the rest of season (python-mlb-statsapi)
+  - 40-man rosters, IL status and player bios (MLB Stats API, pooled client)
   - ESPN fantasy roster + free agent data (local JSON files)
   - MLBAM ↔ FanGraphs ID mapping (Chadwick register via pybaseball)
 """
@@ -21,10 +22,14 @@ import numpy as np
 
 warnings.filterwarnings("ignore")
 
+from .cache import DataCache
+from .ids import IdIndex
+from .names import normalize, normalize_many, flip
 from .config import (
     PARK_FACTORS, TEAM_NORMALIZE, MLB_TEAM_ID_TO_ABBREV,
     FULL_SEASON_GAMES,
 )
+from .statsapi import ROSTER_SWEEP_FIELDS, MLBStatsClient, get_mlb_client
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -58,16 +63,25 @@ def _retry(func, *args, retries: int = 3, delay: float = 3.0, label: str = "", *
     return None
 
 
-def _cached_df(cache_path: Path, fetch_func, *args, label: str = "", **kwargs) -> Optional[pd.DataFrame]:
-    """Load DataFrame from CSV cache; fetch and cache if missing."""
-    if cache_path.exists():
-        print(f"    Cache hit  → {cache_path.name}")
-        return pd.read_csv(cache_path, low_memory=False)
-    print(f"    Fetching   → {cache_path.name}")
-    df = _retry(fetch_func, *args, label=label, **kwargs)
-    if df is not None and not df.empty:
-        df.to_csv(cache_path, index=False)
-    return df
+def cached_frame(fetch_func, *args, season: Optional[int] = None, label: str = "",
+                 cache: Optional[DataCache] = None, **kwargs) -> Optional[pd.DataFrame]:
+    """
+    Load DataFrame from the frame cache (default: the shared one, see
+    get_frame_cache); fetch with retries and cache if missing or expired.
+    """
+    return (cache or get_frame_cache()).fetch(fetch_func, *args, season=season, label=label,
+                                              retry=_retry, **kwargs)
+
+
+_frame_cache: Optional[DataCache] = None
+
+
+def get_frame_cache() -> DataCache:
+    """Shared DataCache rooted at CACHE_DIR (created on first use)."""
+    global _frame_cache
+    if _frame_cache is None:
+        _frame_cache = DataCache(CACHE_DIR)
+    return _frame_cache
 
 
 def _normalize_team(team_raw) -> str:
@@ -82,8 +96,7 @@ def _normalize_team(team_raw) -> str:
 def fetch_id_map() -> pd.DataFrame:
     """Return DataFrame with columns: name_first, name_last, key_fangraphs, key_mlbam."""
     from pybaseball import chadwick_register
-    cache_path = CACHE_DIR / "chadwick_register.csv"
-    df = _cached_df(cache_path, chadwick_register, label="chadwick_register")
+    df = cached_frame(chadwick_register, label="chadwick_register")
     if df is None or df.empty:
         raise RuntimeError("Could not load Chadwick register.")
 
@@ -105,21 +118,64 @@ def fetch_id_map() -> pd.DataFrame:
     return df
 
 
+ID_INDEX_DIR = CACHE_DIR / "id_index"
+
+
+def load_id_index(cache: Optional[DataCache] = None,
+                  path: Optional[Path] = None) -> Optional[IdIndex]:
+    """
+    Persistent FanGraphs / MLBAM / ESPN / name index (erosp/ids.py).
+
+    Memory-maps `path` (default erosp_cache/id_index/) when it was built from
+    the Chadwick frame currently in `cache` (default: the shared frame cache);
+    otherwise (first run, or Chadwick refetched after its weekly TTL) rebuilds
+    it once and saves it, carrying over learned ESPN links. Returns None only
+    if Chadwick can't be loaded and no index exists.
+    """
+    from pybaseball import chadwick_register
+    cache = cache or get_frame_cache()
+    path = path or ID_INDEX_DIR
+    index = IdIndex.load(path)
+    version = cache.version(chadwick_register)
+    if index is not None and version is not None and index.version == version:
+        print(f"    ID index hit → {len(index):,} names")
+        return index
+
+    df = cache.fetch(chadwick_register, label="chadwick_register", retry=_retry)
+    if df is None or df.empty:
+        if index is not None:
+            print("    WARNING: Chadwick register unavailable — using existing (stale) ID index.")
+        return index
+
+    # A failed refetch serves the expired frame — reuse an index built from it
+    version = cache.version(chadwick_register, allow_stale=True) or ""
+    if index is not None and version and index.version == version:
+        print(f"    ID index (stale Chadwick) → {len(index):,} names")
+        return index
+
+    espn_links = index.espn_links() if index is not None else None
+    index = IdIndex.build(df, version=version, espn_links=espn_links)
+    index.save(path)
+    print(f"    ID index built → {len(index):,} names, "
+          f"{len(index.tables['fangraphs']):,} FanGraphs IDs")
+    return index
+
+
 # ---------------------------------------------------------------------------
 # Player info (birthdate + MLB position) from StatsAPI
 # ---------------------------------------------------------------------------
 
-def fetch_player_info(mlbam_ids: List[int]) -> pd.DataFrame:
-    """Batch-fetch birth date + primary position from MLB Stats API."""
-    import requests
-
-    cache_path = CACHE_DIR / "mlb_player_info.csv"
+def fetch_player_info(mlbam_ids: List[int], client: Optional[MLBStatsClient] = None,
+                      cache_path: Optional[Path] = None) -> pd.DataFrame:
+    """Batch-fetch birth date + primary position from MLB Stats API.
+    Incremental CSV cache at `cache_path` (default erosp_cache/mlb_player_info.csv)."""
+    cache_path = Path(cache_path or CACHE_DIR / "mlb_player_info.csv")
     if cache_path.exists():
         cached = pd.read_csv(cache_path)
         cached_ids = set(cached["mlbam_id"].dropna().astype(int).tolist())
         new_ids = [x for x in mlbam_ids if x not in cached_ids]
         if not new_ids:
-            print("    Cache hit  → mlb_player_info.csv")
+            print(f"    Cache hit  → {cache_path.name}")
             return cached
         print(f"    Fetching player info for {len(new_ids):,} new IDs…")
     else:
@@ -127,31 +183,19 @@ def fetch_player_info(mlbam_ids: List[int]) -> pd.DataFrame:
         new_ids = mlbam_ids
         print(f"    Fetching player info for {len(new_ids):,} players…")
 
+    client = client or get_mlb_client()
     rows = []
-    for i in range(0, len(new_ids), 200):
-        batch = new_ids[i : i + 200]
-        url = (
-            f"https://statsapi.mlb.com/api/v1/people"
-            f"?personIds={','.join(str(x) for x in batch)}"
-            f"&fields=people,id,birthDate,primaryPosition,abbreviation"
-        )
-        try:
-            resp = requests.get(url, timeout=15)
-            if resp.status_code == 200:
-                for p in resp.json().get("people", []):
-                    row: dict = {"mlbam_id": p["id"]}
-                    bd = p.get("birthDate", "")
-                    if bd:
-                        parts = bd.split("-")
-                        if len(parts) == 3:
-                            row["birth_year"]  = int(parts[0])
-                            row["birth_month"] = int(parts[1])
-                            row["birth_day"]   = int(parts[2])
-                    row["mlb_position"] = p.get("primaryPosition", {}).get("abbreviation", "")
-                    rows.append(row)
-            time.sleep(0.2)
-        except Exception as exc:
-            print(f"    Warning: player info batch {i//200 + 1} failed ({exc})")
+    for p in client.people(new_ids, fields="people,id,birthDate,primaryPosition,abbreviation"):
+        row: dict = {"mlbam_id": p["id"]}
+        bd = p.get("birthDate", "")
+        if bd:
+            parts = bd.split("-")
+            if len(parts) == 3:
+                row["birth_year"]  = int(parts[0])
+                row["birth_month"] = int(parts[1])
+                row["birth_day"]   = int(parts[2])
+        row["mlb_position"] = p.get("primaryPosition", {}).get("abbreviation", "")
+        rows.append(row)
 
     if rows:
         new_df = pd.DataFrame(rows)
@@ -173,9 +217,8 @@ def fetch_batting_stats(years: List[int], min_pa: int = 100) -> Dict[int, pd.Dat
 
     result: Dict[int, pd.DataFrame] = {}
     for year in years:
-        cache_path = CACHE_DIR / f"batting_stats_{year}.csv"
-        df = _cached_df(cache_path, batting_stats, year, qual=min_pa,
-                        label=f"batting_stats({year})")
+        df = cached_frame(batting_stats, year, qual=min_pa, season=year,
+                          label=f"batting_stats({year}, qual={min_pa})")
         if df is None or df.empty:
             print(f"    WARNING: No batting data for {year}.")
             continue
@@ -271,9 +314,8 @@ def fetch_pitching_stats(years: List[int], min_ip: int = 20) -> Dict[int, pd.Dat
 
     result: Dict[int, pd.DataFrame] = {}
     for year in years:
-        cache_path = CACHE_DIR / f"pitching_stats_{year}.csv"
-        df = _cached_df(cache_path, pitching_stats, year, qual=min_ip,
-                        label=f"pitching_stats({year})")
+        df = cached_frame(pitching_stats, year, qual=min_ip, season=year,
+                          label=f"pitching_stats({year}, qual={min_ip})")
         if df is None or df.empty:
             print(f"    WARNING: No pitching data for {year}.")
             continue
@@ -442,15 +484,14 @@ def fetch_mlb_ytd_pitcher_gs(season: int, mlbam_to_fg: Dict[int, int]) -> pd.Dat
 # Statcast xwOBA
 # ---------------------------------------------------------------------------
 
-def fetch_statcast_xwoba(years: List[int]) -> Dict[int, pd.DataFrame]:
-    """Return dict of year → DataFrame with columns [mlbam_id, xwOBA]."""
+def fetch_statcast_xwoba(years: List[int], cache: Optional[DataCache] = None) -> Dict[int, pd.DataFrame]:
+    """Return dict of year → DataFrame with columns [mlbam_id, xwOBA] (+ wOBA_sv when present)."""
     from pybaseball import statcast_batter_expected_stats
 
     result: Dict[int, pd.DataFrame] = {}
     for year in years:
-        cache_path = CACHE_DIR / f"statcast_xwoba_{year}.csv"
-        df = _cached_df(cache_path, statcast_batter_expected_stats, year,
-                        minPA=25, label=f"statcast_xwoba({year})")
+        df = cached_frame(statcast_batter_expected_stats, year, minPA=25, season=year,
+                          label=f"statcast_xwoba({year})", cache=cache)
         if df is None or df.empty:
             continue
 
@@ -481,13 +522,12 @@ def fetch_statcast_xwoba(years: List[int]) -> Dict[int, pd.DataFrame]:
 # Sprint speed
 # ---------------------------------------------------------------------------
 
-def fetch_sprint_speed(year: int) -> Optional[pd.DataFrame]:
+def fetch_sprint_speed(year: int, cache: Optional[DataCache] = None) -> Optional[pd.DataFrame]:
     """Return DataFrame with [mlbam_id, sprint_speed, speed_pct] or None."""
     from pybaseball import statcast_sprint_speed
 
-    cache_path = CACHE_DIR / f"sprint_speed_{year}.csv"
-    df = _cached_df(cache_path, statcast_sprint_speed, year, min_opp=0,
-                    label=f"sprint_speed({year})")
+    df = cached_frame(statcast_sprint_speed, year, min_opp=0, season=year,
+                      label=f"sprint_speed({year})", cache=cache)
     if df is None or df.empty or "sprint_speed" not in df.columns:
         print(f"    WARNING: Sprint speed data unavailable for {year}.")
         return None
@@ -529,46 +569,104 @@ def _il_code_to_games(code: str) -> int:
     }.get(str(code).upper(), 14)
 
 
+def _daily_cache_path(stem: str, season: int, today: datetime.date) -> Path:
+    return CACHE_DIR / f"{stem}_{season}_{today.strftime('%Y%m%d')}.json"
+
+
+def fetch_40man_roster_sweep(
+    season: int = 2026,
+    client: Optional[MLBStatsClient] = None,
+) -> Tuple[set, Dict[int, str], Dict[int, dict]]:
+    """
+    One concurrent sweep of all 30 40-man rosters (cached daily).
+
+    Returns (active_ids, team_map, injury_map) — the same three structures
+    fetch_active_40man_mlbam_ids, fetch_active_40man_team_map and
+    fetch_injured_players return — and writes all three daily cache files,
+    so whichever of those runs first pays for the 30 roster calls once.
+    """
+    today = datetime.date.today()
+    ids_path    = _daily_cache_path("active_40man", season, today)
+    teams_path  = _daily_cache_path("active_40man_teams", season, today)
+    injury_path = _daily_cache_path("injured_players", season, today)
+
+    if ids_path.exists() and teams_path.exists() and injury_path.exists():
+        with open(ids_path) as f:
+            active_ids = set(json.load(f))
+        with open(teams_path) as f:
+            team_map = {int(k): v for k, v in json.load(f).items()}
+        with open(injury_path) as f:
+            injury_map = {int(k): v for k, v in json.load(f).items()}
+        return active_ids, team_map, injury_map
+
+    print(f"    Fetching 40-man rosters ({season}) — 30 teams, one sweep…")
+    client = client or get_mlb_client()
+    rosters = client.team_rosters(season, roster_type="40Man", fields=ROSTER_SWEEP_FIELDS)
+
+    active_ids: set = set()
+    team_map: Dict[int, str] = {}
+    injury_map: Dict[int, dict] = {}
+    for team_id, roster in rosters.items():
+        if roster is None:
+            continue
+        abbrev = MLB_TEAM_ID_TO_ABBREV[team_id]
+        for entry in roster:
+            mlbam_id = entry.get("person", {}).get("id")
+            if not mlbam_id:
+                continue
+            mlbam_id = int(mlbam_id)
+            active_ids.add(mlbam_id)
+            team_map[mlbam_id] = abbrev
+
+            status   = entry.get("status", {})
+            il_code  = status.get("code", "A")
+
+            # Only include players not on the active roster
+            if il_code in ("A", ""):
+                continue
+
+            # Use expectedActivationDate when available for precision
+            act_str = entry.get("expectedActivationDate", "")
+            if act_str:
+                try:
+                    act_date = datetime.date.fromisoformat(act_str[:10])
+                    games_missed_est = max(0, (act_date - today).days)
+                except (ValueError, TypeError):
+                    games_missed_est = _il_code_to_games(il_code)
+            else:
+                games_missed_est = _il_code_to_games(il_code)
+
+            injury_map[mlbam_id] = {
+                "il_type":         il_code,
+                "games_missed_est": games_missed_est,
+            }
+
+    with open(ids_path, "w") as f:
+        json.dump(list(active_ids), f)
+    with open(teams_path, "w") as f:
+        json.dump(team_map, f)
+    with open(injury_path, "w") as f:
+        json.dump(injury_map, f)
+
+    n_failed = sum(1 for r in rosters.values() if r is None)
+    print(f"    40-man sweep: {len(active_ids):,} players, {len(injury_map):,} on IL"
+          + (f" ({n_failed} team(s) failed)." if n_failed else "."))
+    return active_ids, team_map, injury_map
+
+
 def fetch_active_40man_mlbam_ids(season: int = 2026) -> set:
     """
     Returns a set of MLBAM player IDs currently on any MLB team's 40-man roster.
     Used to filter out released/non-tendered players from EROSP projections.
     Cached daily alongside the injury map.
     """
-    import requests
-
-    today = datetime.date.today()
-    cache_path = CACHE_DIR / f"active_40man_{season}_{today.strftime('%Y%m%d')}.json"
-
+    cache_path = _daily_cache_path("active_40man", season, datetime.date.today())
     if cache_path.exists():
         print(f"    Cache hit  → {cache_path.name}")
         with open(cache_path) as f:
             return set(json.load(f))
 
-    print(f"    Fetching 40-man rosters ({season}) to identify active players…")
-    active_ids: set = set()
-
-    for team_id in sorted(MLB_TEAM_ID_TO_ABBREV.keys()):
-        url = (
-            f"https://statsapi.mlb.com/api/v1/teams/{team_id}/roster"
-            f"?rosterType=40Man&season={season}"
-            f"&fields=roster,person,id"
-        )
-        try:
-            resp = requests.get(url, timeout=10)
-            if resp.status_code != 200:
-                continue
-            for entry in resp.json().get("roster", []):
-                mlbam_id = entry.get("person", {}).get("id")
-                if mlbam_id:
-                    active_ids.add(int(mlbam_id))
-            time.sleep(0.05)
-        except Exception as exc:
-            print(f"    WARNING: 40-man fetch failed for team {team_id}: {exc}")
-
-    with open(cache_path, "w") as f:
-        json.dump(list(active_ids), f)
-
+    active_ids, _, _ = fetch_40man_roster_sweep(season)
     print(f"    Active 40-man roster: {len(active_ids):,} players across all 30 teams.")
     return active_ids
 
@@ -580,39 +678,12 @@ def fetch_active_40man_team_map(season: int = 2026) -> dict:
     FanGraphs blend may carry from a prior team after a trade or free-agent signing.
     Cached daily alongside the IDs-only roster file.
     """
-    today = datetime.date.today()
-    cache_path = CACHE_DIR / f"active_40man_teams_{season}_{today.strftime('%Y%m%d')}.json"
-
+    cache_path = _daily_cache_path("active_40man_teams", season, datetime.date.today())
     if cache_path.exists():
         with open(cache_path) as f:
             return {int(k): v for k, v in json.load(f).items()}
 
-    print(f"    Fetching 40-man team map ({season}) to refresh mlb_team values…")
-    import requests
-    team_map: dict = {}
-
-    for team_id in sorted(MLB_TEAM_ID_TO_ABBREV.keys()):
-        abbrev = MLB_TEAM_ID_TO_ABBREV[team_id]
-        url = (
-            f"https://statsapi.mlb.com/api/v1/teams/{team_id}/roster"
-            f"?rosterType=40Man&season={season}"
-            f"&fields=roster,person,id"
-        )
-        try:
-            resp = requests.get(url, timeout=10)
-            if resp.status_code != 200:
-                continue
-            for entry in resp.json().get("roster", []):
-                mlbam_id = entry.get("person", {}).get("id")
-                if mlbam_id:
-                    team_map[int(mlbam_id)] = abbrev
-            time.sleep(0.05)
-        except Exception as exc:
-            print(f"    WARNING: team map fetch failed for {abbrev} ({team_id}): {exc}")
-
-    with open(cache_path, "w") as f:
-        json.dump(team_map, f)
-
+    _, team_map, _ = fetch_40man_roster_sweep(season)
     print(f"    Team map: {len(team_map):,} player→team entries cached.")
     return team_map
 
@@ -627,66 +698,15 @@ def fetch_injured_players(season: int = 2026) -> Dict[int, dict]:
     Uses MLB Stats API team roster (rosterType=40Man) with status hydration.
     Falls back to IL-type estimates when expectedActivationDate is unavailable.
     """
-    import requests
-
-    today = datetime.date.today()
-    cache_path = CACHE_DIR / f"injured_players_{season}_{today.strftime('%Y%m%d')}.json"
-
+    cache_path = _daily_cache_path("injured_players", season, datetime.date.today())
     if cache_path.exists():
         print(f"    Cache hit  → {cache_path.name}")
         with open(cache_path) as f:
             return {int(k): v for k, v in json.load(f).items()}
 
-    print(f"    Fetching IL status ({season}) — 30 teams…")
-    result: Dict[int, dict] = {}
-
-    for team_id in sorted(MLB_TEAM_ID_TO_ABBREV.keys()):
-        url = (
-            f"https://statsapi.mlb.com/api/v1/teams/{team_id}/roster"
-            f"?rosterType=40Man&season={season}"
-            f"&fields=roster,person,id,fullName,status,code,expectedActivationDate"
-        )
-        try:
-            resp = requests.get(url, timeout=10)
-            if resp.status_code != 200:
-                continue
-            for entry in resp.json().get("roster", []):
-                person = entry.get("person", {})
-                mlbam_id = person.get("id")
-                if not mlbam_id:
-                    continue
-
-                status   = entry.get("status", {})
-                il_code  = status.get("code", "A")
-
-                # Only include players not on the active roster
-                if il_code in ("A", ""):
-                    continue
-
-                # Use expectedActivationDate when available for precision
-                act_str = entry.get("expectedActivationDate", "")
-                if act_str:
-                    try:
-                        act_date = datetime.date.fromisoformat(act_str[:10])
-                        games_missed_est = max(0, (act_date - today).days)
-                    except (ValueError, TypeError):
-                        games_missed_est = _il_code_to_games(il_code)
-                else:
-                    games_missed_est = _il_code_to_games(il_code)
-
-                result[int(mlbam_id)] = {
-                    "il_type":         il_code,
-                    "games_missed_est": games_missed_est,
-                }
-            time.sleep(0.1)  # 30 calls × 0.1s = ~3s total
-        except Exception as exc:
-            print(f"    WARNING: IL fetch failed for team {team_id}: {exc}")
-
-    with open(cache_path, "w") as f:
-        json.dump(result, f)
-
-    print(f"    IL status: {len(result):,} players currently on IL.")
-    return result
+    _, _, injury_map = fetch_40man_roster_sweep(season)
+    print(f"    IL status: {len(injury_map):,} players currently on IL.")
+    return injury_map
 
 
 # ---------------------------------------------------------------------------
@@ -865,18 +885,14 @@ def load_espn_data() -> Tuple[List[dict], List[dict], Dict[int, int]]:
 # ---------------------------------------------------------------------------
 
 def build_name_to_mlbam(id_map_df: pd.DataFrame) -> Dict[str, int]:
-    """Build lowercase full-name → MLBAM ID mapping from Chadwick register."""
-    out: Dict[str, int] = {}
-    for _, row in id_map_df.iterrows():
-        name = str(row["full_name"]).lower().strip()
-        if name:
-            out[name] = int(row["key_mlbam"])
-    return out
+    """Build normalized full-name → MLBAM ID mapping from fetch_id_map() output."""
+    keys = normalize_many(id_map_df["full_name"])
+    return {k: int(m) for k, m in zip(keys, id_map_df["key_mlbam"]) if k}
 
 
 def build_name_to_mlbam_from_chadwick() -> Dict[str, int]:
     """
-    Build a name → MLBAM ID lookup directly from the raw Chadwick CSV cache,
+    Normalized name → MLBAM ID lookup from the raw Chadwick register,
     WITHOUT deduplicating on key_fangraphs.
 
     This is needed for newer/rookie players whose key_fangraphs = -1 (FanGraphs
@@ -884,52 +900,17 @@ def build_name_to_mlbam_from_chadwick() -> Dict[str, int]:
     rows via drop_duplicates(subset=["key_fangraphs"]), so they don't appear in
     the standard name_to_mlbam dict.
 
-    Names are normalized (accents stripped, suffixes removed, alphanumeric only).
-    Ambiguous names (same normalized name → different mlbam_ids) are excluded.
+    Names are keyed by names.normalize() (accents, suffixes, punctuation and
+    spaced initials folded). Ambiguous names (same normalized name → different mlbam_ids) are excluded.
+    Served from the persistent ID index (see load_id_index).
     """
-    import re, unicodedata
-
-    cache_path = CACHE_DIR / "chadwick_register.csv"
-    if not cache_path.exists():
-        print("    WARNING: Chadwick cache not found; build_name_to_mlbam_from_chadwick() returning empty.")
+    index = load_id_index()
+    if index is None:
+        print("    WARNING: Chadwick register not available; build_name_to_mlbam_from_chadwick() returning empty.")
         return {}
-
-    df = pd.read_csv(cache_path, low_memory=False)
-    df = df[["name_first", "name_last", "key_mlbam"]].copy()
-    df["key_mlbam"] = pd.to_numeric(df["key_mlbam"], errors="coerce")
-    df = df.dropna(subset=["key_mlbam"])
-    df["key_mlbam"] = df["key_mlbam"].astype(int)
-
-    df["full_name"] = (
-        df["name_first"].fillna("").str.strip() + " " +
-        df["name_last"].fillna("").str.strip()
-    ).str.strip()
-
-    def _norm(n: str) -> str:
-        n = unicodedata.normalize("NFKD", n).encode("ascii", "ignore").decode()
-        n = re.sub(r"\b(jr|sr|ii|iii|iv)\b\.?", "", n.lower())
-        n = re.sub(r"[^a-z ]", "", n)
-        return " ".join(n.split())
-
-    df["norm_name"] = df["full_name"].apply(_norm)
-    df = df[df["norm_name"].str.len() > 0]
-
-    # Build mapping; skip ambiguous names (same norm_name → different mlbam_ids)
-    name_to_id: Dict[str, int] = {}
-    ambiguous: set = set()
-    for _, row in df.iterrows():
-        norm = row["norm_name"]
-        mid  = int(row["key_mlbam"])
-        if norm in ambiguous:
-            continue
-        if norm in name_to_id and name_to_id[norm] != mid:
-            ambiguous.add(norm)
-            del name_to_id[norm]
-        else:
-            name_to_id[norm] = mid
-
+    name_to_id = index.name_to_mlbam()
     print(f"    Chadwick name→MLBAM (raw): {len(name_to_id):,} unambiguous mappings "
-          f"({len(ambiguous):,} ambiguous names excluded).")
+          f"({index.n_ambiguous:,} ambiguous names excluded).")
     return name_to_id
 
 
@@ -946,25 +927,13 @@ def espn_name_to_mlbam(
     Try to resolve an ESPN player name to an MLBAM ID.
     Handles common name variations: Jr., III, accented characters, etc.
     """
-    import unicodedata
-    import re
-
-    def _normalize(n: str) -> str:
-        # Remove accents, lowercase, strip suffixes
-        n = unicodedata.normalize("NFKD", n).encode("ascii", "ignore").decode()
-        n = re.sub(r"\b(jr|sr|ii|iii|iv)\b\.?", "", n.lower())
-        n = re.sub(r"[^a-z ]", "", n)
-        return " ".join(n.split())
-
-    key = _normalize(espn_name)
+    key = normalize(espn_name)
     if key in name_to_mlbam:
         return name_to_mlbam[key]
 
     # Try last-name-first match
-    parts = key.split()
-    if len(parts) >= 2:
-        flipped = f"{parts[-1]} {' '.join(parts[:-1])}"
-        if flipped in name_to_mlbam:
-            return name_to_mlbam[flipped]
+    flipped = flip(key)
+    if flipped is not None and flipped in name_to_mlbam:
+        return name_to_mlbam[flipped]
 
     return None
@@ -0,0 +1,59 @@
+"""
+Player-name normalization shared by every script.
+
+FanGraphs, Chadwick, ESPN, MLB.com and the injury news feeds spell the same
+player differently ("José Ramírez" / "Jose Ramirez", "J.P. France" /
+"J. P. France", "Bobby Witt Jr." / "Bobby Witt"). normalize() maps all of
+those to one key, so cross-source joins are plain dict / isin lookups:
+
+  1. accents stripped (NFKD → ASCII), lowercase
+  2. suffixes Jr. / Sr. / II / III / IV removed
+  3. everything but letters and spaces dropped ("o'hearn" → "ohearn")
+  4. runs of single-letter initials joined ("j p france" → "jp france")
+  5. whitespace collapsed to single spaces
+
+Patterns are compiled once and normalize() is memoized, so repeated lookups
+of the same roster are dictionary hits. normalize_many() does a pandas Series
+in one pass over its distinct values. Only the standard library is imported
+at module level, so stdlib-only scripts (patch_injury_status.py) can use it.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Optional
+
+_SUFFIX_RE    = re.compile(r"\b(jr|sr|ii|iii|iv)\b\.?")
+_NON_ALPHA_RE = re.compile(r"[^a-z ]")
+_INITIALS_RE  = re.compile(r"\b([a-z]) (?=[a-z]\b)")
+
+
+@lru_cache(maxsize=65536)
+def normalize(name: str) -> str:
+    """Canonical lookup key for a player name ('' if nothing is left)."""
+    n = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode()
+    n = _SUFFIX_RE.sub("", n.lower())
+    n = _NON_ALPHA_RE.sub("", n)
+    n = " ".join(n.split())
+    return _INITIALS_RE.sub(r"\1", n)
+
+
+def normalize_many(names):
+    """
+    normalize() over a pandas Series (returns a Series on the same index) or
+    any iterable of names (returns a list). Missing values become ''.
+    """
+    if hasattr(names, "factorize"):
+        import numpy as np
+        codes, uniques = names.factorize()
+        keys = np.array([normalize(str(u)) for u in uniques] + [""], dtype=object)
+        return names._constructor(keys[codes], index=names.index, name=names.name)
+    return [normalize(n) if isinstance(n, str) else "" for n in names]
+
+
+def flip(key: str) -> Optional[str]:
+    """'wood james' → 'james wood' (last token moved to the front); None for one word."""
+    parts = key.split()
+    if len(parts) < 2:
+        return None
+    return f"{parts[-1]} {' '.join(parts[:-1])}"
@@ -0,0 +1,258 @@
+"""
+Streaming writer and in-place patcher for data/erosp/latest.json.
+
+compute_erosp.py used to collect every output record in a list and
+json.dump(indent=2) the lot; patch_injury_status.py then reloaded and
+re-serialized the whole file to change a few IL fields.
+
+PlayerJsonWriter streams records to disk as they are produced:
+
+  {"generated_at":…,"season":…,"games_remaining":…,"season_started":…,"players":[
+  {"mlbam_id":…,…},
+  {"mlbam_id":…,…}
+  ],"total_players":N}
+
+one compact record per line (pretty=True gives the old indent=2 layout
+instead), into a temp file that is swapped in atomically. While writing it
+records each player's byte span in a minified sidecar, latest.index.json:
+
+  {"format":1,"file":"latest.json","bytes":…,"indent":null,"header":{…},
+   "players":{"<mlbam_id>":[offset,length],…}}
+
+PlayerJsonFile uses that index to read single records and to splice replaced
+records into the file — a byte copy of the untouched spans, with no parse or
+re-serialization of the other players. A missing or stale index (size
+mismatch, or the bytes at an offset aren't that player's record) falls back
+to a full load and rewrite, which also rebuilds the index.
+"""
+
+import bisect
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+INDEX_FORMAT = 1
+
+
+def index_path_for(path: Path) -> Path:
+    """latest.json → latest.index.json"""
+    path = Path(path)
+    return path.with_name(f"{path.stem}.index.json")
+
+
+def _member(key: str, value, indent: Optional[int]) -> str:
+    if indent is None:
+        return f"{json.dumps(key)}:{json.dumps(value, separators=(',', ':'))}"
+    body = json.dumps(value, indent=indent).replace("\n", "\n" + " " * indent)
+    return f"{' ' * indent}{json.dumps(key)}: {body}"
+
+
+def _record(record: dict, indent: Optional[int]) -> bytes:
+    """One player record as it appears inside the "players" array."""
+    if indent is None:
+        return json.dumps(record, separators=(",", ":")).encode()
+    return json.dumps(record, indent=indent).replace("\n", "\n" + " " * (2 * indent)).encode()
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _write_index(path: Path, size: int, indent: Optional[int], header: dict,
+                 spans: Dict[str, Tuple[int, int]]) -> None:
+    index = {"format": INDEX_FORMAT, "file": path.name, "bytes": size, "indent": indent,
+             "header": header, "players": {k: list(v) for k, v in spans.items()}}
+    _atomic_write(index_path_for(path), json.dumps(index, separators=(",", ":")).encode())
+
+
+class PlayerJsonWriter:
+    """
+    Stream player records into `path`, atomically replaced on a clean exit.
+
+        with PlayerJsonWriter(path, header) as out:
+            for rec in records:
+                out.write(rec)
+            out.footer["total_players"] = out.count
+    """
+
+    def __init__(self, path: Path, header: dict, pretty: bool = False):
+        self.path = Path(path)
+        self.header = header
+        self.footer: dict = {}
+        self.indent = 2 if pretty else None
+        self.count = 0
+        self._spans: Dict[str, Tuple[int, int]] = {}
+        self._tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        self._f = None
+
+    def _text(self, s: str) -> None:
+        self._f.write(s.encode())
+
+    def __enter__(self) -> "PlayerJsonWriter":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._f = open(self._tmp, "wb")
+        members = [_member(k, v, self.indent) for k, v in self.header.items()]
+        members.append(_member("players", [], self.indent)[:-1])   # open '['
+        if self.indent is None:
+            self._text("{" + ",".join(members))
+        else:
+            self._text("{\n" + ",\n".join(members))
+        return self
+
+    def write(self, record: dict) -> None:
+        pad = "" if self.indent is None else " " * (2 * self.indent)
+        self._text(("," if self.count else "") + "\n" + pad)
+        data = _record(record, self.indent)
+        self._spans[str(record.get("mlbam_id"))] = (self._f.tell(), len(data))
+        self._f.write(data)
+        self.count += 1
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self._f.close()
+            self._tmp.unlink(missing_ok=True)
+            return
+        members = [_member(k, v, self.indent) for k, v in self.footer.items()]
+        if self.indent is None:
+            self._text("\n]" + "".join("," + m for m in members) + "}\n")
+        else:
+            self._text("\n" + " " * self.indent + "]"
+                       + "".join(",\n" + m for m in members) + "\n}\n")
+        size = self._f.tell()
+        self._f.close()
+        os.replace(self._tmp, self.path)
+        _write_index(self.path, size, self.indent, self.header, self._spans)
+
+
+class PlayerJsonFile:
+    """Indexed record access to a file written by PlayerJsonWriter."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.index: Optional[dict] = None
+        try:
+            with open(index_path_for(self.path)) as f:
+                index = json.load(f)
+            if (index.get("format") == INDEX_FORMAT
+                    and index.get("bytes") == self.path.stat().st_size):
+                self.index = index
+        except (OSError, ValueError):
+            pass
+
+    def load(self) -> dict:
+        """The whole document (full parse — the slow path)."""
+        with open(self.path) as f:
+            return json.load(f)
+
+    def header(self) -> dict:
+        """Top-level fields other than the player list (from the index when possible)."""
+        if self.index is not None and "header" in self.index:
+            return self.index["header"]
+        return {k: v for k, v in self.load().items() if k not in ("players", "total_players")}
+
+    def ids(self) -> list:
+        """mlbam_ids of every record, in file order."""
+        if self.index is None:
+            return [p.get("mlbam_id") for p in self.load().get("players", [])]
+        spans = self.index["players"]
+        return [int(k) for k in sorted(spans, key=lambda k: spans[k][0])]
+
+    def _read(self, f, mlbam_id) -> Optional[dict]:
+        span = self.index["players"].get(str(mlbam_id))
+        if span is None:
+            return None
+        f.seek(span[0])
+        try:
+            record = json.loads(f.read(span[1]))
+        except ValueError:
+            return None
+        return record if str(record.get("mlbam_id")) == str(mlbam_id) else None
+
+    def records(self, ids: Iterable) -> Iterator[dict]:
+        """Records for those of `ids` present in the file (indexed reads when possible)."""
+        if self.index is None:
+            wanted = {str(i) for i in ids}
+            for p in self.load().get("players", []):
+                if str(p.get("mlbam_id")) in wanted:
+                    yield p
+            return
+        with open(self.path, "rb") as f:
+            for mlbam_id in ids:
+                record = self._read(f, mlbam_id)
+                if record is not None:
+                    yield record
+
+    def get(self, mlbam_id) -> Optional[dict]:
+        return next(self.records([mlbam_id]), None)
+
+    def replace(self, records: Dict[int, dict]) -> int:
+        """
+        Swap in new versions of the given player records (keyed by mlbam_id),
+        keeping the index in step. Returns the number of records replaced.
+        """
+        if not records:
+            return 0
+        if self.index is None:
+            return self._rewrite(records)
+
+        spans = self.index["players"]
+        indent = self.index.get("indent")
+        edits = []
+        with open(self.path, "rb") as f:
+            for mlbam_id, record in records.items():
+                key = str(mlbam_id)
+                if self._read(f, mlbam_id) is None:
+                    return self._rewrite(records)
+                offset, length = spans[key]
+                edits.append((offset, length, key, _record(record, indent)))
+            f.seek(0)
+            raw = f.read()
+        edits.sort()
+
+        chunks, pos = [], 0
+        for offset, length, _, data in edits:
+            chunks += [raw[pos:offset], data]
+            pos = offset + length
+        chunks.append(raw[pos:])
+        out = b"".join(chunks)
+
+        # Spans after an edit move by the cumulative size change of the edits before them
+        starts = [e[0] for e in edits]
+        shifts, total = [], 0
+        for offset, length, _, data in edits:
+            total += len(data) - length
+            shifts.append(total)
+        new_len = {key: len(data) for _, _, key, data in edits}
+        new_spans = {}
+        for key, (offset, length) in spans.items():
+            i = bisect.bisect_left(starts, offset)
+            new_spans[key] = (offset + (shifts[i - 1] if i else 0), new_len.get(key, length))
+
+        _atomic_write(self.path, out)
+        header = self.header()
+        _write_index(self.path, len(out), indent, header, new_spans)
+        self.index = {**self.index, "bytes": len(out), "header": header,
+                      "players": {k: list(v) for k, v in new_spans.items()}}
+        return len(edits)
+
+    def _rewrite(self, records: Dict[int, dict]) -> int:
+        """Slow path: full load, swap records, stream back out (rebuilds the index)."""
+        data = self.load()
+        players = data.pop("players", [])
+        footer = {k: data.pop(k) for k in ("total_players",) if k in data}
+        with open(self.path, "rb") as f:
+            pretty = f.read(2) == b"{\n"
+        wanted = {str(k): v for k, v in records.items()}
+        n = 0
+        with PlayerJsonWriter(self.path, data, pretty=pretty) as out:
+            for p in players:
+                new = wanted.get(str(p.get("mlbam_id")))
+                n += new is not None
+                out.write(p if new is None else new)
+            out.footer.update(footer)
+        self.__init__(self.path)
+        return n
@@ -0,0 +1,196 @@
+"""
+Delta journal for the intraday IL patches to data/erosp/latest.json.
+
+patch_injury_status.py runs 4× a day. It used to reload latest.json, re-apply
+the whole IL map and rewrite the file even when nothing had changed. Now it
+diffs the fresh IL / news fields against the last-applied state and, only
+when something moved, splices the changed records into latest.json (see
+erosp/output.py) and appends a JSON-Patch style entry to data/erosp/patches/:
+
+  patches/000042.json   {"seq":42,"base":"<latest.json generated_at>",
+                         "created":"…","ops":[
+                           {"op":"add","path":"/660271/il_type","value":"D10"},
+                           {"op":"remove","path":"/592450/injury_note"}, …]}
+  patches/state.json    {"base":…,"seq":42,"applied":{"<mlbam_id>":{IL fields}}}
+
+Paths are /<mlbam_id>/<field> rather than array positions, so an entry applies
+to any copy of the same base file. `base` ties entries to one compute_erosp
+run: when latest.json is regenerated the state is rebuilt from it and older
+entries are dropped at the next compaction. compact() folds the journal into a
+single entry once it grows past COMPACT_AFTER files.
+
+Readers holding an already-parsed latest.json catch up with
+apply_latest_deltas(data) instead of re-reading the file. Ops set or remove
+field values, so re-applying entries already present in the file is harmless.
+"""
+
+import datetime
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+IL_FIELDS = (
+    "il_type", "il_days_remaining", "injury_note",
+    "injury_news", "injury_news_source", "injury_news_date",
+)
+STATE_NAME    = "state.json"
+COMPACT_AFTER = 28          # one week of 4×-daily entries
+
+
+def _entry_name(seq: int) -> str:
+    return f"{seq:06d}.json"
+
+
+def _write_json(path: Path, obj) -> None:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(obj, f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def il_fields(record: dict) -> dict:
+    """The IL / injury-news fields present on a player record."""
+    return {k: record[k] for k in IL_FIELDS if k in record}
+
+
+def diff_ops(old: Dict[int, dict], new: Dict[int, dict]) -> List[dict]:
+    """JSON-Patch style ops turning the `old` field sets into the `new` ones."""
+    ops = []
+    for mlbam_id in sorted(set(old) | set(new)):
+        before, after = old.get(mlbam_id, {}), new.get(mlbam_id, {})
+        for field in IL_FIELDS:
+            path = f"/{mlbam_id}/{field}"
+            if field in after and field not in before:
+                ops.append({"op": "add", "path": path, "value": after[field]})
+            elif field in after and before[field] != after[field]:
+                ops.append({"op": "replace", "path": path, "value": after[field]})
+            elif field in before and field not in after:
+                ops.append({"op": "remove", "path": path})
+    return ops
+
+
+def apply_ops(players: Dict[int, dict], ops: Iterable[dict]) -> set:
+    """Apply ops to {mlbam_id: record} in place; returns the ids touched."""
+    touched = set()
+    for op in ops:
+        _, mlbam_id, field = op["path"].split("/", 2)
+        record = players.get(int(mlbam_id))
+        if record is None:
+            continue
+        if op["op"] == "remove":
+            record.pop(field, None)
+        else:
+            record[field] = op["value"]
+        touched.add(int(mlbam_id))
+    return touched
+
+
+class PatchJournal:
+    """The patches/ directory: numbered delta entries plus the last-applied state."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def _entry_paths(self) -> List[Path]:
+        if not self.path.exists():
+            return []
+        return sorted(p for p in self.path.glob("[0-9]*.json"))
+
+    def entries(self, base: Optional[str] = None, since: int = 0) -> List[dict]:
+        """Journal entries after seq `since` (for `base` only, if given), oldest first."""
+        out = []
+        for p in self._entry_paths():
+            if int(p.stem) <= since:
+                continue
+            try:
+                with open(p) as f:
+                    entry = json.load(f)
+            except (OSError, ValueError) as exc:
+                print(f"  WARNING: Skipping unreadable patch entry {p.name} ({exc}).")
+                continue
+            if base is None or entry.get("base") == base:
+                out.append(entry)
+        return out
+
+    def load_state(self, base: str) -> Optional[dict]:
+        """{"seq", "applied"} for `base`, or None if missing or for another file."""
+        try:
+            with open(self.path / STATE_NAME) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if state.get("base") != base:
+            return None
+        state["applied"] = {int(k): v for k, v in state.get("applied", {}).items()}
+        return state
+
+    def save_state(self, base: str, seq: int, applied: Dict[int, dict]) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        _write_json(self.path / STATE_NAME, {
+            "base": base, "seq": seq,
+            "applied": {str(k): v for k, v in sorted(applied.items()) if v},
+        })
+
+    def last_seq(self) -> int:
+        """Highest seq issued so far (state.json remembers it across compactions)."""
+        paths = self._entry_paths()
+        seq = int(paths[-1].stem) if paths else 0
+        try:
+            with open(self.path / STATE_NAME) as f:
+                seq = max(seq, int(json.load(f).get("seq", 0)))
+        except (OSError, ValueError):
+            pass
+        return seq
+
+    def append(self, base: str, ops: List[dict], seq: Optional[int] = None) -> int:
+        """Write one entry (callers skip empty deltas). Returns its seq."""
+        seq = seq if seq is not None else self.last_seq() + 1
+        self.path.mkdir(parents=True, exist_ok=True)
+        _write_json(self.path / _entry_name(seq), {
+            "seq": seq, "base": base,
+            "created": datetime.datetime.utcnow().isoformat() + "Z",
+            "ops": ops,
+        })
+        return seq
+
+    def compact(self, base: str, max_entries: int = COMPACT_AFTER) -> int:
+        """
+        Drop entries for other bases, and fold this base's entries into one
+        (last op per path wins, keeping the newest seq) once there are more
+        than `max_entries`. Returns the number of files removed.
+        """
+        paths = self._entry_paths()
+        entries = self.entries()
+        stale = {e["seq"] for e in entries if e.get("base") != base}
+        current = [e for e in entries if e.get("base") == base]
+        fold = len(current) > max_entries
+        if fold:
+            merged: Dict[str, dict] = {}
+            for e in current:
+                for op in e["ops"]:
+                    merged[op["path"]] = op
+            self.append(base, list(merged.values()), seq=current[-1]["seq"])
+        keep = {current[-1]["seq"]} if current else set()
+        removed = 0
+        for p in paths:
+            seq = int(p.stem)
+            if seq in stale or (fold and seq not in keep):
+                p.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+
+def apply_latest_deltas(data: dict, patch_dir: Path, since: int = 0) -> int:
+    """
+    Bring an already-loaded latest.json dict up to date with the journal:
+    applies this file's entries after seq `since` to data["players"] in place.
+    Returns the last seq seen, to pass as `since` next time.
+    """
+    journal = PatchJournal(patch_dir)
+    players = {p.get("mlbam_id"): p for p in data.get("players", [])}
+    seq = since
+    for entry in journal.entries(base=data.get("generated_at"), since=since):
+        apply_ops(players, entry["ops"])
+        seq = entry["seq"]
+    return seq
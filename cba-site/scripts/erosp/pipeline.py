@@ -0,0 +1,273 @@
+"""
+Staged runner for the EROSP pipeline.
+
+compute_erosp.py declares its steps as Stage objects with named inputs and
+outputs; Pipeline resolves them in order and checkpoints each stage's outputs
+under erosp_cache/checkpoints/ together with a fingerprint of everything the
+stage consumed:
+  - the run parameters it declares (e.g. target_season, run_date)
+  - the content hash of each upstream output it reads
+  - the source of the erosp package + driver script (code changes invalidate)
+
+Run modes:
+  default              fetch stages (volatile=True) always run; compute stages
+                       are reused when their fingerprint matches the checkpoint
+  from_stage="x"       stages before x load from checkpoint, x onward recompute
+  refresh=["x", ...]   the named stages and everything downstream of them
+                       recompute; all other stages load from checkpoint
+  force=True           recompute everything
+
+load_artifacts / run_stage / commit let a driver patch individual stage
+outputs (see the incremental mode in compute_erosp.py) while keeping the
+checkpoints and fingerprints consistent for the next run.
+"""
+
+import hashlib
+import json
+import pickle
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set
+
+CHECKPOINT_VERSION = 1
+
+
+def _hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:24]
+
+
+def hash_value(value) -> str:
+    """Content hash of a stage output (pickle bytes; stable for frames/dicts/sets)."""
+    if isinstance(value, set):
+        value = sorted(value, key=repr)
+    return _hash_bytes(pickle.dumps(value, protocol=4))
+
+
+def code_fingerprint(paths: Iterable[Path]) -> str:
+    """Hash the source files whose edits should invalidate every checkpoint."""
+    h = hashlib.sha256()
+    for p in sorted(Path(x) for x in paths):
+        if p.exists():
+            h.update(p.name.encode())
+            h.update(p.read_bytes())
+    return h.hexdigest()[:24]
+
+
+class Stage:
+    """
+    One pipeline step: func(ctx, **inputs) -> dict of outputs.
+
+    `params` lists the ctx keys the stage depends on; `volatile` marks stages
+    that read external state (network, local JSON) and must run every time
+    unless a partial re-run explicitly asks to reuse their checkpoint.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable,
+        inputs: Sequence[str] = (),
+        outputs: Sequence[str] = (),
+        params: Sequence[str] = (),
+        volatile: bool = False,
+        checkpoint: bool = True,
+    ):
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.params = tuple(params)
+        self.volatile = volatile
+        self.checkpoint = checkpoint
+
+    def __repr__(self) -> str:
+        return f"Stage({self.name!r})"
+
+
+class Pipeline:
+    """Ordered list of stages with on-disk checkpoints."""
+
+    def __init__(self, stages: List[Stage], checkpoint_dir: Path, code_hash: str = ""):
+        self.stages = list(stages)
+        self.by_name = {s.name: s for s in self.stages}
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        self.code_hash = code_hash
+        self._validate()
+
+    # -- graph --------------------------------------------------------------
+
+    def _validate(self) -> None:
+        produced: Dict[str, str] = {}
+        for s in self.stages:
+            for name in s.inputs:
+                if name not in produced:
+                    raise ValueError(f"Stage {s.name!r} reads {name!r} before any stage produces it.")
+            for name in s.outputs:
+                if name in produced:
+                    raise ValueError(f"{name!r} produced by both {produced[name]!r} and {s.name!r}.")
+                produced[name] = s.name
+        self.producer = produced
+
+    def downstream(self, names: Iterable[str]) -> Set[str]:
+        """Stage names reachable from `names` (inclusive)."""
+        dirty = set(names)
+        for n in dirty:
+            if n not in self.by_name:
+                raise KeyError(f"Unknown stage {n!r}. Stages: {', '.join(self.by_name)}")
+        dirty_outputs: Set[str] = set()
+        for s in self.stages:
+            if s.name in dirty or any(i in dirty_outputs for i in s.inputs):
+                dirty.add(s.name)
+                dirty_outputs.update(s.outputs)
+        return dirty
+
+    # -- checkpoints --------------------------------------------------------
+
+    def _ckpt_path(self, stage: Stage) -> Path:
+        return self.checkpoint_dir / f"{stage.name}.pkl"
+
+    def _load_checkpoint(self, stage: Stage) -> Optional[dict]:
+        path = self._ckpt_path(stage)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                ckpt = pickle.load(f)
+        except Exception as exc:
+            print(f"  WARNING: checkpoint {path.name} unreadable ({exc}).")
+            return None
+        if ckpt.get("version") != CHECKPOINT_VERSION:
+            return None
+        return ckpt
+
+    def _save_checkpoint(self, stage: Stage, fingerprint: str, outputs: dict, hashes: dict) -> None:
+        path = self._ckpt_path(stage)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump({
+                "version":     CHECKPOINT_VERSION,
+                "stage":       stage.name,
+                "fingerprint": fingerprint,
+                "created":     time.time(),
+                "outputs":     outputs,
+                "hashes":      hashes,
+            }, f, protocol=4)
+        tmp.replace(path)
+
+    def _fingerprint(self, stage: Stage, ctx: dict, hashes: Dict[str, str]) -> str:
+        payload = {
+            "stage":  stage.name,
+            "code":   self.code_hash,
+            "params": {k: ctx.get(k) for k in stage.params},
+            "inputs": {k: hashes[k] for k in stage.inputs},
+        }
+        return _hash_bytes(json.dumps(payload, sort_keys=True, default=repr).encode())
+
+    def load_artifacts(self) -> Optional[Dict[str, dict]]:
+        """
+        Load every checkpointed stage as {"artifacts": {...}, "hashes": {...}}.
+
+        Returns None if any checkpointed stage is missing — the caller should
+        fall back to a full run.
+        """
+        artifacts: dict = {}
+        hashes: Dict[str, str] = {}
+        for stage in self.stages:
+            if not stage.checkpoint:
+                continue
+            ckpt = self._load_checkpoint(stage)
+            if ckpt is None:
+                print(f"  [{stage.name}] no checkpoint — incremental run unavailable.")
+                return None
+            artifacts.update(ckpt["outputs"])
+            hashes.update(ckpt["hashes"])
+        return {"artifacts": artifacts, "hashes": hashes}
+
+    def run_stage(self, name: str, ctx: dict, artifacts: dict, hashes: Dict[str, str]) -> dict:
+        """Execute one stage against `artifacts`, updating it in place and checkpointing."""
+        stage = self.by_name[name]
+        outputs = stage.func(ctx, **{k: artifacts[k] for k in stage.inputs}) or {}
+        self.commit(name, ctx, artifacts, hashes, {o: outputs[o] for o in stage.outputs})
+        return outputs
+
+    def commit(self, name: str, ctx: dict, artifacts: dict, hashes: Dict[str, str],
+               outputs: dict, patched: bool = False) -> None:
+        """
+        Record outputs for stage `name` computed outside run().
+
+        patched=True marks a partial update (only some rows recomputed): the
+        checkpoint stays loadable for later incremental runs but never matches
+        a fingerprint, so the next normal run recomputes the stage in full.
+        """
+        stage = self.by_name[name]
+        fp = "patched" if patched else self._fingerprint(stage, ctx, hashes)
+        out_hashes = {o: hash_value(outputs[o]) for o in stage.outputs}
+        artifacts.update(outputs)
+        hashes.update(out_hashes)
+        if stage.checkpoint:
+            self._save_checkpoint(stage, fp, outputs, out_hashes)
+
+    # -- run ----------------------------------------------------------------
+
+    def run(
+        self,
+        ctx: dict,
+        from_stage: Optional[str] = None,
+        refresh: Optional[Iterable[str]] = None,
+        force: bool = False,
+        stop_after: Optional[str] = None,
+    ) -> dict:
+        """Execute the pipeline and return the dict of all stage outputs."""
+        forced: Set[str] = set()
+        reuse: Set[str] = set()
+        if from_stage is not None:
+            if from_stage not in self.by_name:
+                raise KeyError(f"Unknown stage {from_stage!r}. Stages: {', '.join(self.by_name)}")
+            names = [s.name for s in self.stages]
+            start = names.index(from_stage)
+            reuse.update(names[:start])
+            forced.update(names[start:])
+        if refresh:
+            dirty = self.downstream(refresh)
+            forced.update(dirty)
+            reuse.update(s.name for s in self.stages if s.name not in dirty)
+            reuse.difference_update(dirty)
+
+        artifacts: dict = {}
+        hashes: Dict[str, str] = {}
+        for stage in self.stages:
+            fp = self._fingerprint(stage, ctx, hashes)
+            ckpt = self._load_checkpoint(stage) if stage.checkpoint and not force else None
+
+            use_ckpt = False
+            if ckpt is not None and stage.name not in forced:
+                if stage.name in reuse:
+                    use_ckpt = True
+                elif not stage.volatile and ckpt["fingerprint"] == fp:
+                    use_ckpt = True
+            if stage.name in reuse and ckpt is None:
+                print(f"  [{stage.name}] no usable checkpoint — recomputing.")
+
+            if use_ckpt:
+                outputs, out_hashes = ckpt["outputs"], ckpt["hashes"]
+                print(f"  [{stage.name}] reused checkpoint.")
+            else:
+                t0 = time.perf_counter()
+                inputs = {k: artifacts[k] for k in stage.inputs}
+                outputs = stage.func(ctx, **inputs) or {}
+                missing = [o for o in stage.outputs if o not in outputs]
+                if missing:
+                    raise RuntimeError(f"Stage {stage.name!r} did not return {missing}.")
+                out_hashes = {o: hash_value(outputs[o]) for o in stage.outputs}
+                if stage.checkpoint:
+                    self._save_checkpoint(stage, fp, {o: outputs[o] for o in stage.outputs}, out_hashes)
+                print(f"  [{stage.name}] done in {time.perf_counter() - t0:.1f}s.")
+
+            for o in stage.outputs:
+                artifacts[o] = outputs[o]
+                hashes[o] = out_hashes[o]
+
+            if stop_after is not None and stage.name == stop_after:
+                break
+        return artifacts
@@ -12,12 +12,7 @@ from typing import Dict, Optional
 import numpy as np
 import pandas as pd
 
-from .config import (
-    DEFAULT_P_PLAY_HITTER, DEFAULT_PA_PER_GAME,
-    DEFAULT_P_PLAY_CATCHER, DEFAULT_PA_PER_GAME_CATCHER,
-    DEFAULT_IP_PER_START, DEFAULT_P_APPEAR_RP, DEFAULT_IP_PER_APP,
-    ROTATION_DAYS, FULL_SEASON_GAMES,
-)
+from .config import DEFAULT_CONFIG, EROSPConfig
 
 
 # ---------------------------------------------------------------------------
@@ -29,21 +24,23 @@ def estimate_hitter_playing_time(
     batting_by_year: Dict,
     current_season_year: int,
     steamer_pa_map: Optional[Dict[int, float]] = None,
+    config: Optional[EROSPConfig] = None,
 ) -> pd.DataFrame:
     """
     Returns DataFrame (same index as talent_df) with columns:
       p_play:      probability of being in the starting lineup on a given game day
       pa_per_game: expected plate appearances per game if playing
     """
+    cfg = config or DEFAULT_CONFIG
     result = talent_df[["name", "age", "mlb_team"]].copy()
-    result["p_play"]      = DEFAULT_P_PLAY_HITTER
-    result["pa_per_game"] = DEFAULT_PA_PER_GAME
+    result["p_play"]      = cfg.default_p_play_hitter
+    result["pa_per_game"] = cfg.default_pa_per_game
 
     # Fix 4: Catchers play fewer games and bat lower in the order
     if "mlb_position" in talent_df.columns:
         catcher_mask = talent_df["mlb_position"].str.upper() == "C"
-        result.loc[catcher_mask, "p_play"]      = DEFAULT_P_PLAY_CATCHER
-        result.loc[catcher_mask, "pa_per_game"] = DEFAULT_PA_PER_GAME_CATCHER
+        result.loc[catcher_mask, "p_play"]      = cfg.default_p_play_catcher
+        result.loc[catcher_mask, "pa_per_game"] = cfg.default_pa_per_game_catcher
 
     # Use Steamer projected PA to infer playing time if available
     if steamer_pa_map:
@@ -51,8 +48,8 @@ def estimate_hitter_playing_time(
             fgid = int(row.get("fgid", 0))
             if fgid and fgid in steamer_pa_map:
                 proj_pa   = float(steamer_pa_map[fgid])
-                pa_per_g  = proj_pa / FULL_SEASON_GAMES
-                p_play    = min(pa_per_g / DEFAULT_PA_PER_GAME, 1.0)
+                pa_per_g  = proj_pa / cfg.full_season_games
+                p_play    = min(pa_per_g / cfg.default_pa_per_game, 1.0)
                 if p_play > 0:
                     result.at[mlbam_id, "p_play"]      = round(float(p_play), 4)
                     result.at[mlbam_id, "pa_per_game"] = round(float(min(pa_per_g, 5.0)), 2)
@@ -76,7 +73,7 @@ def estimate_hitter_playing_time(
             y0_pa = float(y0_match.iloc[0].get("PA", 0))
             if y0_pa >= 480:
                 pa_floor    = 0.80 * y0_pa
-                p_play_floor = min(pa_floor / FULL_SEASON_GAMES / DEFAULT_PA_PER_GAME, 1.0)
+                p_play_floor = min(pa_floor / cfg.full_season_games / cfg.default_pa_per_game, 1.0)
                 if result.at[mlbam_id, "p_play"] < p_play_floor:
                     result.at[mlbam_id, "p_play"] = round(float(p_play_floor), 4)
                     healthy_hitter_count += 1
@@ -108,7 +105,7 @@ def estimate_hitter_playing_time(
             player_team = str(row.get("mlb_team", ""))
             team_games  = float(team_max_games.get(player_team, 0))
             if team_games < games:  # fallback for traded players or missing team
-                team_games = games / DEFAULT_P_PLAY_HITTER
+                team_games = games / cfg.default_p_play_hitter
             p_play   = min(games / max(team_games, 1), 1.0)
             pa_per_g = pa / max(games, 1)
             result.at[mlbam_id, "p_play"]      = round(float(p_play), 4)
@@ -131,6 +128,7 @@ def estimate_sp_playing_time(
     current_season_year: int,
     steamer_gs_map: Optional[Dict[int, float]] = None,
     steamer_ip_map: Optional[Dict[int, float]] = None,
+    config: Optional[EROSPConfig] = None,
 ) -> pd.DataFrame:
     """
     Returns DataFrame (same index as pitcher_talent_df, SP only) with:
@@ -141,12 +139,13 @@ def estimate_sp_playing_time(
     When steamer_gs_map / steamer_ip_map are provided, projected GS/IP override
     the rotation-tiering heuristic for pitchers that Steamer covers.
     """
+    cfg = config or DEFAULT_CONFIG
     sp_df = pitcher_talent_df[pitcher_talent_df["role"] == "SP"].copy()
     result = sp_df[["name", "mlb_team"]].copy()
 
     # Set defaults
-    result["p_start_per_day"] = 1.0 / ROTATION_DAYS   # 0.2 for 5-man rotation slot
-    result["ip_per_start"]    = sp_df["ip_per_gs"].clip(lower=3.0, upper=9.0).fillna(DEFAULT_IP_PER_START)
+    result["p_start_per_day"] = 1.0 / cfg.rotation_days   # 0.2 for 5-man rotation slot
+    result["ip_per_start"]    = sp_df["ip_per_gs"].clip(lower=3.0, upper=9.0).fillna(cfg.default_ip_per_start)
     result["is_sp"]           = True
 
     # Adjust p_start based on rotation depth within team
@@ -167,19 +166,19 @@ def estimate_sp_playing_time(
 
         if n_sp_on_team <= 5:
             # Standard 5-man rotation: each gets ~32 starts / 162 games ≈ 0.198
-            p_start = 1.0 / ROTATION_DAYS
+            p_start = 1.0 / cfg.rotation_days
         else:
             # 6+ SPs: rank by quality, give top 5 full rotation slots
             team_sps = sp_df[sp_df["mlb_team"] == team].sort_values("_quality", ascending=False)
             rank = list(team_sps.index).index(mlbam_id) if mlbam_id in team_sps.index else n_sp_on_team - 1
             if rank < 5:
-                p_start = 1.0 / ROTATION_DAYS
+                p_start = 1.0 / cfg.rotation_days
             elif rank == 5:
-                p_start = 15.0 / FULL_SEASON_GAMES   # spot/6th starter
+                p_start = 15.0 / cfg.full_season_games   # spot/6th starter
             elif rank == 6:
-                p_start = 8.0 / FULL_SEASON_GAMES
+                p_start = 8.0 / cfg.full_season_games
             else:
-                p_start = 3.0 / FULL_SEASON_GAMES    # fringe/emergency starter
+                p_start = 3.0 / cfg.full_season_games    # fringe/emergency starter
 
         result.at[mlbam_id, "p_start_per_day"] = round(float(p_start), 4)
 
@@ -196,10 +195,10 @@ def estimate_sp_playing_time(
             ip_proj = steamer_ip_map.get(fgid) if steamer_ip_map else None
 
             if gs_proj is not None and gs_proj > 0:
-                p_start = float(gs_proj) / FULL_SEASON_GAMES
+                p_start = float(gs_proj) / cfg.full_season_games
                 # Cap at 1/ROTATION_DAYS — no pitcher can start every 4th game
                 result.at[mlbam_id, "p_start_per_day"] = round(
-                    float(min(p_start, 1.0 / ROTATION_DAYS)), 4
+                    float(min(p_start, 1.0 / cfg.rotation_days)), 4
                 )
 
             if gs_proj and ip_proj and float(gs_proj) > 0:
@@ -230,7 +229,7 @@ def estimate_sp_playing_time(
                 continue
             ytd_gs = float(ytd_match.iloc[0].get("GS", 0))
             if ytd_gs >= 3:
-                pace_floor = round(min(ytd_gs / _days_elapsed, 1.0 / ROTATION_DAYS), 4)
+                pace_floor = round(min(ytd_gs / _days_elapsed, 1.0 / cfg.rotation_days), 4)
                 if result.at[mlbam_id, "p_start_per_day"] < pace_floor:
                     result.at[mlbam_id, "p_start_per_day"] = pace_floor
                     ytd_anchor_count += 1
@@ -263,7 +262,7 @@ def estimate_sp_playing_time(
                 continue
             y0_gs = float(y0_match.iloc[0].get("GS", 0))
             if y0_gs >= 10:
-                floor = round(15.0 / FULL_SEASON_GAMES, 4)
+                floor = round(15.0 / cfg.full_season_games, 4)
                 if result.at[mlbam_id, "p_start_per_day"] < floor:
                     result.at[mlbam_id, "p_start_per_day"] = floor
 
@@ -285,7 +284,7 @@ def estimate_sp_playing_time(
                 continue
             y0_gs = float(y0_match.iloc[0].get("GS", 0))
             if y0_gs >= 28:
-                gs_floor = round(0.80 * y0_gs / FULL_SEASON_GAMES, 4)
+                gs_floor = round(0.80 * y0_gs / cfg.full_season_games, 4)
                 if result.at[mlbam_id, "p_start_per_day"] < gs_floor:
                     result.at[mlbam_id, "p_start_per_day"] = gs_floor
                     healthy_returnee_count += 1
@@ -304,6 +303,7 @@ def estimate_rp_playing_time(
     pitcher_talent_df: pd.DataFrame,
     pitching_by_year: Dict,
     current_season_year: int,
+    config: Optional[EROSPConfig] = None,
 ) -> pd.DataFrame:
     """
     Returns DataFrame for RP-role pitchers with:
@@ -311,12 +311,13 @@ def estimate_rp_playing_time(
       ip_per_app:        expected IP per appearance
       rp_role:           "closer", "setup", "middle"
     """
+    cfg = config or DEFAULT_CONFIG
     rp_df = pitcher_talent_df[pitcher_talent_df["role"] == "RP"].copy()
     result = rp_df[["name", "mlb_team"]].copy()
 
     # Default playing time
-    result["p_appear_per_game"] = DEFAULT_P_APPEAR_RP
-    result["ip_per_app"]        = rp_df["ip_per_app"].clip(lower=0.2, upper=1.5).fillna(DEFAULT_IP_PER_APP)
+    result["p_appear_per_game"] = cfg.default_p_appear_rp
+    result["ip_per_app"]        = rp_df["ip_per_app"].clip(lower=0.2, upper=1.5).fillna(cfg.default_ip_per_app)
     result["rp_role"]           = "middle"
 
     # Classify closer vs setup vs middle based on SV and HD rates
@@ -415,7 +416,7 @@ def estimate_rp_playing_time(
             player_team = str(row.get("mlb_team", ""))
             team_games  = float(team_max_g.get(player_team, 0))
             if team_games < ytd_g:  # fallback for traded players or missing team
-                team_games = ytd_g / DEFAULT_P_APPEAR_RP
+                team_games = ytd_g / cfg.default_p_appear_rp
             pace = round(min(ytd_g / max(team_games, 1), 0.65), 4)
             if result.at[mlbam_id, "p_appear_per_game"] < pace:
                 result.at[mlbam_id, "p_appear_per_game"] = pace
@@ -448,10 +449,12 @@ def build_playing_time(
     steamer_pa_map: Optional[Dict[int, float]] = None,
     steamer_gs_map: Optional[Dict[int, float]] = None,
     steamer_ip_map: Optional[Dict[int, float]] = None,
+    config: Optional[EROSPConfig] = None,
 ) -> pd.DataFrame:
     """
     Returns a combined DataFrame indexed by mlbam_id with all playing time columns.
     """
+    cfg = config or DEFAULT_CONFIG
     # Determine current season year (only matters if season is in progress)
     import datetime
     today = datetime.date.today()
@@ -463,7 +466,7 @@ def build_playing_time(
     if not hitter_talent_df.empty:
         ht = estimate_hitter_playing_time(
             hitter_talent_df, batting_by_year,
-            current_season_year, steamer_pa_map
+            current_season_year, steamer_pa_map, config=cfg,
         )
         ht["player_type"]    = "hitter"
         ht["is_sp"]          = False
@@ -482,6 +485,7 @@ def build_playing_time(
             pitcher_talent_df, pitching_by_year, current_season_year,
             steamer_gs_map=steamer_gs_map,
             steamer_ip_map=steamer_ip_map,
+            config=cfg,
         )
         sp["player_type"]   = "sp"
         sp["is_sp"]         = True
@@ -496,7 +500,7 @@ def build_playing_time(
     # RPs
     rp_talent = pitcher_talent_df[pitcher_talent_df["role"] == "RP"] if not pitcher_talent_df.empty else pd.DataFrame()
     if not rp_talent.empty:
-        rp = estimate_rp_playing_time(pitcher_talent_df, pitching_by_year, current_season_year)
+        rp = estimate_rp_playing_time(pitcher_talent_df, pitching_by_year, current_season_year, config=cfg)
         rp["player_type"]   = "rp"
         rp["is_sp"]         = False
         rp["is_rp"]         = True
@@ -513,12 +517,12 @@ def build_playing_time(
 
     # Ensure all columns exist
     for col, default in [
-        ("p_play", DEFAULT_P_PLAY_HITTER),
-        ("pa_per_game", DEFAULT_PA_PER_GAME),
+        ("p_play", cfg.default_p_play_hitter),
+        ("pa_per_game", cfg.default_pa_per_game),
         ("p_start_per_day", 0.0),
-        ("ip_per_start", DEFAULT_IP_PER_START),
-        ("p_appear_per_game", DEFAULT_P_APPEAR_RP),
-        ("ip_per_app", DEFAULT_IP_PER_APP),
+        ("ip_per_start", cfg.default_ip_per_start),
+        ("p_appear_per_game", cfg.default_p_appear_rp),
+        ("ip_per_app", cfg.default_ip_per_app),
         ("rp_role", "middle"),
         ("is_sp", False),
         ("is_rp", False),
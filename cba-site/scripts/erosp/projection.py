@@ -6,20 +6,18 @@ For each player, computes:
   erosp_raw:    sum of daily_ev_raw over all remaining games
 """
 
-from typing import Dict
+from typing import Dict, Optional, Sequence, Tuple
 import numpy as np
 import pandas as pd
 
-from typing import Dict, Optional
-
-from .config import SCORING, FULL_SEASON_GAMES
+from .config import DEFAULT_CONFIG, EROSPConfig
 
 
 # ---------------------------------------------------------------------------
 # Expected FP per PA (hitters)
 # ---------------------------------------------------------------------------
 
-def fp_per_pa(rates: dict) -> float:
+def fp_per_pa(rates: dict, config: Optional[EROSPConfig] = None) -> float:
     """
     Compute expected fantasy points per plate appearance from per-PA talent rates.
 
@@ -36,19 +34,20 @@ def fp_per_pa(rates: dict) -> float:
       CS:     -1 pt
       GIDP:   -0.25 pts
     """
+    scoring = (config or DEFAULT_CONFIG).scoring
     ev = (
-        rates.get("single_rate", 0) * SCORING["single"] +
-        rates.get("double_rate", 0) * SCORING["double"] +
-        rates.get("triple_rate", 0) * SCORING["triple"] +
-        rates.get("hr_rate",     0) * SCORING["hr"]     +
-        rates.get("r_per_pa",    0) * SCORING["r"]      +
-        rates.get("rbi_per_pa",  0) * SCORING["rbi"]    +
-        rates.get("bb_rate",     0) * SCORING["bb"]     +
-        rates.get("hbp_rate",    0) * SCORING["hbp"]    +
-        rates.get("k_rate",      0) * SCORING["k"]      +
-        rates.get("sb_rate",     0) * SCORING["sb"]     +
-        rates.get("cs_rate",     0) * SCORING["cs"]     +
-        rates.get("gidp_rate",   0) * SCORING["gidp"]
+        rates.get("single_rate", 0) * scoring["single"] +
+        rates.get("double_rate", 0) * scoring["double"] +
+        rates.get("triple_rate", 0) * scoring["triple"] +
+        rates.get("hr_rate",     0) * scoring["hr"]     +
+        rates.get("r_per_pa",    0) * scoring["r"]      +
+        rates.get("rbi_per_pa",  0) * scoring["rbi"]    +
+        rates.get("bb_rate",     0) * scoring["bb"]     +
+        rates.get("hbp_rate",    0) * scoring["hbp"]    +
+        rates.get("k_rate",      0) * scoring["k"]      +
+        rates.get("sb_rate",     0) * scoring["sb"]     +
+        rates.get("cs_rate",     0) * scoring["cs"]     +
+        rates.get("gidp_rate",   0) * scoring["gidp"]
     )
     return float(ev)
 
@@ -57,7 +56,7 @@ def fp_per_pa(rates: dict) -> float:
 # Expected FP per start (SP)
 # ---------------------------------------------------------------------------
 
-def fp_per_start(rates: dict, ip_per_start: float) -> float:
+def fp_per_start(rates: dict, ip_per_start: float, config: Optional[EROSPConfig] = None) -> float:
     """
     Compute expected fantasy points per start.
 
@@ -71,23 +70,24 @@ def fp_per_start(rates: dict, ip_per_start: float) -> float:
       L:   -3   (modeled as implicit in W/G balance)
       QS:  +3
     """
+    scoring = (config or DEFAULT_CONFIG).scoring
     fp_pitching = (
-        ip_per_start             * SCORING["ip"]  +
-        rates.get("h_per_ip",  0) * ip_per_start * SCORING["ha"]  +
-        rates.get("er_per_ip", 0) * ip_per_start * SCORING["er"]  +
-        rates.get("bb_per_ip", 0) * ip_per_start * SCORING["bba"] +
-        rates.get("k_per_ip",  0) * ip_per_start * SCORING["kp"]
+        ip_per_start             * scoring["ip"]  +
+        rates.get("h_per_ip",  0) * ip_per_start * scoring["ha"]  +
+        rates.get("er_per_ip", 0) * ip_per_start * scoring["er"]  +
+        rates.get("bb_per_ip", 0) * ip_per_start * scoring["bba"] +
+        rates.get("k_per_ip",  0) * ip_per_start * scoring["kp"]
     )
 
     # W/L: each start has ~w_per_gs win probability, ~(1 - w_per_gs) no-decision-or-loss
     # L probability is roughly (1 - w_per_gs) * 0.45 (not every non-win is a loss)
     w_prob = float(rates.get("w_per_gs", 0.33))
     l_prob = (1.0 - w_prob) * 0.45
-    fp_wl = w_prob * SCORING["w"] + l_prob * SCORING["l"]
+    fp_wl = w_prob * scoring["w"] + l_prob * scoring["l"]
 
     # QS: probability per start × scoring
     qs_prob = float(rates.get("qs_per_gs", 0.44))
-    fp_qs = qs_prob * SCORING["qs"]
+    fp_qs = qs_prob * scoring["qs"]
 
     return float(fp_pitching + fp_wl + fp_qs)
 
@@ -96,19 +96,21 @@ def fp_per_start(rates: dict, ip_per_start: float) -> float:
 # Expected FP per appearance (RP)
 # ---------------------------------------------------------------------------
 
-def fp_per_appearance(rates: dict, ip_per_app: float, rp_role: str = "middle") -> float:
+def fp_per_appearance(rates: dict, ip_per_app: float, rp_role: str = "middle",
+                      config: Optional[EROSPConfig] = None) -> float:
     """
     Compute expected fantasy points per relief appearance.
 
     Scoring adds:
       SV: +5, HD: +3, BS: -2 (blown save)
     """
+    scoring = (config or DEFAULT_CONFIG).scoring
     fp_pitching = (
-        ip_per_app               * SCORING["ip"]  +
-        rates.get("h_per_ip",  0) * ip_per_app * SCORING["ha"]  +
-        rates.get("er_per_ip", 0) * ip_per_app * SCORING["er"]  +
-        rates.get("bb_per_ip", 0) * ip_per_app * SCORING["bba"] +
-        rates.get("k_per_ip",  0) * ip_per_app * SCORING["kp"]
+        ip_per_app               * scoring["ip"]  +
+        rates.get("h_per_ip",  0) * ip_per_app * scoring["ha"]  +
+        rates.get("er_per_ip", 0) * ip_per_app * scoring["er"]  +
+        rates.get("bb_per_ip", 0) * ip_per_app * scoring["bba"] +
+        rates.get("k_per_ip",  0) * ip_per_app * scoring["kp"]
     )
 
     sv_per_g = float(rates.get("sv_per_g", 0.0))
@@ -117,9 +119,9 @@ def fp_per_appearance(rates: dict, ip_per_app: float, rp_role: str = "middle") -
     bs_rate  = sv_per_g * 0.12
 
     fp_leverage = (
-        sv_per_g * SCORING["sv"] +
-        hd_per_g * SCORING["hd"] +
-        bs_rate  * SCORING["bs"]
+        sv_per_g * scoring["sv"] +
+        hd_per_g * scoring["hd"] +
+        bs_rate  * scoring["bs"]
     )
 
     return float(fp_pitching + fp_leverage)
@@ -135,9 +137,10 @@ def daily_ev_hitter(
     pa_per_game: float,
     park_factor: float = 1.0,
     opp_factor: float  = 1.0,
+    config: Optional[EROSPConfig] = None,
 ) -> float:
     """Expected fantasy points for a hitter on a given game day."""
-    base_fp = fp_per_pa(talent)
+    base_fp = fp_per_pa(talent, config)
     return base_fp * pa_per_game * p_play * park_factor * opp_factor
 
 
@@ -147,9 +150,10 @@ def daily_ev_sp(
     ip_per_start: float,
     park_factor: float = 1.0,
     opp_factor: float  = 1.0,
+    config: Optional[EROSPConfig] = None,
 ) -> float:
     """Expected fantasy points for a SP on a given team game day."""
-    base_fp = fp_per_start(talent, ip_per_start)
+    base_fp = fp_per_start(talent, ip_per_start, config)
     return base_fp * p_start_per_day * park_factor * opp_factor
 
 
@@ -160,12 +164,137 @@ def daily_ev_rp(
     rp_role: str = "middle",
     park_factor: float = 1.0,
     opp_factor: float  = 1.0,
+    config: Optional[EROSPConfig] = None,
 ) -> float:
     """Expected fantasy points for a RP on a given team game day."""
-    base_fp = fp_per_appearance(talent, ip_per_app, rp_role)
+    base_fp = fp_per_appearance(talent, ip_per_app, rp_role, config)
     return base_fp * p_appear * park_factor * opp_factor
 
 
+# ---------------------------------------------------------------------------
+# Array versions (whole DataFrame columns at once)
+#
+# Same arithmetic, in the same order, as the scalar functions above, which
+# remain the reference implementation. A rate column missing from the frame
+# counts as its scalar default; NaN propagates exactly as float(nan) does.
+# ---------------------------------------------------------------------------
+
+_HITTER_RATE_SCORING: Sequence[Tuple[str, str]] = (
+    ("single_rate", "single"),
+    ("double_rate", "double"),
+    ("triple_rate", "triple"),
+    ("hr_rate",     "hr"),
+    ("r_per_pa",    "r"),
+    ("rbi_per_pa",  "rbi"),
+    ("bb_rate",     "bb"),
+    ("hbp_rate",    "hbp"),
+    ("k_rate",      "k"),
+    ("sb_rate",     "sb"),
+    ("cs_rate",     "cs"),
+    ("gidp_rate",   "gidp"),
+)
+
+_PITCHER_RATE_SCORING: Sequence[Tuple[str, str]] = (
+    ("h_per_ip",  "ha"),
+    ("er_per_ip", "er"),
+    ("bb_per_ip", "bba"),
+    ("k_per_ip",  "kp"),
+)
+
+
+def _col(df: pd.DataFrame, name: str, default: float) -> np.ndarray:
+    """Column as a float array, or `default` everywhere if the column is absent."""
+    if name in df.columns:
+        return df[name].to_numpy(dtype=float)
+    return np.full(len(df), float(default))
+
+
+def fp_per_pa_array(rates: pd.DataFrame, config: Optional[EROSPConfig] = None) -> np.ndarray:
+    """fp_per_pa for every row of a talent frame."""
+    scoring = (config or DEFAULT_CONFIG).scoring
+    ev = np.zeros(len(rates))
+    for col, event in _HITTER_RATE_SCORING:
+        ev = ev + _col(rates, col, 0) * scoring[event]
+    return ev
+
+
+def _fp_pitching_array(rates: pd.DataFrame, ip: np.ndarray, scoring) -> np.ndarray:
+    ip = np.asarray(ip, dtype=float)
+    fp = ip * scoring["ip"]
+    for col, event in _PITCHER_RATE_SCORING:
+        fp = fp + _col(rates, col, 0) * ip * scoring[event]
+    return fp
+
+
+def fp_per_start_array(rates: pd.DataFrame, ip_per_start: np.ndarray,
+                       config: Optional[EROSPConfig] = None) -> np.ndarray:
+    """fp_per_start for every row of an SP talent frame."""
+    scoring = (config or DEFAULT_CONFIG).scoring
+    fp_pitching = _fp_pitching_array(rates, ip_per_start, scoring)
+    w_prob = _col(rates, "w_per_gs", 0.33)
+    l_prob = (1.0 - w_prob) * 0.45
+    fp_wl  = w_prob * scoring["w"] + l_prob * scoring["l"]
+    fp_qs  = _col(rates, "qs_per_gs", 0.44) * scoring["qs"]
+    return fp_pitching + fp_wl + fp_qs
+
+
+def fp_per_appearance_array(rates: pd.DataFrame, ip_per_app: np.ndarray,
+                            config: Optional[EROSPConfig] = None) -> np.ndarray:
+    """fp_per_appearance for every row of an RP talent frame."""
+    scoring = (config or DEFAULT_CONFIG).scoring
+    fp_pitching = _fp_pitching_array(rates, ip_per_app, scoring)
+    sv_per_g = _col(rates, "sv_per_g", 0.0)
+    hd_per_g = _col(rates, "hd_per_g", 0.0)
+    bs_rate  = sv_per_g * 0.12
+    fp_leverage = (
+        sv_per_g * scoring["sv"] +
+        hd_per_g * scoring["hd"] +
+        bs_rate  * scoring["bs"]
+    )
+    return fp_pitching + fp_leverage
+
+
+def daily_ev_hitter_array(
+    talent: pd.DataFrame,
+    p_play: np.ndarray,
+    pa_per_game: np.ndarray,
+    park_factor=1.0,
+    opp_factor=1.0,
+    config: Optional[EROSPConfig] = None,
+) -> np.ndarray:
+    """daily_ev_hitter for every row of a hitter talent frame."""
+    return fp_per_pa_array(talent, config) * pa_per_game * p_play * park_factor * opp_factor
+
+
+def daily_ev_sp_array(
+    talent: pd.DataFrame,
+    p_start_per_day: np.ndarray,
+    ip_per_start: np.ndarray,
+    park_factor=1.0,
+    opp_factor=1.0,
+    config: Optional[EROSPConfig] = None,
+) -> np.ndarray:
+    """daily_ev_sp for every row of an SP talent frame."""
+    return fp_per_start_array(talent, ip_per_start, config) * p_start_per_day * park_factor * opp_factor
+
+
+def daily_ev_rp_array(
+    talent: pd.DataFrame,
+    p_appear: np.ndarray,
+    ip_per_app: np.ndarray,
+    park_factor=1.0,
+    opp_factor=1.0,
+    config: Optional[EROSPConfig] = None,
+) -> np.ndarray:
+    """daily_ev_rp for every row of an RP talent frame."""
+    return fp_per_appearance_array(talent, ip_per_app, config) * p_appear * park_factor * opp_factor
+
+
+def _round(values: np.ndarray, ndigits: int) -> list:
+    # Python round() rather than np.round so output matches the scalar path exactly
+    return [round(float(v), ndigits) for v in values]
+
+
 # ---------------------------------------------------------------------------
 # Compute EROSP_raw for all players
 # ---------------------------------------------------------------------------
@@ -177,6 +306,7 @@ def compute_all_erosp_raw(
     schedule_summary: Dict[int, dict],
     mlb_team_abbrev_to_id: Dict[str, int],
     injury_map: Optional[Dict[int, dict]] = None,
+    config: Optional[EROSPConfig] = None,
 ) -> pd.DataFrame:
     """
     Compute EROSP_raw (unconditional expected rest-of-season fantasy points) for all players.
@@ -184,6 +314,7 @@ def compute_all_erosp_raw(
     Returns DataFrame indexed by mlbam_id with columns:
       erosp_raw, daily_ev_raw, games_remaining, fp_per_pa_or_ip, park_factor
     """
+    cfg = config or DEFAULT_CONFIG
     # Build reverse mapping: abbrev → schedule entry
     abbrev_to_schedule = {}
     for team_id, info in schedule_summary.items():
@@ -191,142 +322,130 @@ def compute_all_erosp_raw(
         if abbrev:
             abbrev_to_schedule[abbrev] = info
 
-    rows = []
+    games_missed = pd.Series(
+        {mid: int(inj.get("games_missed_est", 0)) for mid, inj in (injury_map or {}).items()},
+        dtype=float,
+    )
+
+    def join_playing_time(talent: pd.DataFrame, player_type: str, defaults: Dict[str, object]):
+        """Inner-join talent rows to their playing-time row (talent order kept)."""
+        pt = playing_time_df[playing_time_df["player_type"] == player_type]
+        pt = pt[~pt.index.duplicated()]
+        cols = [c for c in defaults if c in pt.columns]
+        joined = talent.join(pt[cols].add_prefix("pt_"), how="inner")
+        for c, default in defaults.items():
+            if c not in cols:
+                joined["pt_" + c] = default
+        return joined
+
+    def team_context(df: pd.DataFrame) -> pd.DataFrame:
+        """mlb_team, games_remaining (less injury time) and park factor per row."""
+        teams = df["mlb_team"].astype(str) if "mlb_team" in df.columns else pd.Series("", index=df.index)
+        known = teams.isin(abbrev_to_schedule)
+        games = teams.map(
+            {a: int(info.get("games_remaining", cfg.full_season_games)) for a, info in abbrev_to_schedule.items()}
+        ).where(known, cfg.full_season_games).astype(int)
+        missed = games_missed.reindex(df.index)
+        injured = missed.notna().to_numpy()
+        games = np.where(injured, np.maximum(0, games.to_numpy() - missed.fillna(0).to_numpy().astype(int)),
+                         games.to_numpy())
+        pf_map = {a: info["avg_park_factor_remaining"] for a, info in abbrev_to_schedule.items()
+                  if "avg_park_factor_remaining" in info}
+        has_pf = teams.isin(pf_map).to_numpy()
+        pf = np.where(has_pf, teams.map(pf_map).to_numpy(dtype=float), _col(df, "park_factor", 1.0))
+        names = df["name"].astype(str) if "name" in df.columns else pd.Series("", index=df.index)
+        return pd.DataFrame({
+            "name":            names.to_numpy(),
+            "mlb_team":        teams.to_numpy(),
+            "park_factor":     pf,
+            "games_remaining": games.astype(int),
+        }, index=df.index)
+
+    frames = []
 
     # ── Hitters ──────────────────────────────────────────────────────────────
     if not hitter_talent_df.empty:
-        pt_hitters = playing_time_df[playing_time_df["player_type"] == "hitter"]
-        for mlbam_id, talent_row in hitter_talent_df.iterrows():
-            if mlbam_id not in pt_hitters.index:
-                continue
-            pt_row = pt_hitters.loc[mlbam_id]
-
-            team_abbrev = str(talent_row.get("mlb_team", ""))
-            sched = abbrev_to_schedule.get(team_abbrev, {})
-            games_remaining = int(sched.get("games_remaining", FULL_SEASON_GAMES))
-            # Reduce games_remaining for injured players
-            if injury_map and mlbam_id in injury_map:
-                games_remaining = max(0, games_remaining - int(injury_map[mlbam_id].get("games_missed_est", 0)))
-            avg_pf = float(sched.get("avg_park_factor_remaining", talent_row.get("park_factor", 1.0)))
-
-            talent_dict = talent_row.to_dict()
-            ev_per_game = daily_ev_hitter(
-                talent=talent_dict,
-                p_play=float(pt_row.get("p_play", 0.85)),
-                pa_per_game=float(pt_row.get("pa_per_game", 4.0)),
-                park_factor=avg_pf,
-            )
-
-            erosp_raw = ev_per_game * games_remaining
-
-            rows.append({
-                "mlbam_id":       mlbam_id,
-                "name":           str(talent_row.get("name", "")),
-                "player_type":    "hitter",
-                "role":           "H",
-                "mlb_team":       team_abbrev,
-                "park_factor":    avg_pf,
-                "games_remaining": games_remaining,
-                "daily_ev_raw":   round(float(ev_per_game), 4),
-                "erosp_raw":      round(float(max(erosp_raw, 0)), 2),
-                "fp_per_pa":      round(float(fp_per_pa(talent_dict)), 4),
-            })
+        h = join_playing_time(hitter_talent_df, "hitter", {"p_play": 0.85, "pa_per_game": 4.0})
+        ctx = team_context(h)
+        ev_per_game = daily_ev_hitter_array(
+            h,
+            p_play=h["pt_p_play"].to_numpy(dtype=float),
+            pa_per_game=h["pt_pa_per_game"].to_numpy(dtype=float),
+            park_factor=ctx["park_factor"].to_numpy(),
+            config=cfg,
+        )
+        erosp_raw = ev_per_game * ctx["games_remaining"].to_numpy()
+        frames.append(pd.DataFrame({
+            "name":            ctx["name"],
+            "player_type":     "hitter",
+            "role":            "H",
+            "mlb_team":        ctx["mlb_team"],
+            "park_factor":     ctx["park_factor"],
+            "games_remaining": ctx["games_remaining"],
+            "daily_ev_raw":    _round(ev_per_game, 4),
+            "erosp_raw":       _round(np.maximum(erosp_raw, 0), 2),
+            "fp_per_pa":       _round(fp_per_pa_array(h, cfg), 4),
+        }, index=h.index))
 
     # ── Starting Pitchers ─────────────────────────────────────────────────────
     if not pitcher_talent_df.empty:
-        sp_talent = pitcher_talent_df[pitcher_talent_df["role"] == "SP"]
-        pt_sps    = playing_time_df[playing_time_df["player_type"] == "sp"]
-
-        for mlbam_id, talent_row in sp_talent.iterrows():
-            if mlbam_id not in pt_sps.index:
-                continue
-            pt_row = pt_sps.loc[mlbam_id]
-
-            team_abbrev = str(talent_row.get("mlb_team", ""))
-            sched = abbrev_to_schedule.get(team_abbrev, {})
-            games_remaining = int(sched.get("games_remaining", FULL_SEASON_GAMES))
-            if injury_map and mlbam_id in injury_map:
-                games_remaining = max(0, games_remaining - int(injury_map[mlbam_id].get("games_missed_est", 0)))
-            avg_pf = float(sched.get("avg_park_factor_remaining",
-                                     talent_row.get("park_factor", 1.0)))
-
-            p_start_per_day = float(pt_row.get("p_start_per_day", 1.0 / 5.0))
-            ip_per_start    = float(pt_row.get("ip_per_start", 5.5))
-            talent_dict     = talent_row.to_dict()
-
-            ev_per_game = daily_ev_sp(
-                talent=talent_dict,
-                p_start_per_day=p_start_per_day,
-                ip_per_start=ip_per_start,
-                park_factor=avg_pf,
-            )
-
-            projected_starts = p_start_per_day * games_remaining
-            erosp_raw = ev_per_game * games_remaining
-
-            rows.append({
-                "mlbam_id":          mlbam_id,
-                "name":              str(talent_row.get("name", "")),
-                "player_type":       "sp",
-                "role":              "SP",
-                "mlb_team":          team_abbrev,
-                "park_factor":       avg_pf,
-                "games_remaining":   games_remaining,
-                "projected_starts":  round(float(projected_starts), 1),
-                "daily_ev_raw":      round(float(ev_per_game), 4),
-                "erosp_raw":         round(float(max(erosp_raw, 0)), 2),
-                "fp_per_start":      round(float(fp_per_start(talent_dict, ip_per_start)), 2),
-            })
+        sp = join_playing_time(pitcher_talent_df[pitcher_talent_df["role"] == "SP"], "sp",
+                               {"p_start_per_day": 1.0 / 5.0, "ip_per_start": 5.5})
+        ctx = team_context(sp)
+        p_start_per_day = sp["pt_p_start_per_day"].to_numpy(dtype=float)
+        ip_per_start    = sp["pt_ip_per_start"].to_numpy(dtype=float)
+        games_remaining = ctx["games_remaining"].to_numpy()
+        ev_per_game = daily_ev_sp_array(
+            sp,
+            p_start_per_day=p_start_per_day,
+            ip_per_start=ip_per_start,
+            park_factor=ctx["park_factor"].to_numpy(),
+            config=cfg,
+        )
+        erosp_raw = ev_per_game * games_remaining
+        frames.append(pd.DataFrame({
+            "name":             ctx["name"],
+            "player_type":      "sp",
+            "role":             "SP",
+            "mlb_team":         ctx["mlb_team"],
+            "park_factor":      ctx["park_factor"],
+            "games_remaining":  ctx["games_remaining"],
+            "projected_starts": _round(p_start_per_day * games_remaining, 1),
+            "daily_ev_raw":     _round(ev_per_game, 4),
+            "erosp_raw":        _round(np.maximum(erosp_raw, 0), 2),
+            "fp_per_start":     _round(fp_per_start_array(sp, ip_per_start, cfg), 2),
+        }, index=sp.index))
 
     # ── Relief Pitchers ───────────────────────────────────────────────────────
-        rp_talent = pitcher_talent_df[pitcher_talent_df["role"] == "RP"]
-        pt_rps    = playing_time_df[playing_time_df["player_type"] == "rp"]
-
-        for mlbam_id, talent_row in rp_talent.iterrows():
-            if mlbam_id not in pt_rps.index:
-                continue
-            pt_row = pt_rps.loc[mlbam_id]
-
-            team_abbrev = str(talent_row.get("mlb_team", ""))
-            sched = abbrev_to_schedule.get(team_abbrev, {})
-            games_remaining = int(sched.get("games_remaining", FULL_SEASON_GAMES))
-            if injury_map and mlbam_id in injury_map:
-                games_remaining = max(0, games_remaining - int(injury_map[mlbam_id].get("games_missed_est", 0)))
-            avg_pf = float(sched.get("avg_park_factor_remaining",
-                                     talent_row.get("park_factor", 1.0)))
-
-            p_appear  = float(pt_row.get("p_appear_per_game", 0.35))
-            ip_per_app = float(pt_row.get("ip_per_app", 0.67))
-            rp_role   = str(pt_row.get("rp_role", "middle"))
-            talent_dict = talent_row.to_dict()
-
-            ev_per_game = daily_ev_rp(
-                talent=talent_dict,
-                p_appear=p_appear,
-                ip_per_app=ip_per_app,
-                rp_role=rp_role,
-                park_factor=avg_pf,
-            )
-
-            erosp_raw = ev_per_game * games_remaining
-
-            rows.append({
-                "mlbam_id":       mlbam_id,
-                "name":           str(talent_row.get("name", "")),
-                "player_type":    "rp",
-                "role":           "RP",
-                "mlb_team":       team_abbrev,
-                "park_factor":    avg_pf,
-                "games_remaining": games_remaining,
-                "daily_ev_raw":   round(float(ev_per_game), 4),
-                "erosp_raw":      round(float(max(erosp_raw, 0)), 2),
-                "rp_role":        rp_role,
-            })
-
-    if not rows:
+        rp = join_playing_time(pitcher_talent_df[pitcher_talent_df["role"] == "RP"], "rp",
+                               {"p_appear_per_game": 0.35, "ip_per_app": 0.67, "rp_role": "middle"})
+        ctx = team_context(rp)
+        ev_per_game = daily_ev_rp_array(
+            rp,
+            p_appear=rp["pt_p_appear_per_game"].to_numpy(dtype=float),
+            ip_per_app=rp["pt_ip_per_app"].to_numpy(dtype=float),
+            park_factor=ctx["park_factor"].to_numpy(),
+            config=cfg,
+        )
+        erosp_raw = ev_per_game * ctx["games_remaining"].to_numpy()
+        frames.append(pd.DataFrame({
+            "name":            ctx["name"],
+            "player_type":     "rp",
+            "role":            "RP",
+            "mlb_team":        ctx["mlb_team"],
+            "park_factor":     ctx["park_factor"],
+            "games_remaining": ctx["games_remaining"],
+            "daily_ev_raw":    _round(ev_per_game, 4),
+            "erosp_raw":       _round(np.maximum(erosp_raw, 0), 2),
+            "rp_role":         rp["pt_rp_role"].astype(str),
+        }, index=rp.index))
+
+    frames = [f for f in frames if not f.empty]
+    if not frames:
         return pd.DataFrame()
 
-    df = pd.DataFrame(rows).set_index("mlbam_id")
+    df = pd.concat(frames)
+    df.index.name = "mlbam_id"
     df = df.fillna(0)
     print(f"    EROSP raw: {len(df):,} players. "
           f"Mean raw={df['erosp_raw'].mean():.1f}, "
@@ -0,0 +1,291 @@
+"""
+Monte Carlo rest-of-season distribution for EROSP.
+
+erosp_raw is an expected value. This module replays each player's remaining
+season n_sims times from the same inputs — talent rates (talent.py),
+playing-time probabilities (playing_time.py), games remaining and park
+factor (projection.py) — and summarises the spread per player:
+
+  erosp_raw_p10 / _p50 / _p90   percentiles of simulated raw fantasy points
+  downside_risk                 mean shortfall of the worst sim_downside_tail
+                                of sims, as a fraction of the simulated mean
+
+Each simulated season:
+  1. Availability — a per-game injury hazard opens IL stints of geometric
+     length (drawn stint by stint as a renewal process over games_remaining).
+  2. Usage — games played / starts / appearances ~ Binomial(available games, p),
+     with p scaled up by the simulated availability so the mean matches the
+     point model (whose p_play already prices in typical absences).
+  3. Outcomes — PA or IP for those games, then event counts scored with
+     config.scoring. Per-game draws are summed through their aggregate distribution
+     (Poisson PA, sequential-binomial multinomial PA outcomes, Poisson
+     pitching events), which is identical in distribution to drawing game by
+     game but costs O(players × sims) instead of O(players × sims × games).
+
+Draws are vectorised over simulations. Each player gets his own Generator,
+seeded from (seed, mlbam_id, player type), so his percentiles depend only on
+his own inputs: re-drawing a few players (compute_erosp.py --players)
+reproduces a full run for them exactly. Percentiles are on the raw scale, so
+compute_erosp.py scales them by start_probability × cap_factor alongside
+erosp_startable.
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from .config import DEFAULT_CONFIG, EROSPConfig, SIM_DOWNSIDE_TAIL
+
+# Mutually exclusive PA outcomes drawn as one multinomial (the rest are outs)
+_PA_OUTCOMES = (
+    ("single_rate", "single"),
+    ("double_rate", "double"),
+    ("triple_rate", "triple"),
+    ("hr_rate",     "hr"),
+    ("bb_rate",     "bb"),
+    ("hbp_rate",    "hbp"),
+    ("k_rate",      "k"),
+)
+# Counting events that ride on top of a PA
+_PA_EVENTS = (
+    ("r_per_pa",   "r"),
+    ("rbi_per_pa", "rbi"),
+    ("sb_rate",    "sb"),
+    ("cs_rate",    "cs"),
+    ("gidp_rate",  "gidp"),
+)
+_IP_EVENTS = (
+    ("h_per_ip",  "ha"),
+    ("er_per_ip", "er"),
+    ("bb_per_ip", "bba"),
+    ("k_per_ip",  "kp"),
+)
+
+# Players summarised together, chosen so one (chunk, n_sims) float array stays ~16 MB
+_CHUNK_CELLS = 2_000_000
+_MAX_STINTS  = 64
+
+
+def _rates(df: pd.DataFrame, cols, default: float = 0.0) -> Dict[str, np.ndarray]:
+    """Rate columns as (n, 1) float arrays; missing columns and NaN → default."""
+    out = {}
+    for col in cols:
+        if col in df.columns:
+            values = pd.to_numeric(df[col], errors="coerce").fillna(default).to_numpy(dtype=float)
+        else:
+            values = np.full(len(df), default)
+        out[col] = values[:, None]
+    return out
+
+
+def player_rng(seed: int, player_id: int, group: int = 0) -> np.random.Generator:
+    """The Generator for one player's simulations: a function of seed and id only."""
+    return np.random.default_rng(np.random.SeedSequence([int(seed), int(player_id), int(group)]))
+
+
+def _prob(p: np.ndarray) -> np.ndarray:
+    return np.clip(np.nan_to_num(p, nan=0.0), 0.0, 1.0)
+
+
+def _available_games(
+    rng: np.random.Generator,
+    games: np.ndarray,
+    n_sims: int,
+    hazard: float,
+    mean_stint: float,
+) -> np.ndarray:
+    """
+    Games each player is available for, per simulation: (n, n_sims) ints.
+
+    Healthy spells are Geometric(hazard) games long and IL stints
+    Geometric(1 / mean_stint), alternating until games_remaining runs out.
+    """
+    games = games[:, None]
+    shape = (games.shape[0], n_sims)
+    missed = np.zeros(shape, dtype=np.int64)
+    if hazard <= 0:
+        return np.broadcast_to(games, shape).copy()
+    t = np.zeros(shape, dtype=np.int64)
+    q = min(1.0, 1.0 / max(mean_stint, 1.0))
+    for _ in range(_MAX_STINTS):
+        active = t < games
+        if not active.any():
+            break
+        t = t + rng.geometric(hazard, size=shape)          # game the stint starts
+        onset = active & (t <= games)
+        stint = rng.geometric(q, size=shape)
+        missed += np.where(onset, np.minimum(stint, games - t + 1), 0)
+        t = np.where(onset, t + stint - 1, games)          # last game of the stint
+    return np.maximum(games - missed, 0)
+
+
+def _usage(rng, available, games, p) -> np.ndarray:
+    """
+    Binomial games used out of `available`.
+
+    p is divided by the player's simulated availability rate so the expected
+    count stays p × games_remaining, as in the point model.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        avail_frac = available.mean(axis=1, keepdims=True) / games[:, None]
+        p_healthy = np.where(avail_frac > 0, p / avail_frac, 0.0)
+    return rng.binomial(available, _prob(p_healthy))
+
+
+def _innings(rng, uses, ip_per_use, sd_per_use) -> np.ndarray:
+    """Total IP over `uses` outings: normal sum of per-outing IP, floored at 0."""
+    ip = np.nan_to_num(ip_per_use, nan=0.0)
+    noise = rng.standard_normal(uses.shape) * np.sqrt(uses) * sd_per_use
+    return np.maximum(uses * ip + noise, 0.0)
+
+
+def _pitching_events(rng, rates, ip, scoring) -> np.ndarray:
+    pts = ip * scoring["ip"]
+    for col, event in _IP_EVENTS:
+        pts = pts + rng.poisson(np.maximum(rates[col], 0.0) * ip) * scoring[event]
+    return pts
+
+
+def _simulate_hitters(rng, talent, pt, games, n_sims, cfg: EROSPConfig) -> np.ndarray:
+    scoring = cfg.scoring
+    available = _available_games(rng, games, n_sims, cfg.sim_injury_rate_hitter, cfg.sim_injury_games_hitter)
+    played = _usage(rng, available, games, pt["p_play"])
+    pa = rng.poisson(np.maximum(np.nan_to_num(pt["pa_per_game"]), 0.0) * played)
+
+    rates = _rates(talent, [c for c, _ in _PA_OUTCOMES + _PA_EVENTS])
+    pts = np.zeros(pa.shape)
+    left, mass = pa, np.ones((pa.shape[0], 1))
+    for col, event in _PA_OUTCOMES:
+        p = _prob(rates[col])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cond = np.where(mass > 0, p / mass, 0.0)
+        count = rng.binomial(left, _prob(cond))
+        pts += count * scoring[event]
+        left = left - count
+        mass = np.maximum(mass - p, 0.0)
+    for col, event in _PA_EVENTS:
+        pts += rng.poisson(np.maximum(rates[col], 0.0) * pa) * scoring[event]
+    return pts
+
+
+def _simulate_starters(rng, talent, pt, games, n_sims, cfg: EROSPConfig) -> np.ndarray:
+    scoring = cfg.scoring
+    available = _available_games(rng, games, n_sims, cfg.sim_injury_rate_pitcher, cfg.sim_injury_games_pitcher)
+    starts = _usage(rng, available, games, pt["p_start_per_day"])
+    ip = _innings(rng, starts, pt["ip_per_start"], cfg.sim_ip_sd_per_start)
+
+    rates = _rates(talent, [c for c, _ in _IP_EVENTS])
+    rates.update(_rates(talent, ["w_per_gs"], 0.33))
+    rates.update(_rates(talent, ["qs_per_gs"], 0.44))
+    pts = _pitching_events(rng, rates, ip, scoring)
+    wins = rng.binomial(starts, _prob(rates["w_per_gs"]))
+    losses = rng.binomial(starts - wins, 0.45)
+    qs = rng.binomial(starts, _prob(rates["qs_per_gs"]))
+    return pts + wins * scoring["w"] + losses * scoring["l"] + qs * scoring["qs"]
+
+
+def _simulate_relievers(rng, talent, pt, games, n_sims, cfg: EROSPConfig) -> np.ndarray:
+    scoring = cfg.scoring
+    available = _available_games(rng, games, n_sims, cfg.sim_injury_rate_pitcher, cfg.sim_injury_games_pitcher)
+    apps = _usage(rng, available, games, pt["p_appear_per_game"])
+    ip = _innings(rng, apps, pt["ip_per_app"], cfg.sim_ip_sd_per_app)
+
+    rates = _rates(talent, [c for c, _ in _IP_EVENTS] + ["sv_per_g", "hd_per_g"])
+    pts = _pitching_events(rng, rates, ip, scoring)
+    sv_p = _prob(rates["sv_per_g"])
+    saves = rng.binomial(apps, sv_p)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        hd_p = np.where(sv_p < 1.0, rates["hd_per_g"] / (1.0 - sv_p), 0.0)
+    holds = rng.binomial(apps - saves, _prob(hd_p))
+    blown = rng.binomial(apps, _prob(sv_p * 0.12))
+    return pts + saves * scoring["sv"] + holds * scoring["hd"] + blown * scoring["bs"]
+
+
+# player_type → (simulator, talent frame key, playing-time column defaults)
+_GROUPS = {
+    "hitter": (_simulate_hitters,   "hitter",  {"p_play": 0.85, "pa_per_game": 4.0}),
+    "sp":     (_simulate_starters,  "pitcher", {"p_start_per_day": 1.0 / 5.0, "ip_per_start": 5.5}),
+    "rp":     (_simulate_relievers, "pitcher", {"p_appear_per_game": 0.35, "ip_per_app": 0.67}),
+}
+
+
+def summarize_simulations(pts: np.ndarray, tail: float = SIM_DOWNSIDE_TAIL) -> Dict[str, np.ndarray]:
+    """P10/P50/P90 and downside_risk over the simulation axis of (n, n_sims) points."""
+    p10, p50, p90 = np.percentile(pts, [10, 50, 90], axis=1)
+    k = max(1, int(pts.shape[1] * tail))
+    worst = np.partition(pts, k - 1, axis=1)[:, :k].mean(axis=1)
+    mean = pts.mean(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        risk = np.where(mean > 0, (mean - worst) / mean, 0.0)
+    return {"p10": p10, "p50": p50, "p90": p90, "downside_risk": np.clip(risk, 0.0, None)}
+
+
+def simulate_rest_of_season(
+    raw_projection_df: pd.DataFrame,
+    hitter_talent_df: pd.DataFrame,
+    pitcher_talent_df: pd.DataFrame,
+    playing_time_df: pd.DataFrame,
+    n_sims: Optional[int] = None,
+    seed: Optional[int] = None,
+    config: Optional[EROSPConfig] = None,
+) -> pd.DataFrame:
+    """
+    Simulate every player in raw_projection_df (the compute_all_erosp_raw frame).
+    n_sims and seed default to config.sim_n_sims / config.sim_seed.
+
+    Returns a DataFrame with the same index (and row order) and columns
+    erosp_raw_p10, erosp_raw_p50, erosp_raw_p90, downside_risk.
+    """
+    cfg = config or DEFAULT_CONFIG
+    n_sims = cfg.sim_n_sims if n_sims is None else n_sims
+    seed = cfg.sim_seed if seed is None else seed
+    cols = ["erosp_raw_p10", "erosp_raw_p50", "erosp_raw_p90", "downside_risk"]
+    if raw_projection_df.empty or n_sims <= 0:
+        return pd.DataFrame(columns=cols, index=raw_projection_df.index, dtype=float)
+
+    out = np.zeros((len(raw_projection_df), len(cols)))
+    talent_frames = {"hitter": hitter_talent_df, "pitcher": pitcher_talent_df}
+    player_type = raw_projection_df["player_type"].astype(str).to_numpy()
+    chunk = max(1, _CHUNK_CELLS // n_sims)
+
+    for group_no, (ptype, (simulate, talent_key, defaults)) in enumerate(_GROUPS.items()):
+        rows = np.flatnonzero(player_type == ptype)
+        if rows.size == 0:
+            continue
+        group = raw_projection_df.iloc[rows]
+        talent = talent_frames[talent_key]
+        talent = talent[~talent.index.duplicated()].reindex(group.index)
+        pt = playing_time_df[playing_time_df["player_type"] == ptype]
+        pt = pt[~pt.index.duplicated()].reindex(group.index)
+        pt_cols = {c: (pt[c].astype(float).fillna(d) if c in pt.columns else pd.Series(d, index=pt.index))
+                   for c, d in defaults.items()}
+        pt_arrays = {c: s.to_numpy(dtype=float)[:, None] for c, s in pt_cols.items()}
+        games = group["games_remaining"].fillna(0).to_numpy(dtype=np.int64)
+        park = group["park_factor"].fillna(1.0).to_numpy(dtype=float)
+        ids = group.index.to_numpy()
+
+        for start in range(0, rows.size, chunk):
+            sl = slice(start, start + chunk)
+            pts = np.vstack([
+                simulate(
+                    player_rng(seed, ids[i], group_no),
+                    talent.iloc[i:i + 1],
+                    {c: a[i:i + 1] for c, a in pt_arrays.items()},
+                    games[i:i + 1],
+                    n_sims,
+                    cfg,
+                )
+                for i in range(start, min(start + chunk, rows.size))
+            ]) * park[sl, None]
+            summary = summarize_simulations(pts, cfg.sim_downside_tail)
+            out[rows[sl]] = np.column_stack(
+                [summary["p10"], summary["p50"], summary["p90"], summary["downside_risk"]]
+            )
+
+    dist = pd.DataFrame(out, index=raw_projection_df.index, columns=cols)
+    dist[cols[:3]] = dist[cols[:3]].round(2)
+    dist["downside_risk"] = dist["downside_risk"].round(3)
+    print(f"    Simulated {len(dist):,} players × {n_sims:,} seasons. "
+          f"Median P90−P10 spread={float((dist['erosp_raw_p90'] - dist['erosp_raw_p10']).median()):.1f}")
+    return dist
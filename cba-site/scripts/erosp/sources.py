@@ -0,0 +1,568 @@
+"""
+Projection sources and the ensemble that blends their rates.
+
+Every source yields the same schema — SourceRates, two frames indexed by
+mlbam_id:
+  hitters   per-PA rates: talent.py's RATE_COLS (single_rate … hbp_rate)
+  pitchers  per-IP rates h_per_ip / er_per_ip / bb_per_ip / k_per_ip, plus
+            w_per_gs, qs_per_gs, sv_per_g and hd_per_g
+A source that only projects season fantasy points (ESPN, generate_projections.py)
+fills fp_per_pa / fp_per_ip instead, dividing by its own projected PA / IP; a
+player without them, or a two-way player whose total mixes hitting and
+pitching, is left out. An absent column or a NaN means the source has no
+opinion on that rate.
+
+ProjectionSource wraps a zero-argument loader, so nothing is read until the
+ensemble asks for it; load_sources() loads the weighted sources concurrently.
+Preseason sources (PRESEASON_SOURCES) lose weight as the season is played —
+preseason_weights() scales them by the share of the schedule still to come.
+
+blend_rates() then works per player, over the sources that project him
+(weights renormalized):
+  1. each component rate is averaged across the component sources
+  2. fantasy points per PA / IP are averaged across all sources — component
+     sources scored with projection.py under the player's playing time
+  3. where an FP-only source covers the player, the rates from (1) are moved
+     onto (2): hitter rates are scaled (FP per PA is linear in them with no
+     constant term), pitcher er_per_ip is shifted (FP per IP is linear in it)
+The result is a talent frame compute_all_erosp_raw() accepts as is.
+"""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import DEFAULT_CONFIG, EROSPConfig, MIN_PA_QUALIFIER, MIN_IP_QUALIFIER
+from .ingest import espn_name_to_mlbam
+from .projection import fp_per_pa_array, fp_per_start_array, fp_per_appearance_array
+from .talent import RATE_COLS
+
+HITTER_RATE_COLS: List[str] = list(RATE_COLS)
+PITCHER_RATE_COLS: List[str] = [
+    "h_per_ip", "er_per_ip", "bb_per_ip", "k_per_ip",
+    "w_per_gs", "qs_per_gs", "sv_per_g", "hd_per_g",
+]
+
+# Steamer column → per-PA rate
+_STEAMER_BAT_RATES = (
+    ("1B",  "single_rate"),
+    ("2B",  "double_rate"),
+    ("3B",  "triple_rate"),
+    ("HR",  "hr_rate"),
+    ("R",   "r_per_pa"),
+    ("RBI", "rbi_per_pa"),
+    ("BB",  "bb_rate"),
+    ("HBP", "hbp_rate"),
+    ("SO",  "k_rate"),
+    ("SB",  "sb_rate"),
+    ("CS",  "cs_rate"),
+    ("GDP", "gidp_rate"),
+)
+
+# Steamer column, denominator column → pitcher rate
+_STEAMER_PIT_RATES = (
+    ("H",   "IP", "h_per_ip"),
+    ("ER",  "IP", "er_per_ip"),
+    ("BB",  "IP", "bb_per_ip"),
+    ("SO",  "IP", "k_per_ip"),
+    ("W",   "GS", "w_per_gs"),
+    ("QS",  "GS", "qs_per_gs"),
+    ("SV",  "G",  "sv_per_g"),
+    ("HLD", "G",  "hd_per_g"),
+)
+
+STEAMER_BAT_COLUMNS = ["playerid", "xMLBAMID", "PA"] + [c for c, _ in _STEAMER_BAT_RATES]
+STEAMER_PIT_COLUMNS = ["playerid", "xMLBAMID", "G", "GS", "IP"] + [c for c, _, _ in _STEAMER_PIT_RATES]
+
+PITCHER_POSITIONS = ("SP", "RP", "P")
+
+# Sources projected before Opening Day. The talent estimates update in-season
+# and the international lines are all their debutants have, so neither fades.
+PRESEASON_SOURCES = ("steamer", "projections", "espn")
+
+
+class SourceRates(NamedTuple):
+    hitters:  pd.DataFrame
+    pitchers: pd.DataFrame
+
+
+# ---------------------------------------------------------------------------
+# Source interface
+# ---------------------------------------------------------------------------
+
+class ProjectionSource:
+    """
+    A named rate source. `load()` returns SourceRates and runs at most once,
+    the first time rates() is called (from any thread).
+    """
+
+    def __init__(self, name: str, load: Callable[[], SourceRates]):
+        self.name = name
+        self._load = load
+        self._rates: Optional[SourceRates] = None
+        self._lock = threading.Lock()
+
+    def rates(self) -> SourceRates:
+        with self._lock:
+            if self._rates is None:
+                self._rates = self._load()
+            return self._rates
+
+    def __repr__(self) -> str:
+        return f"ProjectionSource({self.name!r})"
+
+
+def load_sources(sources: Iterable[ProjectionSource], weights: Mapping[str, float],
+                 max_workers: Optional[int] = None) -> Dict[str, SourceRates]:
+    """
+    Load every source with a positive weight, concurrently. A source whose
+    loader fails is reported and left out; the rest keep their order.
+    """
+    wanted = [s for s in sources if weights.get(s.name, 0.0) > 0]
+
+    def _safe(source: ProjectionSource) -> Optional[SourceRates]:
+        try:
+            return source.rates()
+        except Exception as exc:
+            print(f"  WARNING: projection source {source.name!r} unavailable ({exc}).")
+            return None
+
+    if len(wanted) <= 1:
+        results = [_safe(s) for s in wanted]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers or len(wanted)) as pool:
+            results = list(pool.map(_safe, wanted))
+
+    loaded: Dict[str, SourceRates] = {}
+    for source, rates in zip(wanted, results):
+        if rates is None:
+            continue
+        loaded[source.name] = rates
+        print(f"  {source.name:<14} {len(rates.hitters):>5,} hitters  {len(rates.pitchers):>5,} pitchers")
+    return loaded
+
+
+# ---------------------------------------------------------------------------
+# Source loaders
+# ---------------------------------------------------------------------------
+
+def _num(df: pd.DataFrame, col: str) -> pd.Series:
+    """Numeric column, or all-NaN if the frame doesn't have it."""
+    if col in df.columns:
+        return pd.to_numeric(df[col], errors="coerce")
+    return pd.Series(np.nan, index=df.index)
+
+
+def _rates_frame(df: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
+    """
+    `columns` (those present) as floats, indexed by the integer mlbam_id column.
+    Rows without an id or without any rate are dropped; first row per id wins.
+    """
+    cols = [c for c in columns if c in df.columns]
+    ids = pd.to_numeric(df["mlbam_id"], errors="coerce")
+    out = df.loc[ids.notna(), cols].astype(float)
+    out.index = pd.Index(ids[ids.notna()].astype(int).to_numpy(), name="mlbam_id")
+    out = out[out.notna().any(axis=1)] if cols else out
+    return out[~out.index.duplicated()]
+
+
+def talent_rates(hitter_talent_df: pd.DataFrame, pitcher_talent_df: pd.DataFrame) -> SourceRates:
+    """The talent.py estimates (already indexed by mlbam_id) as a source."""
+    def _pick(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        if df.empty:
+            return pd.DataFrame(columns=columns, dtype=float)
+        out = df[[c for c in columns if c in df.columns]].astype(float)
+        return out[~out.index.duplicated()]
+    return SourceRates(_pick(hitter_talent_df, HITTER_RATE_COLS), _pick(pitcher_talent_df, PITCHER_RATE_COLS))
+
+
+def _steamer_ids(df: pd.DataFrame, fg_to_mlbam: Dict[int, int]) -> pd.Series:
+    """xMLBAMID where FanGraphs supplies it, else the FanGraphs id through fg_to_mlbam."""
+    ids = _num(df, "xMLBAMID")
+    fgid = _num(df, "playerid")
+    by_fg = fgid.map(lambda v: fg_to_mlbam.get(int(v)) if pd.notna(v) else None)
+    return ids.fillna(pd.to_numeric(by_fg, errors="coerce"))
+
+
+def steamer_rates(bat: pd.DataFrame, pit: pd.DataFrame, fg_to_mlbam: Dict[int, int]) -> SourceRates:
+    """
+    Steamer projections (FanGraphs projections API rows) as rates. Hitters need
+    MIN_PA_QUALIFIER projected PA, pitchers MIN_IP_QUALIFIER IP; per-GS rates
+    are left out for pitchers projected for no starts.
+    """
+    hitters = pd.DataFrame(columns=HITTER_RATE_COLS, dtype=float)
+    if not bat.empty:
+        pa = _num(bat, "PA")
+        h = pd.DataFrame({"mlbam_id": _steamer_ids(bat, fg_to_mlbam)}, index=bat.index)
+        for col, rate in _STEAMER_BAT_RATES:
+            if col in bat.columns:
+                h[rate] = _num(bat, col) / pa
+        hitters = _rates_frame(h[pa >= MIN_PA_QUALIFIER], HITTER_RATE_COLS)
+
+    pitchers = pd.DataFrame(columns=PITCHER_RATE_COLS, dtype=float)
+    if not pit.empty:
+        ip = _num(pit, "IP")
+        p = pd.DataFrame({"mlbam_id": _steamer_ids(pit, fg_to_mlbam)}, index=pit.index)
+        for col, denom, rate in _STEAMER_PIT_RATES:
+            if col in pit.columns:
+                d = _num(pit, denom)
+                p[rate] = _num(pit, col) / d.where(d > 0)
+        pitchers = _rates_frame(p[ip >= MIN_IP_QUALIFIER], PITCHER_RATE_COLS)
+    return SourceRates(hitters, pitchers)
+
+
+def international_hitter_rates(rates: dict) -> dict:
+    """Convert avg/obp/slg/k_rate/bb_rate/hr_rate to per-PA rates for fp_per_pa()."""
+    avg      = float(rates.get("avg",      0.250))
+    obp      = float(rates.get("obp",      0.320))
+    slg      = float(rates.get("slg",      0.400))
+    k_rate   = float(rates.get("k_rate",   0.220))
+    bb_rate  = float(rates.get("bb_rate",  0.090))
+    hr_rate  = float(rates.get("hr_rate",  0.025))  # per PA
+    sb_rate  = float(rates.get("sb_rate",  0.005))
+    hbp_rate = float(rates.get("hbp_rate", 0.010))
+
+    ab_per_pa   = max(0.01, 1.0 - bb_rate - hbp_rate)
+    hit_per_pa  = avg * ab_per_pa
+    tb_per_pa   = slg * ab_per_pa
+    # xb_per_pa = 1×2B + 2×3B + 3×HR; solve for 2B and 3B assuming 3B≈0.176×2B
+    xb_per_pa   = max(0.0, tb_per_pa - hit_per_pa)
+    remaining   = max(0.0, xb_per_pa - 3.0 * hr_rate)
+    double_rate = remaining / 1.353
+    triple_rate = double_rate * 0.176
+    single_rate = max(0.0, hit_per_pa - hr_rate - double_rate - triple_rate)
+
+    return {
+        "single_rate": single_rate,
+        "double_rate": double_rate,
+        "triple_rate": triple_rate,
+        "hr_rate":     hr_rate,
+        "r_per_pa":    obp * 0.67,   # empirical correlation
+        "rbi_per_pa":  slg * 0.28,   # empirical correlation
+        "bb_rate":     bb_rate,
+        "hbp_rate":    hbp_rate,
+        "k_rate":      k_rate,
+        "sb_rate":     sb_rate,
+        "cs_rate":     sb_rate * 0.20,
+        "gidp_rate":   0.035,
+    }
+
+
+def international_sp_rates(rates: dict) -> dict:
+    """Convert ERA/K9/BB9/H9 to per-IP rates for fp_per_start()."""
+    era     = float(rates.get("era",     4.00))
+    k_per_9 = float(rates.get("k_per_9", 8.00))
+    bb_per_9 = float(rates.get("bb_per_9", 3.00))
+    h_per_9  = float(rates.get("h_per_9",  9.00 - k_per_9 * 0.35))
+    return {
+        "h_per_ip":  h_per_9  / 9.0,
+        "er_per_ip": era      / 9.0,
+        "bb_per_ip": bb_per_9 / 9.0,
+        "k_per_ip":  k_per_9  / 9.0,
+        "w_per_gs":  float(rates.get("w_per_gs",  0.33)),
+        "qs_per_gs": float(rates.get("qs_per_gs", 0.44)),
+    }
+
+
+def international_rates(path: Path) -> SourceRates:
+    """The manual MLB-equivalent lines in international_overrides.json (role H or SP)."""
+    with open(path) as f:
+        players = json.load(f).get("players", [])
+    hitters, pitchers = [], []
+    for ovr in players:
+        mid = int(ovr.get("mlbam_id", 0) or 0)
+        if not mid:
+            continue
+        role = ovr.get("role", "H")
+        if role == "H":
+            hitters.append({"mlbam_id": mid, **international_hitter_rates(ovr.get("rates", {}))})
+        elif role == "SP":
+            pitchers.append({"mlbam_id": mid, **international_sp_rates(ovr.get("rates", {}))})
+    return SourceRates(
+        _rates_frame(pd.DataFrame(hitters, columns=["mlbam_id"] + HITTER_RATE_COLS), HITTER_RATE_COLS),
+        _rates_frame(pd.DataFrame(pitchers, columns=["mlbam_id"] + PITCHER_RATE_COLS), PITCHER_RATE_COLS),
+    )
+
+
+def fp_total_rates(table: pd.DataFrame) -> SourceRates:
+    """
+    Season fantasy-point projections as fp_per_pa / fp_per_ip. `table` has
+    mlbam_id, is_pitcher, fp, opportunities (the source's own projected PA or
+    IP — the points only mean something per the playing time they assume)
+    and optionally two_way. Rows without opportunities are dropped, as are
+    two-way players: flagged, or listed both as hitter and as pitcher.
+    """
+    ids = pd.to_numeric(table["mlbam_id"], errors="coerce")
+    pitcher = table["is_pitcher"].astype(bool)
+    fp = pd.to_numeric(table["fp"], errors="coerce")
+    opportunities = _num(table, "opportunities")
+    two_way = (table["two_way"].astype(bool) if "two_way" in table.columns
+               else pd.Series(False, index=table.index))
+    two_way |= ids.isin(set(ids[pitcher]) & set(ids[~pitcher]))
+    floor = np.where(pitcher, MIN_IP_QUALIFIER, MIN_PA_QUALIFIER)
+    ok = (opportunities >= floor) & fp.notna() & ~two_way
+    rate = fp / opportunities
+    hitters = pd.DataFrame({"mlbam_id": ids, "fp_per_pa": rate})[ok & ~pitcher]
+    pitchers = pd.DataFrame({"mlbam_id": ids, "fp_per_ip": rate})[ok & pitcher]
+    return SourceRates(_rates_frame(hitters, ["fp_per_pa"]), _rates_frame(pitchers, ["fp_per_ip"]))
+
+
+def projections_rates(path: Path) -> SourceRates:
+    """
+    generate_projections.py's table (fantasy_projections_{season}.csv). Its
+    "Projected PA" column holds projected IP for pitchers; TWP rows are
+    two-way players.
+    """
+    df = pd.read_csv(path)
+    position = df["Position"].astype(str)
+    table = pd.DataFrame({
+        "mlbam_id":      df["MLBAM ID"],
+        "is_pitcher":    position.isin(PITCHER_POSITIONS),
+        "fp":            df["ProjectedFP"],
+        "opportunities": df["Projected PA"],
+        "two_way":       position == "TWP",
+    })
+    return fp_total_rates(table)
+
+
+# ESPN's "UTIL" also stands for the bench slot every player holds, so it
+# doesn't make a pitcher a hitter
+_ESPN_HITTER_POSITIONS = ("C", "1B", "2B", "3B", "SS", "MI", "CI", "OF", "DH")
+
+
+def espn_rates(path: Path, espn_id_to_mlbam: Dict[str, int],
+               name_to_mlbam: Dict[str, int]) -> SourceRates:
+    """
+    ESPN projections (data/espn-projections/{season}.json): projectedFP over
+    ESPN's own projectedPA / projectedIP (fetch-espn-projections.ts); players
+    without them are skipped. Two-way players (eligible at a pitcher and a
+    hitter position) carry combined points and are skipped too. ESPN ids
+    resolve through espn_id_to_mlbam, then by name.
+    """
+    with open(path) as f:
+        players = json.load(f).get("players", [])
+    rows = []
+    for p in players:
+        mid = (espn_id_to_mlbam.get(str(p.get("playerId", "")))
+               or espn_name_to_mlbam(str(p.get("playerName", "")), name_to_mlbam))
+        if not mid:
+            continue
+        eligible = set(p.get("eligiblePositions") or [p.get("position")])
+        is_pitcher = str(p.get("position", "")) in PITCHER_POSITIONS
+        rows.append({
+            "mlbam_id":      int(mid),
+            "is_pitcher":    is_pitcher,
+            "fp":            p.get("projectedFP"),
+            "opportunities": p.get("projectedIP" if is_pitcher else "projectedPA"),
+            "two_way":       bool(eligible & set(PITCHER_POSITIONS))
+                             and bool(eligible & set(_ESPN_HITTER_POSITIONS)),
+        })
+    columns = ["mlbam_id", "is_pitcher", "fp", "opportunities", "two_way"]
+    return fp_total_rates(pd.DataFrame(rows, columns=columns))
+
+
+# ---------------------------------------------------------------------------
+# Weights
+# ---------------------------------------------------------------------------
+
+def backtest_weights(data_dir: Path, before: Optional[int] = None) -> Dict[str, float]:
+    """
+    {"erosp": w, "steamer": w} from every steamer_head_to_head_{year}.csv in
+    `data_dir` (benchmark_steamer.py): inverse mean-squared error of each system
+    on the players both projected, MSE averaged over seasons, normalized to
+    sum to 1. `before` limits it to earlier seasons, so a backtest doesn't
+    weight by its own result. {} when no season has been benchmarked.
+    """
+    mse: Dict[str, List[float]] = {"erosp": [], "steamer": []}
+    for path in sorted(Path(data_dir).glob("steamer_head_to_head_*.csv")):
+        year = path.stem.rsplit("_", 1)[-1]
+        if before is not None and not (year.isdigit() and int(year) < before):
+            continue
+        try:
+            table = pd.read_csv(path).set_index("metric")
+            values = {name: float(table.at["rmse", name]) ** 2 for name in mse}
+        except Exception as exc:
+            print(f"  WARNING: {path.name} unreadable ({exc}); skipped.")
+            continue
+        if all(np.isfinite(v) and v > 0 for v in values.values()):
+            for name, v in values.items():
+                mse[name].append(v)
+    if not mse["erosp"]:
+        return {}
+    inverse = {name: 1.0 / float(np.mean(v)) for name, v in mse.items()}
+    total = sum(inverse.values())
+    return {name: v / total for name, v in inverse.items()}
+
+
+def ensemble_weights(priors: Mapping[str, float], measured: Mapping[str, float]) -> Dict[str, float]:
+    """
+    `priors` with the sources in `measured` re-split by it: together they keep
+    their prior share, divided in the measured proportions.
+    """
+    weights = dict(priors)
+    share = sum(priors.get(name, 0.0) for name in measured)
+    for name, w in measured.items():
+        weights[name] = share * w
+    return weights
+
+
+def season_remaining_share(schedule_summary: Mapping[int, dict],
+                           config: Optional[EROSPConfig] = None) -> float:
+    """Mean share of the full season each team still has to play (1.0 before Opening Day)."""
+    cfg = config or DEFAULT_CONFIG
+    games = [float(info.get("games_remaining", cfg.full_season_games)) for info in schedule_summary.values()]
+    if not games:
+        return 1.0
+    return float(np.clip(np.mean(games) / cfg.full_season_games, 0.0, 1.0))
+
+
+def preseason_weights(weights: Mapping[str, float], remaining_share: float) -> Dict[str, float]:
+    """
+    `weights` with each PRESEASON_SOURCES entry scaled by `remaining_share`
+    (season_remaining_share): a projection made before Opening Day knows
+    nothing of the games since, so it fades as they are played while the
+    in-season talent estimate keeps its weight.
+    """
+    return {name: w * remaining_share if name in PRESEASON_SOURCES else w
+            for name, w in weights.items()}
+
+
+# ---------------------------------------------------------------------------
+# Ensemble
+# ---------------------------------------------------------------------------
+
+def _stack(frames: List[pd.DataFrame], index: pd.Index, col: str) -> np.ndarray:
+    """(sources × players) values of `col`, NaN where a source lacks it."""
+    return np.vstack([
+        frame[col].reindex(index).to_numpy(dtype=float) if col in frame.columns
+        else np.full(len(index), np.nan)
+        for frame in frames
+    ])
+
+
+def _weighted_mean(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Column-wise mean of `values` over its non-NaN entries; NaN where there are none."""
+    have = ~np.isnan(values)
+    w = np.where(have, weights[:, None], 0.0)
+    total = w.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = (np.where(have, values, 0.0) * w).sum(axis=0) / total
+    # a single contributing source passes through unchanged
+    single = have.sum(axis=0) == 1
+    if single.any():
+        first = np.argmax(have, axis=0)
+        mean[single] = values[first[single], np.flatnonzero(single)]
+    return np.where(total > 0, mean, np.nan)
+
+
+def _blend_group(pool: pd.DataFrame, frames: List[pd.DataFrame], weights: np.ndarray,
+                 columns: List[str], fp_col: str,
+                 source_fp: Callable[[pd.DataFrame], np.ndarray]) -> Tuple[pd.DataFrame, np.ndarray, np.ndarray]:
+    """
+    Steps 1–2 for one player group. Returns the pool with blended component
+    rates, the FP-rate target, and whether an FP-only source covers each row.
+    """
+    index = pool.index
+    out = pool.copy()
+    for col in columns:
+        blended = _weighted_mean(_stack(frames, index, col), weights)
+        current = out[col].to_numpy(dtype=float) if col in out.columns else np.full(len(index), np.nan)
+        out[col] = np.where(np.isnan(blended), current, blended)
+    out_rates = out[columns].to_numpy(dtype=float)
+
+    votes = []
+    fp_only = np.zeros(len(index), dtype=bool)
+    for frame in frames:
+        if any(c in frame.columns for c in columns):
+            rows = frame.reindex(index=index, columns=columns).to_numpy(dtype=float)
+            present = ~np.isnan(rows).all(axis=1)
+            # rates the source doesn't project take the blended value
+            filled = pd.DataFrame(np.where(np.isnan(rows), out_rates, rows), index=index, columns=columns)
+            fp = np.asarray(source_fp(filled), dtype=float)
+            votes.append(np.where(present, fp, np.nan))
+        elif fp_col in frame.columns:
+            fp = frame[fp_col].reindex(index).to_numpy(dtype=float)
+            fp_only |= ~np.isnan(fp)
+            votes.append(fp)
+        else:
+            votes.append(np.full(len(index), np.nan))
+    target = _weighted_mean(np.vstack(votes), weights) if votes else np.full(len(index), np.nan)
+    return out, target, fp_only
+
+
+def _pitcher_ip(pitchers: pd.DataFrame, playing_time_df: pd.DataFrame,
+                cfg: EROSPConfig) -> Tuple[np.ndarray, np.ndarray]:
+    """IP per start / per appearance for each pitcher row, config defaults where unknown."""
+    pt = playing_time_df[~playing_time_df.index.duplicated()] if not playing_time_df.empty else playing_time_df
+    def _col(name: str, player_type: str, default: float) -> np.ndarray:
+        if pt.empty or name not in pt.columns:
+            return np.full(len(pitchers), default)
+        sub = pt[pt["player_type"] == player_type]
+        return _num(sub, name).reindex(pitchers.index).fillna(default).to_numpy(dtype=float)
+    return (_col("ip_per_start", "sp", cfg.default_ip_per_start),
+            _col("ip_per_app", "rp", cfg.default_ip_per_app))
+
+
+def blend_rates(
+    hitter_talent_df: pd.DataFrame,
+    pitcher_talent_df: pd.DataFrame,
+    playing_time_df: pd.DataFrame,
+    rates: Mapping[str, SourceRates],
+    weights: Optional[Mapping[str, float]] = None,
+    config: Optional[EROSPConfig] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    The talent frames with every rate replaced by the ensemble of `rates`
+    (load_sources output) under `weights` (default: the config's
+    source_weights). Rows, index and every other column are kept, so the
+    frames go straight into compute_all_erosp_raw(). With one source or none,
+    the frames come back unchanged.
+    """
+    cfg = config or DEFAULT_CONFIG
+    weights = cfg.source_weights if weights is None else weights
+    names = [n for n in rates if weights.get(n, 0.0) > 0]
+    if len(names) <= 1:
+        return hitter_talent_df, pitcher_talent_df
+    w = np.array([float(weights[n]) for n in names])
+
+    hitters = hitter_talent_df
+    if not hitter_talent_df.empty:
+        hitters, target, fp_only = _blend_group(
+            hitter_talent_df, [rates[n].hitters for n in names], w,
+            HITTER_RATE_COLS, "fp_per_pa", lambda r: fp_per_pa_array(r, cfg))
+        current = fp_per_pa_array(hitters, cfg)
+        adjust = fp_only & (current > 0) & (target > 0)
+        scale = np.where(adjust, target / np.where(adjust, current, 1.0), 1.0)
+        for col in HITTER_RATE_COLS:
+            if col in hitters.columns:
+                hitters[col] = np.where(adjust, hitters[col].to_numpy(dtype=float) * scale, hitters[col])
+
+    pitchers = pitcher_talent_df
+    if not pitcher_talent_df.empty:
+        ip_start, ip_app = _pitcher_ip(pitcher_talent_df, playing_time_df, cfg)
+        is_sp = (pitcher_talent_df["role"] == "SP").to_numpy()
+        ip = np.where(is_sp, ip_start, ip_app)
+
+        def _fp_per_ip(r: pd.DataFrame) -> np.ndarray:
+            fp = np.where(is_sp, fp_per_start_array(r, ip_start, cfg), fp_per_appearance_array(r, ip_app, cfg))
+            with np.errstate(invalid="ignore", divide="ignore"):
+                return np.where(ip > 0, fp / ip, np.nan)
+
+        pitchers, target, fp_only = _blend_group(
+            pitcher_talent_df, [rates[n].pitchers for n in names], w,
+            PITCHER_RATE_COLS, "fp_per_ip", _fp_per_ip)
+        current = _fp_per_ip(pitchers)
+        adjust = fp_only & ~np.isnan(target) & ~np.isnan(current)
+        shift = np.where(adjust, (target - current) / cfg.scoring["er"], 0.0)
+        er = pitchers["er_per_ip"].to_numpy(dtype=float)
+        pitchers["er_per_ip"] = np.where(adjust, np.maximum(er + shift, 0.0), er)
+
+    share = ", ".join(f"{n} {weights[n] / w.sum():.0%}" for n in names)
+    print(f"    Ensemble of {len(names)} sources ({share}): "
+          f"{len(hitters):,} hitters, {len(pitchers):,} pitchers.")
+    return hitters, pitchers
@@ -14,31 +14,96 @@ from typing import Dict, List, Optional
 import numpy as np
 import pandas as pd
 
-from .config import (
-    HITTER_SLOTS, PITCHER_SLOTS, POSITION_ELIGIBILITY,
-    LEAGUE_TEAMS, SP_WEEKLY_CAP, RP_DAILY_STARTS,
-    SIGMOID_TAU, FULL_SEASON_GAMES, REPLACEMENT_POOL_MULTIPLIER,
-)
+from .config import DEFAULT_CONFIG, EROSPConfig, HITTER_SLOTS
 
 
 # ---------------------------------------------------------------------------
 # Sigmoid start probability
 # ---------------------------------------------------------------------------
 
-def sigmoid(x: float, tau: float = SIGMOID_TAU) -> float:
-    """Logistic function for soft start probability."""
+def sigmoid(x: float, tau: Optional[float] = None) -> float:
+    """Logistic function for soft start probability (tau defaults to DEFAULT_CONFIG's)."""
+    if tau is None:
+        tau = DEFAULT_CONFIG.sigmoid_tau
     return 1.0 / (1.0 + math.exp(-x / tau))
 
 
+def sigmoid_array(x: np.ndarray, tau: Optional[float] = None) -> np.ndarray:
+    """Element-wise sigmoid() for arrays of any shape."""
+    if tau is None:
+        tau = DEFAULT_CONFIG.sigmoid_tau
+    with np.errstate(over="ignore"):
+        return 1.0 / (1.0 + np.exp(-np.asarray(x, dtype=float) / tau))
+
+
 # ---------------------------------------------------------------------------
 # Replacement level computation
 # ---------------------------------------------------------------------------
 
+HITTER_SLOT_NAMES: List[str] = list(HITTER_SLOTS)
+
+
+def slot_eligibility(positions, slots: Optional[List[str]] = None,
+                     config: Optional[EROSPConfig] = None) -> np.ndarray:
+    """
+    Boolean (n_players, n_slots) matrix: can each MLB position fill each slot?
+
+    Unknown positions are UTIL-only, as in POSITION_ELIGIBILITY lookups
+    elsewhere. The table is built once per distinct position, not per player.
+    `slots` defaults to the config's hitter slots.
+    """
+    cfg = config or DEFAULT_CONFIG
+    if slots is None:
+        slots = cfg.hitter_slot_names
+    positions = np.asarray(positions, dtype=str)
+    if positions.size == 0:
+        return np.zeros((0, len(slots)), dtype=bool)
+    uniq, inverse = np.unique(positions, return_inverse=True)
+    table = np.array(
+        [[slot in cfg.position_eligibility.get(pos, ["UTIL"]) for slot in slots] for pos in uniq],
+        dtype=bool,
+    )
+    return table[inverse.reshape(-1)]
+
+
+def slot_replacement_levels(
+    daily_ev: np.ndarray,
+    eligibility: np.ndarray,
+    pool_sizes: np.ndarray,
+) -> np.ndarray:
+    """
+    Pool-index value of daily_ev for each slot column of `eligibility`.
+
+    One descending sort of daily_ev, then a cumulative count of eligible
+    players per slot: the replacement level is the value where that count
+    first reaches the slot's pool size (or the last eligible player when the
+    pool is shallower). Slots with no eligible player get 0.0.
+    Cheap enough to call inside simulation loops.
+    """
+    daily_ev = np.asarray(daily_ev, dtype=float)
+    pool_sizes = np.asarray(pool_sizes, dtype=int)
+    n_slots = eligibility.shape[1]
+    if daily_ev.size == 0:
+        return np.zeros(n_slots)
+
+    order = np.argsort(-daily_ev, kind="stable")
+    sorted_ev = daily_ev[order]
+    counts = np.cumsum(eligibility[order], axis=0)   # (n_players, n_slots)
+    n_eligible = counts[-1]
+
+    rank = np.where((pool_sizes > 0) & (pool_sizes <= n_eligible), pool_sizes, n_eligible)
+    levels = np.zeros(n_slots)
+    for j in np.flatnonzero(n_eligible > 0):
+        levels[j] = sorted_ev[np.searchsorted(counts[:, j], rank[j])]
+    return levels
+
+
 def compute_replacement_levels(
     hitter_projection_df: pd.DataFrame,
     pitcher_projection_df: pd.DataFrame,
     hitter_talent_df: pd.DataFrame,
     pitcher_talent_df: pd.DataFrame,
+    config: Optional[EROSPConfig] = None,
 ) -> Dict[str, float]:
     """
     Compute replacement-level daily_ev_raw for each fantasy position.
@@ -48,56 +113,38 @@ def compute_replacement_levels(
 
     Returns dict: position → replacement_level_daily_ev
     """
+    cfg = config or DEFAULT_CONFIG
+    slot_names = cfg.hitter_slot_names
     replacement: Dict[str, float] = {}
 
     # ── Hitter replacement levels ──────────────────────────────────────────
     if not hitter_projection_df.empty and not hitter_talent_df.empty:
         # Add position info to projection df
         pos_map = hitter_talent_df["mlb_position"].to_dict()
-        h_proj = hitter_projection_df[hitter_projection_df["player_type"] == "hitter"].copy()
-        h_proj["position"] = h_proj.index.map(lambda mid: str(pos_map.get(mid, "OF")))
-
-        for slot, n_slots in HITTER_SLOTS.items():
-            # Collect all players eligible for this slot
-            eligible_ids = []
-            for mlbam_id, row in h_proj.iterrows():
-                pos = row["position"]
-                eligible_slots = POSITION_ELIGIBILITY.get(pos, ["UTIL"])
-                if slot in eligible_slots:
-                    eligible_ids.append(mlbam_id)
-
-            if not eligible_ids:
-                replacement[slot] = 0.0
-                continue
-
-            eligible_evs = (
-                h_proj.loc[eligible_ids, "daily_ev_raw"]
-                .sort_values(ascending=False)
-                .values
-            )
-            # Use a larger pool index to represent the best *available* FA in a
-            # keeper league (where top players are already drafted).
-            pool_idx = min(int(n_slots * REPLACEMENT_POOL_MULTIPLIER) - 1,
-                           len(eligible_evs) - 1)
-            replacement[slot] = float(eligible_evs[pool_idx]) if len(eligible_evs) > 0 else 0.0
+        h_proj = hitter_projection_df[hitter_projection_df["player_type"] == "hitter"]
+        positions = [str(pos_map.get(mid, "OF")) for mid in h_proj.index]
+
+        # Use a larger pool index to represent the best *available* FA in a
+        # keeper league (where top players are already drafted).
+        pool_sizes = [int(cfg.hitter_slots[s] * cfg.replacement_pool_multiplier) for s in slot_names]
+        levels = slot_replacement_levels(
+            h_proj["daily_ev_raw"].to_numpy(dtype=float),
+            slot_eligibility(positions, slot_names, cfg),
+            pool_sizes,
+        )
+        replacement.update(zip(slot_names, (float(v) for v in levels)))
 
     # ── Pitcher replacement levels ─────────────────────────────────────────
     if not pitcher_projection_df.empty:
-        sp_proj = pitcher_projection_df[pitcher_projection_df["role"] == "SP"]
-        rp_proj = pitcher_projection_df[pitcher_projection_df["role"] == "RP"]
-
-        n_sp = PITCHER_SLOTS["SP"]   # 60
-        n_rp = PITCHER_SLOTS["RP"]   # 30
-
-        if not sp_proj.empty:
-            sp_evs = sp_proj["daily_ev_raw"].sort_values(ascending=False).values
-            sp_idx = min(int(n_sp * REPLACEMENT_POOL_MULTIPLIER) - 1, len(sp_evs) - 1)
-            replacement["SP"] = float(sp_evs[sp_idx]) if len(sp_evs) > 0 else 0.0
-
-        if not rp_proj.empty:
-            rp_evs = rp_proj["daily_ev_raw"].sort_values(ascending=False).values
-            rp_idx = min(int(n_rp * REPLACEMENT_POOL_MULTIPLIER) - 1, len(rp_evs) - 1)
-            replacement["RP"] = float(rp_evs[rp_idx]) if len(rp_evs) > 0 else 0.0
+        for role in ("SP", "RP"):
+            evs = pitcher_projection_df.loc[pitcher_projection_df["role"] == role, "daily_ev_raw"]
+            if evs.empty:
+                continue
+            pool = int(cfg.pitcher_slots[role] * cfg.replacement_pool_multiplier)
+            level = slot_replacement_levels(
+                evs.to_numpy(dtype=float), np.ones((len(evs), 1), dtype=bool), [pool],
+            )
+            replacement[role] = float(level[0])
 
     print(f"    Replacement levels:")
     for pos in ["C", "1B", "2B", "SS", "OF", "SP", "RP"]:
@@ -114,7 +161,7 @@ def compute_replacement_levels(
 def hitter_start_prob(
     daily_ev: float,
     replacement_level: float,
-    tau: float = SIGMOID_TAU,
+    tau: Optional[float] = None,
 ) -> float:
     """Soft probability that a hitter's daily production exceeds replacement level."""
     return sigmoid(daily_ev - replacement_level, tau)
@@ -123,14 +170,26 @@ def hitter_start_prob(
 def _best_slot_replacement(
     pos: str,
     replacement_levels: Dict[str, float],
+    config: Optional[EROSPConfig] = None,
 ) -> float:
     """Return the highest (most favorable) replacement level for a given position."""
-    eligible_slots = POSITION_ELIGIBILITY.get(pos, ["UTIL"])
+    eligible_slots = (config or DEFAULT_CONFIG).position_eligibility.get(pos, ["UTIL"])
     levels = [replacement_levels.get(s, 0.0) for s in eligible_slots if s in replacement_levels]
     # Best slot = where replacement is lowest (easiest to beat)
     return min(levels) if levels else 0.0
 
 
+def best_slot_replacement_array(positions, replacement_levels: Dict[str, float],
+                                config: Optional[EROSPConfig] = None) -> np.ndarray:
+    """_best_slot_replacement for many positions (evaluated once per distinct position)."""
+    positions = np.asarray(positions, dtype=str)
+    if positions.size == 0:
+        return np.zeros(0)
+    uniq, inverse = np.unique(positions, return_inverse=True)
+    best = np.array([_best_slot_replacement(pos, replacement_levels, config) for pos in uniq], dtype=float)
+    return best[inverse.reshape(-1)]
+
+
 # ---------------------------------------------------------------------------
 # SP 6-start weekly cap factor
 # ---------------------------------------------------------------------------
@@ -138,8 +197,8 @@ def _best_slot_replacement(
 def sp_cap_factor(
     projected_starts: float,
     team_total_projected_starts: float,
-    cap: int = SP_WEEKLY_CAP,
-    games_remaining: int = FULL_SEASON_GAMES,
+    cap: int = DEFAULT_CONFIG.sp_weekly_cap,
+    games_remaining: int = DEFAULT_CONFIG.full_season_games,
 ) -> float:
     """
     Fraction of this SP's starts that would count under the 7-start weekly cap.
@@ -177,6 +236,27 @@ def sp_cap_factor(
     return float(min(cap_fraction, 1.0))
 
 
+def sp_cap_factor_array(
+    team_total_projected_starts: np.ndarray,
+    games_remaining: np.ndarray,
+    cap: int = DEFAULT_CONFIG.sp_weekly_cap,
+) -> np.ndarray:
+    """
+    sp_cap_factor for arrays of SPs.
+
+    The factor depends only on the team's total projected starts and the
+    games remaining, so every SP on a team shares it.
+    """
+    team_total = np.asarray(team_total_projected_starts, dtype=float)
+    games      = np.asarray(games_remaining, dtype=float)
+    weeks      = games / 7.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        team_starts_per_week = team_total / weeks
+        cap_fraction = np.minimum(cap / team_starts_per_week, 1.0)
+    uncapped = (games <= 0) | (team_total <= 0) | (weeks <= 0) | (team_starts_per_week <= cap)
+    return np.where(uncapped, 1.0, cap_fraction)
+
+
 # ---------------------------------------------------------------------------
 # RP daily start probability
 # ---------------------------------------------------------------------------
@@ -184,7 +264,7 @@ def sp_cap_factor(
 def rp_start_prob(
     daily_ev: float,
     replacement_level_rp: float,
-    tau: float = SIGMOID_TAU,
+    tau: Optional[float] = None,
 ) -> float:
     """Soft probability that this RP is among the top-3 started each day."""
     return sigmoid(daily_ev - replacement_level_rp, tau)
@@ -194,12 +274,43 @@ def rp_start_prob(
 # Compute EROSP_startable for all players
 # ---------------------------------------------------------------------------
 
+def start_probability_array(
+    player_type: np.ndarray,
+    daily_ev: np.ndarray,
+    positions: np.ndarray,
+    replacement_levels: Dict[str, float],
+    tau: Optional[float] = None,
+    config: Optional[EROSPConfig] = None,
+) -> np.ndarray:
+    """
+    Start probability for every player, columnar.
+
+    Hitters are compared with their best eligible slot's replacement level,
+    SPs with the SP level and RPs with the RP level; any other player type
+    starts with probability 1. `daily_ev` may carry leading dimensions
+    (e.g. simulations × players) — the per-player levels broadcast.
+    `tau` defaults to the config's sigmoid_tau.
+    """
+    if tau is None:
+        tau = (config or DEFAULT_CONFIG).sigmoid_tau
+    player_type = np.asarray(player_type, dtype=str)
+    repl = np.where(
+        player_type == "hitter",
+        best_slot_replacement_array(positions, replacement_levels, config),
+        np.where(player_type == "sp", replacement_levels.get("SP", 0.0),
+                 replacement_levels.get("RP", 0.0)),
+    )
+    known = np.isin(player_type, ["hitter", "sp", "rp"])
+    return np.where(known, sigmoid_array(np.asarray(daily_ev, dtype=float) - repl, tau), 1.0)
+
+
 def compute_erosp_startable(
     projection_df: pd.DataFrame,
     hitter_talent_df: pd.DataFrame,
     pitcher_talent_df: pd.DataFrame,
     espn_roster_map: Dict[str, int],       # mlbam_id (str) → fantasy_team_id
     replacement_levels: Dict[str, float],
+    config: Optional[EROSPConfig] = None,
 ) -> pd.DataFrame:
     """
     Augment projection_df with erosp_startable and start_probability columns.
@@ -208,57 +319,44 @@ def compute_erosp_startable(
     don't always have fantasy roster data). We group all projected SP starts
     by MLB team and apply the cap there.
     """
+    cfg = config or DEFAULT_CONFIG
     df = projection_df.copy()
     df["start_probability"] = 1.0
     df["cap_factor"]        = 1.0
     df["erosp_startable"]   = 0.0
+    if df.empty:
+        return df
 
     # Build position map from talent DataFrames
     hitter_pos = hitter_talent_df["mlb_position"].to_dict() if not hitter_talent_df.empty else {}
-    pitcher_pos = pitcher_talent_df["mlb_position"].to_dict() if not pitcher_talent_df.empty else {}
+
+    games_rem = (df["games_remaining"].to_numpy(dtype=float) if "games_remaining" in df.columns
+                 else np.full(len(df), float(cfg.full_season_games)))
 
     # ── SP cap factor computation ─────────────────────────────────────────
-    # Sum projected starts per MLB team
-    sp_rows = df[df["role"] == "SP"].copy()
-    if not sp_rows.empty:
-        team_starts = sp_rows.groupby("mlb_team")["projected_starts"].sum().to_dict()
-        # Apply cap factor per SP based on their team's total projected starts
-        for mlbam_id, row in sp_rows.iterrows():
-            proj_starts = float(row.get("projected_starts", 0))
-            team_total  = float(team_starts.get(str(row.get("mlb_team", "")), proj_starts))
-            games_rem   = int(row.get("games_remaining", FULL_SEASON_GAMES))
-            cf = sp_cap_factor(proj_starts, team_total, cap=SP_WEEKLY_CAP, games_remaining=games_rem)
-            df.at[mlbam_id, "cap_factor"] = round(cf, 4)
+    # Sum projected starts per MLB team; every SP on the team shares the factor
+    is_sp = (df["role"] == "SP").to_numpy()
+    if is_sp.any():
+        sp_rows = df[is_sp]
+        proj_starts = sp_rows["projected_starts"].astype(float)
+        team_total = (
+            proj_starts.groupby(sp_rows["mlb_team"]).transform("sum")
+            .fillna(proj_starts)
+            .to_numpy()
+        )
+        cf = sp_cap_factor_array(team_total, games_rem[is_sp], cap=cfg.sp_weekly_cap)
+        df.loc[is_sp, "cap_factor"] = np.round(cf, 4)
 
     # ── Per-player startability ────────────────────────────────────────────
-    for mlbam_id, row in df.iterrows():
-        player_type = str(row.get("player_type", "hitter"))
-        daily_ev    = float(row.get("daily_ev_raw", 0.0))
-        games_rem   = int(row.get("games_remaining", FULL_SEASON_GAMES))
-        cap_f       = float(row.get("cap_factor", 1.0))
-
-        if player_type == "hitter":
-            pos = str(hitter_pos.get(mlbam_id, "OF"))
-            repl_level = _best_slot_replacement(pos, replacement_levels)
-            p_start    = hitter_start_prob(daily_ev, repl_level)
-
-        elif player_type == "sp":
-            repl_sp = replacement_levels.get("SP", 0.0)
-            # For SPs, start_probability is the per-day probability of being an active starter
-            # (already encoded in p_start_per_day). Here we model whether the roster slot is used.
-            p_start = hitter_start_prob(daily_ev, repl_sp)
-
-        elif player_type == "rp":
-            repl_rp = replacement_levels.get("RP", 0.0)
-            p_start = rp_start_prob(daily_ev, repl_rp)
-
-        else:
-            p_start = 1.0
-
-        erosp_startable = daily_ev * p_start * cap_f * games_rem
-
-        df.at[mlbam_id, "start_probability"] = round(float(p_start), 4)
-        df.at[mlbam_id, "erosp_startable"]   = round(float(max(erosp_startable, 0)), 2)
+    player_type = (df["player_type"].astype(str).to_numpy() if "player_type" in df.columns
+                   else np.full(len(df), "hitter"))
+    positions = [str(hitter_pos.get(mid, "OF")) for mid in df.index]
+    daily_ev = df["daily_ev_raw"].to_numpy(dtype=float)
+    p_start = start_probability_array(player_type, daily_ev, positions, replacement_levels, config=cfg)
+
+    erosp_startable = daily_ev * p_start * df["cap_factor"].to_numpy(dtype=float) * games_rem
+    df["start_probability"] = np.round(p_start, 4)
+    df["erosp_startable"]   = np.round(np.maximum(erosp_startable, 0), 2)
 
     print(f"    EROSP startable: "
           f"mean={df['erosp_startable'].mean():.1f}, "
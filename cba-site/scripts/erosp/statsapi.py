@@ -0,0 +1,176 @@
+"""
+MLB Stats API client for EROSP and the roster scripts.
+
+One pooled requests.Session, a bounded thread pool for fan-out calls and
+per-endpoint rate limiting. Needs only requests — check_prospect_callups.py
+uses it without the pandas stack that erosp.ingest pulls in; erosp.ingest
+builds its roster, IL and people fetchers on it.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from .config import MLB_TEAM_ID_TO_ABBREV
+
+# Override with a local stub server for offline runs:
+#   MLB_STATS_API_BASE=http://127.0.0.1:8000/api/v1 python compute_erosp.py
+MLB_STATS_API_BASE = os.environ.get("MLB_STATS_API_BASE", "https://statsapi.mlb.com/api/v1").rstrip("/")
+
+# Minimum seconds between request starts, per endpoint family
+MLB_API_RATE_LIMITS: Dict[str, float] = {
+    "roster":  0.05,
+    "people":  0.2,
+    "default": 0.1,
+}
+
+# Superset of the roster fields each consumer needs, so one sweep serves all of them
+ROSTER_SWEEP_FIELDS = "roster,person,id,fullName,status,code,expectedActivationDate"
+
+
+class _RateLimiter:
+    """Spaces out request starts to at most one per `min_interval` seconds (thread-safe)."""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.min_interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class MLBStatsClient:
+    """
+    Thin MLB Stats API client shared by the roster, IL and people fetchers.
+
+    One pooled requests.Session, a bounded thread pool for fan-out calls
+    (30 team rosters, people batches) and per-endpoint rate limiting.
+    base_url can point at a local stub server for testing.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        max_workers: int = 8,
+        timeout: float = 10.0,
+        rate_limits: Optional[Dict[str, float]] = None,
+        session=None,
+    ):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.base_url    = (base_url or MLB_STATS_API_BASE).rstrip("/")
+        self.max_workers = max_workers
+        self.timeout     = timeout
+        self._limits     = {**MLB_API_RATE_LIMITS, **(rate_limits or {})}
+        self._limiters: Dict[str, _RateLimiter] = {}
+        self._limiters_lock = threading.Lock()
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+
+    def _limiter(self, endpoint: str) -> _RateLimiter:
+        with self._limiters_lock:
+            if endpoint not in self._limiters:
+                interval = self._limits.get(endpoint, self._limits["default"])
+                self._limiters[endpoint] = _RateLimiter(interval)
+            return self._limiters[endpoint]
+
+    def get_json(
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        endpoint: str = "default",
+        timeout: Optional[float] = None,
+    ) -> Optional[dict]:
+        """GET base_url/path; returns parsed JSON, or None on a non-200 response."""
+        self._limiter(endpoint).wait()
+        resp = self.session.get(
+            f"{self.base_url}/{path.lstrip('/')}",
+            params=params,
+            timeout=timeout or self.timeout,
+        )
+        if resp.status_code != 200:
+            return None
+        return resp.json()
+
+    def map(self, func, items: list, label: str = "") -> list:
+        """Apply func to items across the worker pool; failures become None (with a warning)."""
+        def _safe(item):
+            try:
+                return func(item)
+            except Exception as exc:
+                print(f"    WARNING: {label or func.__name__} failed for {item}: {exc}")
+                return None
+
+        if len(items) <= 1 or self.max_workers <= 1:
+            return [_safe(item) for item in items]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(_safe, items))
+
+    def team_rosters(
+        self,
+        season: int,
+        roster_type: str = "40Man",
+        fields: str = ROSTER_SWEEP_FIELDS,
+        team_ids: Optional[List[int]] = None,
+    ) -> Dict[int, Optional[list]]:
+        """Fetch rosters for team_ids (default: all 30). Failed teams map to None."""
+        team_ids = sorted(MLB_TEAM_ID_TO_ABBREV.keys()) if team_ids is None else list(team_ids)
+
+        def _roster(team_id: int) -> Optional[list]:
+            data = self.get_json(
+                f"teams/{team_id}/roster",
+                params={"rosterType": roster_type, "season": season, "fields": fields},
+                endpoint="roster",
+            )
+            return None if data is None else data.get("roster", [])
+
+        return dict(zip(team_ids, self.map(_roster, team_ids, label=f"{roster_type} roster")))
+
+    def people(
+        self,
+        mlbam_ids: List[int],
+        fields: Optional[str] = None,
+        hydrate: Optional[str] = None,
+        batch_size: int = 200,
+    ) -> List[dict]:
+        """Bulk /people lookup, batch_size IDs per request, batches fetched concurrently."""
+        batches = [mlbam_ids[i : i + batch_size] for i in range(0, len(mlbam_ids), batch_size)]
+
+        def _batch(batch: List[int]) -> List[dict]:
+            params = {"personIds": ",".join(str(x) for x in batch)}
+            if fields:
+                params["fields"] = fields
+            if hydrate:
+                params["hydrate"] = hydrate
+            data = self.get_json("people", params=params, endpoint="people", timeout=15)
+            return [] if data is None else data.get("people", [])
+
+        out: List[dict] = []
+        for people in self.map(_batch, batches, label="people batch"):
+            out.extend(people or [])
+        return out
+
+
+_MLB_CLIENT: Optional[MLBStatsClient] = None
+
+
+def get_mlb_client() -> MLBStatsClient:
+    """Process-wide default client (lazily created so importing stays cheap)."""
+    global _MLB_CLIENT
+    if _MLB_CLIENT is None:
+        _MLB_CLIENT = MLBStatsClient()
+    return _MLB_CLIENT
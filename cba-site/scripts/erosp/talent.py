@@ -5,36 +5,12 @@ Produces per-PA (hitters) and per-IP (pitchers) true-talent rate estimates
 by blending 3 years of historical FanGraphs data with age and Statcast adjustments.
 """
 
-import re
-import unicodedata
 from typing import Dict, List, Optional
 import numpy as np
 import pandas as pd
 
-from .config import (
-    BLEND_WEIGHTS_3YR, BLEND_WEIGHTS_2YR, BLEND_WEIGHTS_5YR, BLEND_WEIGHT_YTD, MEAN_REGRESSION,
-    AGE_PEAK, AGE_GROWTH_RATE, AGE_DECLINE_EARLY, AGE_DECLINE_LATE,
-    AGE_DECLINE_FAST_THRESHOLD, AGE_PITCHER_DECLINE_MULT,
-    AGE_MOD_MIN, AGE_MOD_MAX,
-    XWOBA_DAMP, XWOBA_LG_AVG,
-    PA_FULL_SEASON, IP_FULL_SEASON, MEAN_REGRESSION_HIGH, MEAN_REGRESSION_LOW,
-    PARK_FACTORS, TEAM_NORMALIZE,
-)
-
-# ---------------------------------------------------------------------------
-# Name normalization for Chadwick fallback lookup
-# ---------------------------------------------------------------------------
-
-def _norm_player_name(n: str) -> str:
-    """
-    Normalize a FanGraphs player name to match the Chadwick name_to_mlbam keys.
-    Strips accents, lowercases, removes suffixes (Jr./Sr./II/III/IV).
-    """
-    n = unicodedata.normalize("NFKD", n).encode("ascii", "ignore").decode()
-    n = re.sub(r"\b(jr|sr|ii|iii|iv)\b\.?", "", n.lower())
-    n = re.sub(r"[^a-z ]", "", n)
-    return " ".join(n.split())
-
+from .config import DEFAULT_CONFIG, EROSPConfig
+from .names import normalize_many
 
 # ---------------------------------------------------------------------------
 # League-average rate benchmarks (used for regression to mean)
@@ -74,7 +50,8 @@ LG_AVG_PITCH = {
 # Age adjustment
 # ---------------------------------------------------------------------------
 
-def age_modifier(age: float, is_pitcher: bool = False) -> float:
+def age_modifier(age: float, is_pitcher: bool = False,
+                 config: Optional[EROSPConfig] = None) -> float:
     """
     Asymmetric age modifier with research-based rates.
 
@@ -88,20 +65,56 @@ def age_modifier(age: float, is_pitcher: bool = False) -> float:
     Pitchers inherit the same curve but post-peak decline is 40% steeper.
     Young pitchers (< peak) are unchanged — no faster growth before peak.
     """
-    if age <= AGE_PEAK:
-        raw = 1.0 + (AGE_PEAK - age) * AGE_GROWTH_RATE
-    elif age <= AGE_DECLINE_FAST_THRESHOLD:
-        raw = 1.0 - (age - AGE_PEAK) * AGE_DECLINE_EARLY
+    cfg = config or DEFAULT_CONFIG
+    if age <= cfg.age_peak:
+        raw = 1.0 + (cfg.age_peak - age) * cfg.age_growth_rate
+    elif age <= cfg.age_decline_fast_threshold:
+        raw = 1.0 - (age - cfg.age_peak) * cfg.age_decline_early
     else:
-        early_loss = (AGE_DECLINE_FAST_THRESHOLD - AGE_PEAK) * AGE_DECLINE_EARLY
-        late_loss  = (age - AGE_DECLINE_FAST_THRESHOLD) * AGE_DECLINE_LATE
+        early_loss = (cfg.age_decline_fast_threshold - cfg.age_peak) * cfg.age_decline_early
+        late_loss  = (age - cfg.age_decline_fast_threshold) * cfg.age_decline_late
         raw = 1.0 - early_loss - late_loss
 
     # Pitchers decline faster post-peak (arm wear, less adaptation)
-    if is_pitcher and age > AGE_PEAK:
-        raw = 1.0 - (1.0 - raw) * AGE_PITCHER_DECLINE_MULT
-
-    return float(np.clip(raw, AGE_MOD_MIN, AGE_MOD_MAX))
+    if is_pitcher and age > cfg.age_peak:
+        raw = 1.0 - (1.0 - raw) * cfg.age_pitcher_decline_mult
+
+    return float(np.clip(raw, cfg.age_mod_min, cfg.age_mod_max))
+
+
+def _age_modifier_array(ages: np.ndarray, is_pitcher: bool = False,
+                        config: Optional[EROSPConfig] = None) -> np.ndarray:
+    """Array version of age_modifier() — same branches, evaluated element-wise."""
+    cfg = config or DEFAULT_CONFIG
+    ages = np.asarray(ages, dtype=float)
+    early_loss = (cfg.age_decline_fast_threshold - cfg.age_peak) * cfg.age_decline_early
+    raw = np.where(
+        ages <= cfg.age_peak,
+        1.0 + (cfg.age_peak - ages) * cfg.age_growth_rate,
+        np.where(
+            ages <= cfg.age_decline_fast_threshold,
+            1.0 - (ages - cfg.age_peak) * cfg.age_decline_early,
+            1.0 - early_loss - (ages - cfg.age_decline_fast_threshold) * cfg.age_decline_late,
+        ),
+    )
+    if is_pitcher:
+        raw = np.where(ages > cfg.age_peak, 1.0 - (1.0 - raw) * cfg.age_pitcher_decline_mult, raw)
+    return np.clip(raw, cfg.age_mod_min, cfg.age_mod_max)
+
+
+def _ages_from_birth_cols(df: pd.DataFrame, target_season: int) -> pd.Series:
+    """Age as of April 1 of the target season; NaN where the birth date is missing or invalid."""
+    if "birth_year" not in df.columns:
+        return pd.Series(np.nan, index=df.index)
+    births = pd.to_datetime(
+        pd.DataFrame({
+            "year":  pd.to_numeric(df["birth_year"],  errors="coerce"),
+            "month": pd.to_numeric(df["birth_month"], errors="coerce"),
+            "day":   pd.to_numeric(df["birth_day"],   errors="coerce"),
+        }),
+        errors="coerce",
+    )
+    return (pd.Timestamp(target_season, 4, 1) - births).dt.days / 365.25
 
 
 def compute_ages(player_info_df: pd.DataFrame, target_season: int) -> pd.Series:
@@ -133,6 +146,7 @@ def _blend_hitter_rates(
     year_dfs: List[Optional[pd.DataFrame]],
     year_pas: Optional[List[Optional[float]]] = None,
     weights: Optional[List[float]] = None,
+    config: Optional[EROSPConfig] = None,
 ) -> pd.Series:
     """
     Blend per-PA rates across up to N years with PA-based sample-size weighting.
@@ -144,16 +158,17 @@ def _blend_hitter_rates(
               Single-year samples also get more mean regression when PA is low.
     weights:  base blend weights (defaults to BLEND_WEIGHTS_3YR for 3-year inputs).
     """
+    cfg = config or DEFAULT_CONFIG
     if year_pas is None:
         year_pas = [None] * len(year_dfs)
-    base_weights = weights if weights is not None else BLEND_WEIGHTS_3YR
+    base_weights = weights if weights is not None else cfg.blend_weights_3yr
 
     # Scale base weights by PA coverage (partial season = partial trust)
     scaled = []
     for df, base_w, pa in zip(year_dfs, base_weights, year_pas):
         if df is None:
             continue
-        pa_scale = min(float(pa) / PA_FULL_SEASON, 1.0) if (pa and pa > 0) else 1.0
+        pa_scale = min(float(pa) / cfg.pa_full_season, 1.0) if (pa and pa > 0) else 1.0
         scaled.append((df, base_w * pa_scale, pa))
 
     if not scaled:
@@ -163,14 +178,14 @@ def _blend_hitter_rates(
         df, _, pa = scaled[0]
         # Regression scales with sample size: less PA → more regression to mean
         if pa and pa > 0:
-            pa_clamped = float(np.clip(pa, 200.0, PA_FULL_SEASON))
-            regression = MEAN_REGRESSION_LOW - (
-                (MEAN_REGRESSION_LOW - MEAN_REGRESSION_HIGH)
-                * (pa_clamped - 200.0) / (PA_FULL_SEASON - 200.0)
+            pa_clamped = float(np.clip(pa, 200.0, cfg.pa_full_season))
+            regression = cfg.mean_regression_low - (
+                (cfg.mean_regression_low - cfg.mean_regression_high)
+                * (pa_clamped - 200.0) / (cfg.pa_full_season - 200.0)
             )
-            regression = float(np.clip(regression, MEAN_REGRESSION_HIGH, MEAN_REGRESSION_LOW))
+            regression = float(np.clip(regression, cfg.mean_regression_high, cfg.mean_regression_low))
         else:
-            regression = MEAN_REGRESSION
+            regression = cfg.mean_regression
         result = {}
         for col in RATE_COLS:
             val = float(df.get(col, LG_AVG[col]))
@@ -185,6 +200,129 @@ def _blend_hitter_rates(
     return pd.Series(result)
 
 
+# ---------------------------------------------------------------------------
+# Columnar blend engine (shared by hitters and pitchers)
+# ---------------------------------------------------------------------------
+
+def _first_by_fgid(df: pd.DataFrame) -> pd.DataFrame:
+    """Index a season DataFrame by IDfg, keeping the first row per player (matches .iloc[0] lookups)."""
+    return df.drop_duplicates(subset=["IDfg"], keep="first").set_index("IDfg")
+
+
+def _stack_year_rates(
+    by_year: Dict[int, pd.DataFrame],
+    years: List[Optional[int]],
+    fgids: np.ndarray,
+    rate_cols: List[str],
+    lg_avg: Dict[str, float],
+    sample_col: str,
+):
+    """
+    Gather per-year rates for every player into dense arrays.
+
+    Returns (rates, present, sample):
+      rates:   (n_players × n_years × n_rates); a rate column missing from a season
+               falls back to the league average, as the scalar blend does
+      present: (n_players × n_years) bool — player has a row in that season
+      sample:  (n_players × n_years) PA or IP for that season (0 when absent)
+    """
+    n, n_years, n_rates = len(fgids), len(years), len(rate_cols)
+    rates   = np.zeros((n, n_years, n_rates))
+    present = np.zeros((n, n_years), dtype=bool)
+    sample  = np.zeros((n, n_years))
+    for j, year in enumerate(years):
+        if not year or year not in by_year:
+            continue
+        yr = _first_by_fgid(by_year[year]).reindex(fgids)
+        present[:, j] = np.isin(fgids, by_year[year]["IDfg"].values)
+        if sample_col in yr.columns:
+            sample[:, j] = yr[sample_col].astype(float).values
+        for k, col in enumerate(rate_cols):
+            rates[:, j, k] = yr[col].astype(float).values if col in yr.columns else lg_avg[col]
+    sample = np.where(present, sample, 0.0)
+    return rates, present, sample
+
+
+def _blend_rates_array(
+    rates: np.ndarray,
+    present: np.ndarray,
+    sample: np.ndarray,
+    weights: np.ndarray,
+    lg_avg: np.ndarray,
+    full_season: float,
+    min_sample: float,
+    config: Optional[EROSPConfig] = None,
+) -> np.ndarray:
+    """
+    Array version of _blend_hitter_rates / _blend_pitcher_rates.
+
+    weights is (n_players × n_years) or broadcastable to it, so each player can carry
+    its own base-weight schedule (YTD prepended, 5-year lookback, ...). Sums run in
+    year order so results are bit-identical to the scalar reference.
+    """
+    cfg = config or DEFAULT_CONFIG
+    n, n_years, n_rates = rates.shape
+    has_sample = present & (sample > 0)
+    scale = np.where(has_sample, np.minimum(sample / full_season, 1.0), 1.0)
+    eff_w = np.where(present, np.broadcast_to(weights, present.shape) * scale, 0.0)
+
+    total_w = np.zeros(n)
+    acc     = np.zeros((n, n_rates))
+    for j in range(n_years):
+        total_w = total_w + eff_w[:, j]
+        acc = acc + np.where(present[:, j, None], rates[:, j, :] * eff_w[:, j, None], 0.0)
+    n_present = present.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        multi = acc / total_w[:, None]
+
+    # Single-season players: regress toward the league mean, more so on small samples
+    only = present.argmax(axis=1)
+    rows = np.arange(n)
+    single_val    = rates[rows, only, :]
+    single_sample = sample[rows, only]
+    clamped = np.clip(single_sample, min_sample, full_season)
+    regression = cfg.mean_regression_low - (
+        (cfg.mean_regression_low - cfg.mean_regression_high)
+        * (clamped - min_sample) / (full_season - min_sample)
+    )
+    regression = np.clip(regression, cfg.mean_regression_high, cfg.mean_regression_low)
+    regression = np.where(single_sample > 0, regression, cfg.mean_regression)[:, None]
+    single = single_val * (1 - regression) + lg_avg * regression
+
+    return np.where(
+        (n_present >= 2)[:, None], multi,
+        np.where((n_present == 1)[:, None], single, np.broadcast_to(lg_avg, (n, n_rates))),
+    )
+
+
+def _fallback_team(
+    teams: pd.Series,
+    fgids: np.ndarray,
+    by_year: Dict[int, pd.DataFrame],
+    fallback_years: List[Optional[int]],
+) -> np.ndarray:
+    """
+    Replace FanGraphs' multi-team "- - -" (or blank) with the first real team found
+    in fallback_years, in order.
+    """
+    out = np.array([str(t) for t in teams], dtype=object)
+    for year in fallback_years:
+        if not year or year not in by_year:
+            continue
+        unresolved = np.isin(out, ["- - -", ""])
+        if not unresolved.any():
+            break
+        prior = _first_by_fgid(by_year[year])
+        if "team_norm" not in prior.columns:
+            continue
+        cand = prior["team_norm"].reindex(fgids)
+        in_year = np.isin(fgids, prior.index.values)
+        cand = np.array([str(c) for c in cand], dtype=object)
+        usable = unresolved & in_year & ~np.isin(cand, ["- - -", ""])
+        out = np.where(usable, cand, out)
+    return out
+
+
 def estimate_hitter_talent(
     batting_by_year: Dict[int, pd.DataFrame],
     historical_years: List[int],           # [y1, y2, y3], y1 = most recent
@@ -195,11 +333,13 @@ def estimate_hitter_talent(
     fg_to_mlbam: Dict[int, int],
     name_to_mlbam: Optional[Dict[str, int]] = None,
     in_season_year: Optional[int] = None,  # Fix I: current season YTD for in-season blend
+    config: Optional[EROSPConfig] = None,
 ) -> pd.DataFrame:
     """
     Returns DataFrame indexed by MLBAM ID with talent rate columns.
     One row per player, representing their true-talent per-PA rates.
     """
+    cfg = config or DEFAULT_CONFIG
     y1, y2, y3 = (historical_years + [None, None, None])[:3]
 
     # Only include years that have data
@@ -234,10 +374,9 @@ def estimate_hitter_talent(
     if name_to_mlbam:
         n_before = base_df["mlbam_id"].notna().sum()
         mask = base_df["mlbam_id"].isna()
-        for idx in base_df[mask].index:
-            norm = _norm_player_name(str(base_df.at[idx, "Name"]))
-            if norm in name_to_mlbam:
-                base_df.at[idx, "mlbam_id"] = name_to_mlbam[norm]
+        base_df.loc[mask, "mlbam_id"] = (
+            normalize_many(base_df.loc[mask, "Name"].astype(str)).map(name_to_mlbam)
+        )
         n_after = base_df["mlbam_id"].notna().sum()
         if n_after > n_before:
             print(f"    Name fallback resolved {n_after - n_before} hitter(s) missing from Chadwick.")
@@ -249,17 +388,7 @@ def estimate_hitter_talent(
         base_df = base_df.merge(player_info_df[info_cols], on="mlbam_id", how="left")
 
     # Compute age
-    if "birth_year" in base_df.columns:
-        target_date = pd.Timestamp(target_season, 4, 1)
-        def _age(row):
-            try:
-                bd = pd.Timestamp(int(row["birth_year"]), int(row["birth_month"]), int(row["birth_day"]))
-                return (target_date - bd).days / 365.25
-            except Exception:
-                return np.nan
-        base_df["age"] = base_df.apply(_age, axis=1)
-    else:
-        base_df["age"] = np.nan
+    base_df["age"] = _ages_from_birth_cols(base_df, target_season)
 
     median_age = base_df["age"].median()
     base_df["age"] = base_df["age"].fillna(median_age if not np.isnan(median_age) else 28.0)
@@ -282,20 +411,12 @@ def estimate_hitter_talent(
     else:
         base_df["xwoba_y2"] = np.nan
 
-    def _blend_xwoba(r):
-        v1 = r.get("xwoba_y1")
-        v2 = r.get("xwoba_y2")
-        h1 = v1 is not None and not (isinstance(v1, float) and np.isnan(v1))
-        h2 = v2 is not None and not (isinstance(v2, float) and np.isnan(v2))
-        if h1 and h2:
-            return (2 * float(v1) + float(v2)) / 3.0
-        elif h1:
-            return float(v1)
-        elif h2:
-            return float(v2)
-        return np.nan
-
-    base_df["xwoba_latest"] = base_df.apply(_blend_xwoba, axis=1)
+    xw1 = base_df["xwoba_y1"].astype(float)
+    xw2 = base_df["xwoba_y2"].astype(float)
+    base_df["xwoba_latest"] = np.where(
+        xw1.notna() & xw2.notna(), (2 * xw1 + xw2) / 3.0,
+        np.where(xw1.notna(), xw1, xw2),
+    )
 
     # Merge sprint speed
     if sprint_speed_df is not None:
@@ -305,122 +426,86 @@ def estimate_hitter_talent(
         )
     base_df["speed_pct"] = base_df.get("speed_pct", pd.Series(50.0, index=base_df.index)).fillna(50.0)
 
-    rows = []
-    for _, row in base_df.iterrows():
-        fgid = int(row["IDfg"])
-        mlbam = row.get("mlbam_id")
-        if pd.isna(mlbam):
-            continue
-
-        # Collect per-PA rates and actual PA for each available year
-        yr_rates: list = []
-        yr_pas:   list = []
-        hitter_blend_years  = [y1, y2, y3]
-        hitter_blend_weights: List[float] = list(BLEND_WEIGHTS_3YR)
-
-        # Fix I: prepend current-season YTD data when in_season_year is provided.
-        # PA-based sample-size weighting discounts it heavily early in the season.
-        if (in_season_year and in_season_year in batting_by_year
-                and in_season_year not in hitter_blend_years):
-            ytd_bat   = batting_by_year[in_season_year]
-            ytd_match = ytd_bat[ytd_bat["IDfg"] == fgid]
-            if not ytd_match.empty:
-                ytd_pa = float(ytd_match.iloc[0].get("PA", 0))
-                if ytd_pa >= 10:  # minimum threshold
-                    hitter_blend_years   = [in_season_year] + hitter_blend_years
-                    hitter_blend_weights = [BLEND_WEIGHT_YTD] + hitter_blend_weights
-
-        for year in hitter_blend_years:
-            if not year or year not in batting_by_year:
-                yr_rates.append(None)
-                yr_pas.append(None)
-                continue
-            yr_df = batting_by_year[year]
-            match = yr_df[yr_df["IDfg"] == fgid]
-            if match.empty:
-                yr_rates.append(None)
-                yr_pas.append(None)
-            else:
-                # Only include RATE_COLS that exist in this year's data
-                available = [c for c in RATE_COLS if c in match.columns]
-                yr_rates.append(match.iloc[0][available].to_dict())
-                yr_pas.append(float(match.iloc[0].get("PA", 0)))
-
-        # Blend rates with PA-based sample-size weighting
-        blended = _blend_hitter_rates(
-            [pd.Series(r) if r is not None else None for r in yr_rates],
-            year_pas=yr_pas,
-            weights=hitter_blend_weights,
-        )
-
-        # Age modifier
-        age     = float(row.get("age", 28.0))
-        age_mod = age_modifier(age)
-
-        # xwOBA adjustment (multiplicative, dampened)
-        xwoba = float(row.get("xwoba_latest", np.nan))
-        if not np.isnan(xwoba) and xwoba > 0:
-            xwoba_adj = (xwoba / XWOBA_LG_AVG) ** XWOBA_DAMP
-        else:
-            xwoba_adj = 1.0
-
-        # Speed adjustment on SB rates (above-median speed → higher SB attempt rate)
-        speed_pct = float(row.get("speed_pct", 50.0))
-        speed_factor = 0.5 + (speed_pct / 100.0)  # 0.5 to 1.5
-
-        adjusted = dict(blended)
-        # Apply age to all contact/power rates (hits, walks, HBP, run production)
-        for col in ["single_rate", "double_rate", "triple_rate", "hr_rate",
-                    "bb_rate", "hbp_rate", "r_per_pa", "rbi_per_pa"]:
-            adjusted[col] = blended[col] * age_mod * xwoba_adj
-        # K rate inversely affected by age for young players
-        adjusted["k_rate"] = blended["k_rate"] * (2.0 - age_mod)
-        # Speed-based adjustments
-        adjusted["sb_rate"]   = blended["sb_rate"]   * age_mod * speed_factor
-        adjusted["cs_rate"]   = blended["cs_rate"]   * age_mod * speed_factor
-        adjusted["gidp_rate"] = blended["gidp_rate"] * (2.0 - age_mod)  # older players GIDP more
-
-        # Clip rates to reasonable ranges
-        adjusted["k_rate"]      = np.clip(adjusted["k_rate"],      0.05, 0.45)
-        adjusted["bb_rate"]     = np.clip(adjusted["bb_rate"],      0.03, 0.20)
-        adjusted["hr_rate"]     = np.clip(adjusted["hr_rate"],      0.00, 0.12)
-        adjusted["single_rate"] = np.clip(adjusted["single_rate"],  0.05, 0.25)
-        adjusted["sb_rate"]     = np.clip(adjusted["sb_rate"],      0.00, 0.08)
-        adjusted["gidp_rate"]   = np.clip(adjusted["gidp_rate"],    0.00, 0.10)
-        adjusted["hbp_rate"]    = np.clip(adjusted["hbp_rate"],     0.00, 0.04)
-
-        # For multi-team players FanGraphs uses "- - -"; fall back to prior years for a real team
-        park_abbrev = str(row.get("team_norm", ""))
-        if park_abbrev in ("- - -", ""):
-            for fallback_year in [y2, y3]:
-                if not fallback_year or fallback_year not in batting_by_year:
-                    continue
-                prior = batting_by_year[fallback_year]
-                prior_match = prior[prior["IDfg"] == fgid]
-                if not prior_match.empty:
-                    candidate = str(prior_match.iloc[0].get("team_norm", ""))
-                    if candidate not in ("- - -", ""):
-                        park_abbrev = candidate
-                        break
-        park_factor = PARK_FACTORS.get(str(park_abbrev), 1.00)
-
-        rows.append({
-            "mlbam_id":    int(mlbam),
-            "fgid":        fgid,
-            "name":        str(row.get("Name", "")),
-            "age":         age,
-            "age_mod":     age_mod,
-            "xwoba_adj":   xwoba_adj,
-            "mlb_team":    park_abbrev,
-            "park_factor": park_factor,
-            "mlb_position": str(row.get("mlb_position", "")),
-            **{k: round(v, 6) for k, v in adjusted.items()},
-        })
-
-    if not rows:
+    base_df = base_df[base_df["mlbam_id"].notna()].reset_index(drop=True)
+    if base_df.empty:
         return pd.DataFrame()
+    fgids = base_df["IDfg"].astype(int).values
+
+    # Fix I: current-season YTD data becomes slot y0 for players with ≥10 PA.
+    # PA-based sample-size weighting discounts it heavily early in the season.
+    blend_years: List[Optional[int]] = [None, y1, y2, y3]
+    if in_season_year and in_season_year in batting_by_year and in_season_year not in [y1, y2, y3]:
+        blend_years[0] = in_season_year
+    rates, present, pas = _stack_year_rates(
+        batting_by_year, blend_years, fgids, RATE_COLS, LG_AVG, sample_col="PA",
+    )
+    present[:, 0] &= pas[:, 0] >= 10   # minimum threshold
+
+    blended = _blend_rates_array(
+        rates, present, pas,
+        weights=np.array([cfg.blend_weight_ytd] + list(cfg.blend_weights_3yr)),
+        lg_avg=np.array([LG_AVG[col] for col in RATE_COLS]),
+        full_season=cfg.pa_full_season,
+        min_sample=200.0,
+        config=cfg,
+    )
+    blended = pd.DataFrame(blended, columns=RATE_COLS)
+
+    # Age modifier
+    age     = base_df["age"].astype(float).values
+    age_mod = _age_modifier_array(age, config=cfg)
+
+    # xwOBA adjustment (multiplicative, dampened)
+    xwoba = base_df["xwoba_latest"].astype(float).values
+    with np.errstate(invalid="ignore"):
+        xwoba_adj = np.where(xwoba > 0, (xwoba / cfg.xwoba_lg_avg) ** cfg.xwoba_damp, 1.0)
+
+    # Speed adjustment on SB rates (above-median speed → higher SB attempt rate)
+    speed_factor = 0.5 + (base_df["speed_pct"].astype(float).values / 100.0)  # 0.5 to 1.5
+
+    adjusted = blended.copy()
+    # Apply age to all contact/power rates (hits, walks, HBP, run production)
+    for col in ["single_rate", "double_rate", "triple_rate", "hr_rate",
+                "bb_rate", "hbp_rate", "r_per_pa", "rbi_per_pa"]:
+        adjusted[col] = blended[col] * age_mod * xwoba_adj
+    # K rate inversely affected by age for young players
+    adjusted["k_rate"] = blended["k_rate"] * (2.0 - age_mod)
+    # Speed-based adjustments
+    adjusted["sb_rate"]   = blended["sb_rate"]   * age_mod * speed_factor
+    adjusted["cs_rate"]   = blended["cs_rate"]   * age_mod * speed_factor
+    adjusted["gidp_rate"] = blended["gidp_rate"] * (2.0 - age_mod)  # older players GIDP more
+
+    # Clip rates to reasonable ranges
+    adjusted["k_rate"]      = adjusted["k_rate"].clip(0.05, 0.45)
+    adjusted["bb_rate"]     = adjusted["bb_rate"].clip(0.03, 0.20)
+    adjusted["hr_rate"]     = adjusted["hr_rate"].clip(0.00, 0.12)
+    adjusted["single_rate"] = adjusted["single_rate"].clip(0.05, 0.25)
+    adjusted["sb_rate"]     = adjusted["sb_rate"].clip(0.00, 0.08)
+    adjusted["gidp_rate"]   = adjusted["gidp_rate"].clip(0.00, 0.10)
+    adjusted["hbp_rate"]    = adjusted["hbp_rate"].clip(0.00, 0.04)
+
+    # For multi-team players FanGraphs uses "- - -"; fall back to prior years for a real team
+    park_abbrev = _fallback_team(
+        base_df.get("team_norm", pd.Series("", index=base_df.index)),
+        fgids, batting_by_year, [y2, y3],
+    )
+    park_factor = [cfg.park_factors.get(t, 1.00) for t in park_abbrev]
+
+    result_df = pd.DataFrame({
+        "mlbam_id":     base_df["mlbam_id"].astype(int).values,
+        "fgid":         fgids,
+        "name":         [str(n) for n in base_df.get("Name", pd.Series("", index=base_df.index))],
+        "age":          age,
+        "age_mod":      age_mod,
+        "xwoba_adj":    xwoba_adj,
+        "mlb_team":     park_abbrev,
+        "park_factor":  park_factor,
+        "mlb_position": [str(p) for p in base_df.get("mlb_position", pd.Series("", index=base_df.index))],
+    })
+    for col in RATE_COLS:
+        result_df[col] = adjusted[col].round(6).values
 
-    result_df = pd.DataFrame(rows).drop_duplicates(subset=["mlbam_id"], keep="first").set_index("mlbam_id")
+    result_df = result_df.drop_duplicates(subset=["mlbam_id"], keep="first").set_index("mlbam_id")
     print(f"    Hitter talent: {len(result_df):,} players estimated.")
     return result_df
 
@@ -440,22 +525,24 @@ def _blend_pitcher_rates(
     year_dfs: List[Optional[pd.Series]],
     year_ips: Optional[List[Optional[float]]] = None,
     weights: Optional[List[float]] = None,
+    config: Optional[EROSPConfig] = None,
 ) -> pd.Series:
     """Blend per-IP pitcher rates across up to 5 years with IP-based sample-size weighting.
 
     weights: base year weights; defaults to BLEND_WEIGHTS_3YR.
              Pass BLEND_WEIGHTS_5YR for extended 5-year lookback.
     """
+    cfg = config or DEFAULT_CONFIG
     if year_ips is None:
         year_ips = [None] * len(year_dfs)
     if weights is None:
-        weights = BLEND_WEIGHTS_3YR
+        weights = cfg.blend_weights_3yr
 
     scaled = []
     for df, base_w, ip in zip(year_dfs, weights, year_ips):
         if df is None:
             continue
-        ip_scale = min(float(ip) / IP_FULL_SEASON, 1.0) if (ip and ip > 0) else 1.0
+        ip_scale = min(float(ip) / cfg.ip_full_season, 1.0) if (ip and ip > 0) else 1.0
         scaled.append((df, base_w * ip_scale, ip))
 
     if not scaled:
@@ -464,14 +551,14 @@ def _blend_pitcher_rates(
     if len(scaled) == 1:
         df, _, ip = scaled[0]
         if ip and ip > 0:
-            ip_clamped = float(np.clip(ip, 20.0, IP_FULL_SEASON))
-            regression = MEAN_REGRESSION_LOW - (
-                (MEAN_REGRESSION_LOW - MEAN_REGRESSION_HIGH)
-                * (ip_clamped - 20.0) / (IP_FULL_SEASON - 20.0)
+            ip_clamped = float(np.clip(ip, 20.0, cfg.ip_full_season))
+            regression = cfg.mean_regression_low - (
+                (cfg.mean_regression_low - cfg.mean_regression_high)
+                * (ip_clamped - 20.0) / (cfg.ip_full_season - 20.0)
             )
-            regression = float(np.clip(regression, MEAN_REGRESSION_HIGH, MEAN_REGRESSION_LOW))
+            regression = float(np.clip(regression, cfg.mean_regression_high, cfg.mean_regression_low))
         else:
-            regression = MEAN_REGRESSION
+            regression = cfg.mean_regression
         result = {}
         for col in PITCH_RATE_COLS:
             val = float(df.get(col, LG_AVG_PITCH[col]))
@@ -495,6 +582,7 @@ def estimate_pitcher_talent(
     name_to_mlbam: Optional[Dict[str, int]] = None,
     extra_years: Optional[List[int]] = None,   # Fix 2: y4/y5 for extended lookback
     in_season_year: Optional[int] = None,      # Fix I: current season YTD for in-season blend
+    config: Optional[EROSPConfig] = None,
 ) -> pd.DataFrame:
     """
     Returns DataFrame indexed by MLBAM ID with pitcher talent rate columns.
@@ -505,6 +593,7 @@ def estimate_pitcher_talent(
     in_season_year: when provided, the current season's YTD stats are blended in as y0
                     with BLEND_WEIGHT_YTD base weight (heavily discounted by IP sample size).
     """
+    cfg = config or DEFAULT_CONFIG
     y1, y2, y3 = (historical_years + [None, None, None])[:3]
     y4, y5 = ((extra_years or []) + [None, None])[:2]   # Fix 2
 
@@ -544,10 +633,9 @@ def estimate_pitcher_talent(
     if name_to_mlbam:
         n_before = base_df["mlbam_id"].notna().sum()
         mask = base_df["mlbam_id"].isna()
-        for idx in base_df[mask].index:
-            norm = _norm_player_name(str(base_df.at[idx, "Name"]))
-            if norm in name_to_mlbam:
-                base_df.at[idx, "mlbam_id"] = name_to_mlbam[norm]
+        base_df.loc[mask, "mlbam_id"] = (
+            normalize_many(base_df.loc[mask, "Name"].astype(str)).map(name_to_mlbam)
+        )
         n_after = base_df["mlbam_id"].notna().sum()
         if n_after > n_before:
             print(f"    Name fallback resolved {n_after - n_before} pitcher(s) missing from Chadwick.")
@@ -558,17 +646,7 @@ def estimate_pitcher_talent(
                                     if c in player_info_df.columns]
         base_df = base_df.merge(player_info_df[info_cols], on="mlbam_id", how="left")
 
-    if "birth_year" in base_df.columns:
-        target_date = pd.Timestamp(target_season, 4, 1)
-        def _age(row):
-            try:
-                bd = pd.Timestamp(int(row["birth_year"]), int(row["birth_month"]), int(row["birth_day"]))
-                return (target_date - bd).days / 365.25
-            except Exception:
-                return np.nan
-        base_df["age"] = base_df.apply(_age, axis=1)
-    else:
-        base_df["age"] = np.nan
+    base_df["age"] = _ages_from_birth_cols(base_df, target_season)
 
     median_age = base_df["age"].median()
     base_df["age"] = base_df["age"].fillna(median_age if not np.isnan(median_age) else 28.0)
@@ -576,143 +654,116 @@ def estimate_pitcher_talent(
     # Classify role from most recent year
     base_df["role"] = base_df.get("role", "SP")
 
-    rows = []
-    for _, row in base_df.iterrows():
-        fgid   = int(row["IDfg"])
-        mlbam  = row.get("mlbam_id")
-        if pd.isna(mlbam):
-            continue
-
-        # Fix 2: pitchers absent from y1 AND y2 (TJ returnees, multi-year injuries)
-        # get an extended 5-year blend to capture older healthy seasons.
-        # Pitchers with recent data use the standard 3-year blend only.
-        has_recent_data = any(
-            yr and yr in pitching_by_year
-            and not pitching_by_year[yr][pitching_by_year[yr]["IDfg"] == fgid].empty
-            for yr in [y1, y2]
-        )
-        if has_recent_data or not (y4 or y5):
-            years_for_blend  = [y1, y2, y3]
-            blend_weights    = list(BLEND_WEIGHTS_3YR)
-        else:
-            years_for_blend  = [y1, y2, y3, y4, y5]
-            blend_weights    = list(BLEND_WEIGHTS_5YR)
-
-        # Fix I: prepend current-season YTD data when in_season_year is provided.
-        # The existing IP-based sample-size weighting automatically discounts small samples
-        # (e.g. 20 IP early in season → eff_w = 0.45 * 20/150 = 0.06 before normalization).
-        if (in_season_year and in_season_year in pitching_by_year
-                and in_season_year not in years_for_blend):
-            ytd_df    = pitching_by_year[in_season_year]
-            ytd_match = ytd_df[ytd_df["IDfg"] == fgid]
-            if not ytd_match.empty:
-                ytd_ip = float(ytd_match.iloc[0].get("IP", 0))
-                if ytd_ip >= 5:  # minimum threshold — noise below this
-                    years_for_blend = [in_season_year] + years_for_blend
-                    blend_weights   = [BLEND_WEIGHT_YTD] + blend_weights
-
-        yr_rates: list = []
-        yr_ips:   list = []
-        for year in years_for_blend:
-            if not year or year not in pitching_by_year:
-                yr_rates.append(None)
-                yr_ips.append(None)
-                continue
-            yr_df = pitching_by_year[year]
-            match = yr_df[yr_df["IDfg"] == fgid]
-            if match.empty:
-                yr_rates.append(None)
-                yr_ips.append(None)
-            else:
-                available = [c for c in PITCH_RATE_COLS if c in match.columns]
-                yr_rates.append(match.iloc[0][available].to_dict())
-                yr_ips.append(float(match.iloc[0].get("IP", 0)))
-
-        # Comeback year de-emphasis:
-        # If a blend year immediately follows a fully missed season (0 IP / absent from data)
-        # AND that comeback year had < 100 IP (still partial/rusty), halve its effective weight.
-        # Full-season comebacks (e.g. Rodon 2025: 180 IP) are NOT affected.
-        COMEBACK_IP_THRESHOLD = 100
-        COMEBACK_WEIGHT_FACTOR = 0.5
-        for i, (year, ip) in enumerate(zip(years_for_blend, yr_ips)):
-            if year is None or ip is None or ip == 0:
-                continue
-            if ip >= COMEBACK_IP_THRESHOLD:
-                continue  # Full comeback season — no adjustment needed
-            prev_year = year - 1
-            if prev_year not in pitching_by_year:
-                continue  # Can't confirm a miss without prior-year data
-            prev_df = pitching_by_year[prev_year]
-            prev_match = prev_df[prev_df["IDfg"] == fgid]
-            fully_missed = prev_match.empty or float(prev_match.iloc[0].get("IP", 0)) == 0
-            if fully_missed:
-                yr_ips[i] = ip * COMEBACK_WEIGHT_FACTOR
-
-        blended = _blend_pitcher_rates(
-            [pd.Series(r) if r is not None else None for r in yr_rates],
-            year_ips=yr_ips,
-            weights=blend_weights,
-        )
-
-        age = float(row.get("age", 28.0))
-        age_mod = age_modifier(age, is_pitcher=True)
-
-        # Apply age to K and ER rates
-        adjusted = dict(blended)
-        adjusted["k_per_ip"]  = blended["k_per_ip"]  * age_mod
-        adjusted["bb_per_ip"] = blended["bb_per_ip"] * (2.0 - age_mod)  # walk rate rises with age
-        adjusted["er_per_ip"] = blended["er_per_ip"] * (2.0 - age_mod)
-
-        # Clip to reasonable ranges
-        adjusted["k_per_ip"]  = np.clip(adjusted["k_per_ip"],  0.30, 1.60)
-        adjusted["bb_per_ip"] = np.clip(adjusted["bb_per_ip"], 0.10, 0.70)
-        adjusted["h_per_ip"]  = np.clip(adjusted["h_per_ip"],  0.50, 1.30)
-        adjusted["er_per_ip"] = np.clip(adjusted["er_per_ip"], 0.20, 0.80)
-        adjusted["ip_per_gs"] = np.clip(adjusted["ip_per_gs"], 3.0,  7.5)
-        adjusted["ip_per_app"] = np.clip(adjusted["ip_per_app"], 0.20, 1.50)
-        adjusted["qs_per_gs"] = np.clip(adjusted["qs_per_gs"], 0.0, 0.80)
-        adjusted["w_per_gs"]  = np.clip(adjusted["w_per_gs"],  0.0, 0.50)
-
-        # Role (SP or RP) — prefer MLB position data if available
-        mlb_pos = str(row.get("mlb_position", row.get("role", "SP"))).upper()
-        if mlb_pos in ("SP", "RP"):
-            role = mlb_pos
-        else:
-            role = str(row.get("role", "SP"))
-
-        # Park factor is inverse for pitchers (pitcher-friendly = better)
-        # For multi-team players FanGraphs uses "- - -"; fall back to prior years for a real team
-        park_abbrev = str(row.get("team_norm", ""))
-        if park_abbrev in ("- - -", ""):
-            for fallback_year in [y2, y3]:
-                if not fallback_year or fallback_year not in pitching_by_year:
-                    continue
-                prior = pitching_by_year[fallback_year]
-                prior_match = prior[prior["IDfg"] == fgid]
-                if not prior_match.empty:
-                    candidate = str(prior_match.iloc[0].get("team_norm", ""))
-                    if candidate not in ("- - -", ""):
-                        park_abbrev = candidate
-                        break
-        pf_raw = PARK_FACTORS.get(park_abbrev, 1.00)
-        park_factor_pitcher = 2.0 - pf_raw   # invert: COL 1.15 → 0.85
-
-        rows.append({
-            "mlbam_id":            int(mlbam),
-            "fgid":                fgid,
-            "name":                str(row.get("Name", "")),
-            "age":                 age,
-            "age_mod":             age_mod,
-            "mlb_team":            park_abbrev,
-            "park_factor":         park_factor_pitcher,
-            "role":                role,
-            "mlb_position":        mlb_pos,
-            **{k: round(v, 6) for k, v in adjusted.items()},
-        })
-
-    if not rows:
+    base_df = base_df[base_df["mlbam_id"].notna()].reset_index(drop=True)
+    if base_df.empty:
         return pd.DataFrame()
+    fgids = base_df["IDfg"].astype(int).values
+
+    # Slots: [y0 (YTD), y1, y2, y3, y4, y5] — every pitcher's seasons in one array pass
+    blend_years: List[Optional[int]] = [in_season_year, y1, y2, y3, y4, y5]
+    if not (in_season_year and in_season_year in pitching_by_year):
+        blend_years[0] = None
+    rates, present, ips = _stack_year_rates(
+        pitching_by_year, blend_years, fgids, PITCH_RATE_COLS, LG_AVG_PITCH, sample_col="IP",
+    )
+
+    # Fix 2: pitchers absent from y1 AND y2 (TJ returnees, multi-year injuries)
+    # get an extended 5-year blend to capture older healthy seasons.
+    # Pitchers with recent data use the standard 3-year blend only.
+    has_recent_data = present[:, 1] | present[:, 2]
+    use_5yr = ~has_recent_data & bool(y4 or y5)
+    present[:, 4:] &= use_5yr[:, None]
+    weights = np.where(
+        use_5yr[:, None],
+        np.array([cfg.blend_weight_ytd] + list(cfg.blend_weights_5yr)),
+        np.array([cfg.blend_weight_ytd] + list(cfg.blend_weights_3yr) + [0.0, 0.0]),
+    )
+
+    # Fix I: prepend current-season YTD data when in_season_year is provided.
+    # The existing IP-based sample-size weighting automatically discounts small samples
+    # (e.g. 20 IP early in season → eff_w = 0.45 * 20/150 = 0.06 before normalization).
+    ytd_allowed = np.where(
+        use_5yr,
+        in_season_year not in [y1, y2, y3, y4, y5],
+        in_season_year not in [y1, y2, y3],
+    )
+    present[:, 0] &= ytd_allowed & (ips[:, 0] >= 5)   # minimum threshold — noise below this
+    ips = np.where(present, ips, 0.0)
+
+    # Comeback year de-emphasis:
+    # If a blend year immediately follows a fully missed season (0 IP / absent from data)
+    # AND that comeback year had < 100 IP (still partial/rusty), halve its effective weight.
+    # Full-season comebacks (e.g. Rodon 2025: 180 IP) are NOT affected.
+    COMEBACK_IP_THRESHOLD = 100
+    COMEBACK_WEIGHT_FACTOR = 0.5
+    for j, year in enumerate(blend_years):
+        if year is None or (year - 1) not in pitching_by_year:
+            continue  # Can't confirm a miss without prior-year data
+        prev = _first_by_fgid(pitching_by_year[year - 1])
+        prev_ip = (prev["IP"] if "IP" in prev.columns else pd.Series(0.0, index=prev.index)).reindex(fgids)
+        fully_missed = ~np.isin(fgids, prev.index.values) | (prev_ip.astype(float).values == 0)
+        comeback = present[:, j] & (ips[:, j] != 0) & ~(ips[:, j] >= COMEBACK_IP_THRESHOLD) & fully_missed
+        ips[:, j] = np.where(comeback, ips[:, j] * COMEBACK_WEIGHT_FACTOR, ips[:, j])
+
+    blended = _blend_rates_array(
+        rates, present, ips,
+        weights=weights,
+        lg_avg=np.array([LG_AVG_PITCH[col] for col in PITCH_RATE_COLS]),
+        full_season=cfg.ip_full_season,
+        min_sample=20.0,
+        config=cfg,
+    )
+    blended = pd.DataFrame(blended, columns=PITCH_RATE_COLS)
+
+    age     = base_df["age"].astype(float).values
+    age_mod = _age_modifier_array(age, is_pitcher=True, config=cfg)
+
+    # Apply age to K and ER rates
+    adjusted = blended.copy()
+    adjusted["k_per_ip"]  = blended["k_per_ip"]  * age_mod
+    adjusted["bb_per_ip"] = blended["bb_per_ip"] * (2.0 - age_mod)  # walk rate rises with age
+    adjusted["er_per_ip"] = blended["er_per_ip"] * (2.0 - age_mod)
+
+    # Clip to reasonable ranges
+    adjusted["k_per_ip"]  = adjusted["k_per_ip"].clip(0.30, 1.60)
+    adjusted["bb_per_ip"] = adjusted["bb_per_ip"].clip(0.10, 0.70)
+    adjusted["h_per_ip"]  = adjusted["h_per_ip"].clip(0.50, 1.30)
+    adjusted["er_per_ip"] = adjusted["er_per_ip"].clip(0.20, 0.80)
+    adjusted["ip_per_gs"] = adjusted["ip_per_gs"].clip(3.0,  7.5)
+    adjusted["ip_per_app"] = adjusted["ip_per_app"].clip(0.20, 1.50)
+    adjusted["qs_per_gs"] = adjusted["qs_per_gs"].clip(0.0, 0.80)
+    adjusted["w_per_gs"]  = adjusted["w_per_gs"].clip(0.0, 0.50)
+
+    # Role (SP or RP) — prefer MLB position data if available
+    fg_role = np.array([str(r) for r in base_df["role"]], dtype=object)
+    if "mlb_position" in base_df.columns:
+        mlb_pos = np.array([str(p).upper() for p in base_df["mlb_position"]], dtype=object)
+    else:
+        mlb_pos = np.array([r.upper() for r in fg_role], dtype=object)
+    role = np.where(np.isin(mlb_pos, ["SP", "RP"]), mlb_pos, fg_role)
+
+    # Park factor is inverse for pitchers (pitcher-friendly = better)
+    # For multi-team players FanGraphs uses "- - -"; fall back to prior years for a real team
+    park_abbrev = _fallback_team(
+        base_df.get("team_norm", pd.Series("", index=base_df.index)),
+        fgids, pitching_by_year, [y2, y3],
+    )
+    park_factor_pitcher = [2.0 - cfg.park_factors.get(t, 1.00) for t in park_abbrev]   # invert: COL 1.15 → 0.85
+
+    result_df = pd.DataFrame({
+        "mlbam_id":     base_df["mlbam_id"].astype(int).values,
+        "fgid":         fgids,
+        "name":         [str(n) for n in base_df.get("Name", pd.Series("", index=base_df.index))],
+        "age":          age,
+        "age_mod":      age_mod,
+        "mlb_team":     park_abbrev,
+        "park_factor":  park_factor_pitcher,
+        "role":         role,
+        "mlb_position": mlb_pos,
+    })
+    for col in PITCH_RATE_COLS:
+        result_df[col] = adjusted[col].round(6).values
 
-    result_df = pd.DataFrame(rows).drop_duplicates(subset=["mlbam_id"], keep="first").set_index("mlbam_id")
+    result_df = result_df.drop_duplicates(subset=["mlbam_id"], keep="first").set_index("mlbam_id")
     print(f"    Pitcher talent: {len(result_df):,} pitchers estimated.")
     return result_df
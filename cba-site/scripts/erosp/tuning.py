@@ -0,0 +1,110 @@
+"""
+Search spaces for tuning the EROSPConfig parameter set (erosp/config.py).
+
+A trial is a dict of EROSPConfig field overrides; make_config() turns it into
+a config via dataclasses.replace(), which the stage functions take as
+`config=`. Nothing module-level changes, so any number of trials can run side
+by side — in one process or across a process pool.
+
+SEARCH_SPACE describes the tunable fields:
+  (lo, hi)      continuous range — grid search takes grid_points evenly
+                spaced values, random search draws uniformly
+  [a, b, ...]   discrete choices (e.g. candidate blend-weight vectors)
+
+A grid over the whole space is 4 × 3^9 ≈ 79k trials at 3 points, so grid
+search defaults to GRID_PARAMS and is capped at MAX_GRID_TRIALS.
+"""
+
+import dataclasses
+import itertools
+import random
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .config import DEFAULT_CONFIG, EROSPConfig
+
+SEARCH_SPACE: Dict[str, object] = {
+    "blend_weights_5yr": [
+        (0.50, 0.30, 0.20, 0.05, 0.05),   # current (Fix 2)
+        (0.55, 0.30, 0.15, 0.00, 0.00),
+        (0.45, 0.30, 0.15, 0.05, 0.05),
+        (0.40, 0.30, 0.20, 0.05, 0.05),
+    ],
+    "mean_regression_high":        (0.05, 0.25),
+    "mean_regression_low":         (0.25, 0.50),
+    "age_growth_rate":             (0.000, 0.020),
+    "age_decline_early":           (0.005, 0.020),
+    "age_decline_late":            (0.015, 0.040),
+    "age_pitcher_decline_mult":    (1.0, 1.8),
+    "xwoba_damp":                  (0.2, 0.8),
+    "sigmoid_tau":                 (0.15, 0.50),
+    "replacement_pool_multiplier": (1.0, 2.0),
+}
+
+# Grid search covers these unless told otherwise (27 trials at 3 points)
+GRID_PARAMS = ("xwoba_damp", "sigmoid_tau", "replacement_pool_multiplier")
+MAX_GRID_TRIALS = 1000
+
+
+def _check_names(names: Sequence[str]) -> None:
+    fields = {f.name for f in dataclasses.fields(EROSPConfig)}
+    unknown = [n for n in names if n not in fields]
+    if unknown:
+        raise ValueError(f"Not EROSPConfig fields: {unknown}")
+
+
+def make_config(params: Dict[str, object], base: Optional[EROSPConfig] = None) -> EROSPConfig:
+    """`base` (default DEFAULT_CONFIG) with the fields in `params` replaced."""
+    _check_names(list(params))
+    return dataclasses.replace(base or DEFAULT_CONFIG, **params)
+
+
+def current_values(names: Sequence[str]) -> Dict[str, object]:
+    """The DEFAULT_CONFIG values of `names`."""
+    _check_names(names)
+    return {n: getattr(DEFAULT_CONFIG, n) for n in names}
+
+
+def _axis(spec, grid_points: int) -> List[object]:
+    if isinstance(spec, tuple):
+        lo, hi = spec
+        return [round(float(v), 6) for v in np.linspace(lo, hi, grid_points)]
+    return list(spec)
+
+
+def grid_size(space: Dict[str, object], grid_points: int = 3) -> int:
+    """Number of trials grid_trials(space, grid_points) would return."""
+    return int(np.prod([len(_axis(spec, grid_points)) for spec in space.values()]))
+
+
+def grid_trials(space: Dict[str, object], grid_points: int = 3,
+                max_trials: int = MAX_GRID_TRIALS) -> List[Dict[str, object]]:
+    """
+    Every combination of the space's values (ranges → grid_points values
+    each). Raises ValueError past max_trials — narrow the space or use
+    random_trials instead.
+    """
+    size = grid_size(space, grid_points)
+    if size > max_trials:
+        raise ValueError(f"grid of {size:,} trials exceeds {max_trials:,} — search fewer "
+                         f"parameters or grid points, or use random search")
+    names = list(space)
+    axes = [_axis(space[n], grid_points) for n in names]
+    return [dict(zip(names, combo)) for combo in itertools.product(*axes)]
+
+
+def random_trials(space: Dict[str, object], n: int,
+                  seed: Optional[int] = None) -> List[Dict[str, object]]:
+    """`n` independent draws: uniform over ranges, uniform choice among discrete values."""
+    rng = random.Random(seed)
+    trials = []
+    for _ in range(n):
+        trial: Dict[str, object] = {}
+        for name, spec in space.items():
+            if isinstance(spec, tuple):
+                trial[name] = round(rng.uniform(*spec), 6)
+            else:
+                trial[name] = spec[rng.randrange(len(spec))]
+        trials.append(trial)
+    return trials
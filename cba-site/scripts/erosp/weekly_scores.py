@@ -0,0 +1,265 @@
+"""
+Columnar store for ESPN weekly player scores.
+
+fetch-weekly-player-scores.ts writes data/current/weekly-player-scores-<season>.json
+as week → team → players dicts (~3 MB by midseason), so answering "points for
+player X in weeks 3–7" means parsing all of it. This module flattens it into
+one row per player-team-week and saves plain column arrays in a single
+compressed .npz under erosp_cache/:
+
+  player / teamId / week / weekPoints / activePoints / benchPoints /
+  activeDays / benchDays / primarySlotId      one entry per row
+  points_by_slot                              rows × slot_ids (NaN = slot not used)
+  week_numbers + week_offsets                 rows are sorted by week, so a
+                                              week range is one contiguous slice
+  player_ids + player_offsets + player_rows   CSR index: every row of a player
+  player_names / player_positions             latest spelling per player
+
+np.load reads (and inflates) .npz members lazily, so load_weekly_scores()
+only touches the columns a caller asks for. The store records a hash of the JSON it was built
+from and is rebuilt automatically whenever the JSON changes.
+
+Usage:
+    df = load_weekly_scores(2026, columns=["weekPoints"], weeks=range(3, 8),
+                            players=["32801"])
+
+    python -m erosp.weekly_scores --season 2026      # (re)build explicitly
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .ingest import CACHE_DIR, DATA_DIR
+
+SCHEMA_VERSION = 1
+
+ROW_COLUMNS = {
+    "teamId":        np.int16,
+    "week":          np.int16,
+    "weekPoints":    np.float64,
+    "activePoints":  np.float64,
+    "benchPoints":   np.float64,
+    "activeDays":    np.int8,
+    "benchDays":     np.int8,
+    "primarySlotId": np.int16,
+}
+PLAYER_COLUMNS = ("playerName", "position")
+DEFAULT_COLUMNS = ("teamId", "week", "weekPoints", "activePoints", "benchPoints",
+                   "activeDays", "pointsBySlot")
+
+
+def weekly_scores_json_path(season: int) -> Path:
+    return DATA_DIR / f"weekly-player-scores-{season}.json"
+
+
+def weekly_scores_store_path(season: int) -> Path:
+    return CACHE_DIR / f"weekly_scores_{season}.npz"
+
+
+def _source_hash(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()[:24]
+
+
+def _csr(codes: np.ndarray, n: int):
+    """Row numbers grouped by code (stable, so each group stays in week order) + offsets."""
+    rows = np.argsort(codes, kind="stable")
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(codes, minlength=n), out=offsets[1:])
+    return rows, offsets
+
+
+def write_weekly_scores(json_path: Path, out_path: Path) -> Optional[Path]:
+    """Flatten the weekly JSON at json_path into the columnar store at out_path."""
+    try:
+        raw = Path(json_path).read_bytes()
+        data = json.loads(raw)
+    except (OSError, ValueError) as exc:
+        print(f"    WARNING: Could not read weekly scores {json_path} ({exc}).")
+        return None
+
+    records: List[dict] = []
+    slot_points: List[dict] = []
+    for week_key in sorted(data.get("weeks", {}), key=int):
+        for team in data["weeks"][week_key]:
+            for p in team.get("players", []):
+                records.append({
+                    "playerId":      str(p.get("playerId", "")),
+                    "playerName":    p.get("playerName", ""),
+                    "position":      p.get("position", ""),
+                    "teamId":        team.get("teamId", 0),
+                    "week":          team.get("week", int(week_key)),
+                    "weekPoints":    p.get("weekPoints", 0),
+                    "activePoints":  p.get("activePoints", 0),
+                    "benchPoints":   p.get("benchPoints", 0),
+                    "activeDays":    p.get("activeDays", 0),
+                    "benchDays":     p.get("benchDays", 0),
+                    "primarySlotId": p.get("primarySlotId", -1),
+                })
+                slot_points.append(p.get("pointsBySlot") or {})
+
+    df = pd.DataFrame.from_records(records, columns=["playerId", *PLAYER_COLUMNS, *ROW_COLUMNS])
+    df = df.fillna({c: 0 for c in ROW_COLUMNS})
+    order = np.argsort(df["week"].to_numpy(np.int64), kind="stable")
+    df = df.iloc[order].reset_index(drop=True)
+    slot_points = [slot_points[i] for i in order]
+
+    player_codes, player_ids = pd.factorize(df["playerId"], sort=True)
+    n_players = len(player_ids)
+    player_rows, player_offsets = _csr(player_codes, n_players)
+    last_row = player_rows[np.maximum(player_offsets[1:] - 1, 0)] if n_players else player_rows
+
+    weeks = df["week"].to_numpy(np.int64)
+    week_numbers = np.unique(weeks)
+    week_offsets = np.searchsorted(weeks, np.append(week_numbers, np.iinfo(np.int64).max))
+
+    slot_ids = np.array(sorted({int(s) for d in slot_points for s in d}), dtype=np.int16)
+    slot_col = {int(s): j for j, s in enumerate(slot_ids)}
+    points_by_slot = np.full((len(df), len(slot_ids)), np.nan)
+    for i, d in enumerate(slot_points):
+        for s, pts in d.items():
+            points_by_slot[i, slot_col[int(s)]] = pts
+
+    arrays = {col: df[col].to_numpy(dtype) for col, dtype in ROW_COLUMNS.items()}
+    arrays.update({
+        "player":           player_codes.astype(np.int32),
+        "player_ids":       np.asarray(player_ids, dtype=str),
+        "player_names":     df["playerName"].to_numpy(str)[last_row],
+        "player_positions": df["position"].to_numpy(str)[last_row],
+        "player_rows":      player_rows.astype(np.int32),
+        "player_offsets":   player_offsets,
+        "week_numbers":     week_numbers.astype(np.int16),
+        "week_offsets":     week_offsets.astype(np.int64),
+        "slot_ids":         slot_ids,
+        "points_by_slot":   points_by_slot,
+        "schema":           np.array(SCHEMA_VERSION),
+        "season":           np.array(int(data.get("season", 0))),
+        "source_hash":      np.array(_source_hash(raw)),
+    })
+
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out_path.with_suffix(".tmp.npz")
+    np.savez_compressed(tmp, **arrays)
+    tmp.replace(out_path)
+    print(f"    Weekly scores store: {len(df):,} player-weeks, {n_players:,} players, "
+          f"{len(week_numbers)} weeks → {out_path.name}")
+    return out_path
+
+
+def _open_store(season: int, json_path: Optional[Path], store_path: Optional[Path]):
+    """Open the store for `season`, rebuilding it first if missing or built from other JSON."""
+    json_path  = Path(json_path or weekly_scores_json_path(season))
+    store_path = Path(store_path or weekly_scores_store_path(season))
+
+    source_hash = _source_hash(json_path.read_bytes()) if json_path.exists() else None
+    if store_path.exists():
+        store = np.load(store_path)
+        fresh = (int(store["schema"]) == SCHEMA_VERSION
+                 and (source_hash is None or str(store["source_hash"]) == source_hash))
+        if fresh:
+            return store
+        store.close()
+    if source_hash is None:
+        print(f"    WARNING: {json_path.name} not found; no weekly scores available.")
+        return None
+    if write_weekly_scores(json_path, store_path) is None:
+        return None
+    return np.load(store_path)
+
+
+def _lookup(keys: np.ndarray, wanted: np.ndarray) -> np.ndarray:
+    """Positions in sorted `keys` of the entries of `wanted` that are present."""
+    pos = np.searchsorted(keys, wanted)
+    hit = pos < len(keys)
+    hit[hit] = keys[pos[hit]] == wanted[hit]
+    return pos[hit]
+
+
+def _gather(offsets: np.ndarray, groups: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+    """Concatenate the CSR groups `groups` (as row numbers, or entries of `rows`)."""
+    if len(groups) == 0:
+        return np.zeros(0, dtype=np.int64)
+    idx = np.concatenate([np.arange(offsets[g], offsets[g + 1]) for g in groups])
+    return idx if rows is None else rows[idx]
+
+
+def _select_rows(store, weeks: Optional[Iterable[int]], players: Optional[Iterable]) -> Optional[np.ndarray]:
+    """Row numbers (sorted) matching the week and player filters; None = every row."""
+    rows = None
+    if weeks is not None:
+        wanted = np.unique(np.fromiter((int(w) for w in weeks), dtype=np.int64))
+        found = _lookup(store["week_numbers"], wanted)
+        rows = _gather(store["week_offsets"], found)
+    if players is not None:
+        player_ids = store["player_ids"]
+        wanted = np.unique(np.array([str(p) for p in players], dtype=player_ids.dtype))
+        found = _lookup(player_ids, wanted)
+        by_player = np.sort(_gather(store["player_offsets"], found, store["player_rows"]))
+        rows = by_player if rows is None else np.intersect1d(rows, by_player)
+    return rows
+
+
+def load_weekly_scores(
+    season: int = 2026,
+    columns: Optional[Iterable[str]] = None,
+    weeks: Optional[Iterable[int]] = None,
+    players: Optional[Iterable] = None,
+    json_path: Optional[Path] = None,
+    store_path: Optional[Path] = None,
+) -> pd.DataFrame:
+    """
+    Per-player-week rows for the requested weeks and ESPN player IDs (None = all).
+
+    Always includes playerId; `columns` picks from ROW_COLUMNS, PLAYER_COLUMNS
+    and "pointsBySlot" ({slotId: points}), default DEFAULT_COLUMNS. Only the
+    requested arrays are read from disk. Rows are in week order.
+    """
+    columns = list(DEFAULT_COLUMNS if columns is None else columns)
+    unknown = [c for c in columns if c not in ROW_COLUMNS and c not in PLAYER_COLUMNS
+               and c != "pointsBySlot"]
+    if unknown:
+        raise ValueError(f"Unknown weekly score column(s): {unknown}")
+
+    store = _open_store(season, json_path, store_path)
+    if store is None:
+        return pd.DataFrame(columns=["playerId", *columns])
+
+    with store:
+        rows = _select_rows(store, weeks, players)
+
+        def take(a: np.ndarray) -> np.ndarray:
+            return a if rows is None else a[rows]
+
+        player = take(store["player"])
+        out = {"playerId": store["player_ids"][player]}
+        for col in columns:
+            if col in ROW_COLUMNS:
+                out[col] = take(store[col])
+            elif col == "playerName":
+                out[col] = store["player_names"][player]
+            elif col == "position":
+                out[col] = store["player_positions"][player]
+            else:
+                slot_ids = store["slot_ids"].tolist()
+                out[col] = [
+                    {s: float(v) for s, v in zip(slot_ids, r) if not np.isnan(v)}
+                    for r in take(store["points_by_slot"])
+                ]
+    return pd.DataFrame(out, columns=["playerId", *columns])
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the columnar weekly player scores store")
+    parser.add_argument("--season", type=int, default=2026)
+    parser.add_argument("--out", type=Path, default=None,
+                        help="Output .npz (default: erosp_cache/weekly_scores_<season>.npz)")
+    args = parser.parse_args()
+    write_weekly_scores(weekly_scores_json_path(args.season),
+                        args.out or weekly_scores_store_path(args.season))
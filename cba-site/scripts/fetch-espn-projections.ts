@@ -22,10 +22,26 @@ interface ProjectedPlayer {
   position: string;
   eligiblePositions: string[];  // all ESPN-eligible positions
   projectedFP: number;
+  projectedPA?: number;  // hitters: projected plate appearances
+  projectedIP?: number;  // pitchers: projected innings
   teamId: number;        // fantasy team (0 = free agent)
   fantasyTeamName: string;
 }
 
+// ESPN stat IDs: 16 = PA, 34 = outs pitched (IP = outs / 3). The EROSP
+// ensemble divides projectedFP by these, not by its own playing-time model.
+function projectedOpportunities(
+  projStat: Record<string, unknown> | undefined
+): Pick<ProjectedPlayer, 'projectedPA' | 'projectedIP'> {
+  const counts = (projStat?.stats ?? {}) as Record<string, number>;
+  const pa = counts['16'] ?? 0;
+  const outs = counts['34'] ?? 0;
+  return {
+    ...(pa > 0 ? { projectedPA: Math.round(pa) } : {}),
+    ...(outs > 0 ? { projectedIP: Math.round((outs / 3) * 10) / 10 } : {}),
+  };
+}
+
 function extractProjectedStats(
   teams: Record<string, unknown>[],
   teamNames: Record<number, string>
@@ -74,6 +90,7 @@ function extractProjectedStats(
         position,
         eligiblePositions,
         projectedFP: Math.round(projectedFP * 10) / 10,
+        ...projectedOpportunities(projStat as Record<string, unknown> | undefined),
         teamId: fantasyTeamId,
         fantasyTeamName,
       });
@@ -151,6 +168,7 @@ async function fetchFreeAgentProjections(
         position,
         eligiblePositions,
         projectedFP: Math.round(projectedFP * 10) / 10,
+        ...projectedOpportunities(projStat as Record<string, unknown> | undefined),
         teamId: 0,
         fantasyTeamName: 'Free Agent',
         eligiblePositions,
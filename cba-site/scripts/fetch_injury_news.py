@@ -4,38 +4,60 @@ fetch_injury_news.py — Scrapes injury news from multiple sources.
 Option A: RSS feeds (CBS Sports injuries)
 Option B: HTML scraping (Rotowire, FantasyPros)
 
-Returns a daily-cached map of normalized_player_name -> {text, source, date}
+Responses are parsed as they stream in — XMLPullParser for RSS, an
+incremental html.parser tokenizer for the scraped pages — and items flow
+through a generator pipeline (extract → keyword / name filter → collect)
+that stops at the first item older than the newest one already cached for
+that source, closing the connection without reading the rest of the page.
+
+Returns a map of normalized player name (erosp.names.normalize)
+-> {text, source, date}
 that patch_injury_status.py merges into data/erosp/latest.json as `injury_news`.
 
-Run time: ~5-10 seconds (3-4 HTTP requests + parse).
+Sources are fetched concurrently (a run takes as long as the slowest source,
+not the sum) and cached separately under erosp_cache/injury_news_sources/ for
+SOURCE_TTL_SECONDS. An expired source is revalidated with If-None-Match /
+If-Modified-Since, so an unchanged page costs a 304 and no parse; a failed
+source falls back to its last good items. Per-source status and latency of
+every run are appended to erosp_cache/injury_news_timings.jsonl, which keeps
+the last TIMINGS_MAX_LINES entries.
+
+Run time: bounded by the slowest source (12–15 s timeouts), ~0 s within the TTL.
 Called by patch_injury_status.py — not meant to be run standalone.
 
-Dependencies: requests, beautifulsoup4
-  pip install requests beautifulsoup4
+Dependencies: requests
+  pip install requests
 """
 
+import codecs
 import datetime
 import json
 import re
-import unicodedata
+import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from email.utils import parsedate
+from html.parser import HTMLParser
 from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     raise ImportError("requests not installed: pip install requests")
 
-try:
-    from bs4 import BeautifulSoup
-    BS4_AVAILABLE = True
-except ImportError:
-    BS4_AVAILABLE = False
+from erosp.names import normalize
 
 SCRIPTS_DIR = Path(__file__).parent
 CACHE_DIR = SCRIPTS_DIR / "erosp_cache"
 CACHE_DIR.mkdir(exist_ok=True)
+SOURCE_CACHE_DIR = CACHE_DIR / "injury_news_sources"
+TIMINGS_LOG      = CACHE_DIR / "injury_news_timings.jsonl"
+
+SOURCE_TTL_SECONDS = 3600   # re-check a source at most hourly
+MAX_WORKERS        = 4
+TIMINGS_MAX_LINES  = 1000   # ~2 months of 4×-daily runs over 4 sources
 
 HEADERS = {
     "User-Agent": (
@@ -49,22 +71,11 @@ HEADERS = {
 
 # Max chars to store per news blurb — long enough to be useful, short enough for JSON
 NEWS_MAX_CHARS = 400
+# Cached items older than this are dropped when a source is re-fetched
+NEWS_MAX_AGE_DAYS = 21
 
 # ─────────────────────────────────────────────────────────────────
-# Name normalization (mirrors EROSP pipeline)
-# ─────────────────────────────────────────────────────────────────
-
-def normalize_name(name: str) -> str:
-    """Lowercase alphanumeric only, strip accents and suffixes."""
-    name = unicodedata.normalize("NFKD", name)
-    name = name.encode("ascii", "ignore").decode("ascii")
-    name = re.sub(r"\s+(jr\.?|sr\.?|ii|iii|iv)\.?\s*$", "", name, flags=re.IGNORECASE)
-    name = re.sub(r"[^a-z0-9]", "", name.lower())
-    return name.strip()
-
-
-# ─────────────────────────────────────────────────────────────────
-# Source A — RSS feeds
+# Injury keywords / headline parsing
 # ─────────────────────────────────────────────────────────────────
 
 INJURY_KEYWORDS = {
@@ -126,267 +137,468 @@ def _parse_rss_date(pub_date: str) -> str:
     return today
 
 
-def fetch_rss_injuries() -> dict:
-    """Option A: Fetch injury-related items from RSS feeds.
-    Returns {normalized_name: {text, source, date}}.
-    """
-    result: dict = {}
-    today = datetime.date.today().isoformat()
+# ─────────────────────────────────────────────────────────────────
+# Streaming readers — items are parsed as the body downloads
+# ─────────────────────────────────────────────────────────────────
 
-    for source_name, feed_url in RSS_FEEDS:
-        try:
-            resp = requests.get(feed_url, headers=HEADERS, timeout=12)
-            if resp.status_code != 200:
-                print(f"  {source_name} RSS: HTTP {resp.status_code}")
-                continue
+STREAM_CHUNK_BYTES = 16384
 
-            root = ET.fromstring(resp.content)
-            items = root.findall(".//item")
-            count = 0
 
-            for item in items:
-                title   = (item.findtext("title")       or "").strip()
-                desc    = (item.findtext("description") or "").strip()
-                pub_raw = (item.findtext("pubDate")     or today)
+def _iter_chunks(resp, text: bool = False) -> Iterator:
+    """Body chunks of a stream=True response (decoded incrementally if text)."""
+    if not text:
+        yield from resp.iter_content(STREAM_CHUNK_BYTES)
+        return
+    decoder = codecs.getincrementaldecoder(resp.encoding or "utf-8")(errors="replace")
+    for chunk in resp.iter_content(STREAM_CHUNK_BYTES):
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
 
-                combined = f"{title} {desc}".lower()
-                if not any(kw in combined for kw in INJURY_KEYWORDS):
-                    continue
 
-                player_name = _extract_name_from_headline(title)
-                if not player_name:
-                    continue
+def _iter_rss_items(resp) -> Iterator[dict]:
+    """{title, description, pubDate} per <item>, each element freed once read."""
+    parser = ET.XMLPullParser(events=("end",))
+    for chunk in _iter_chunks(resp):
+        parser.feed(chunk)
+        for _, elem in parser.read_events():
+            if elem.tag == "item":
+                yield {k: (elem.findtext(k) or "").strip()
+                       for k in ("title", "description", "pubDate")}
+                elem.clear()
 
-                # Strip HTML from description
-                text = re.sub(r"<[^>]+>", " ", desc).strip()
-                text = re.sub(r"\s{2,}", " ", text)
-                if not text:
-                    text = title
-                text = text[:NEWS_MAX_CHARS]
 
-                date_str = _parse_rss_date(pub_raw)
-                key = normalize_name(player_name)
+_VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input",
+              "link", "meta", "source", "track", "wbr"}
 
-                if key not in result or date_str > result[key]["date"]:
-                    result[key] = {"text": text, "source": source_name, "date": date_str}
-                    count += 1
 
-            print(f"  {source_name} RSS: {count} injury items matched")
+class _Sel(NamedTuple):
+    """Minimal CSS-ish selector: tag name, one class, and/or an href substring."""
+    tag:  Optional[str] = None
+    cls:  Optional[str] = None
+    href: Optional[str] = None
 
-        except ET.ParseError as exc:
-            print(f"  {source_name} RSS XML parse error: {exc}")
-        except Exception as exc:
-            print(f"  {source_name} RSS failed: {exc}")
+    def matches(self, tag: str, attrs: dict) -> bool:
+        return ((self.tag is None or tag == self.tag)
+                and (self.cls is None or self.cls in (attrs.get("class") or "").split())
+                and (self.href is None or self.href in (attrs.get("href") or "")))
 
-    return result
+
+class _AnyOf(tuple):
+    """Selector group sharing one priority (".date, .timestamp"): first match in document order."""
+
+    def matches(self, tag: str, attrs: dict) -> bool:
+        return any(sel.matches(tag, attrs) for sel in self)
+
+
+class _Frame:
+    """One news item being assembled: best capture so far for each field."""
+
+    def __init__(self, lane: int, seq: int):
+        self.lane = lane                        # container selector index; len(containers) = fallback
+        self.seq = seq                          # start-tag order, for document-order output
+        self.best: Dict[str, int] = {}          # field → priority of its capture
+        self.pieces: Dict[str, list] = {}       # field → text nodes
+        self.attr: Dict[str, str] = {}          # field → attribute value (time[datetime])
+        self.has_link = self.has_p = False
+
+
+class _NewsListParser(HTMLParser):
+    """
+    Incremental news-list extractor: feed() HTML chunks, drain() finished
+    {name, text, date} items. Each layout lists container selectors and,
+    per field, selectors in priority order (first match in document order
+    wins within a priority, like BeautifulSoup's select_one / find).
+
+    Containers resolve like `soup.select(a) or soup.select(b) or …`: the
+    highest-priority selector present anywhere in the page wins, and every
+    element it matches is an item. Items of the top selector are emitted as
+    soon as they close; items of lower selectors (and of the fallback — any
+    li/div… holding a player link and a <p>) are buffered until the page
+    ends, since a better selector may still turn up.
+    """
+
+    def __init__(self, layout: dict):
+        super().__init__(convert_charrefs=True)
+        self.layout = layout
+        self._fallback = len(layout["containers"])
+        self._stack: List[tuple] = []           # (tag, frames opened here, captures started here)
+        self._frames: List[_Frame] = []
+        self._captures: List[tuple] = []        # active (frame, field, priority)
+        self._lane = self._fallback             # best container selector seen so far
+        self._pending: List[tuple] = []         # (seq, item) of self._lane, not yet emitted
+        self._seq = 0
+        self._done: List[dict] = []
+        self._in_text = False
+
+    def drain(self) -> List[dict]:
+        out, self._done = self._done, []
+        return out
+
+    def handle_starttag(self, tag, attrs):
+        self._in_text = False
+        attrs = dict(attrs)
+        opened = []
+        for i, sel in enumerate(self.layout["containers"][:self._lane + 1]):
+            if sel.matches(tag, attrs):
+                if i < self._lane:
+                    self._lane, self._pending = i, []
+                opened.append(_Frame(i, self._seq))
+        if self._lane == self._fallback and tag in self.layout["fallback_tags"]:
+            opened.append(_Frame(self._fallback, self._seq))
+        self._seq += 1
+
+        # Only descendants count toward a frame's fields, as with select_one / find
+        started = []
+        for f in self._frames:
+            if f.lane > self._lane:
+                continue
+            if self.layout["player_link"].matches(tag, attrs):
+                f.has_link = True
+            if tag == "p":
+                f.has_p = True
+            for field, sels in self.layout["fields"].items():
+                for prio, sel in enumerate(sels):
+                    if prio >= f.best.get(field, len(sels)):
+                        break
+                    if sel.matches(tag, attrs):
+                        f.best[field] = prio
+                        f.pieces[field] = []
+                        if attrs.get("datetime"):
+                            f.attr[field] = attrs["datetime"]
+                        else:
+                            f.attr.pop(field, None)
+                        started.append((f, field, prio))
+                        break
+        self._frames.extend(opened)
+        if tag in _VOID_TAGS:
+            for frame in opened:
+                self._close_frame(frame)
+            return
+        self._captures.extend(started)
+        self._stack.append((tag, opened, started))
+
+    def handle_endtag(self, tag):
+        self._in_text = False
+        if not any(t == tag for t, _, _ in self._stack):
+            return
+        while self._stack:
+            t, opened, started = self._stack.pop()
+            for cap in started:
+                self._captures.remove(cap)
+            for frame in opened:
+                self._close_frame(frame)
+            if t == tag:
+                break
+
+    def handle_data(self, data):
+        # A text node can arrive in several calls when it spans a chunk boundary
+        for f, field, prio in self._captures:
+            if f.best[field] == prio:       # a better match nested inside supersedes
+                pieces = f.pieces[field]
+                if self._in_text and pieces:
+                    pieces[-1] += data
+                else:
+                    pieces.append(data)
+        self._in_text = True
+
+    def handle_comment(self, data):
+        self._in_text = False
+
+    def close(self):
+        super().close()
+        while self._stack:
+            self.handle_endtag(self._stack[-1][0])
+        self._emit()
+
+    def _close_frame(self, frame: _Frame) -> None:
+        self._frames.remove(frame)
+        if frame.lane != self._lane:
+            return
+        if frame.lane == self._fallback and not (frame.has_link and frame.has_p):
+            return
+        if "name" in frame.best and "text" in frame.best:
+            pieces = {k: [p.strip() for p in v if p.strip()] for k, v in frame.pieces.items()}
+            self._pending.append((frame.seq, {
+                "name": "".join(pieces["name"]),
+                "text": " ".join(pieces["text"]),
+                "date": frame.attr.get("date") or "".join(pieces.get("date", [])),
+            }))
+        # Nothing outranks the first selector — emit once no enclosing item is open
+        if self._lane == 0 and not any(f.lane == 0 for f in self._frames):
+            self._emit()
+
+    def _emit(self) -> None:
+        self._done.extend(item for _, item in sorted(self._pending, key=lambda p: p[0]))
+        self._pending = []
+
+
+def _iter_html_items(resp, layout: dict) -> Iterator[dict]:
+    parser = _NewsListParser(layout)
+    for chunk in _iter_chunks(resp, text=True):
+        parser.feed(chunk)
+        yield from parser.drain()
+    parser.close()
+    yield from parser.drain()
 
 
 # ─────────────────────────────────────────────────────────────────
-# Source B1 — Rotowire
+# Source A — RSS feeds
 # ─────────────────────────────────────────────────────────────────
 
-def fetch_rotowire_news() -> dict:
-    """Option B: Scrape Rotowire MLB injury news page.
+def _rss_entries(items: Iterable[dict], source_name: str) -> Iterator[tuple]:
+    """RSS items → (normalized_name, {text, source, date}) for injury items."""
+    for item in items:
+        title, desc = item["title"], item["description"]
+        combined = f"{title} {desc}".lower()
+        if not any(kw in combined for kw in INJURY_KEYWORDS):
+            continue
+
+        player_name = _extract_name_from_headline(title)
+        if not player_name:
+            continue
+
+        # Strip HTML from description
+        text = re.sub(r"<[^>]+>", " ", desc).strip()
+        text = re.sub(r"\s{2,}", " ", text)
+        if not text:
+            text = title
+        text = text[:NEWS_MAX_CHARS]
+
+        date_str = _parse_rss_date(item["pubDate"] or datetime.date.today().isoformat())
+        yield normalize(player_name), {"text": text, "source": source_name, "date": date_str}
+
+
+def parse_rss_injuries(source_name: str, resp, since: str = "") -> dict:
+    """Option A: injury-related items from one RSS feed response, stopping at
+    the first item older than `since`.
     Returns {normalized_name: {text, source, date}}.
     """
-    if not BS4_AVAILABLE:
-        print("  Rotowire: skipped (beautifulsoup4 not installed)")
-        return {}
+    result = _collect(_rss_entries(_iter_rss_items(resp), source_name), since)
+    print(f"  {source_name} RSS: {len(result)} injury items matched")
+    return result
 
-    url = "https://www.rotowire.com/baseball/injury-news.php"
-    try:
-        resp = requests.get(url, headers=HEADERS, timeout=15)
-        if resp.status_code != 200:
-            print(f"  Rotowire: HTTP {resp.status_code}")
-            return {}
-    except Exception as exc:
-        print(f"  Rotowire fetch failed: {exc}")
-        return {}
 
-    soup = BeautifulSoup(resp.text, "html.parser")
-    today = datetime.date.today().isoformat()
-    result: dict = {}
+# ─────────────────────────────────────────────────────────────────
+# Source B — scraped news pages (Rotowire, FantasyPros)
+# ─────────────────────────────────────────────────────────────────
 
-    # Rotowire renders news as a list; try likely container selectors in order
-    items = (
-        soup.select("li.news-list__item")
-        or soup.select(".player-news__item")
-        or soup.select(".news-item")
-        or soup.select("article")
-    )
+ROTOWIRE_URL = "https://www.rotowire.com/baseball/injury-news.php"
+FANTASYPROS_URL = "https://www.fantasypros.com/mlb/news/injuries/"
+
+# Rotowire renders news as a list; FantasyPros wraps each article in a container
+ROTOWIRE_LAYOUT = {
+    "containers":    [_Sel("li", "news-list__item"), _Sel(cls="player-news__item"),
+                      _Sel(cls="news-item"), _Sel("article")],
+    "fallback_tags": {"li", "div"},
+    "player_link":   _Sel("a", href="/baseball/player/"),
+    "fields": {
+        "name": [_Sel(cls="news-player-name"), _Sel(cls="news-player"),
+                 _Sel("a", href="/baseball/player/")],
+        "text": [_Sel(cls="news-item__text"), _Sel(cls="news-body"),
+                 _Sel(cls="news-content"), _Sel("p")],
+        "date": [_Sel("time"), _Sel(cls="news-timestamp")],
+    },
+    "max_name_len": 60,
+}
+FANTASYPROS_LAYOUT = {
+    "containers":    [_Sel(cls="news-item"), _Sel("article"),
+                      _Sel(cls="article-item"), _Sel(cls="player-news-item")],
+    "fallback_tags": {"div", "article"},
+    "player_link":   _Sel("a", href="/mlb/players/"),
+    "fields": {
+        "name": [_Sel("a", href="/mlb/players/"), _Sel(cls="player-name"),
+                 _Sel("h4"), _Sel("h3")],
+        "text": [_Sel(cls="news-item__body"), _Sel(cls="article-body"),
+                 _Sel(cls="news-content"), _Sel("p")],
+        "date": [_Sel("time"),
+                 _AnyOf((_Sel(cls="date"), _Sel(cls="timestamp"), _Sel(cls="article-date")))],
+    },
+    "max_name_len": 50,
+}
 
-    if not items:
-        # Fallback: look for any div/li containing a player link + paragraph
-        items = [
-            el for el in soup.find_all(["li", "div"])
-            if el.find("a", href=re.compile(r"/baseball/player/"))
-            and el.find("p")
-        ]
 
-    count = 0
+def _page_entries(items: Iterable[dict], source_name: str, max_name_len: int) -> Iterator[tuple]:
+    """Scraped items → (normalized_name, {text, source, date})."""
+    today = datetime.date.today().isoformat()
     for item in items:
-        # Player name — prefer explicit class, fall back to first player link
-        name_el = (
-            item.select_one(".news-player-name")
-            or item.select_one(".news-player")
-            or item.find("a", href=re.compile(r"/baseball/player/"))
-        )
-        if not name_el:
-            continue
-        player_name = name_el.get_text(strip=True)
-        if not player_name or len(player_name) > 60:
+        player_name = item["name"]
+        if not player_name or len(player_name) > max_name_len:
             continue
-
-        # News text — prefer dedicated body class, fall back to first <p>
-        text_el = (
-            item.select_one(".news-item__text")
-            or item.select_one(".news-body")
-            or item.select_one(".news-content")
-            or item.find("p")
-        )
-        if not text_el:
-            continue
-        news_text = text_el.get_text(" ", strip=True)
+        news_text = item["text"]
         if len(news_text) < 20:
             continue
+        # Could be "2026-03-29" or "Mar 29" or "3/29/2026"
+        m = re.search(r"(\d{4}-\d{2}-\d{2})", item["date"])
+        date_str = m.group(1) if m else today
+        yield normalize(player_name), {
+            "text": news_text[:NEWS_MAX_CHARS],
+            "source": source_name,
+            "date": date_str,
+        }
+
+
+def parse_news_page(source_name: str, layout: dict, resp, since: str = "") -> dict:
+    """Option B: player news from a scraped page, stopping at the first item
+    older than `since`.
+    Returns {normalized_name: {text, source, date}}.
+    """
+    entries = _page_entries(_iter_html_items(resp, layout), source_name, layout["max_name_len"])
+    result = _collect(entries, since)
+    print(f"  {source_name}: {len(result)} player news items")
+    return result
+
 
-        # Date
-        date_str = today
-        date_el = item.find("time") or item.select_one(".news-timestamp")
-        if date_el:
-            dt = date_el.get("datetime", "") or date_el.get_text(strip=True)
-            if dt:
-                # Could be "2026-03-29" or "Mar 29" or "3/29/2026"
-                m = re.search(r"(\d{4}-\d{2}-\d{2})", dt)
-                if m:
-                    date_str = m.group(1)
-
-        key = normalize_name(player_name)
-        if key not in result or date_str > result[key]["date"]:
-            result[key] = {
-                "text": news_text[:NEWS_MAX_CHARS],
-                "source": "Rotowire",
-                "date": date_str,
-            }
-            count += 1
-
-    print(f"  Rotowire: {count} player news items")
+def _collect(entries: Iterable[tuple], since: str) -> dict:
+    """Newest entry per player; stops at the first entry older than `since`
+    (pages list newest first, and older items are already in the source cache)."""
+    result: dict = {}
+    for key, entry in entries:
+        if since and entry["date"] < since:
+            break
+        if key not in result or entry["date"] > result[key]["date"]:
+            result[key] = entry
     return result
 
 
 # ─────────────────────────────────────────────────────────────────
-# Source B2 — FantasyPros
+# Per-source fetch — TTL cache + conditional revalidation
 # ─────────────────────────────────────────────────────────────────
 
-def fetch_fantasypros_news() -> dict:
-    """Option B: Scrape FantasyPros MLB injury news page.
-    Returns {normalized_name: {text, source, date}}.
-    """
-    if not BS4_AVAILABLE:
-        print("  FantasyPros: skipped (beautifulsoup4 not installed)")
-        return {}
+# (source, url, parser(resp, since) → items, timeout) in merge order
+NEWS_SOURCES = [
+    ("Rotowire",    ROTOWIRE_URL,
+     lambda resp, since: parse_news_page("Rotowire", ROTOWIRE_LAYOUT, resp, since), 15),
+    ("FantasyPros", FANTASYPROS_URL,
+     lambda resp, since: parse_news_page("FantasyPros", FANTASYPROS_LAYOUT, resp, since), 15),
+] + [
+    (name, url, lambda resp, since, name=name: parse_rss_injuries(name, resp, since), 12)
+    for name, url in RSS_FEEDS
+]
+
+
+def _source_cache_path(source: str) -> Path:
+    return SOURCE_CACHE_DIR / f"{re.sub(r'[^a-z0-9]+', '_', source.lower())}.json"
+
 
-    url = "https://www.fantasypros.com/mlb/news/injuries/"
+def _load_source_cache(source: str) -> dict:
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=15)
-        if resp.status_code != 200:
-            print(f"  FantasyPros: HTTP {resp.status_code}")
-            return {}
-    except Exception as exc:
-        print(f"  FantasyPros fetch failed: {exc}")
+        with open(_source_cache_path(source)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
         return {}
 
-    soup = BeautifulSoup(resp.text, "html.parser")
-    today = datetime.date.today().isoformat()
-    result: dict = {}
 
-    # FantasyPros wraps each article in a distinct container
-    articles = (
-        soup.select(".news-item")
-        or soup.select("article")
-        or soup.select(".article-item")
-        or soup.select(".player-news-item")
-    )
+def _save_source_cache(source: str, cache: dict) -> None:
+    SOURCE_CACHE_DIR.mkdir(exist_ok=True)
+    with open(_source_cache_path(source), "w") as f:
+        json.dump(cache, f)
 
-    if not articles:
-        articles = [
-            el for el in soup.find_all(["div", "article"])
-            if el.find("a", href=re.compile(r"/mlb/players/"))
-            and el.find("p")
-        ]
-
-    count = 0
-    for article in articles:
-        # Player name — prefer player link, then h3/h4
-        name_el = (
-            article.find("a", href=re.compile(r"/mlb/players/"))
-            or article.select_one(".player-name")
-            or article.find("h4")
-            or article.find("h3")
-        )
-        if not name_el:
-            continue
-        player_name = name_el.get_text(strip=True)
-        # Reject if obviously not a name (too long, or contains lowercase run)
-        if not player_name or len(player_name) > 50:
-            continue
 
-        # News text
-        text_el = (
-            article.select_one(".news-item__body")
-            or article.select_one(".article-body")
-            or article.select_one(".news-content")
-            or article.find("p")
-        )
-        if not text_el:
-            continue
-        news_text = text_el.get_text(" ", strip=True)
-        if len(news_text) < 20:
-            continue
+def _merge_items(old: dict, new: dict) -> dict:
+    """Newer entries over cached ones, dropping entries past NEWS_MAX_AGE_DAYS."""
+    cutoff = (datetime.date.today() - datetime.timedelta(days=NEWS_MAX_AGE_DAYS)).isoformat()
+    merged = {k: v for k, v in old.items() if v["date"] >= cutoff}
+    for key, entry in new.items():
+        if key not in merged or entry["date"] >= merged[key]["date"]:
+            merged[key] = entry
+    return merged
 
-        # Date
-        date_str = today
-        date_el = article.find("time") or article.select_one(".date, .timestamp, .article-date")
-        if date_el:
-            dt = date_el.get("datetime", "") or date_el.get_text(strip=True)
-            m = re.search(r"(\d{4}-\d{2}-\d{2})", dt)
-            if m:
-                date_str = m.group(1)
-
-        key = normalize_name(player_name)
-        if key not in result or date_str > result[key]["date"]:
-            result[key] = {
-                "text": news_text[:NEWS_MAX_CHARS],
-                "source": "FantasyPros",
-                "date": date_str,
-            }
-            count += 1
-
-    print(f"  FantasyPros: {count} player news items")
-    return result
+
+def _fetch_source(session, source: str, url: str, parse, timeout: float):
+    """
+    Items for one source: from its cache within the TTL, else a conditional
+    streamed GET (304 keeps the cached items; a 200 is parsed only down to
+    the newest date already cached). Failures fall back to the last good items.
+    Returns (items, timing).
+    """
+    cache = _load_source_cache(source)
+    now = time.time()
+    if "items" in cache and now - cache.get("fetched_at", 0) < SOURCE_TTL_SECONDS:
+        return cache["items"], {"source": source, "status": "cached", "latency_s": 0.0}
+
+    headers = dict(HEADERS)
+    if "items" in cache and cache.get("etag"):
+        headers["If-None-Match"] = cache["etag"]
+    if "items" in cache and cache.get("last_modified"):
+        headers["If-Modified-Since"] = cache["last_modified"]
+    old_items = cache.get("items", {})
+    since = max((e["date"] for e in old_items.values()), default="")
+
+    t0 = time.perf_counter()
+    try:
+        with session.get(url, headers=headers, timeout=timeout, stream=True) as resp:
+            if resp.status_code == 304 and "items" in cache:
+                status = "not-modified"
+            elif resp.status_code == 200:
+                cache["items"] = _merge_items(old_items, parse(resp, since))
+                cache["etag"] = resp.headers.get("ETag")
+                cache["last_modified"] = resp.headers.get("Last-Modified")
+                status = "fetched"
+            else:
+                raise RuntimeError(f"HTTP {resp.status_code}")
+    except Exception as exc:
+        latency = round(time.perf_counter() - t0, 3)
+        stale = cache.get("items", {})
+        print(f"  {source}: failed after {latency:.1f}s ({exc})"
+              + (f" — using {len(stale)} cached items" if stale else ""))
+        return stale, {"source": source, "status": "failed", "latency_s": latency,
+                       "error": str(exc)[:200]}
+
+    latency = round(time.perf_counter() - t0, 3)
+    cache["fetched_at"] = now
+    _save_source_cache(source, cache)
+    if status == "not-modified":
+        print(f"  {source}: not modified ({len(cache['items'])} cached items)")
+    return cache["items"], {"source": source, "status": status, "latency_s": latency}
+
+
+def _log_timings(timings: list, max_lines: int = TIMINGS_MAX_LINES) -> None:
+    """Append this run's per-source timings, keeping only the last max_lines."""
+    at = datetime.datetime.utcnow().isoformat() + "Z"
+    lines = [json.dumps({"at": at, **t}) + "\n" for t in timings]
+    try:
+        with open(TIMINGS_LOG) as f:
+            lines = f.readlines() + lines
+    except OSError:
+        pass
+    tmp = TIMINGS_LOG.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        f.writelines(lines[-max_lines:])
+    tmp.replace(TIMINGS_LOG)
 
 
 # ─────────────────────────────────────────────────────────────────
-# Main entry — merge all sources, cache daily
+# Main entry — fetch all sources concurrently, merge
 # ─────────────────────────────────────────────────────────────────
 
 def fetch_all_injury_news(season: int) -> dict:
-    """Fetch from all sources, deduplicate, cache daily.
+    """Fetch from all sources, deduplicate.
 
     Priority: Rotowire > FantasyPros > RSS (in recency order).
-    Returns {normalized_player_name: {text, source, date}}.
+    Returns {normalized_player_name: {text, source, date}}. The merged map is
+    also written to erosp_cache/injury_news_<season>_<date>.json, which
+    compute_erosp.py reads for its day-to-day supplement.
     """
     today = datetime.date.today()
     cache_path = CACHE_DIR / f"injury_news_{season}_{today.strftime('%Y%m%d')}.json"
 
-    if cache_path.exists():
-        print(f"  Cache hit → {cache_path.name}")
-        with open(cache_path) as f:
-            return json.load(f)
-
-    print("  Fetching injury news (Rotowire + FantasyPros + RSS)…")
-
-    # Rotowire is highest quality — fetch first, others fill gaps
+    sources = NEWS_SOURCES
+    print(f"  Fetching injury news ({', '.join(s[0] for s in sources)})…")
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+    session.mount("https://", adapter)
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = [pool.submit(_fetch_source, session, name, url, parse, timeout)
+                   for name, url, parse, timeout in sources]
+        results = [f.result() for f in futures]
+    timings = [timing for _, timing in results]
+    _log_timings(timings)
+    print("  Sources: " + ", ".join(f"{t['source']} {t['status']} {t['latency_s']:.1f}s"
+                                    for t in timings)
+          + f" (wall {time.perf_counter() - t0:.1f}s)")
+
+    # Rotowire is highest quality — merged first, others fill gaps
     combined: dict = {}
     source_priority = {"Rotowire": 3, "FantasyPros": 2, "CBS Sports": 1, "ESPN": 1}
 
@@ -404,9 +616,8 @@ def fetch_all_injury_news(season: int) -> dict:
                 ):
                     combined[key] = entry
 
-    _merge(fetch_rotowire_news())
-    _merge(fetch_fantasypros_news())
-    _merge(fetch_rss_injuries())
+    for items, _ in results:
+        _merge(items)
 
     print(f"  Combined: {len(combined)} unique player news items across all sources")
 
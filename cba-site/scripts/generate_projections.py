@@ -11,67 +11,34 @@ Generates projected fantasy points for the upcoming MLB season using:
 
 Usage:
     python generate_projections.py
+    python generate_projections.py --season 2026 --no-plot
+    python generate_projections.py --format csv,json --output-dir /tmp/proj
+        # json → /tmp/proj/fantasy_projections_<season>.json, in the
+        # data/projections/<season>.json layout (copy it there to update the site)
+    python generate_projections.py --cache-dir /tmp/projection_cache
+
+As a library (nothing is fetched or printed at import):
+    from generate_projections import run_projections
+    proj = run_projections(season=2026, formats=(), plot=False)
 
 Requirements:
-    pip install pybaseball pandas numpy matplotlib requests
+    pip install pybaseball pandas numpy requests pyarrow
+    pip install matplotlib   # only for the scatter plot
 """
 
-import os
+import argparse
+import json
 import sys
-import time
 import datetime
 import warnings
 from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import pandas as pd
 import numpy as np
 
 warnings.filterwarnings("ignore")
 
-try:
-    import requests
-except ImportError:
-    print("ERROR: requests not installed. Run: pip install requests")
-    sys.exit(1)
-
-try:
-    import pybaseball
-    from pybaseball import (
-        batting_stats,
-        statcast_batter_expected_stats,
-        statcast_sprint_speed,
-        chadwick_register,
-    )
-    pybaseball.cache.enable()
-except ImportError:
-    print("ERROR: pybaseball not installed. Run: pip install pybaseball pandas numpy")
-    sys.exit(1)
-
-
-# ──────────────────────────────────────────────────────────────────────────────
-# DYNAMIC YEAR LOGIC
-# ──────────────────────────────────────────────────────────────────────────────
-
-today = datetime.date.today()
-current_year = today.year
-current_month = today.month
-
-if current_month >= 11:          # November / December → project next year
-    TARGET_SEASON = current_year + 1
-    HISTORICAL_YEARS = [current_year, current_year - 1, current_year - 2]
-else:                            # January – October → project current year
-    TARGET_SEASON = current_year
-    HISTORICAL_YEARS = [current_year - 1, current_year - 2, current_year - 3]
-
-Y1, Y2, Y3 = HISTORICAL_YEARS   # Y1 = most recent completed, Y3 = oldest
-
-print(f"\n{'='*65}")
-print(f"  Fantasy Baseball Projection System")
-print(f"{'='*65}")
-print(f"  Projecting for {TARGET_SEASON} season using data from {Y1}, {Y2}, and {Y3}.")
-print(f"  Run date: {today.strftime('%B %d, %Y')}")
-print(f"{'='*65}\n")
-
 
 # ──────────────────────────────────────────────────────────────────────────────
 # CONFIGURATION
@@ -129,45 +96,77 @@ LEAGUE_AVG_PITCH_FP = 280.0  # Approximate average fantasy points for a qualifie
 MIN_PA  = 200                # Minimum PA qualifier for batting_stats() pull
 MIN_IP  = 30                 # Minimum IP qualifier for pitching_stats() pull
 
+OUTPUT_FORMATS = ("csv", "json", "parquet")
+
 # ──────────────────────────────────────────────────────────────────────────────
 # PATHS
 # ──────────────────────────────────────────────────────────────────────────────
 
 SCRIPT_DIR = Path(__file__).parent
 CACHE_DIR  = SCRIPT_DIR / "projection_cache"
-CACHE_DIR.mkdir(exist_ok=True)
+HIST_DIR   = SCRIPT_DIR.parent / "data" / "historical"
+
+sys.path.insert(0, str(SCRIPT_DIR))
+from erosp.cache import DataCache
+from erosp.ingest import (
+    cached_frame, load_id_index, fetch_player_info,
+    fetch_statcast_xwoba, fetch_sprint_speed,
+)
+from erosp.names import normalize, normalize_many
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # UTILITY FUNCTIONS
 # ──────────────────────────────────────────────────────────────────────────────
 
-def retry_fetch(func, *args, max_retries=3, delay=3, label="", **kwargs):
-    """Call func(*args, **kwargs) with retries and delay on failure."""
-    for attempt in range(max_retries):
-        try:
-            result = func(*args, **kwargs)
-            if result is not None:
-                return result
-        except Exception as exc:
-            if attempt < max_retries - 1:
-                print(f"    Attempt {attempt+1} failed ({exc}). Retrying in {delay}s…")
-                time.sleep(delay)
-            else:
-                print(f"    All {max_retries} attempts failed for {label or func.__name__}: {exc}")
-    return None
+def resolve_years(season: Optional[int] = None,
+                  today: Optional[datetime.date] = None) -> Tuple[int, List[int]]:
+    """
+    (TARGET_SEASON, [Y1, Y2, Y3]) — Y1 = most recent completed, Y3 = oldest.
+    Without an explicit season: November / December → project next year,
+    January – October → project the current year.
+    """
+    today = today or datetime.date.today()
+    if season is None:
+        season = today.year + 1 if today.month >= 11 else today.year
+    return season, [season - 1, season - 2, season - 3]
 
 
-def cached_fetch(cache_path: Path, fetch_func, *args, label="", **kwargs):
-    """Load DataFrame from CSV cache if it exists, otherwise fetch and cache."""
-    if cache_path.exists():
-        print(f"    Cache hit  → {cache_path.name}")
-        return pd.read_csv(cache_path, low_memory=False)
-    print(f"    Fetching   → {cache_path.name}")
-    df = retry_fetch(fetch_func, *args, label=label, **kwargs)
-    if df is not None and not df.empty:
-        df.to_csv(cache_path, index=False)
-    return df
+def _enable_pybaseball() -> None:
+    try:
+        import pybaseball
+    except ImportError:
+        raise RuntimeError("pybaseball not installed. Run: pip install pybaseball pandas numpy")
+    pybaseball.cache.enable()
+
+
+def seed_legacy_cache(cache: DataCache, cache_dir: Path) -> int:
+    """
+    Import CSVs left by the old one-file-per-fetch cache (batting_stats_2025.csv
+    etc. in `cache_dir`) into `cache` under the keys load_batting & co. use.
+    Seeds count as expired: online runs refetch them once, offline runs fall
+    back to them. Returns the number imported.
+    """
+    from pybaseball import (batting_stats, pitching_stats, chadwick_register,
+                            statcast_batter_expected_stats, statcast_sprint_speed)
+
+    cache_dir = Path(cache_dir)
+    seeded = int(cache.seed_csv(cache_dir / "chadwick_register.csv", chadwick_register,
+                                label="chadwick_register"))
+    per_year = (
+        ("batting_stats",  batting_stats,                  {"qual": MIN_PA}),
+        ("pitching_stats", pitching_stats,                 {"qual": MIN_IP}),
+        ("statcast_xwoba", statcast_batter_expected_stats, {"minPA": 25}),
+        ("sprint_speed",   statcast_sprint_speed,          {"min_opp": 0}),
+    )
+    for stem, func, kwargs in per_year:
+        for path in sorted(cache_dir.glob(f"{stem}_*.csv")):
+            year = path.stem.rsplit("_", 1)[-1]
+            if year.isdigit():
+                seeded += cache.seed_csv(path, func, int(year), label=f"{stem}({year})", **kwargs)
+    if seeded:
+        print(f"  Seeded {seeded} frame(s) from legacy CSVs in {cache_dir.name}/.")
+    return seeded
 
 
 def normalize_team(team_raw) -> str:
@@ -225,796 +224,589 @@ def calc_pitcher_fantasy_points(df: pd.DataFrame) -> pd.Series:
     )
 
 
-# ──────────────────────────────────────────────────────────────────────────────
-# STEP 1 — CHADWICK REGISTER (cross-ID mapping + birthdates)
-# ──────────────────────────────────────────────────────────────────────────────
-
-print("─── Step 1: Chadwick player registry ───────────────────────────")
-chad_cache = CACHE_DIR / "chadwick_register.csv"
-chad_raw = cached_fetch(chad_cache, chadwick_register, label="chadwick_register")
-
-if chad_raw is None or chad_raw.empty:
-    print("  ERROR: Could not load Chadwick register. Exiting.")
-    sys.exit(1)
-
-id_map = chad_raw[["key_fangraphs", "key_mlbam"]].copy().dropna(subset=["key_fangraphs", "key_mlbam"])
-id_map["key_fangraphs"] = pd.to_numeric(id_map["key_fangraphs"], errors="coerce")
-id_map["key_mlbam"]     = pd.to_numeric(id_map["key_mlbam"],     errors="coerce")
-id_map = id_map.dropna(subset=["key_fangraphs", "key_mlbam"])
-id_map["key_fangraphs"] = id_map["key_fangraphs"].astype(int)
-id_map["key_mlbam"]     = id_map["key_mlbam"].astype(int)
-id_map = id_map.drop_duplicates(subset=["key_fangraphs"])
-print(f"  {len(id_map):,} player ID mappings loaded.\n")
-
-
-def fetch_player_info(mlbam_ids: list[int]) -> pd.DataFrame:
-    """Fetch birth dates + primary position from MLB Stats API in batches of 200.
-    Cache is incrementally updated — new IDs are fetched and merged in."""
-    cache_path = CACHE_DIR / "mlb_player_info.csv"
-
-    # Load existing cache
-    if cache_path.exists():
-        cached = pd.read_csv(cache_path)
-        cached_ids = set(cached["mlbam_id"].dropna().astype(int).tolist())
-        new_ids = [x for x in mlbam_ids if x not in cached_ids]
-        if not new_ids:
-            print("    Cache hit  → mlb_player_info.csv")
-            return cached
-        print(f"    Cache hit  → mlb_player_info.csv; fetching {len(new_ids):,} new IDs…")
-    else:
-        cached = pd.DataFrame()
-        new_ids = mlbam_ids
-        print(f"    Fetching player info for {len(new_ids):,} players from MLB Stats API…")
-
-    rows = []
-    batch_size = 200
-    for i in range(0, len(new_ids), batch_size):
-        batch = new_ids[i:i + batch_size]
-        ids_str = ",".join(str(x) for x in batch)
-        url = (f"https://statsapi.mlb.com/api/v1/people?personIds={ids_str}"
-               f"&fields=people,id,birthDate,primaryPosition,abbreviation")
-        try:
-            resp = requests.get(url, timeout=15)
-            if resp.status_code == 200:
-                for person in resp.json().get("people", []):
-                    row: dict = {"mlbam_id": person["id"]}
-                    bd = person.get("birthDate", "")
-                    if bd:
-                        parts = bd.split("-")
-                        if len(parts) == 3:
-                            row["birth_year"]  = int(parts[0])
-                            row["birth_month"] = int(parts[1])
-                            row["birth_day"]   = int(parts[2])
-                    pos = person.get("primaryPosition", {}).get("abbreviation", "")
-                    row["mlb_position"] = pos
-                    rows.append(row)
-            time.sleep(0.2)
-        except Exception as exc:
-            print(f"    Warning: batch {i//batch_size + 1} failed ({exc})")
-
-    if rows:
-        new_df = pd.DataFrame(rows)
-        df = pd.concat([cached, new_df], ignore_index=True) if not cached.empty else new_df
-        df.to_csv(cache_path, index=False)
-        print(f"    {len(rows):,} new players fetched and cached (total: {len(df):,}).")
-        return df
-
-    return cached if not cached.empty else pd.DataFrame()
+def numeric_col(df: pd.DataFrame, col: str) -> np.ndarray:
+    """df[col] as a float array (NaN where missing/non-numeric, all-NaN if absent)."""
+    if col not in df.columns:
+        return np.full(len(df), np.nan)
+    return pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=float)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
-# STEP 2 — BATTING STATISTICS (3 historical seasons)
+# STEPS 2–6 — INPUT DATA
 # ──────────────────────────────────────────────────────────────────────────────
 
-print("─── Step 2: Batting statistics ─────────────────────────────────")
-batting_by_year: dict[int, pd.DataFrame] = {}
-data_available_years: list[int] = []
-
-for year in HISTORICAL_YEARS:
-    print(f"  {year}:")
-    cache_path = CACHE_DIR / f"batting_stats_{year}.csv"
-    df = cached_fetch(cache_path, batting_stats, year, qual=MIN_PA, label=f"batting_stats({year})")
-
-    if df is None or df.empty:
-        print(f"    WARNING: No batting data for {year}. Skipping.")
-        continue
-
-    # Normalize column names (pybaseball versions can differ slightly)
-    df.columns = [c.strip() for c in df.columns]
-
-    required = ["Name", "IDfg", "Team", "G", "PA", "H", "2B", "3B",
-                "HR", "R", "RBI", "SB", "BB"]
-    missing = [c for c in required if c not in df.columns]
-    if missing:
-        print(f"    WARNING: Missing columns {missing} for {year}. Skipping.")
-        continue
-
-    df["IDfg"] = pd.to_numeric(df["IDfg"], errors="coerce")
-    df = df.dropna(subset=["IDfg"])
-    df["IDfg"] = df["IDfg"].astype(int)
-
-    # Pull wOBA (column name varies)
-    for woba_col in ["wOBA", "woba", "wOBA_x", "woba_x"]:
-        if woba_col in df.columns:
-            df["wOBA"] = pd.to_numeric(df[woba_col], errors="coerce")
-            break
-    else:
-        df["wOBA"] = np.nan
-
-    df["fantasy_points"] = calc_fantasy_points(df)
-    df["year"] = year
-    batting_by_year[year] = df
-    data_available_years.append(year)
-    print(f"    {len(df):,} qualified players loaded.")
-
-if not data_available_years:
-    print("\nERROR: No batting data could be loaded. Exiting.")
-    sys.exit(1)
-
-# If the most-recent year is unavailable, shift the Y1/Y2/Y3 references back
-if Y1 not in batting_by_year:
-    available = sorted(batting_by_year.keys(), reverse=True)
-    old_y1 = Y1
-    Y1 = available[0] if len(available) > 0 else None
-    Y2 = available[1] if len(available) > 1 else None
-    Y3 = available[2] if len(available) > 2 else None
-    print(f"\n  WARNING: {old_y1} data not available. Shifted references → {Y1}, {Y2}, {Y3}")
-    print(f"  NOTE: Output filename will reflect this (projections based on older data).\n")
+def load_batting(years: List[int], cache: DataCache) -> Dict[int, pd.DataFrame]:
+    """Step 2: year → qualified batters with wOBA and fantasy_points."""
+    from pybaseball import batting_stats
 
-print()
+    print("─── Step 2: Batting statistics ─────────────────────────────────")
+    batting_by_year: Dict[int, pd.DataFrame] = {}
 
+    for year in years:
+        print(f"  {year}:")
+        df = cached_frame(batting_stats, year, qual=MIN_PA, season=year,
+                          label=f"batting_stats({year})", cache=cache)
 
-# ──────────────────────────────────────────────────────────────────────────────
-# STEP 3 — STATCAST EXPECTED STATS (xwOBA)
-# ──────────────────────────────────────────────────────────────────────────────
-
-print("─── Step 3: Statcast xwOBA ──────────────────────────────────────")
-xwoba_by_year: dict[int, pd.DataFrame] = {}
-
-for year in [Y1, Y2]:
-    if year is None:
-        continue
-    print(f"  {year}:")
-    cache_path = CACHE_DIR / f"statcast_xwoba_{year}.csv"
-    df = cached_fetch(
-        cache_path,
-        statcast_batter_expected_stats,
-        year,
-        minPA=25,
-        label=f"statcast_expected({year})"
-    )
+        if df is None or df.empty:
+            print(f"    WARNING: No batting data for {year}. Skipping.")
+            continue
 
-    if df is None or df.empty:
-        print(f"    WARNING: No xwOBA data for {year}.")
-        continue
+        # Normalize column names (pybaseball versions can differ slightly)
+        df.columns = [c.strip() for c in df.columns]
 
-    df.columns = [c.strip() for c in df.columns]
+        required = ["Name", "IDfg", "Team", "G", "PA", "H", "2B", "3B",
+                    "HR", "R", "RBI", "SB", "BB"]
+        missing = [c for c in required if c not in df.columns]
+        if missing:
+            print(f"    WARNING: Missing columns {missing} for {year}. Skipping.")
+            continue
 
-    # Normalize column names across Baseball Savant API versions
-    rename_map = {}
-    for src, dst in [("player_id", "mlbam_id"),
-                     ("est_woba",  "xwOBA"),
-                     ("woba",      "wOBA_savant")]:
-        if src in df.columns:
-            rename_map[src] = dst
-    df = df.rename(columns=rename_map)
+        df["IDfg"] = pd.to_numeric(df["IDfg"], errors="coerce")
+        df = df.dropna(subset=["IDfg"])
+        df["IDfg"] = df["IDfg"].astype(int)
 
-    if "xwOBA" not in df.columns:
-        print(f"    WARNING: xwOBA column not found for {year}. Skipping.")
-        continue
+        # Pull wOBA (column name varies)
+        for woba_col in ["wOBA", "woba", "wOBA_x", "woba_x"]:
+            if woba_col in df.columns:
+                df["wOBA"] = pd.to_numeric(df[woba_col], errors="coerce")
+                break
+        else:
+            df["wOBA"] = np.nan
 
-    df["mlbam_id"] = pd.to_numeric(df.get("mlbam_id", pd.Series(dtype=float)), errors="coerce")
-    df = df.dropna(subset=["mlbam_id"])
-    df["mlbam_id"] = df["mlbam_id"].astype(int)
+        df["fantasy_points"] = calc_fantasy_points(df)
+        df["year"] = year
+        batting_by_year[year] = df
+        print(f"    {len(df):,} qualified players loaded.")
 
-    keep = ["mlbam_id", "xwOBA"]
-    if "wOBA_savant" in df.columns:
-        keep.append("wOBA_savant")
-    xwoba_by_year[year] = df[keep].copy()
-    print(f"    {len(df):,} players loaded.")
+    return batting_by_year
 
-print()
 
+def load_pitching(years: List[int], cache: DataCache) -> Dict[int, pd.DataFrame]:
+    """Year → qualified pitchers with fantasy_points (for Step 11b)."""
+    from pybaseball import pitching_stats
 
-# ──────────────────────────────────────────────────────────────────────────────
-# STEP 4 — SPRINT SPEED
-# ──────────────────────────────────────────────────────────────────────────────
+    pitch_by_year: Dict[int, pd.DataFrame] = {}
+    for year in years:
+        print(f"  {year}:")
+        df = cached_frame(pitching_stats, year, qual=MIN_IP, season=year,
+                          label=f"pitching_stats({year})", cache=cache)
+        if df is None or df.empty:
+            print(f"    WARNING: No pitching data for {year}.")
+            continue
+        df.columns = [c.strip() for c in df.columns]
+        df["IDfg"] = pd.to_numeric(df.get("IDfg", pd.Series(dtype=float)), errors="coerce")
+        df = df.dropna(subset=["IDfg"])
+        df["IDfg"] = df["IDfg"].astype(int)
+        df["fantasy_points"] = calc_pitcher_fantasy_points(df)
+        df["year"] = year
+        pitch_by_year[year] = df
+        print(f"    {len(df):,} qualified pitchers loaded.")
+    return pitch_by_year
 
-print(f"─── Step 4: Sprint speed ({Y1}) ─────────────────────────────────")
-speed_df = None
-
-if Y1:
-    cache_path = CACHE_DIR / f"sprint_speed_{Y1}.csv"
-    raw_speed = cached_fetch(
-        cache_path,
-        statcast_sprint_speed,
-        Y1,
-        min_opp=0,
-        label=f"sprint_speed({Y1})"
-    )
 
-    if raw_speed is not None and not raw_speed.empty and "sprint_speed" in raw_speed.columns:
-        raw_speed["player_id"] = pd.to_numeric(
-            raw_speed.get("player_id", pd.Series(dtype=float)), errors="coerce"
-        )
-        raw_speed = raw_speed.dropna(subset=["player_id"])
-        raw_speed["player_id"] = raw_speed["player_id"].astype(int)
-
-        # Compute percentile from the raw speed distribution
-        raw_speed["speed_pct"] = raw_speed["sprint_speed"].rank(pct=True) * 100
-        speed_df = raw_speed[["player_id", "sprint_speed", "speed_pct"]].copy()
-        league_med = speed_df["sprint_speed"].median()
-        print(f"  {len(speed_df):,} players. League median: {league_med:.1f} ft/sec")
+def estimate_league_sb(batting_by_year: Dict[int, pd.DataFrame], y1: Optional[int]) -> int:
+    """Step 5: league-wide stolen bases in Y1, scaled up from qualified players."""
+    print(f"─── Step 5: League SB total ({y1}) ──────────────────────────────")
+    if y1 and y1 in batting_by_year:
+        qual_sb = batting_by_year[y1]["SB"].sum()
+        # Qualified players (200+ PA) represent ~72% of league SB total
+        league_sb = int(qual_sb / 0.72)
+        print(f"  Qualified SB: {qual_sb:,}  →  Estimated league total: {league_sb:,}\n")
     else:
-        print(f"  WARNING: Sprint speed data unavailable for {Y1}.")
+        league_sb = 3000   # Conservative estimate for a high-SB era
+        print(f"  Using fallback estimate: {league_sb:,}\n")
+    return league_sb
 
-print()
-
-
-# ──────────────────────────────────────────────────────────────────────────────
-# STEP 5 — LEAGUE-WIDE STOLEN BASES (Y1)
-# ──────────────────────────────────────────────────────────────────────────────
-
-print(f"─── Step 5: League SB total ({Y1}) ──────────────────────────────")
-if Y1 and Y1 in batting_by_year:
-    qual_sb = batting_by_year[Y1]["SB"].sum()
-    # Qualified players (200+ PA) represent ~72% of league SB total
-    league_sb = int(qual_sb / 0.72)
-    print(f"  Qualified SB: {qual_sb:,}  →  Estimated league total: {league_sb:,}\n")
-else:
-    league_sb = 3000   # Conservative estimate for a high-SB era
-    print(f"  Using fallback estimate: {league_sb:,}\n")
-
-
-# ──────────────────────────────────────────────────────────────────────────────
-# STEP 6 — PLAYING TIME PROJECTIONS
-# ──────────────────────────────────────────────────────────────────────────────
 
-print(f"─── Step 6: Playing time projections ({TARGET_SEASON}) ──────────")
-proj_pa_map: dict[int, float] = {}
-using_pt_fallback = False
+def load_playing_time(batting_by_year: Dict[int, pd.DataFrame], y1: Optional[int],
+                      target_season: int) -> Tuple[Dict[int, float], bool]:
+    """Step 6: ({IDfg: projected PA}, using_fallback) — Steamer, else Y1 actual PA."""
+    print(f"─── Step 6: Playing time projections ({target_season}) ──────────")
+    proj_pa_map: Dict[int, float] = {}
+    using_pt_fallback = False
 
-# Attempt to pull Steamer projections from Fangraphs API
-try:
-    steamer_url = (
-        "https://www.fangraphs.com/api/projections"
-        "?type=steamer&stats=bat&pos=all&team=0&players=0&lg=all"
-    )
-    resp = requests.get(
-        steamer_url, timeout=12,
-        headers={"User-Agent": "Mozilla/5.0 (compatible; FantasyProjections/1.0)"}
-    )
-    if resp.status_code == 200:
-        proj_data = resp.json()
-        if proj_data and isinstance(proj_data, list) and len(proj_data) > 50:
-            proj_df = pd.DataFrame(proj_data)
-            if "PA" in proj_df.columns and "playerid" in proj_df.columns:
-                proj_df["playerid"] = pd.to_numeric(proj_df["playerid"], errors="coerce")
-                proj_df["PA"]       = pd.to_numeric(proj_df["PA"],       errors="coerce")
-                proj_pa_map = dict(
-                    zip(proj_df["playerid"].dropna().astype(int),
-                        proj_df["PA"].fillna(0))
-                )
-                print(f"  Steamer projections loaded: {len(proj_pa_map):,} players.")
+    # Attempt to pull Steamer projections from Fangraphs API
+    try:
+        import requests
+        steamer_url = (
+            "https://www.fangraphs.com/api/projections"
+            "?type=steamer&stats=bat&pos=all&team=0&players=0&lg=all"
+        )
+        resp = requests.get(
+            steamer_url, timeout=12,
+            headers={"User-Agent": "Mozilla/5.0 (compatible; FantasyProjections/1.0)"}
+        )
+        if resp.status_code == 200:
+            proj_data = resp.json()
+            if proj_data and isinstance(proj_data, list) and len(proj_data) > 50:
+                proj_df = pd.DataFrame(proj_data)
+                if "PA" in proj_df.columns and "playerid" in proj_df.columns:
+                    proj_df["playerid"] = pd.to_numeric(proj_df["playerid"], errors="coerce")
+                    proj_df["PA"]       = pd.to_numeric(proj_df["PA"],       errors="coerce")
+                    proj_pa_map = dict(
+                        zip(proj_df["playerid"].dropna().astype(int),
+                            proj_df["PA"].fillna(0))
+                    )
+                    print(f"  Steamer projections loaded: {len(proj_pa_map):,} players.")
+                else:
+                    raise ValueError("Expected columns (PA, playerid) not found in Steamer data.")
             else:
-                raise ValueError("Expected columns (PA, playerid) not found in Steamer data.")
+                raise ValueError("Empty or undersized Steamer response.")
         else:
-            raise ValueError("Empty or undersized Steamer response.")
-    else:
-        raise ValueError(f"HTTP {resp.status_code}")
+            raise ValueError(f"HTTP {resp.status_code}")
 
-except Exception as exc:
-    print(f"  Steamer projections unavailable: {exc}")
-    print(f"  FALLBACK: Using {Y1} actual PA (capped at 700).")
-    using_pt_fallback = True
-    if Y1 and Y1 in batting_by_year:
-        for _, row in batting_by_year[Y1].iterrows():
-            proj_pa_map[int(row["IDfg"])] = min(float(row["PA"]), 700.0)
+    except Exception as exc:
+        print(f"  Steamer projections unavailable: {exc}")
+        print(f"  FALLBACK: Using {y1} actual PA (capped at 700).")
+        using_pt_fallback = True
+        if y1 and y1 in batting_by_year:
+            y1_bat = batting_by_year[y1]
+            proj_pa_map = dict(zip(y1_bat["IDfg"].astype(int),
+                                   y1_bat["PA"].astype(float).clip(upper=700.0)))
 
-print()
+    print()
+    return proj_pa_map, using_pt_fallback
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # STEP 7 — BUILD MASTER PLAYER DATASET
 # ──────────────────────────────────────────────────────────────────────────────
 
-print("─── Step 7: Building master dataset ────────────────────────────")
-
-if Y1 not in batting_by_year:
-    print("ERROR: Primary year data missing. Cannot build projections.")
-    sys.exit(1)
-
-# Base = Y1 batting stats
-base = batting_by_year[Y1].copy()
-base = base.rename(columns={
-    "fantasy_points": "fp_y1",
-    "PA": "pa_y1",
-    "Team": "team_y1",
-    "wOBA": "woba_y1",
-})
-
-# Merge Y2
-if Y2 and Y2 in batting_by_year:
-    y2 = (batting_by_year[Y2][["IDfg", "fantasy_points", "PA", "wOBA"]]
-          .rename(columns={"fantasy_points": "fp_y2",
-                            "PA": "pa_y2",
-                            "wOBA": "woba_y2"}))
-    base = base.merge(y2, on="IDfg", how="left")
-else:
-    base["fp_y2"] = np.nan
-    base["pa_y2"] = np.nan
-    base["woba_y2"] = np.nan
-
-# Merge Y3
-if Y3 and Y3 in batting_by_year:
-    y3 = (batting_by_year[Y3][["IDfg", "fantasy_points", "PA"]]
-          .rename(columns={"fantasy_points": "fp_y3", "PA": "pa_y3"}))
-    base = base.merge(y3, on="IDfg", how="left")
-else:
-    base["fp_y3"] = np.nan
-    base["pa_y3"] = np.nan
-
-# Add MLBAM ID from Chadwick
-base = base.merge(
-    id_map[["key_fangraphs", "key_mlbam"]],
-    left_on="IDfg", right_on="key_fangraphs",
-    how="left"
-)
-base["mlbam_id"] = pd.to_numeric(base["key_mlbam"], errors="coerce")
-
-def norm_name(s: str) -> str:
-    """Normalize player name: collapse spaces after periods (e.g. 'J. T.' → 'J.T.')."""
-    import re
-    return re.sub(r'\.\s+', '.', str(s).strip())
-
-
-# Build a name→MLBAM map from Chadwick for use as a fallback when FG ID lookup fails.
-# Only include names that appear exactly once (avoids same-name collisions).
-_chad_nm = chad_raw[["name_first", "name_last", "key_mlbam"]].copy()
-_chad_nm = _chad_nm.dropna(subset=["name_first", "name_last", "key_mlbam"])
-_chad_nm["key_mlbam"] = pd.to_numeric(_chad_nm["key_mlbam"], errors="coerce")
-_chad_nm = _chad_nm.dropna(subset=["key_mlbam"])
-_chad_nm["key_mlbam"] = _chad_nm["key_mlbam"].astype(int)
-_chad_nm["full_name"] = _chad_nm.apply(
-    lambda r: norm_name(r["name_first"].strip() + " " + r["name_last"].strip()), axis=1)
-_nc = _chad_nm["full_name"].value_counts()
-chad_name_map = (_chad_nm[_chad_nm["full_name"].isin(_nc[_nc == 1].index)]
-                 .set_index("full_name")["key_mlbam"].to_dict())
-print(f"  Chadwick name-fallback map: {len(chad_name_map):,} unambiguous entries.\n")
-
-# Fallback: for players missing MLBAM ID (FG ID not yet in Chadwick, key_fangraphs=-1),
-# resolve via name lookup. Shared by batter and pitcher sections.
-missing_mask = base["mlbam_id"].isna()
-if missing_mask.any():
-    n_resolved = 0
-    for idx in base[missing_mask].index:
-        player_name = norm_name(str(base.at[idx, "Name"]))
-        if player_name in chad_name_map:
-            base.at[idx, "mlbam_id"] = chad_name_map[player_name]
-            n_resolved += 1
-    if n_resolved:
-        print(f"  Name-based Chadwick fallback: resolved MLBAM IDs for {n_resolved} players.")
-    still_missing = base["mlbam_id"].isna().sum()
-    if still_missing:
-        print(f"  {still_missing} players still have no MLBAM ID after name fallback.")
-
-# Fetch birth dates + position from MLB Stats API
-print("  Fetching player info (birth dates + positions)…")
-mlbam_ids = base["mlbam_id"].dropna().astype(int).unique().tolist()
-player_info_df = fetch_player_info(mlbam_ids)
-if not player_info_df.empty:
-    base = base.merge(player_info_df, on="mlbam_id", how="left")
-else:
-    base["birth_year"]   = np.nan
-    base["birth_month"]  = np.nan
-    base["birth_day"]    = np.nan
-    base["mlb_position"] = np.nan
-
-# Merge xwOBA — Y1
-if Y1 in xwoba_by_year:
-    xw = (xwoba_by_year[Y1]
-          .rename(columns={"xwOBA": "xwoba_y1",
-                            "wOBA_savant": "woba_savant_y1"}))
-    base = base.merge(xw, on="mlbam_id", how="left")
-else:
-    base["xwoba_y1"] = np.nan
-    base["woba_savant_y1"] = np.nan
-
-# Merge xwOBA — Y2
-if Y2 and Y2 in xwoba_by_year:
-    xw = (xwoba_by_year[Y2]
-          .rename(columns={"xwOBA": "xwoba_y2",
-                            "wOBA_savant": "woba_savant_y2"}))
-    base = base.merge(xw, on="mlbam_id", how="left")
-else:
-    base["xwoba_y2"] = np.nan
-    base["woba_savant_y2"] = np.nan
-
-# Merge sprint speed
-if speed_df is not None:
+def build_master_dataset(batting_by_year: Dict[int, pd.DataFrame],
+                         years: Tuple[Optional[int], Optional[int], Optional[int]],
+                         id_map: pd.DataFrame, chad_name_map: dict,
+                         xwoba_by_year: Dict[int, pd.DataFrame],
+                         speed_df: Optional[pd.DataFrame],
+                         proj_pa_map: Dict[int, float],
+                         player_info_path: Path) -> pd.DataFrame:
+    """Y1 batters joined with Y2/Y3 history, IDs, bio, xwOBA, speed and projected PA."""
+    print("─── Step 7: Building master dataset ────────────────────────────")
+    y1, y2, y3 = years
+
+    if y1 not in batting_by_year:
+        raise RuntimeError("Primary year data missing. Cannot build projections.")
+
+    # Base = Y1 batting stats
+    base = batting_by_year[y1].copy()
+    base = base.rename(columns={
+        "fantasy_points": "fp_y1",
+        "PA": "pa_y1",
+        "Team": "team_y1",
+        "wOBA": "woba_y1",
+    })
+
+    # Merge Y2
+    if y2 and y2 in batting_by_year:
+        hist = (batting_by_year[y2][["IDfg", "fantasy_points", "PA", "wOBA"]]
+                .rename(columns={"fantasy_points": "fp_y2",
+                                 "PA": "pa_y2",
+                                 "wOBA": "woba_y2"}))
+        base = base.merge(hist, on="IDfg", how="left")
+    else:
+        base["fp_y2"] = np.nan
+        base["pa_y2"] = np.nan
+        base["woba_y2"] = np.nan
+
+    # Merge Y3
+    if y3 and y3 in batting_by_year:
+        hist = (batting_by_year[y3][["IDfg", "fantasy_points", "PA"]]
+                .rename(columns={"fantasy_points": "fp_y3", "PA": "pa_y3"}))
+        base = base.merge(hist, on="IDfg", how="left")
+    else:
+        base["fp_y3"] = np.nan
+        base["pa_y3"] = np.nan
+
+    # Add MLBAM ID from Chadwick
     base = base.merge(
-        speed_df.rename(columns={"player_id": "mlbam_id"}),
-        on="mlbam_id",
+        id_map[["key_fangraphs", "key_mlbam"]],
+        left_on="IDfg", right_on="key_fangraphs",
         how="left"
     )
-    base["speed_pct"] = base["speed_pct"].fillna(50.0)
-else:
-    base["speed_pct"]    = 50.0
-    base["sprint_speed"] = np.nan
-
-# Projected PA (Steamer uses FG IDs; fallback already maps FG IDs too)
-base["proj_pa"] = base["IDfg"].map(proj_pa_map).fillna(base["pa_y1"].clip(upper=700))
-base["proj_pa"] = pd.to_numeric(base["proj_pa"], errors="coerce").clip(lower=0, upper=700).fillna(0)
-
-print(f"  Master dataset: {len(base):,} players.\n")
-
-
-# ──────────────────────────────────────────────────────────────────────────────
-# STEP 8 — AGE CALCULATION
-# ──────────────────────────────────────────────────────────────────────────────
+    base["mlbam_id"] = pd.to_numeric(base["key_mlbam"], errors="coerce")
+    print(f"  Chadwick name-fallback map: {len(chad_name_map):,} unambiguous entries.\n")
+
+    # Fallback: for players missing MLBAM ID (FG ID not yet in Chadwick, key_fangraphs=-1),
+    # resolve via name lookup. Shared by batter and pitcher sections.
+    missing_mask = base["mlbam_id"].isna()
+    if missing_mask.any():
+        resolved = normalize_many(base.loc[missing_mask, "Name"].astype(str)).map(chad_name_map)
+        base.loc[missing_mask, "mlbam_id"] = resolved
+        n_resolved = int(resolved.notna().sum())
+        if n_resolved:
+            print(f"  Name-based Chadwick fallback: resolved MLBAM IDs for {n_resolved} players.")
+        still_missing = base["mlbam_id"].isna().sum()
+        if still_missing:
+            print(f"  {still_missing} players still have no MLBAM ID after name fallback.")
+
+    # Fetch birth dates + position from MLB Stats API
+    print("  Fetching player info (birth dates + positions)…")
+    mlbam_ids = base["mlbam_id"].dropna().astype(int).unique().tolist()
+    player_info_df = fetch_player_info(mlbam_ids, cache_path=player_info_path)
+    if not player_info_df.empty:
+        base = base.merge(player_info_df, on="mlbam_id", how="left")
+    else:
+        base["birth_year"]   = np.nan
+        base["birth_month"]  = np.nan
+        base["birth_day"]    = np.nan
+        base["mlb_position"] = np.nan
+
+    # Merge xwOBA — Y1 / Y2
+    for yr, year in (("y1", y1), ("y2", y2)):
+        if year and year in xwoba_by_year:
+            xw = (xwoba_by_year[year]
+                  .rename(columns={"xwOBA": f"xwoba_{yr}",
+                                   "wOBA_sv": f"woba_savant_{yr}"}))
+            base = base.merge(xw, on="mlbam_id", how="left")
+        else:
+            base[f"xwoba_{yr}"] = np.nan
+            base[f"woba_savant_{yr}"] = np.nan
 
-print(f"─── Step 8: Player ages as of April 1, {TARGET_SEASON} ──────────")
-target_date = datetime.date(TARGET_SEASON, 4, 1)
+    # Merge sprint speed
+    if speed_df is not None:
+        base = base.merge(speed_df, on="mlbam_id", how="left")
+        base["speed_pct"] = base["speed_pct"].fillna(50.0)
+    else:
+        base["speed_pct"]    = 50.0
+        base["sprint_speed"] = np.nan
 
-def calc_age(row) -> float:
-    try:
-        bdate = datetime.date(
-            int(row["birth_year"]),
-            int(row["birth_month"]),
-            int(row["birth_day"])
-        )
-        return round((target_date - bdate).days / 365.25, 1)
-    except Exception:
-        return np.nan
+    # Projected PA (Steamer uses FG IDs; fallback already maps FG IDs too)
+    base["proj_pa"] = base["IDfg"].map(proj_pa_map).fillna(base["pa_y1"].clip(upper=700))
+    base["proj_pa"] = pd.to_numeric(base["proj_pa"], errors="coerce").clip(lower=0, upper=700).fillna(0)
 
-base["age"] = base.apply(calc_age, axis=1)
-median_age = base["age"].median()
-missing_age = base["age"].isna().sum()
-if missing_age:
-    base["age"] = base["age"].fillna(median_age)
-    print(f"  {missing_age} players missing birth date → filled with median ({median_age:.1f})")
-print(f"  Age range: {base['age'].min():.0f}–{base['age'].max():.0f}  "
-      f"median: {base['age'].median():.1f}\n")
+    print(f"  Master dataset: {len(base):,} players.\n")
+    return base
 
 
 # ──────────────────────────────────────────────────────────────────────────────
-# STEP 8b — ESPN ACTUAL POINTS OVERRIDE
-# Replace FanGraphs-recalculated fp_y1/fp_y2/fp_y3 with ESPN's actual league
-# fantasy points for rostered players. This captures scoring categories
-# (HBP, etc.) and stat-tracking differences that the FanGraphs recalc misses.
+# STEP 8 — AGE CALCULATION / 8b — ESPN ACTUAL POINTS OVERRIDE
 # ──────────────────────────────────────────────────────────────────────────────
 
-print("─── Step 8b: ESPN actual points override ─────────────────────")
+def calc_age(df: pd.DataFrame, target_date: datetime.date) -> pd.Series:
+    # Invalid or missing birth dates come back as NaT → NaN age
+    bdate = pd.to_datetime(pd.DataFrame({
+        "year":  df["birth_year"],
+        "month": df["birth_month"],
+        "day":   df["birth_day"],
+    }), errors="coerce")
+    return ((pd.Timestamp(target_date) - bdate).dt.days / 365.25).round(1)
+
+
+def add_ages(base: pd.DataFrame, target_season: int) -> pd.DataFrame:
+    print(f"─── Step 8: Player ages as of April 1, {target_season} ──────────")
+    base["age"] = calc_age(base, datetime.date(target_season, 4, 1))
+    median_age = base["age"].median()
+    missing_age = base["age"].isna().sum()
+    if missing_age:
+        base["age"] = base["age"].fillna(median_age)
+        print(f"  {missing_age} players missing birth date → filled with median ({median_age:.1f})")
+    print(f"  Age range: {base['age'].min():.0f}–{base['age'].max():.0f}  "
+          f"median: {base['age'].median():.1f}\n")
+    return base
 
-HIST_DIR = SCRIPT_DIR.parent / "data" / "historical"
 
 def load_espn_points(year) -> dict:
     """Return {normalized_name: total_points} from a historical JSON file."""
     path = HIST_DIR / f"{year}.json"
     if not path.exists():
         return {}
-    import json
     with open(path) as f:
         data = json.load(f)
     points = {}
     for roster in data.get("rosters", []):
         for player in roster.get("players", []):
-            name = norm_name(player.get("playerName", ""))
+            name = normalize(player.get("playerName", ""))
             tp = player.get("totalPoints")
             if name and tp is not None and float(tp) > 0:
                 points[name] = float(tp)
     return points
 
-base["_norm_name"] = base["Name"].apply(norm_name)
 
-for col, year in [("fp_y1", Y1), ("fp_y2", Y2), ("fp_y3", Y3)]:
-    if year is None:
-        continue
-    espn_pts = load_espn_points(year)
-    if not espn_pts:
-        print(f"  {year}: no ESPN historical file found, keeping FanGraphs values.")
-        continue
-    mask = base["_norm_name"].isin(espn_pts)
-    base.loc[mask, col] = base.loc[mask, "_norm_name"].map(espn_pts)
-    print(f"  {year} (fp_{col[-2:]}): overrode {mask.sum()} players with ESPN actual points.")
+def apply_espn_points(base: pd.DataFrame, years: Iterable[Optional[int]]) -> pd.DataFrame:
+    """
+    Replace FanGraphs-recalculated fp_y1/fp_y2/fp_y3 with ESPN's actual league
+    fantasy points for rostered players. This captures scoring categories
+    (HBP, etc.) and stat-tracking differences that the FanGraphs recalc misses.
+    """
+    print("─── Step 8b: ESPN actual points override ─────────────────────")
+    base["_norm_name"] = normalize_many(base["Name"])
 
-base = base.drop(columns=["_norm_name"])
-print()
-
-# ──────────────────────────────────────────────────────────────────────────────
-# STEP 9 — WEIGHTED BASE FANTASY POINTS
-# ──────────────────────────────────────────────────────────────────────────────
-
-print("─── Step 9: Weighted historical fantasy points ───────────────")
-
-def weighted_fp(row, pa_baseline=None) -> float:
-    # When pa_baseline is set (batters: 600 PA), normalize each year's FP to
-    # that rate so partial seasons (injuries, late callups, rookie debuts) aren't
-    # penalized vs. full seasons. PlayingTimeMod in Step 10 then scales the result
-    # back to projected PA. Pitchers pass pa_baseline=None (no normalization) since
-    # their pa_y1/pa_y2 fields hold IP, not plate appearances.
-    def pa_normalize(fp, pa):
-        if pd.isna(fp) or fp <= 0:
-            return np.nan
-        if pa_baseline is None or pd.isna(pa) or pa <= 0:
-            return fp
-        return fp * (pa_baseline / pa)
-
-    y1 = pa_normalize(row.get("fp_y1"), row.get("pa_y1"))
-    y2 = pa_normalize(row.get("fp_y2"), row.get("pa_y2"))
-    y3 = pa_normalize(row.get("fp_y3"), row.get("pa_y3"))
-
-    has = [pd.notna(v) for v in [y1, y2, y3]]
-    n   = sum(has)
-
-    if n == 3:
-        return 0.50 * y1 + 0.33 * y2 + 0.17 * y3
-    elif n == 2:
-        if has[0] and has[1]:
-            return 0.60 * y1 + 0.40 * y2
-        elif has[0] and has[2]:
-            return 0.60 * y1 + 0.40 * y3
-        else:
-            return 0.60 * y2 + 0.40 * y3
-    elif n == 1:
-        val = y1 if has[0] else (y2 if has[1] else y3)
-        # 15% regression toward league average for limited sample
-        return val * 0.85 + LEAGUE_AVG_FP * 0.15
-    else:
-        return np.nan
+    for col, year in zip(("fp_y1", "fp_y2", "fp_y3"), years):
+        if year is None:
+            continue
+        espn_pts = load_espn_points(year)
+        if not espn_pts:
+            print(f"  {year}: no ESPN historical file found, keeping FanGraphs values.")
+            continue
+        mask = base["_norm_name"].isin(espn_pts)
+        base.loc[mask, col] = base.loc[mask, "_norm_name"].map(espn_pts)
+        print(f"  {year} (fp_{col[-2:]}): overrode {mask.sum()} players with ESPN actual points.")
 
-base["WeightedBase"] = base.apply(lambda row: weighted_fp(row, pa_baseline=600), axis=1)
-before = len(base)
-base = base.dropna(subset=["WeightedBase"])
-print(f"  {len(base):,} players with valid weighted base "
-      f"({before - len(base)} dropped).\n")
+    base = base.drop(columns=["_norm_name"])
+    print()
+    return base
 
 
 # ──────────────────────────────────────────────────────────────────────────────
-# STEP 10 — PROJECTION MODIFIERS
+# STEPS 9–11 — WEIGHTED BASE, MODIFIERS, FINAL PROJECTIONS
 # ──────────────────────────────────────────────────────────────────────────────
 
-print("─── Step 10: Projection modifiers ───────────────────────────────")
-
-# Age modifier: +0.6% per year under 28, -0.6% per year over 28, capped ±10%
-base["AgeMod"] = (1 + ((28 - base["age"]) * 0.006)).clip(0.90, 1.10)
-
-# Park factor
-base["team_norm"]  = base["team_y1"].apply(normalize_team)
-base["ParkFactor"] = base["team_norm"].map(PARK_FACTORS).fillna(1.00)
+def weighted_fp(df: pd.DataFrame, pa_baseline=None) -> pd.Series:
+    # When pa_baseline is set (batters: 600 PA; pitchers: a per-row SP/RP IP
+    # baseline), normalize each year's FP to that rate so partial seasons
+    # (injuries, late callups, rookie debuts) aren't penalized vs. full seasons.
+    # PlayingTimeMod in Step 10 then scales the result back to projected PA.
+    # pa_baseline=None skips normalization.
+    ys = []
+    for yr in ("y1", "y2", "y3"):
+        fp = numeric_col(df, f"fp_{yr}")
+        pa = numeric_col(df, f"pa_{yr}")
+        fp = np.where(fp > 0, fp, np.nan)
+        if pa_baseline is not None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                fp = np.where(pa > 0, fp * (pa_baseline / pa), fp)
+        ys.append(fp)
+    y1, y2, y3 = ys
+    h1, h2, h3 = (~np.isnan(y) for y in ys)
+    n = h1.astype(int) + h2 + h3
+
+    # 1 year: 15% regression toward league average for limited sample
+    only = np.where(h1, y1, np.where(h2, y2, y3))
+    out = np.select(
+        [n == 3, (n == 2) & h1 & h2, (n == 2) & h1 & h3, n == 2, n == 1],
+        [0.50 * y1 + 0.33 * y2 + 0.17 * y3,
+         0.60 * y1 + 0.40 * y2,
+         0.60 * y1 + 0.40 * y3,
+         0.60 * y2 + 0.40 * y3,
+         only * 0.85 + LEAGUE_AVG_FP * 0.15],
+        default=np.nan,
+    )
+    return pd.Series(out, index=df.index)
 
-# Playing time modifier (relative to 600 PA baseline)
-base["PlayingTimeMod"] = (base["proj_pa"] / 600.0).clip(lower=0)
 
 # xwOBA adjustment: captures regression toward expected contact quality
 # Formula: [(0.6 × gap_y1 + 0.4 × gap_y2)] × 150
 # Positive gap → player underperformed their Statcast metrics → positive adj
-def xwoba_adjustment(row) -> float:
-    adj, w_sum = 0.0, 0.0
+def xwoba_adjustment(df: pd.DataFrame) -> pd.Series:
+    adj, w_sum = np.zeros(len(df)), np.zeros(len(df))
+    for yr, weight in (("y1", 0.6), ("y2", 0.4)):
+        xw = numeric_col(df, f"xwoba_{yr}")
+        # Prefer Baseball Savant's wOBA; fall back to Fangraphs wOBA
+        w = numeric_col(df, f"woba_savant_{yr}")
+        w = np.where(np.isnan(w), numeric_col(df, f"woba_{yr}"), w)
+        ok = ~np.isnan(xw) & (w > 0)
+        adj   += np.where(ok, weight * (xw - w), 0.0)
+        w_sum += np.where(ok, weight, 0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.where(w_sum > 0, adj / w_sum * 150, 0.0)
+    return pd.Series(out, index=df.index)
 
-    xw1 = row.get("xwoba_y1", np.nan)
-    # Prefer Baseball Savant's wOBA; fall back to Fangraphs wOBA
-    w1  = row.get("woba_savant_y1", np.nan)
-    if pd.isna(w1):
-        w1 = row.get("woba_y1", np.nan)
-    if pd.notna(xw1) and pd.notna(w1) and w1 > 0:
-        adj   += 0.6 * (xw1 - w1)
-        w_sum += 0.6
 
-    xw2 = row.get("xwoba_y2", np.nan)
-    w2  = row.get("woba_savant_y2", np.nan)
-    if pd.isna(w2):
-        w2 = row.get("woba_y2", np.nan)
-    if pd.notna(xw2) and pd.notna(w2) and w2 > 0:
-        adj   += 0.4 * (xw2 - w2)
-        w_sum += 0.4
+# Assign batter position from MLB Stats API; normalize OF variants
+POS_NORMALIZE = {"LF": "OF", "CF": "OF", "RF": "OF", "DH": "DH"}
 
-    return (adj / w_sum * 150) if w_sum > 0 else 0.0
+def mlb_position_codes(df: pd.DataFrame) -> np.ndarray:
+    """str(mlb_position or "").strip() per row, as an object array of str."""
+    if "mlb_position" not in df.columns:
+        return np.full(len(df), "", dtype=object)
+    raw = df["mlb_position"].to_numpy(dtype=object)
+    raw = np.where(raw.astype(bool), raw, "")
+    return np.char.strip(raw.astype(str)).astype(object)
+
+
+def resolve_pos(df: pd.DataFrame) -> pd.Series:
+    mlb = mlb_position_codes(df)
+    pos = mlb.copy()
+    for raw, norm in POS_NORMALIZE.items():
+        pos[mlb == raw] = norm
+    pos[mlb == ""] = "—"
+    return pd.Series(pos, index=df.index)
+
+
+def assign_pitcher_pos(df: pd.DataFrame) -> pd.Series:
+    # Only trust explicit SP/RP from MLB API; 'P' is too generic
+    mlb = mlb_position_codes(df)
+    # Otherwise use GS/G ratio from actual stats
+    if "GS" in df.columns and "G" in df.columns:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = numeric_col(df, "GS") / np.maximum(numeric_col(df, "G"), 1)
+        fallback = np.where(ratio >= 0.5, "SP", "RP")
+    else:
+        fallback = "SP"
+    pos = np.where(np.isin(mlb, ("SP", "RP")), mlb, fallback)
+    return pd.Series(pos.astype(object), index=df.index)
 
-base["xwOBA_Adjustment"] = base.apply(xwoba_adjustment, axis=1)
 
-# Speed bonus: credits fast players with additional projected stolen base value
-# SpeedBonus = (pct/100) × 0.4 × (league_sb / 450) × 30
-base["SpeedBonus"] = (base["speed_pct"] / 100.0) * 0.4 * (league_sb / 450.0) * 30.0
+def project_batters(base: pd.DataFrame, league_sb: int) -> pd.DataFrame:
+    """Steps 9–11: weighted base × modifiers → ProjectedFP, ranked."""
+    print("─── Step 9: Weighted historical fantasy points ───────────────")
+    base["WeightedBase"] = weighted_fp(base, pa_baseline=600)
+    before = len(base)
+    base = base.dropna(subset=["WeightedBase"])
+    print(f"  {len(base):,} players with valid weighted base "
+          f"({before - len(base)} dropped).\n")
 
-print(f"  AgeMod:         range {base['AgeMod'].min():.3f}–{base['AgeMod'].max():.3f}")
-print(f"  ParkFactor:     range {base['ParkFactor'].min():.3f}–{base['ParkFactor'].max():.3f}")
-print(f"  PlayingTimeMod: range {base['PlayingTimeMod'].min():.2f}–{base['PlayingTimeMod'].max():.2f}")
-print(f"  xwOBA_Adj:      range {base['xwOBA_Adjustment'].min():.1f}–{base['xwOBA_Adjustment'].max():.1f}")
-print(f"  SpeedBonus:     range {base['SpeedBonus'].min():.1f}–{base['SpeedBonus'].max():.1f}\n")
+    print("─── Step 10: Projection modifiers ───────────────────────────────")
 
+    # Age modifier: +0.6% per year under 28, -0.6% per year over 28, capped ±10%
+    base["AgeMod"] = (1 + ((28 - base["age"]) * 0.006)).clip(0.90, 1.10)
 
-# ──────────────────────────────────────────────────────────────────────────────
-# STEP 11 — FINAL PROJECTIONS
-# ──────────────────────────────────────────────────────────────────────────────
+    # Park factor
+    base["team_norm"]  = base["team_y1"].apply(normalize_team)
+    base["ParkFactor"] = base["team_norm"].map(PARK_FACTORS).fillna(1.00)
 
-print("─── Step 11: Final projections ──────────────────────────────────")
+    # Playing time modifier (relative to 600 PA baseline)
+    base["PlayingTimeMod"] = (base["proj_pa"] / 600.0).clip(lower=0)
 
-base["ProjectedFP"] = (
-    base["WeightedBase"]
-    * base["AgeMod"]
-    * base["ParkFactor"]
-    * base["PlayingTimeMod"]
-    + base["xwOBA_Adjustment"]
-    + base["SpeedBonus"]
-)
+    base["xwOBA_Adjustment"] = xwoba_adjustment(base)
 
-base = base.sort_values("ProjectedFP", ascending=False).reset_index(drop=True)
-base["FP_MostRecentYear"] = base["fp_y1"].fillna(0)
-base["Projection_vs_MostRecent"] = (
-    (base["ProjectedFP"] - base["FP_MostRecentYear"])
-    / base["FP_MostRecentYear"].replace(0, np.nan) * 100
-).round(1)
-base["Percentile"] = (base["ProjectedFP"].rank(pct=True) * 100).round(1)
+    # Speed bonus: credits fast players with additional projected stolen base value
+    # SpeedBonus = (pct/100) × 0.4 × (league_sb / 450) × 30
+    base["SpeedBonus"] = (base["speed_pct"] / 100.0) * 0.4 * (league_sb / 450.0) * 30.0
 
-# Assign batter position from MLB Stats API; normalize OF variants
-POS_NORMALIZE = {"LF": "OF", "CF": "OF", "RF": "OF", "DH": "DH"}
-def resolve_pos(row) -> str:
-    mlb = str(row.get("mlb_position", "") or "").strip()
-    if mlb:
-        return POS_NORMALIZE.get(mlb, mlb)
-    return "—"
-base["Position"] = base.apply(resolve_pos, axis=1)
+    print(f"  AgeMod:         range {base['AgeMod'].min():.3f}–{base['AgeMod'].max():.3f}")
+    print(f"  ParkFactor:     range {base['ParkFactor'].min():.3f}–{base['ParkFactor'].max():.3f}")
+    print(f"  PlayingTimeMod: range {base['PlayingTimeMod'].min():.2f}–{base['PlayingTimeMod'].max():.2f}")
+    print(f"  xwOBA_Adj:      range {base['xwOBA_Adjustment'].min():.1f}–{base['xwOBA_Adjustment'].max():.1f}")
+    print(f"  SpeedBonus:     range {base['SpeedBonus'].min():.1f}–{base['SpeedBonus'].max():.1f}\n")
 
-print(f"  Projections complete: {len(base):,} batters.\n")
+    print("─── Step 11: Final projections ──────────────────────────────────")
 
+    base["ProjectedFP"] = (
+        base["WeightedBase"]
+        * base["AgeMod"]
+        * base["ParkFactor"]
+        * base["PlayingTimeMod"]
+        + base["xwOBA_Adjustment"]
+        + base["SpeedBonus"]
+    )
 
-# ──────────────────────────────────────────────────────────────────────────────
-# STEP 11b — PITCHER PROJECTIONS
-# ──────────────────────────────────────────────────────────────────────────────
+    base = base.sort_values("ProjectedFP", ascending=False).reset_index(drop=True)
+    base["FP_MostRecentYear"] = base["fp_y1"].fillna(0)
+    base["Projection_vs_MostRecent"] = (
+        (base["ProjectedFP"] - base["FP_MostRecentYear"])
+        / base["FP_MostRecentYear"].replace(0, np.nan) * 100
+    ).round(1)
+    base["Percentile"] = (base["ProjectedFP"].rank(pct=True) * 100).round(1)
+    base["Position"] = resolve_pos(base)
 
-print("─── Step 11b: Pitcher projections ───────────────────────────────")
+    print(f"  Projections complete: {len(base):,} batters.\n")
+    return base
 
-try:
-    from pybaseball import pitching_stats
-    pitch_by_year: dict[int, pd.DataFrame] = {}
-    for year in HISTORICAL_YEARS:
-        print(f"  {year}:")
-        cache_path = CACHE_DIR / f"pitching_stats_{year}.csv"
-        df = cached_fetch(cache_path, pitching_stats, year, qual=MIN_IP, label=f"pitching_stats({year})")
-        if df is None or df.empty:
-            print(f"    WARNING: No pitching data for {year}.")
-            continue
-        df.columns = [c.strip() for c in df.columns]
-        df["IDfg"] = pd.to_numeric(df.get("IDfg", pd.Series(dtype=float)), errors="coerce")
-        df = df.dropna(subset=["IDfg"])
-        df["IDfg"] = df["IDfg"].astype(int)
-        df["fantasy_points"] = calc_pitcher_fantasy_points(df)
-        df["year"] = year
-        pitch_by_year[year] = df
-        print(f"    {len(df):,} qualified pitchers loaded.")
 
-    if pitch_by_year and Y1 in pitch_by_year:
-        # Build pitcher base dataset
-        pb = pitch_by_year[Y1].copy()
-        pb = pb.rename(columns={"fantasy_points": "fp_y1", "IP": "pa_y1", "Team": "team_y1"})
-        if Y2 and Y2 in pitch_by_year:
-            py2 = pitch_by_year[Y2][["IDfg", "fantasy_points", "IP"]].rename(
-                columns={"fantasy_points": "fp_y2", "IP": "pa_y2"})
-            pb = pb.merge(py2, on="IDfg", how="left")
-        else:
-            pb["fp_y2"] = np.nan; pb["pa_y2"] = np.nan
-        if Y3 and Y3 in pitch_by_year:
-            py3 = pitch_by_year[Y3][["IDfg", "fantasy_points"]].rename(columns={"fantasy_points": "fp_y3"})
-            pb = pb.merge(py3, on="IDfg", how="left")
-        else:
-            pb["fp_y3"] = np.nan
-
-        pb = pb.merge(id_map[["key_fangraphs", "key_mlbam"]],
-                      left_on="IDfg", right_on="key_fangraphs", how="left")
-        pb["mlbam_id"] = pd.to_numeric(pb["key_mlbam"], errors="coerce")
-
-        # Fallback: name-based Chadwick lookup for pitchers missing MLBAM ID
-        pitch_missing = pb["mlbam_id"].isna()
-        if pitch_missing.any() and "chad_name_map" in dir():
-            n_resolved = 0
-            for idx in pb[pitch_missing].index:
-                player_name = norm_name(str(pb.at[idx, "Name"]))
-                if player_name in chad_name_map:
-                    pb.at[idx, "mlbam_id"] = chad_name_map[player_name]
-                    n_resolved += 1
-            if n_resolved:
-                print(f"  Name-based Chadwick fallback: resolved MLBAM IDs for {n_resolved} pitchers.")
-
-        # Player info (birthdates + positions)
-        pitch_mlbam = pb["mlbam_id"].dropna().astype(int).unique().tolist()
-        # Reuse same cache (already fetched for batters if IDs overlap)
-        pinfo = fetch_player_info(pitch_mlbam)
-        if not pinfo.empty:
-            pb = pb.merge(pinfo, on="mlbam_id", how="left")
-        else:
-            pb["birth_year"] = pb["birth_month"] = pb["birth_day"] = pb["mlb_position"] = np.nan
+# ──────────────────────────────────────────────────────────────────────────────
+# STEP 11b — PITCHER PROJECTIONS
+# ──────────────────────────────────────────────────────────────────────────────
 
-        # Age
-        def pcalc_age(row) -> float:
-            try:
-                return round((target_date - datetime.date(
-                    int(row["birth_year"]), int(row["birth_month"]), int(row["birth_day"])
-                )).days / 365.25, 1)
-            except Exception:
-                return np.nan
-        pb["age"] = pb.apply(pcalc_age, axis=1)
-        pb["age"] = pb["age"].fillna(pb["age"].median() if not pb["age"].isna().all() else 28)
-
-        # Weighted base — normalize to per-season IP rate so partial seasons
-        # (injury, TJ surgery, late callup) aren't penalized vs. full seasons.
-        # Starters baseline: 180 IP  |  Relievers baseline: 70 IP
-        SP_IP_BASELINE = 180.0
-        RP_IP_BASELINE = 70.0
-        if "GS" in pb.columns and "G" in pb.columns:
-            is_sp = (pb["GS"].fillna(0) / pb["G"].replace(0, np.nan).fillna(1)) >= 0.5
-            pb["_ip_baseline"] = np.where(is_sp, SP_IP_BASELINE, RP_IP_BASELINE)
-        else:
-            pb["_ip_baseline"] = SP_IP_BASELINE  # fallback
-        pb["WeightedBase"] = pb.apply(
-            lambda row: weighted_fp(row, pa_baseline=row["_ip_baseline"]), axis=1
-        )
-        pb = pb.drop(columns=["_ip_baseline"])
-        pb = pb.dropna(subset=["WeightedBase"])
-
-        # SP vs RP: use GS (games started) vs G ratio
-        gs_col = "GS" if "GS" in pb.columns else None
-        g_col  = "G"  if "G"  in pb.columns else None
-        def assign_pitcher_pos(row) -> str:
-            # Only trust explicit SP/RP from MLB API; 'P' is too generic
-            mlb = str(row.get("mlb_position", "") or "").strip()
-            if mlb in ("SP", "RP"):
-                return mlb
-            # Use GS/G ratio from actual stats
-            if gs_col and g_col:
-                gs = row.get(gs_col, 0) or 0
-                g  = row.get(g_col, 1) or 1
-                return "SP" if (gs / max(g, 1)) >= 0.5 else "RP"
-            return "SP"
-        pb["Position"] = pb.apply(assign_pitcher_pos, axis=1)
-
-        # Modifiers — pitchers use inverse park factor (pitcher-friendly park = better)
-        pb["AgeMod"] = (1 + ((28 - pb["age"]) * 0.006)).clip(0.90, 1.10)
-        pb["team_norm"] = pb["team_y1"].apply(normalize_team)
-        pb["ParkFactor"] = pb["team_norm"].map(PARK_FACTORS).apply(
-            lambda x: 2.0 - x if pd.notna(x) else 1.0)  # invert: COL 1.15 → 0.85 for pitchers
-        pb["proj_pa"] = pb["IDfg"].map(proj_pa_map).fillna(pb["pa_y1"].clip(upper=250))
-        pb["PlayingTimeMod"] = (pb["proj_pa"] / 180.0).clip(lower=0, upper=1.6)
-        pb["xwOBA_Adjustment"] = 0.0
-        pb["SpeedBonus"] = 0.0
-
-        pb["ProjectedFP"] = (
-            pb["WeightedBase"] * pb["AgeMod"] * pb["ParkFactor"] * pb["PlayingTimeMod"])
-        pb["FP_MostRecentYear"] = pb["fp_y1"].fillna(0)
-        pb["Projection_vs_MostRecent"] = (
-            (pb["ProjectedFP"] - pb["FP_MostRecentYear"])
-            / pb["FP_MostRecentYear"].replace(0, np.nan) * 100).round(1)
-        pb["Percentile"] = 0.0  # recalculated after merge
-
-        print(f"  {len(pb):,} pitchers projected.")
-
-        # Merge with batter projections
-        shared = ["Name", "mlbam_id", "Position", "team_y1", "age", "proj_pa",
+# Columns kept when batters and pitchers are combined
+SHARED_COLUMNS = ["Name", "mlbam_id", "Position", "team_y1", "age", "proj_pa",
                   "WeightedBase", "AgeMod", "ParkFactor", "PlayingTimeMod",
                   "xwOBA_Adjustment", "SpeedBonus", "ProjectedFP",
                   "FP_MostRecentYear", "Projection_vs_MostRecent", "Percentile"]
-        pb_out = pb[[c for c in shared if c in pb.columns]].copy()
-        base   = pd.concat([base[shared], pb_out], ignore_index=True)
-        base   = base.sort_values("ProjectedFP", ascending=False).reset_index(drop=True)
-        base["Percentile"] = (base["ProjectedFP"].rank(pct=True) * 100).round(1)
-        print(f"  Combined total: {len(base):,} players.\n")
+
+
+def project_pitchers(pitch_by_year: Dict[int, pd.DataFrame],
+                     years: Tuple[Optional[int], Optional[int], Optional[int]],
+                     id_map: pd.DataFrame, chad_name_map: dict,
+                     proj_pa_map: Dict[int, float], target_season: int,
+                     player_info_path: Path) -> pd.DataFrame:
+    """Pitcher projections in the batter output schema (Percentile filled in later)."""
+    y1, y2, y3 = years
+
+    # Build pitcher base dataset
+    pb = pitch_by_year[y1].copy()
+    pb = pb.rename(columns={"fantasy_points": "fp_y1", "IP": "pa_y1", "Team": "team_y1"})
+    if y2 and y2 in pitch_by_year:
+        py2 = pitch_by_year[y2][["IDfg", "fantasy_points", "IP"]].rename(
+            columns={"fantasy_points": "fp_y2", "IP": "pa_y2"})
+        pb = pb.merge(py2, on="IDfg", how="left")
+    else:
+        pb["fp_y2"] = np.nan; pb["pa_y2"] = np.nan
+    if y3 and y3 in pitch_by_year:
+        py3 = pitch_by_year[y3][["IDfg", "fantasy_points"]].rename(columns={"fantasy_points": "fp_y3"})
+        pb = pb.merge(py3, on="IDfg", how="left")
     else:
-        print("  No pitcher data available — skipping pitcher projections.\n")
-except Exception as exc:
-    print(f"  Pitcher projections failed: {exc} — continuing with batters only.\n")
+        pb["fp_y3"] = np.nan
+
+    pb = pb.merge(id_map[["key_fangraphs", "key_mlbam"]],
+                  left_on="IDfg", right_on="key_fangraphs", how="left")
+    pb["mlbam_id"] = pd.to_numeric(pb["key_mlbam"], errors="coerce")
+
+    # Fallback: name-based Chadwick lookup for pitchers missing MLBAM ID
+    pitch_missing = pb["mlbam_id"].isna()
+    if pitch_missing.any():
+        resolved = normalize_many(pb.loc[pitch_missing, "Name"].astype(str)).map(chad_name_map)
+        pb.loc[pitch_missing, "mlbam_id"] = resolved
+        n_resolved = int(resolved.notna().sum())
+        if n_resolved:
+            print(f"  Name-based Chadwick fallback: resolved MLBAM IDs for {n_resolved} pitchers.")
+
+    # Player info (birthdates + positions)
+    pitch_mlbam = pb["mlbam_id"].dropna().astype(int).unique().tolist()
+    # Reuse same cache (already fetched for batters if IDs overlap)
+    pinfo = fetch_player_info(pitch_mlbam, cache_path=player_info_path)
+    if not pinfo.empty:
+        pb = pb.merge(pinfo, on="mlbam_id", how="left")
+    else:
+        pb["birth_year"] = pb["birth_month"] = pb["birth_day"] = pb["mlb_position"] = np.nan
+
+    # Age
+    pb["age"] = calc_age(pb, datetime.date(target_season, 4, 1))
+    pb["age"] = pb["age"].fillna(pb["age"].median() if not pb["age"].isna().all() else 28)
+
+    # Weighted base — normalize to per-season IP rate so partial seasons
+    # (injury, TJ surgery, late callup) aren't penalized vs. full seasons.
+    # Starters baseline: 180 IP  |  Relievers baseline: 70 IP
+    SP_IP_BASELINE = 180.0
+    RP_IP_BASELINE = 70.0
+    if "GS" in pb.columns and "G" in pb.columns:
+        is_sp = (pb["GS"].fillna(0) / pb["G"].replace(0, np.nan).fillna(1)) >= 0.5
+        pb["_ip_baseline"] = np.where(is_sp, SP_IP_BASELINE, RP_IP_BASELINE)
+    else:
+        pb["_ip_baseline"] = SP_IP_BASELINE  # fallback
+    pb["WeightedBase"] = weighted_fp(pb, pa_baseline=pb["_ip_baseline"].to_numpy(dtype=float))
+    pb = pb.drop(columns=["_ip_baseline"])
+    pb = pb.dropna(subset=["WeightedBase"])
+
+    # SP vs RP: use GS (games started) vs G ratio
+    pb["Position"] = assign_pitcher_pos(pb)
+
+    # Modifiers — pitchers use inverse park factor (pitcher-friendly park = better)
+    pb["AgeMod"] = (1 + ((28 - pb["age"]) * 0.006)).clip(0.90, 1.10)
+    pb["team_norm"] = pb["team_y1"].apply(normalize_team)
+    pb["ParkFactor"] = pb["team_norm"].map(PARK_FACTORS).apply(
+        lambda x: 2.0 - x if pd.notna(x) else 1.0)  # invert: COL 1.15 → 0.85 for pitchers
+    pb["proj_pa"] = pb["IDfg"].map(proj_pa_map).fillna(pb["pa_y1"].clip(upper=250))
+    pb["PlayingTimeMod"] = (pb["proj_pa"] / 180.0).clip(lower=0, upper=1.6)
+    pb["xwOBA_Adjustment"] = 0.0
+    pb["SpeedBonus"] = 0.0
+
+    pb["ProjectedFP"] = (
+        pb["WeightedBase"] * pb["AgeMod"] * pb["ParkFactor"] * pb["PlayingTimeMod"])
+    pb["FP_MostRecentYear"] = pb["fp_y1"].fillna(0)
+    pb["Projection_vs_MostRecent"] = (
+        (pb["ProjectedFP"] - pb["FP_MostRecentYear"])
+        / pb["FP_MostRecentYear"].replace(0, np.nan) * 100).round(1)
+    pb["Percentile"] = 0.0  # recalculated after merge
+
+    print(f"  {len(pb):,} pitchers projected.")
+    return pb[[c for c in SHARED_COLUMNS if c in pb.columns]].copy()
+
+
+def combine_projections(base: pd.DataFrame, pitchers: pd.DataFrame) -> pd.DataFrame:
+    """Merge pitcher projections into the batter table and re-rank."""
+    base = pd.concat([base[SHARED_COLUMNS], pitchers], ignore_index=True)
+    base = base.sort_values("ProjectedFP", ascending=False).reset_index(drop=True)
+    base["Percentile"] = (base["ProjectedFP"].rank(pct=True) * 100).round(1)
+    print(f"  Combined total: {len(base):,} players.\n")
+    return base
 
 
 # ──────────────────────────────────────────────────────────────────────────────
-# STEP 12 — OUTPUT: MAIN PROJECTIONS CSV
+# STEP 12 — OUTPUT FILES
 # ──────────────────────────────────────────────────────────────────────────────
 
-print("─── Step 12: Writing output files ───────────────────────────────")
-
-# Suffix if we had to fall back to older data
-year_suffix = f"_based_on_{Y1}" if Y1 != HISTORICAL_YEARS[0] else ""
-base_name   = f"fantasy_projections_{TARGET_SEASON}{year_suffix}"
-
-output_cols = {
+OUTPUT_COLS = {
     "Name":                    "Player Name",
     "mlbam_id":                "MLBAM ID",
     "Position":                "Position",
@@ -1032,200 +824,409 @@ output_cols = {
     "Projection_vs_MostRecent":"Projection_vs_MostRecent",
     "Percentile":              "Percentile",
 }
+ROUNDED_COLS = ["WeightedBase", "AgeMod", "ParkFactor", "PlayingTimeMod",
+                "xwOBA_Adjustment", "SpeedBonus", "ProjectedFP",
+                "FP_MostRecentYear", "Projection_vs_MostRecent", "Percentile"]
+
+
+def projections_table(base: pd.DataFrame) -> pd.DataFrame:
+    """The main output table (display column names, modifiers rounded to 0.1)."""
+    out = base[list(OUTPUT_COLS.keys())].rename(columns=OUTPUT_COLS).copy()
+    for col in ROUNDED_COLS:
+        out[col] = out[col].round(1)
+    return out
+
+
+def _site_json(out: pd.DataFrame) -> dict:
+    """{"players": [...]} in the data/projections/<season>.json layout."""
+    players = pd.DataFrame({
+        "playerName":  out["Player Name"],
+        "mlbamId":     pd.to_numeric(out["MLBAM ID"], errors="coerce").astype("Int64"),
+        "position":    out["Position"],
+        "team":        out["Team"],
+        "age":         out["Age"],
+        "projectedFP": out["ProjectedFP"],
+        "percentile":  out["Percentile"],
+    })
+    return {"players": json.loads(players.to_json(orient="records"))}
+
+
+def write_projections(base: pd.DataFrame, base_name: str, output_dir: Path,
+                      formats: Iterable[str]) -> List[Path]:
+    """
+    Main projections table as output_dir/<base_name>.<fmt> for each requested
+    format (json in the data/projections layout, see _site_json). Returns the
+    paths written.
+    """
+    out = projections_table(base)
+    paths = []
+    for fmt in formats:
+        path = output_dir / f"{base_name}.{fmt}"
+        if fmt == "csv":
+            out.to_csv(path, index=False)
+        elif fmt == "json":
+            with open(path, "w") as f:
+                json.dump(_site_json(out), f, indent=2)
+        elif fmt == "parquet":
+            try:
+                out.to_parquet(path, index=False)
+            except ImportError:
+                print("  Parquet:     skipped (pyarrow not installed — run: pip install pyarrow)")
+                continue
+        else:
+            raise ValueError(f"Unknown output format: {fmt!r}")
+        print(f"  Main {fmt.upper() + ':':<7} {path.name}  ({len(out):,} rows)")
+        paths.append(path)
+    return paths
+
+
+def write_reports(base: pd.DataFrame, target_season: int, year_suffix: str,
+                  output_dir: Path) -> None:
+    """Flags, breakout-candidate and decline-risk CSVs."""
+
+    # ─── Flags CSV ────────────────────────────────────────────────────────────
+    flag_frames = []
+
+    # < 300 PA (or IP) in Y1 — use proj_pa as proxy since pa_y1 may not exist post-merge
+    if "proj_pa" in base.columns:
+        lpa = base[base["proj_pa"] < 300].copy()
+        lpa["flag"] = f"Low projected PA/IP (injury/role concern)"
+        flag_frames.append(
+            lpa[["Name", "ProjectedFP", "flag"]]
+              .assign(IDfg=lpa.get("IDfg", "—"), flag_value=lpa["proj_pa"])
+        )
 
-out = base[list(output_cols.keys())].rename(columns=output_cols).copy()
-for col in ["WeightedBase", "AgeMod", "ParkFactor", "PlayingTimeMod",
-            "xwOBA_Adjustment", "SpeedBonus", "ProjectedFP",
-            "FP_MostRecentYear", "Projection_vs_MostRecent", "Percentile"]:
-    out[col] = out[col].round(1)
-
-main_path = SCRIPT_DIR / f"{base_name}.csv"
-out.to_csv(main_path, index=False)
-print(f"  Main CSV:    {main_path.name}  ({len(out):,} rows)")
-
-
-# ─── Flags CSV ────────────────────────────────────────────────────────────────
-
-flag_frames = []
-
-# < 300 PA (or IP) in Y1 — use proj_pa as proxy since pa_y1 may not exist post-merge
-if "proj_pa" in base.columns:
-    lpa = base[base["proj_pa"] < 300].copy()
-    lpa["flag"] = f"Low projected PA/IP (injury/role concern)"
+    # Large xwOBA adjustment
+    lx = base[base["xwOBA_Adjustment"].abs() > 30].copy()
+    lx["flag"] = lx["xwOBA_Adjustment"].apply(
+        lambda x: f"Large positive xwOBA adj (+{x:.1f}) — due for positive regression"
+        if x > 0 else f"Large negative xwOBA adj ({x:.1f}) — may underperform"
+    )
     flag_frames.append(
-        lpa[["Name", "ProjectedFP", "flag"]]
-          .assign(IDfg=lpa.get("IDfg", "—"), flag_value=lpa["proj_pa"])
+        lx[["Name", "xwOBA_Adjustment", "ProjectedFP", "flag"]]
+          .rename(columns={"xwOBA_Adjustment": "flag_value"})
     )
 
-# Large xwOBA adjustment
-lx = base[base["xwOBA_Adjustment"].abs() > 30].copy()
-lx["flag"] = lx["xwOBA_Adjustment"].apply(
-    lambda x: f"Large positive xwOBA adj (+{x:.1f}) — due for positive regression"
-    if x > 0 else f"Large negative xwOBA adj ({x:.1f}) — may underperform"
-)
-flag_frames.append(
-    lx[["Name", "xwOBA_Adjustment", "ProjectedFP", "flag"]]
-      .rename(columns={"xwOBA_Adjustment": "flag_value"})
-)
-
-# Age 35+
-old = base[base["age"] >= 35].copy()
-old["flag"] = old["age"].apply(lambda a: f"Age {a:.0f} — heightened decline risk")
-flag_frames.append(
-    old[["Name", "age", "ProjectedFP", "flag"]]
-       .rename(columns={"age": "flag_value"})
-)
-
-# Fewer than 2 years of MLB data
-if "fp_y2" in base.columns:
-    ltd = base[base["fp_y2"].isna() | (base["fp_y2"] == 0)].copy()
-    ltd["flag"] = "Limited sample — fewer than 2 years of data"
+    # Age 35+
+    old = base[base["age"] >= 35].copy()
+    old["flag"] = old["age"].apply(lambda a: f"Age {a:.0f} — heightened decline risk")
     flag_frames.append(
-        ltd[["Name", "ProjectedFP", "flag"]]
-           .assign(flag_value=ltd.get("fp_y1", 0))
+        old[["Name", "age", "ProjectedFP", "flag"]]
+           .rename(columns={"age": "flag_value"})
     )
 
-if flag_frames:
-    flags_df = (pd.concat(flag_frames, ignore_index=True)
-                  .sort_values("ProjectedFP", ascending=False))
-    flags_path = SCRIPT_DIR / f"projection_flags_{TARGET_SEASON}{year_suffix}.csv"
-    flags_df.to_csv(flags_path, index=False)
-    print(f"  Flags CSV:   {flags_path.name}  ({len(flags_df):,} entries)")
-
-
-# ─── Breakout Candidates & Decline Risks ──────────────────────────────────────
-
-spd = base.get("speed_pct", pd.Series(50, index=base.index))
-breakouts = (
-    base[(base["age"] < 27) &
-         (base["xwOBA_Adjustment"] > 0) &
-         (spd >= 70)]
-    .sort_values("ProjectedFP", ascending=False)
-    .head(20)
-)
-declines = (
-    base[(base["age"] > 32) & (base["xwOBA_Adjustment"] < 0)]
-    .sort_values("ProjectedFP", ascending=False)
-    .head(20)
-)
-
-bo_path = SCRIPT_DIR / f"breakout_candidates_{TARGET_SEASON}{year_suffix}.csv"
-dc_path = SCRIPT_DIR / f"decline_risks_{TARGET_SEASON}{year_suffix}.csv"
+    # Fewer than 2 years of MLB data
+    if "fp_y2" in base.columns:
+        ltd = base[base["fp_y2"].isna() | (base["fp_y2"] == 0)].copy()
+        ltd["flag"] = "Limited sample — fewer than 2 years of data"
+        flag_frames.append(
+            ltd[["Name", "ProjectedFP", "flag"]]
+               .assign(flag_value=ltd.get("fp_y1", 0))
+        )
 
-breakouts[["Name", "age", "xwOBA_Adjustment", "ProjectedFP"]].to_csv(bo_path, index=False)
-declines[ ["Name", "age", "xwOBA_Adjustment", "ProjectedFP"]].to_csv(dc_path, index=False)
-print(f"  Breakouts:   {bo_path.name}  ({len(breakouts)} players)")
-print(f"  Declines:    {dc_path.name}  ({len(declines)} players)")
+    if flag_frames:
+        flags_df = (pd.concat(flag_frames, ignore_index=True)
+                      .sort_values("ProjectedFP", ascending=False))
+        flags_path = output_dir / f"projection_flags_{target_season}{year_suffix}.csv"
+        flags_df.to_csv(flags_path, index=False)
+        print(f"  Flags CSV:   {flags_path.name}  ({len(flags_df):,} entries)")
+
+    # ─── Breakout Candidates & Decline Risks ──────────────────────────────────
+    spd = base.get("speed_pct", pd.Series(50, index=base.index))
+    breakouts = (
+        base[(base["age"] < 27) &
+             (base["xwOBA_Adjustment"] > 0) &
+             (spd >= 70)]
+        .sort_values("ProjectedFP", ascending=False)
+        .head(20)
+    )
+    declines = (
+        base[(base["age"] > 32) & (base["xwOBA_Adjustment"] < 0)]
+        .sort_values("ProjectedFP", ascending=False)
+        .head(20)
+    )
 
+    bo_path = output_dir / f"breakout_candidates_{target_season}{year_suffix}.csv"
+    dc_path = output_dir / f"decline_risks_{target_season}{year_suffix}.csv"
 
-# ─── Scatter Plot ─────────────────────────────────────────────────────────────
+    breakouts[["Name", "age", "xwOBA_Adjustment", "ProjectedFP"]].to_csv(bo_path, index=False)
+    declines[ ["Name", "age", "xwOBA_Adjustment", "ProjectedFP"]].to_csv(dc_path, index=False)
+    print(f"  Breakouts:   {bo_path.name}  ({len(breakouts)} players)")
+    print(f"  Declines:    {dc_path.name}  ({len(declines)} players)")
 
-try:
-    import matplotlib
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
 
-    fig, ax = plt.subplots(figsize=(10, 8))
-    sc = ax.scatter(
-        base["FP_MostRecentYear"],
-        base["ProjectedFP"],
-        alpha=0.5, s=30,
-        c=base["age"], cmap="RdYlGn_r",
-        vmin=22, vmax=38
-    )
-    lim = max(base["FP_MostRecentYear"].max(), base["ProjectedFP"].max()) + 50
-    ax.plot([0, lim], [0, lim], "k--", alpha=0.3, linewidth=1, label="No change")
-
-    base["_variance"] = (base["ProjectedFP"] - base["FP_MostRecentYear"]).abs()
-    for _, row in base.nlargest(12, "_variance").iterrows():
-        ax.annotate(
-            row["Name"].split()[-1],
-            (row["FP_MostRecentYear"], row["ProjectedFP"]),
-            fontsize=7, ha="left", va="bottom",
-            xytext=(3, 3), textcoords="offset points",
+def plot_scatter(base: pd.DataFrame, path: Path, y1: int, target_season: int) -> None:
+    """Projected vs most-recent FP scatter (matplotlib is imported only here)."""
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        fig, ax = plt.subplots(figsize=(10, 8))
+        sc = ax.scatter(
+            base["FP_MostRecentYear"],
+            base["ProjectedFP"],
+            alpha=0.5, s=30,
+            c=base["age"], cmap="RdYlGn_r",
+            vmin=22, vmax=38
         )
+        lim = max(base["FP_MostRecentYear"].max(), base["ProjectedFP"].max()) + 50
+        ax.plot([0, lim], [0, lim], "k--", alpha=0.3, linewidth=1, label="No change")
+
+        variance = (base["ProjectedFP"] - base["FP_MostRecentYear"]).abs()
+        for _, row in base.loc[variance.nlargest(12).index].iterrows():
+            ax.annotate(
+                row["Name"].split()[-1],
+                (row["FP_MostRecentYear"], row["ProjectedFP"]),
+                fontsize=7, ha="left", va="bottom",
+                xytext=(3, 3), textcoords="offset points",
+            )
+
+        plt.colorbar(sc, ax=ax, label="Player Age")
+        ax.set_xlabel(f"{y1} Actual Fantasy Points", fontsize=11)
+        ax.set_ylabel(f"{target_season} Projected Fantasy Points", fontsize=11)
+        ax.set_title(f"{target_season} Fantasy Baseball Projections vs {y1} Actuals",
+                     fontsize=13, fontweight="bold")
+        ax.legend(fontsize=9)
+        ax.grid(True, alpha=0.2)
+
+        plt.savefig(path, dpi=150, bbox_inches="tight")
+        plt.close()
+        print(f"  Scatter:     {path.name}")
+
+    except ImportError:
+        print("  Scatter:     skipped (matplotlib not installed — run: pip install matplotlib)")
+    except Exception as exc:
+        print(f"  Scatter:     skipped ({exc})")
 
-    plt.colorbar(sc, ax=ax, label="Player Age")
-    ax.set_xlabel(f"{Y1} Actual Fantasy Points", fontsize=11)
-    ax.set_ylabel(f"{TARGET_SEASON} Projected Fantasy Points", fontsize=11)
-    ax.set_title(f"{TARGET_SEASON} Fantasy Baseball Projections vs {Y1} Actuals",
-                 fontsize=13, fontweight="bold")
-    ax.legend(fontsize=9)
-    ax.grid(True, alpha=0.2)
-
-    scatter_path = SCRIPT_DIR / f"projection_scatter_{TARGET_SEASON}{year_suffix}.png"
-    plt.savefig(scatter_path, dpi=150, bbox_inches="tight")
-    plt.close()
-    print(f"  Scatter:     {scatter_path.name}")
 
-except ImportError:
-    print("  Scatter:     skipped (matplotlib not installed — run: pip install matplotlib)")
-except Exception as exc:
-    print(f"  Scatter:     skipped ({exc})")
+# ──────────────────────────────────────────────────────────────────────────────
+# STEP 13 — VALIDATION CHECKS
+# ──────────────────────────────────────────────────────────────────────────────
 
-print()
+def print_validation(base: pd.DataFrame, target_season: int) -> None:
+    print("─── Step 13: Validation ─────────────────────────────────────────")
+
+    # Top 20 visual check
+    print(f"\nTop 20 projected players for {target_season}:\n")
+    header = f"{'#':<4} {'Name':<24} {'Team':<5} {'Age':<5} {'ProjFP':<8} {'ActFP':<8} {'Δ%':<8} {'Pct'}"
+    print(header)
+    print("-" * len(header))
+    for i, row in base.head(20).iterrows():
+        delta = f"{row['Projection_vs_MostRecent']:+.1f}%" if pd.notna(row["Projection_vs_MostRecent"]) else "N/A"
+        print(f"{i+1:<4} {row['Name']:<24} {str(row['team_y1']):<5} "
+              f"{row['age']:<5.1f} {row['ProjectedFP']:<8.1f} "
+              f"{row['FP_MostRecentYear']:<8.1f} {delta:<8} {row['Percentile']:.0f}th")
+
+    # Mean FP check
+    mean_fp = base["ProjectedFP"].mean()
+    status  = "✓" if 250 <= mean_fp <= 400 else "⚠ WARNING"
+    print(f"\n{status}  Mean projected FP: {mean_fp:.1f}  (expected 250–400)")
+
+    # Park factor directional check
+    print("\nPark factor directional check:")
+    team_norm = base["team_y1"].apply(normalize_team)
+    for team, expected in [("COL", ">1.00"), ("SF", "<1.00"), ("MIA", "<1.00")]:
+        players = base[team_norm == team].head(5)
+        if players.empty:
+            print(f"  — {team}: no players found")
+            continue
+        avg_pf = players["ParkFactor"].mean()
+        direction = "above" if avg_pf > 1.00 else "below"
+        expected_dir = "above" if ">" in expected else "below"
+        icon = "✓" if direction == expected_dir else "⚠"
+        print(f"  {icon} {team}: avg PF = {avg_pf:.3f}  (expected {expected})")
+        for _, r in players.iterrows():
+            print(f"      {r['Name']:<22} PF={r['ParkFactor']:.3f}")
+
+    # Age modifier directional check
+    young      = base[base["age"] < 27]
+    old        = base[base["age"] > 32]
+    young_bad  = young[young["AgeMod"] <= 1.00]
+    old_bad    = old[  old["AgeMod"]   >= 1.00]
+    print(f"\nAge modifier check:")
+    icon = "✓" if young_bad.empty else "⚠"
+    print(f"  {icon}  {len(young)} young players (<27): "
+          f"{'all AgeMod > 1.00' if young_bad.empty else f'{len(young_bad)} exceptions'}")
+    icon = "✓" if old_bad.empty else "⚠"
+    print(f"  {icon}  {len(old)} veterans (>32): "
+          f"{'all AgeMod < 1.00' if old_bad.empty else f'{len(old_bad)} exceptions'}")
 
 
 # ──────────────────────────────────────────────────────────────────────────────
-# STEP 13 — VALIDATION CHECKS
+# RUN
 # ──────────────────────────────────────────────────────────────────────────────
 
-print("─── Step 13: Validation ─────────────────────────────────────────")
-
-# Top 20 visual check
-print(f"\nTop 20 projected players for {TARGET_SEASON}:\n")
-header = f"{'#':<4} {'Name':<24} {'Team':<5} {'Age':<5} {'ProjFP':<8} {'ActFP':<8} {'Δ%':<8} {'Pct'}"
-print(header)
-print("-" * len(header))
-for i, row in base.head(20).iterrows():
-    delta = f"{row['Projection_vs_MostRecent']:+.1f}%" if pd.notna(row["Projection_vs_MostRecent"]) else "N/A"
-    print(f"{i+1:<4} {row['Name']:<24} {str(row['team_y1']):<5} "
-          f"{row['age']:<5.1f} {row['ProjectedFP']:<8.1f} "
-          f"{row['FP_MostRecentYear']:<8.1f} {delta:<8} {row['Percentile']:.0f}th")
-
-# Mean FP check
-mean_fp = base["ProjectedFP"].mean()
-status  = "✓" if 250 <= mean_fp <= 400 else "⚠ WARNING"
-print(f"\n{status}  Mean projected FP: {mean_fp:.1f}  (expected 250–400)")
-
-# Park factor directional check
-print("\nPark factor directional check:")
-for team, expected in [("COL", ">1.00"), ("SF", "<1.00"), ("MIA", "<1.00")]:
-    players = base[base["team_y1"].apply(normalize_team) == team].head(5)
-    if players.empty:
-        print(f"  — {team}: no players found")
-        continue
-    avg_pf = players["ParkFactor"].mean()
-    direction = "above" if avg_pf > 1.00 else "below"
-    expected_dir = "above" if ">" in expected else "below"
-    icon = "✓" if direction == expected_dir else "⚠"
-    print(f"  {icon} {team}: avg PF = {avg_pf:.3f}  (expected {expected})")
-    for _, r in players.iterrows():
-        print(f"      {r['Name']:<22} PF={r['ParkFactor']:.3f}")
-
-# Age modifier directional check
-young      = base[base["age"] < 27]
-old        = base[base["age"] > 32]
-young_bad  = young[young["AgeMod"] <= 1.00]
-old_bad    = old[  old["AgeMod"]   >= 1.00]
-print(f"\nAge modifier check:")
-icon = "✓" if young_bad.empty else "⚠"
-print(f"  {icon}  {len(young)} young players (<27): "
-      f"{'all AgeMod > 1.00' if young_bad.empty else f'{len(young_bad)} exceptions'}")
-icon = "✓" if old_bad.empty else "⚠"
-print(f"  {icon}  {len(old)} veterans (>32): "
-      f"{'all AgeMod < 1.00' if old_bad.empty else f'{len(old_bad)} exceptions'}")
-
-# Data source summary
-print(f"\nData sources confirmed:")
-print(f"  Batting stats:    {', '.join(str(y) for y in data_available_years)}")
-print(f"  xwOBA data:       {', '.join(str(y) for y in xwoba_by_year) or 'None'}")
-print(f"  Sprint speed:     {Y1 if speed_df is not None else 'Not available'}")
-print(f"  Playing time:     {'Steamer projections' if not using_pt_fallback else f'{Y1} actual PA (fallback)'}")
-
-print(f"\n{'='*65}")
-print(f"  ✓ Projections complete!")
-print(f"    Target season:   {TARGET_SEASON}")
-print(f"    Players ranked:  {len(base):,}")
-print(f"    Main output:     {main_path.name}")
-print(f"{'='*65}\n")
+def run_projections(
+    season: Optional[int] = None,
+    cache_dir: Path = CACHE_DIR,
+    output_dir: Path = SCRIPT_DIR,
+    formats: Iterable[str] = ("csv",),
+    plot: bool = True,
+    today: Optional[datetime.date] = None,
+) -> pd.DataFrame:
+    """
+    Project `season` (default: see resolve_years) and return the ranked
+    batter + pitcher table. Fetches go through the erosp.ingest frame cache
+    rooted at `cache_dir`. `formats` ⊆ OUTPUT_FORMATS picks the main table
+    files written to `output_dir` ("csv" also writes the flag / breakout /
+    decline reports); pass formats=() and plot=False to write nothing.
+    Raises RuntimeError when the inputs needed for a projection are missing.
+    """
+    formats = list(formats)
+    unknown = [f for f in formats if f not in OUTPUT_FORMATS]
+    if unknown:
+        raise ValueError(f"Unknown output format(s): {unknown}")
+
+    today = today or datetime.date.today()
+    target_season, historical_years = resolve_years(season, today)
+    y1, y2, y3 = historical_years   # Y1 = most recent completed, Y3 = oldest
+
+    print(f"\n{'='*65}")
+    print(f"  Fantasy Baseball Projection System")
+    print(f"{'='*65}")
+    print(f"  Projecting for {target_season} season using data from {y1}, {y2}, and {y3}.")
+    print(f"  Run date: {today.strftime('%B %d, %Y')}")
+    print(f"{'='*65}\n")
+
+    _enable_pybaseball()
+    cache_dir = Path(cache_dir)
+    cache = DataCache(cache_dir)
+    seed_legacy_cache(cache, cache_dir)
+    player_info_path = cache_dir / "mlb_player_info.csv"
+
+    # ─── Step 1: Chadwick register (cross-ID mapping) ─────────────────────────
+    print("─── Step 1: Chadwick player registry ───────────────────────────")
+    id_index = load_id_index(cache, cache_dir / "id_index")
+    if id_index is None:
+        raise RuntimeError("Could not load Chadwick register.")
+    id_map = pd.DataFrame({"key_fangraphs": np.asarray(id_index.tables["fangraphs"]),
+                           "key_mlbam":     np.asarray(id_index.tables["fg_mlbam"])})
+    print(f"  {len(id_map):,} player ID mappings loaded.\n")
+
+    # ─── Step 2: Batting statistics (3 historical seasons) ────────────────────
+    batting_by_year = load_batting(historical_years, cache)
+    if not batting_by_year:
+        raise RuntimeError("No batting data could be loaded.")
+    data_available_years = list(batting_by_year)
+
+    # If the most-recent year is unavailable, shift the Y1/Y2/Y3 references back
+    if y1 not in batting_by_year:
+        available = sorted(batting_by_year.keys(), reverse=True)
+        old_y1 = y1
+        y1 = available[0] if len(available) > 0 else None
+        y2 = available[1] if len(available) > 1 else None
+        y3 = available[2] if len(available) > 2 else None
+        print(f"\n  WARNING: {old_y1} data not available. Shifted references → {y1}, {y2}, {y3}")
+        print(f"  NOTE: Output filename will reflect this (projections based on older data).\n")
+    print()
+    years = (y1, y2, y3)
+
+    # ─── Steps 3–6: Statcast xwOBA, sprint speed, league SB, playing time ────
+    print("─── Step 3: Statcast xwOBA ──────────────────────────────────────")
+    xwoba_by_year = fetch_statcast_xwoba([y for y in (y1, y2) if y is not None], cache=cache)
+    print()
+
+    print(f"─── Step 4: Sprint speed ({y1}) ─────────────────────────────────")
+    speed_df = fetch_sprint_speed(y1, cache=cache) if y1 else None
+    print()
+
+    league_sb = estimate_league_sb(batting_by_year, y1)
+    proj_pa_map, using_pt_fallback = load_playing_time(batting_by_year, y1, target_season)
+
+    # ─── Steps 7–11: Batter projections ───────────────────────────────────────
+    chad_name_map = id_index.name_to_mlbam()
+    base = build_master_dataset(batting_by_year, years, id_map, chad_name_map,
+                                xwoba_by_year, speed_df, proj_pa_map, player_info_path)
+    base = add_ages(base, target_season)
+    base = apply_espn_points(base, years)
+    base = project_batters(base, league_sb)
+
+    # ─── Step 11b: Pitcher projections ────────────────────────────────────────
+    print("─── Step 11b: Pitcher projections ───────────────────────────────")
+    try:
+        pitch_by_year = load_pitching(historical_years, cache)
+        if pitch_by_year and y1 in pitch_by_year:
+            pitchers = project_pitchers(pitch_by_year, years, id_map, chad_name_map,
+                                        proj_pa_map, target_season, player_info_path)
+            base = combine_projections(base, pitchers)
+        else:
+            print("  No pitcher data available — skipping pitcher projections.\n")
+    except Exception as exc:
+        print(f"  Pitcher projections failed: {exc} — continuing with batters only.\n")
+
+    # ─── Step 12: Output files ────────────────────────────────────────────────
+    # Suffix if we had to fall back to older data
+    year_suffix = f"_based_on_{y1}" if y1 != historical_years[0] else ""
+    base_name   = f"fantasy_projections_{target_season}{year_suffix}"
+
+    output_dir = Path(output_dir)
+    main_paths: List[Path] = []
+    if formats or plot:
+        print("─── Step 12: Writing output files ───────────────────────────────")
+        output_dir.mkdir(parents=True, exist_ok=True)
+        main_paths = write_projections(base, base_name, output_dir, formats)
+        if "csv" in formats:
+            write_reports(base, target_season, year_suffix, output_dir)
+        if plot:
+            plot_scatter(base, output_dir / f"projection_scatter_{target_season}{year_suffix}.png",
+                         y1, target_season)
+        print()
+
+    print_validation(base, target_season)
+
+    # Data source summary
+    print(f"\nData sources confirmed:")
+    print(f"  Batting stats:    {', '.join(str(y) for y in data_available_years)}")
+    print(f"  xwOBA data:       {', '.join(str(y) for y in xwoba_by_year) or 'None'}")
+    print(f"  Sprint speed:     {y1 if speed_df is not None else 'Not available'}")
+    print(f"  Playing time:     {'Steamer projections' if not using_pt_fallback else f'{y1} actual PA (fallback)'}")
+
+    print(f"\n{'='*65}")
+    print(f"  ✓ Projections complete!")
+    print(f"    Target season:   {target_season}")
+    print(f"    Players ranked:  {len(base):,}")
+    if main_paths:
+        print(f"    Main output:     {', '.join(p.name for p in main_paths)}")
+    print(f"{'='*65}\n")
+    return base
+
+
+def _parse_formats(value: str) -> List[str]:
+    formats = [f.strip().lower() for f in value.split(",") if f.strip()]
+    unknown = [f for f in formats if f not in OUTPUT_FORMATS]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown format(s) {unknown}; choose from {', '.join(OUTPUT_FORMATS)}")
+    return formats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate season-long fantasy point projections")
+    parser.add_argument("--season", type=int, default=None,
+                        help="Season to project (default: this year; next year from November)")
+    parser.add_argument("--cache-dir", type=Path, default=CACHE_DIR,
+                        help="Frame / ID index / player info cache (default: scripts/projection_cache)")
+    parser.add_argument("--output-dir", type=Path, default=SCRIPT_DIR,
+                        help="Where output files are written (default: scripts/)")
+    parser.add_argument("--format", dest="formats", type=_parse_formats, default=["csv"],
+                        help=f"Comma-separated main table formats: {', '.join(OUTPUT_FORMATS)} "
+                             f"(default: csv; csv also writes the flag/breakout/decline reports). "
+                             f"Each is written to OUTPUT_DIR/fantasy_projections_<season>.<format>; "
+                             f"json uses the data/projections/<season>.json layout")
+    parser.add_argument("--no-plot", action="store_true",
+                        help="Skip the matplotlib scatter plot")
+    args = parser.parse_args(argv)
+
+    try:
+        run_projections(season=args.season, cache_dir=args.cache_dir,
+                        output_dir=args.output_dir, formats=args.formats,
+                        plot=not args.no_plot)
+    except RuntimeError as exc:
+        print(f"\nERROR: {exc}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,11 +2,18 @@
 patch_injury_status.py — Lightweight IL status patcher.
 
 Fetches the current MLB Stats API injury/IL map and patches
-data/erosp/latest.json in place:
+data/erosp/latest.json in place (only changed player records are rewritten,
+see erosp/output.py):
   - Adds/updates `il_type` and `il_days_remaining` for players currently on IL
   - Adds/updates `injury_note` with the injury reason (e.g. "right knee inflammation")
   - Removes IL fields for players who have been activated
 
+The fresh fields are diffed against the last-applied state in
+data/erosp/patches/state.json; latest.json is only touched when the delta is
+non-empty, and each delta is journaled as patches/<seq>.json (see
+erosp/patches.py). update-injury-status.yml commits patches/ along with
+latest.json, so the state and sequence numbers carry over between runs.
+
 Run time: ~5 seconds (30 MLB API calls + 1 transactions API call).
 Scheduled 4x daily via update-injury-status.yml to keep IL status
 current throughout the day.
@@ -19,6 +26,10 @@ import sys
 import time
 from pathlib import Path
 
+from erosp.names import normalize
+from erosp.output import PlayerJsonFile
+from erosp.patches import PatchJournal, apply_ops, diff_ops, il_fields
+
 # fetch_injury_news provides multi-source scraping (Rotowire, FantasyPros, RSS)
 try:
     from fetch_injury_news import fetch_all_injury_news
@@ -35,6 +46,7 @@ except ImportError:
 SCRIPTS_DIR = Path(__file__).parent
 PROJECT_DIR = SCRIPTS_DIR.parent
 LATEST_JSON = PROJECT_DIR / "data" / "erosp" / "latest.json"
+PATCH_DIR   = PROJECT_DIR / "data" / "erosp" / "patches"
 CACHE_DIR   = SCRIPTS_DIR / "erosp_cache"
 CACHE_DIR.mkdir(exist_ok=True)
 
@@ -184,15 +196,28 @@ if not LATEST_JSON.exists():
     print("data/erosp/latest.json not found — nothing to patch.")
     sys.exit(0)
 
-with open(LATEST_JSON) as f:
-    data = json.load(f)
+latest  = PlayerJsonFile(LATEST_JSON)
+header  = latest.header()
+base    = header.get("generated_at", "")
+journal = PatchJournal(PATCH_DIR)
 
-players = data.get("players", [])
-if not players:
+player_ids = latest.ids()
+if not player_ids:
     print("No players in latest.json — nothing to patch.")
     sys.exit(0)
 
-season = data.get("season", 2026)
+season = header.get("season", 2026)
+
+# IL fields currently in latest.json — from the journal state, or read from the
+# file once after compute_erosp.py regenerates it
+state = journal.load_state(base)
+if state is not None:
+    applied = state["applied"]
+else:
+    print("  No patch state for this latest.json — reading current IL fields.")
+    applied = {p["mlbam_id"]: il_fields(p) for p in latest.load().get("players", [])
+               if p.get("mlbam_id") is not None}
+    applied = {k: v for k, v in applied.items() if v}
 
 # ── Fetch injury map + notes + news ──────────────────────────────
 
@@ -200,35 +225,26 @@ injury_map   = fetch_injury_map(season)
 injury_notes = fetch_injury_notes(season)
 
 # Multi-source injury news (Rotowire, FantasyPros, RSS)
-# Keyed by normalized player name (lowercase alphanumeric)
+# Keyed by erosp.names.normalize(player name)
 injury_news_map: dict = {}
 if NEWS_AVAILABLE:
     try:
-        from fetch_injury_news import normalize_name as _norm
         raw_news = fetch_all_injury_news(season)
         injury_news_map = raw_news  # already normalized-name keyed
     except Exception as exc:
         print(f"  WARNING: Injury news fetch failed: {exc}")
 
-# ── Build name→news lookup (normalized name → news entry) ─────────
-
-def _norm_simple(name: str) -> str:
-    """Quick normalize without unicodedata (already handled in fetch_injury_news)."""
-    import re as _re
-    n = name.lower()
-    n = _re.sub(r"\s+(jr\.?|sr\.?|ii|iii|iv)\.?\s*$", "", n)
-    n = _re.sub(r"[^a-z0-9]", "", n)
-    return n.strip()
+# ── Diff against the applied state ───────────────────────────────
 
-# ── Patch each player ─────────────────────────────────────────────
+on_il = [mid for mid in player_ids if mid in injury_map]
+names = {p["mlbam_id"]: p.get("name", "") for p in latest.records(on_il)}
 
 patched   = 0
 activated = 0
+desired: dict = {}   # mlbam_id → IL fields latest.json should carry
 
-for player in players:
-    mlbam_id = player.get("mlbam_id")
-    if mlbam_id is None:
-        continue
+for mlbam_id in player_ids:
+    current = applied.get(mlbam_id, {})
 
     if mlbam_id in injury_map:
         il_info  = injury_map[mlbam_id]
@@ -237,48 +253,56 @@ for player in players:
         txn_note = injury_notes.get(mlbam_id, "")
 
         # Look up multi-source news by normalized name
-        norm_key  = _norm_simple(player.get("name", ""))
+        norm_key  = normalize(names.get(mlbam_id, ""))
         news_entry = injury_news_map.get(norm_key, {})
         news_text   = news_entry.get("text", "")
         news_source = news_entry.get("source", "")
         news_date   = news_entry.get("date", "")
 
         changed = (
-            player.get("il_type") != il_type
-            or player.get("il_days_remaining") != il_days
-            or player.get("injury_note", "") != txn_note
-            or player.get("injury_news", "") != news_text
+            current.get("il_type") != il_type
+            or current.get("il_days_remaining") != il_days
+            or current.get("injury_note", "") != txn_note
+            or current.get("injury_news", "") != news_text
         )
         if changed:
-            player["il_type"] = il_type
-            player["il_days_remaining"] = il_days
+            fields = {"il_type": il_type, "il_days_remaining": il_days}
             if txn_note:
-                player["injury_note"] = txn_note
-            else:
-                player.pop("injury_note", None)
+                fields["injury_note"] = txn_note
             if news_text:
-                player["injury_news"] = news_text
-                player["injury_news_source"] = news_source
-                player["injury_news_date"] = news_date
-            else:
-                player.pop("injury_news", None)
-                player.pop("injury_news_source", None)
-                player.pop("injury_news_date", None)
+                fields["injury_news"] = news_text
+                fields["injury_news_source"] = news_source
+                fields["injury_news_date"] = news_date
+            desired[mlbam_id] = fields
             patched += 1
-    else:
-        if "il_type" in player:
-            del player["il_type"]
-            player.pop("il_days_remaining", None)
-            player.pop("injury_note", None)
-            player.pop("injury_news", None)
-            player.pop("injury_news_source", None)
-            player.pop("injury_news_date", None)
-            activated += 1
+        else:
+            desired[mlbam_id] = current
+    elif "il_type" in current:
+        activated += 1
+    elif current:
+        desired[mlbam_id] = current
 
-# ── Save ──────────────────────────────────────────────────────────
-
-with open(LATEST_JSON, "w") as f:
-    json.dump(data, f, separators=(",", ":"))
+ops = diff_ops(applied, desired)
 
-print(f"Patched: {patched} IL updates, {activated} activations cleared.")
-print(f"Saved → {LATEST_JSON.relative_to(PROJECT_DIR)}")
+# ── Save ──────────────────────────────────────────────────────────
+# latest.json is touched only for a non-empty delta, and then only the changed
+# records are re-serialized (spliced in via latest.index.json).
+
+if ops:
+    touched = {int(op["path"].split("/")[1]) for op in ops}
+    records = {p["mlbam_id"]: p for p in latest.records(sorted(touched))}
+    apply_ops(records, ops)
+    latest.replace(records)
+    seq = journal.append(base, ops)
+    journal.save_state(base, seq, desired)
+    print(f"Patched: {patched} IL updates, {activated} activations cleared "
+          f"({len(ops)} field ops → patches/{seq:06d}.json).")
+    print(f"Saved → {LATEST_JSON.relative_to(PROJECT_DIR)}")
+else:
+    if state is None:
+        journal.save_state(base, journal.last_seq(), applied)
+    print("No IL changes — latest.json untouched.")
+
+removed = journal.compact(base)
+if removed:
+    print(f"  Compacted patch journal ({removed} entries folded or dropped).")
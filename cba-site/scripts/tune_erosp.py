@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+tune_erosp.py — Search EROSPConfig parameters (erosp/config.py) against the backtest.
+
+Loads the backtest inputs for the chosen seasons once (backtest_erosp.py's
+load_inputs — stats, player info, schedules, Steamer playing time, actual
+points), then scores each trial by re-running talent → playing time →
+projection → startability for every season under the trial's EROSPConfig
+(erosp/tuning.py make_config — nothing patched, nothing written to disk).
+Trials run in a process pool that inherits the loaded inputs.
+
+The objective is the mean over seasons of the overall backtest metric for
+--projection (default erosp_startable): Spearman / Pearson are maximized,
+RMSE / MAE minimized. Trial 0 is always the current config; if it fails
+the run stops. A failing season in any other trial is logged to stderr
+and scores NaN.
+
+Usage:
+    python tune_erosp.py --years 2023-2025 --search random --trials 64
+    python tune_erosp.py --search grid --grid-points 3 --params xwoba_damp,sigmoid_tau
+    python tune_erosp.py --search grid                     (GRID_PARAMS, 27 trials)
+    python tune_erosp.py --search bayes --trials 100       (needs: pip install optuna)
+    python tune_erosp.py --benchmark [--trials 8]          trials/sec, serial vs pool
+
+Output:
+    data/erosp/tuning_trials.csv — one row per trial: values, objective and
+                                   the per-season metric, best first
+"""
+
+import os
+import sys
+import argparse
+import contextlib
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+import numpy as np
+
+SCRIPT_DIR = Path(__file__).parent
+sys.path.insert(0, str(SCRIPT_DIR))
+
+from backtest_erosp import (
+    OUTPUT_DIR, load_inputs, project_season, output_records, match_actuals,
+    accuracy_table, parse_years,
+)
+from erosp.tuning import (
+    SEARCH_SPACE, GRID_PARAMS, MAX_GRID_TRIALS, make_config, current_values,
+    grid_size, grid_trials, random_trials,
+)
+
+TRIALS_PATH = OUTPUT_DIR / "tuning_trials.csv"
+
+# metric → True if higher is better
+OBJECTIVES = {"spearman": True, "pearson": True, "rmse": False, "mae": False}
+PROJECTIONS = ("erosp_startable", "erosp_raw")
+SEARCHES    = ("random", "grid", "bayes")
+
+
+# ---------------------------------------------------------------------------
+# Trial evaluation
+# ---------------------------------------------------------------------------
+
+def evaluate(params: dict, inputs: dict, seasons: List[int],
+             metric: str = "spearman", projection: str = "erosp_startable",
+             strict: bool = False) -> dict:
+    """
+    Backtest `seasons` with `params` overriding DEFAULT_CONFIG. Returns
+    {"objective": mean metric, "<metric>_<season>": ...}. A season whose
+    projection fails is logged to stderr and scores NaN, or re-raises if
+    `strict`.
+    """
+    config = make_config(params)
+    scores: Dict[str, float] = {}
+    with open(os.devnull, "w") as quiet, contextlib.redirect_stdout(quiet):
+        for season in seasons:
+            try:
+                projection_df = project_season(season, inputs, config)
+                df_m, _, _ = match_actuals(output_records(projection_df), inputs["actuals"][season])
+                acc = accuracy_table(season, df_m)
+                overall = acc[(acc["scope"] == "overall") & (acc["projection"] == projection)]
+                scores[f"{metric}_{season}"] = float(overall[metric].iloc[0])
+            except Exception:
+                if strict:
+                    raise
+                print(f"  WARNING: {season} failed for {params or 'current config'}:\n"
+                      + traceback.format_exc(), file=sys.stderr)
+                scores[f"{metric}_{season}"] = float("nan")
+    values = list(scores.values())
+    objective = float(np.mean(values)) if not np.isnan(values).any() else float("nan")
+    return {"objective": objective, **scores}
+
+
+_WORKER_STATE: Optional[tuple] = None
+
+
+def _init_worker(inputs: dict, seasons: List[int], metric: str, projection: str) -> None:
+    # Under fork the inputs are inherited copy-on-write; spawn/forkserver
+    # unpickle them once per worker.
+    global _WORKER_STATE
+    _WORKER_STATE = (inputs, seasons, metric, projection)
+
+
+def _trial_worker(params: dict) -> dict:
+    inputs, seasons, metric, projection = _WORKER_STATE
+    return evaluate(params, inputs, seasons, metric, projection)
+
+
+def _pool(workers: int, inputs: dict, seasons: List[int], metric: str,
+          projection: str) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                               initargs=(inputs, seasons, metric, projection))
+
+
+# ---------------------------------------------------------------------------
+# Search strategies
+# ---------------------------------------------------------------------------
+
+def run_trials(trials: List[dict], pool: ProcessPoolExecutor) -> List[dict]:
+    results = []
+    for i, (params, score) in enumerate(zip(trials, pool.map(_trial_worker, trials)), 1):
+        results.append({**params, **score})
+        print(f"  trial {i:>4}/{len(trials)}  objective={score['objective']:.4f}")
+    return results
+
+
+def run_bayes(space: Dict[str, object], n_trials: int, pool: ProcessPoolExecutor,
+              workers: int, maximize: bool, seed: Optional[int]) -> List[dict]:
+    """TPE search (optuna), asking for one batch of `workers` trials at a time."""
+    try:
+        import optuna
+    except ImportError:
+        raise RuntimeError("optuna not installed — run: pip install optuna (or use --search random)")
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+
+    distributions = {}
+    for name, spec in space.items():
+        if isinstance(spec, tuple):
+            distributions[name] = optuna.distributions.FloatDistribution(*spec)
+        else:   # discrete values may be lists — search over their index
+            distributions[name] = optuna.distributions.CategoricalDistribution(list(range(len(spec))))
+
+    study = optuna.create_study(direction="maximize" if maximize else "minimize",
+                                sampler=optuna.samplers.TPESampler(seed=seed))
+    results: List[dict] = []
+    while len(results) < n_trials:
+        batch = [study.ask(distributions) for _ in range(min(workers, n_trials - len(results)))]
+        params = [{name: (round(t.params[name], 6) if isinstance(spec, tuple) else spec[t.params[name]])
+                   for name, spec in space.items()} for t in batch]
+        for trial, p, score in zip(batch, params, pool.map(_trial_worker, params)):
+            value = score["objective"]
+            study.tell(trial, value if not np.isnan(value) else None,
+                       state=None if not np.isnan(value) else optuna.trial.TrialState.FAIL)
+            results.append({**p, **score})
+            print(f"  trial {len(results):>4}/{n_trials}  objective={value:.4f}")
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+def benchmark(inputs: dict, seasons: List[int], n_trials: int, workers: int,
+              metric: str, projection: str, seed: Optional[int]) -> None:
+    """Trials per second for `n_trials` random trials, serially and across the pool."""
+    trials = random_trials(SEARCH_SPACE, n_trials, seed=seed)
+    print(f"─── Benchmark: {n_trials} trial(s) × {len(seasons)} season(s) ──────────────────────")
+
+    t0 = time.perf_counter()
+    evaluate(trials[0], inputs, seasons, metric, projection)   # warm-up
+    warm = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for params in trials:
+        evaluate(params, inputs, seasons, metric, projection)
+    serial = time.perf_counter() - t0
+
+    with _pool(workers, inputs, seasons, metric, projection) as pool:
+        list(pool.map(_trial_worker, trials[:workers]))   # start workers
+        t0 = time.perf_counter()
+        list(pool.map(_trial_worker, trials))
+        parallel = time.perf_counter() - t0
+
+    print(f"  Warm-up trial:  {warm:.2f}s")
+    print(f"  Serial:         {n_trials / serial:.2f} trials/s  ({serial / n_trials:.2f}s per trial)")
+    print(f"  Pool ({workers:>2}):      {n_trials / parallel:.2f} trials/s  ({parallel / n_trials:.2f}s per trial)")
+    print()
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _fmt(value) -> str:
+    return f"{value:.4g}" if isinstance(value, float) else str(value)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Tune EROSPConfig parameters against the backtest")
+    parser.add_argument("--years", type=parse_years, default=[2025],
+                        help="Seasons to backtest per trial, e.g. 2023-2025 (default: 2025)")
+    parser.add_argument("--search", choices=SEARCHES, default="random",
+                        help="random (default), grid, or bayes (optuna TPE)")
+    parser.add_argument("--trials", type=int, default=32,
+                        help="Trials for random / bayes search and --benchmark (default: 32)")
+    parser.add_argument("--grid-points", type=int, default=3,
+                        help="Values per continuous range for grid search (default: 3)")
+    parser.add_argument("--params", type=lambda v: [p.strip() for p in v.split(",") if p.strip()],
+                        default=None,
+                        help=f"Comma-separated subset of: {', '.join(SEARCH_SPACE)} "
+                             f"(default: all; {', '.join(GRID_PARAMS)} for grid search)")
+    parser.add_argument("--max-grid-trials", type=int, default=MAX_GRID_TRIALS,
+                        help=f"Refuse grids larger than this (default: {MAX_GRID_TRIALS})")
+    parser.add_argument("--metric", choices=list(OBJECTIVES), default="spearman",
+                        help="Backtest metric to optimize (default: spearman)")
+    parser.add_argument("--projection", choices=PROJECTIONS, default="erosp_startable",
+                        help="Projection column scored (default: erosp_startable)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0, help="Random / TPE seed (default: 0)")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Report trials/sec instead of searching")
+    args = parser.parse_args(argv)
+
+    workers = args.workers or os.cpu_count() or 1
+    names = args.params or list(GRID_PARAMS if args.search == "grid" else SEARCH_SPACE)
+    unknown = [n for n in names if n not in SEARCH_SPACE]
+    if unknown:
+        parser.error(f"unknown --params {unknown}; choose from {', '.join(SEARCH_SPACE)}")
+    space = {n: SEARCH_SPACE[n] for n in names}
+    maximize = OBJECTIVES[args.metric]
+    if args.search == "grid" and grid_size(space, args.grid_points) > args.max_grid_trials:
+        parser.error(f"grid of {grid_size(space, args.grid_points):,} trials exceeds "
+                     f"--max-grid-trials {args.max_grid_trials:,}; narrow --params / "
+                     f"--grid-points or use --search random")
+
+    try:
+        inputs = load_inputs(args.years)
+    except RuntimeError as exc:
+        print(f"\nERROR: {exc}")
+        return 1
+    seasons = [y for y in sorted(set(args.years)) if inputs["actuals"].get(y) is not None]
+    skipped = sorted(set(args.years) - set(seasons))
+    if skipped:
+        print(f"  WARNING: no data/historical/{{year}}.json for {skipped} — left out.")
+    if not seasons:
+        print("\nERROR: No season with actual points to score against.")
+        return 1
+
+    if args.benchmark:
+        benchmark(inputs, seasons, args.trials, workers, args.metric, args.projection, args.seed)
+        return 0
+
+    if args.search == "grid":
+        trials = grid_trials(space, args.grid_points, max_trials=args.max_grid_trials)
+    elif args.search == "random":
+        trials = random_trials(space, args.trials, seed=args.seed)
+    else:
+        trials = []
+    n_trials = len(trials) if trials else args.trials
+
+    print(f"\n{'='*65}")
+    print(f"  EROSP CONFIG SEARCH")
+    print(f"{'='*65}")
+    print(f"  Seasons:    {', '.join(map(str, seasons))}")
+    print(f"  Search:     {args.search} — {n_trials:,} trial(s) over {len(space)} parameter(s)")
+    print(f"  Objective:  {'max' if maximize else 'min'} mean {args.metric}({args.projection})")
+    print(f"  Workers:    {workers}")
+    print(f"{'='*65}\n")
+
+    try:
+        baseline = {**current_values(names),
+                    **evaluate({}, inputs, seasons, args.metric, args.projection, strict=True)}
+    except Exception:
+        traceback.print_exc()
+        print("\nERROR: the current config fails the backtest — fix that before tuning.")
+        return 1
+    print(f"  baseline (current config)  objective={baseline['objective']:.4f}")
+    try:
+        with _pool(workers, inputs, seasons, args.metric, args.projection) as pool:
+            if args.search == "bayes":
+                results = run_bayes(space, args.trials, pool, workers, maximize, args.seed)
+            else:
+                results = run_trials(trials, pool)
+    except RuntimeError as exc:
+        print(f"\nERROR: {exc}")
+        return 1
+    print()
+
+    table = pd.DataFrame([{"trial": 0, **baseline}]
+                         + [{"trial": i, **r} for i, r in enumerate(results, 1)])
+    table = table.sort_values("objective", ascending=not maximize, na_position="last")
+    for name in names:   # tuple-valued fields → readable cells
+        table[name] = table[name].map(_fmt)
+    table.to_csv(TRIALS_PATH, index=False)
+
+    best = table.iloc[0]
+    print("  ── Best trial ────────────────────────────────────────────────")
+    print(f"  trial {best['trial']}  objective={best['objective']:.4f}  "
+          f"(baseline {baseline['objective']:.4f})")
+    for name in names:
+        print(f"    {name:<28} {best[name]:<30} (current {_fmt(baseline[name])})")
+    print(f"\n  ✓ Saved {len(table):,} trials → {TRIALS_PATH.relative_to(SCRIPT_DIR.parent)}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())